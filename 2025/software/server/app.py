@@ -1,5 +1,9 @@
 """Main entry point"""
 
+import build_laser_objects
+# Compiles the graphics up front, before the laser modules and the worker process map them
+build_laser_objects.ensure_current()
+
 import pygame 
 import laser_server
 import song_handler
@@ -41,7 +45,8 @@ class MainApp:
                         'Song Queue': 'Empty',
                         'Wands': '1 (Simulated)',
                         'Synthesizer': 'Not Running',
-                        'Focusing': 'True' }
+                        'Focusing': 'True',
+                        'Lasers': 'Not Running' }
 
         # Maps mode number to name and whether the jukebox music is playing
         self.modes = { 1: ('Jukebox', True), 
@@ -72,7 +77,7 @@ class MainApp:
 
     def show_screen(self) -> None:
         clock = pygame.time.Clock()
-        screen = pygame.display.set_mode((750, 300), pygame.RESIZABLE)
+        screen = pygame.display.set_mode((750, 340), pygame.RESIZABLE)
         pygame.display.set_caption(self.APP_NAME)
         pygame.time.set_timer(UPDATE_SONGS, 100)
         pygame.time.set_timer(REFOCUS, 3000, 1)
@@ -133,6 +138,7 @@ class MainApp:
                     self.labels['Playing'] = self.songs.current_song.running_str if self.songs.current_song else 'None'
                     self.labels['Song Queue'] = song_queue if song_queue else 'Empty'
                     self.labels['Synthesizer'] = 'Running' if self.synth.running else 'Not Running'
+                    self.labels['Lasers'] = self.laser_server.telemetry.summary() if self.laser_server.server_running else 'Not Running'
                     self._update_lcds()
                     self._update_screen(screen)
                 elif event.type == BLE_WAND_CONNECT:
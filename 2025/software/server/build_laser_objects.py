@@ -0,0 +1,150 @@
+"""Compiles the graphics in laser_objects_source.py into the laser_objects.bin asset file
+
+The file holds a header with the size and modification time of the source it was built
+from and the simplifier tolerance and optimizer version it was built with, an index of
+graphic names with their offset and length, and the graphics as one uint16 array. On
+the way each graphic is simplified by path_simplifier and its strokes are reordered by
+stroke_optimizer.
+
+Building takes a moment, so laser_objects only does it on import when the file is
+missing or unreadable, and loads a stale file with a warning. Run this script after
+editing the source, or call ensure_current at startup before anything imports
+laser_objects."""
+
+import argparse
+import os
+import numpy as np
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+SOURCE_PATH = os.path.join(DIRECTORY, 'laser_objects_source.py')
+ASSET_PATH = os.path.join(DIRECTORY, 'laser_objects.bin')
+
+MAGIC = b'LOBJ'
+VERSION = 4
+HEADER_DTYPE = np.dtype([('magic', 'S4'), ('version', '<u4'), ('count', '<u4'), ('optimizer_version', '<u4'),
+                         ('source_size', '<i8'), ('source_mtime_ns', '<i8'), ('tolerance', '<f8')])
+INDEX_DTYPE = np.dtype([('name', 'S32'), ('offset', '<u4'), ('length', '<u4')])
+
+def source_stamp(source_path: str = SOURCE_PATH) -> tuple[int, int]:
+    """Returns the size and modification time that identify a version of the source, like a .pyc does"""
+    stat = os.stat(source_path)
+    return (stat.st_size, stat.st_mtime_ns)
+
+def build_parameters(optimize_strokes: bool = True, simplify_tolerance: float = None) -> tuple[float, int]:
+    """Returns the simplifier tolerance and optimizer version a build uses, version 0 when strokes keep their order"""
+    import path_simplifier
+    import stroke_optimizer
+    if simplify_tolerance is None:
+        simplify_tolerance = path_simplifier.DEFAULT_TOLERANCE
+    return (float(simplify_tolerance), stroke_optimizer.VERSION if optimize_strokes else 0)
+
+def read_header(asset_path: str = ASSET_PATH) -> np.void:
+    """Returns the header of the asset file, or None if there is no such file"""
+    if not os.path.exists(asset_path):
+        return None
+    header = np.fromfile(asset_path, dtype=HEADER_DTYPE, count=1)
+    return header[0] if len(header) else None
+
+def stale_reason(header: np.void, source_path: str = SOURCE_PATH) -> str:
+    """Returns why an asset file no longer matches the source and the default build, or None if it does"""
+    if header['magic'] != MAGIC or header['version'] != VERSION:
+        return f'it has format version {int(header["version"])} instead of {VERSION}'
+    if (int(header['source_size']), int(header['source_mtime_ns'])) != source_stamp(source_path):
+        return f'{os.path.basename(source_path)} has changed'
+    tolerance, optimizer_version = build_parameters()
+    if header['tolerance'] != tolerance:
+        return f'it was simplified with tolerance {float(header["tolerance"])} instead of {tolerance}'
+    if header['optimizer_version'] != optimizer_version:
+        return f'it was ordered by stroke optimizer version {int(header["optimizer_version"])} instead of {optimizer_version}'
+    return None
+
+def is_current(header: np.void, source_path: str = SOURCE_PATH) -> bool:
+    return stale_reason(header, source_path) is None
+
+def ensure_current(source_path: str = SOURCE_PATH, asset_path: str = ASSET_PATH) -> bool:
+    """Rebuilds the asset file with the default parameters if it is missing or stale, returns True if it did"""
+    header = read_header(asset_path)
+    if header is not None and is_current(header, source_path):
+        return False
+    print(f'Building {asset_path}')
+    build(source_path, asset_path)
+    return True
+
+def parse_source(source_path: str = SOURCE_PATH) -> dict[str, list[int]]:
+    """Returns every list literal assigned to a module level name in the source file"""
+    # Only needed when building, so loading the graphics does not pay for importing ast
+    import ast
+    with open(source_path) as f:
+        tree = ast.parse(f.read(), source_path)
+    graphics = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.List):
+            graphics[node.targets[0].id] = ast.literal_eval(node.value)
+    return graphics
+
+def build(source_path: str = SOURCE_PATH, asset_path: str = ASSET_PATH, optimize_strokes: bool = True,
+          simplify_tolerance: float = None) -> None:
+    """Compiles the source into the asset file, a simplify_tolerance of 0 keeps every vertex"""
+    graphics = parse_source(source_path)
+    simplify_tolerance, optimizer_version = build_parameters(optimize_strokes, simplify_tolerance)
+    if simplify_tolerance > 0:
+        import path_simplifier
+        graphics = {name: path_simplifier.simplify(graphic, simplify_tolerance) for name, graphic in graphics.items()}
+    if optimize_strokes:
+        import stroke_optimizer
+        graphics = {name: stroke_optimizer.optimize(graphic) for name, graphic in graphics.items()}
+    header = np.zeros(1, dtype=HEADER_DTYPE)
+    header[0] = (MAGIC, VERSION, len(graphics), optimizer_version, *source_stamp(source_path), simplify_tolerance)
+    index = np.zeros(len(graphics), dtype=INDEX_DTYPE)
+    offset = 0
+    for i, (name, values) in enumerate(graphics.items()):
+        index[i] = (name.encode(), offset, len(values))
+        offset += len(values)
+    data = np.fromiter((v for values in graphics.values() for v in values), dtype=np.uint16, count=offset)
+
+    # Write to a temporary file first so a running process never maps a partial file
+    temp_path = f'{asset_path}.{os.getpid()}.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(header.tobytes())
+        f.write(index.tobytes())
+        f.write(data.tobytes())
+    os.replace(temp_path, asset_path)
+
+def _interpolate_objects_reference(obj: list[list[int]], seg_dist: int=8) -> list[list[int]]:
+    """The original per-segment implementation of laser_objects.interpolate_objects"""
+    result = [[obj[0][0], obj[0][1], obj[0][2]]]
+    for i in range(1, len(obj)):
+        num_segments = max(abs(obj[i-1][0] - obj[i][0]) // seg_dist, abs(obj[i-1][1] - obj[i][1]) // seg_dist) + 2
+        x_interp = np.linspace(obj[i-1][0], obj[i][0], num_segments)
+        y_interp = np.linspace(obj[i-1][1], obj[i][1], num_segments)
+        for x, y in zip(x_interp[1:], y_interp[1:]):
+            result.append([int(x), int(y), obj[i][2]])
+    return result
+
+def verify() -> bool:
+    """Checks that interpolate_objects matches the reference implementation for every graphic"""
+    import laser_objects
+    failures = 0
+    for name, graphic in parse_source().items():
+        for scale in [0.4, 0.5, 1]:
+            for seg_dist in [4, 8, 16]:
+                obj = laser_objects.convert_to_xy(graphic, scale, scale)
+                if not np.array_equal(laser_objects.interpolate_objects(obj, seg_dist),
+                                      _interpolate_objects_reference(obj, seg_dist)):
+                    print(f'{name} differs at scale {scale} and seg_dist {seg_dist}')
+                    failures += 1
+    return failures == 0
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compiles laser_objects_source.py into laser_objects.bin')
+    parser.add_argument('--verify', action='store_true', help='Check interpolate_objects against the reference implementation')
+    parser.add_argument('--no-optimize', action='store_true', help='Keep the strokes in their authored order')
+    parser.add_argument('--tolerance', type=float, default=None, help='Simplification tolerance in graphic units, 0 to disable')
+    args = parser.parse_args()
+
+    build(optimize_strokes=not args.no_optimize, simplify_tolerance=args.tolerance)
+    print(f'Built {ASSET_PATH}')
+    if args.verify:
+        if not verify():
+            raise SystemExit(1)
+        print('interpolate_objects matches the reference for every graphic')
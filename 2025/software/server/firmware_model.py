@@ -0,0 +1,43 @@
+"""Models the point queue of the laser firmware (see laser.c)"""
+
+import laser_point
+
+POINT_BUFFER_SIZE = 1000
+# 170 points at the firmware's 150 us per point, plus DAC write overhead
+PACKET_DELAY = 0.0258
+POINT_PERIOD = PACKET_DELAY / laser_point.POINTS_PER_PACKET
+
+class BufferModel:
+    """Predicts how many points are queued on one laser and when to send it the next packet"""
+    def __init__(self, point_period: float = POINT_PERIOD, capacity: int = POINT_BUFFER_SIZE,
+                 target_fill: int = POINT_BUFFER_SIZE // 2) -> None:
+        self.point_period = point_period
+        self.capacity = capacity
+        self.target_fill = target_fill
+        self.level = 0
+        self.last_update = None
+        self.overflow_points = 0
+        self.underrun_time = 0
+
+    def update(self, now: float) -> float:
+        """Drains the modelled queue up to now and returns the predicted fill level"""
+        if self.last_update is not None:
+            drained = (now - self.last_update) / self.point_period
+            if drained > self.level:
+                self.underrun_time += (drained - self.level) * self.point_period
+            self.level = max(self.level - drained, 0)
+        self.last_update = now
+        return self.level
+
+    def on_send(self, now: float, num_points: int = laser_point.POINTS_PER_PACKET) -> None:
+        self.update(now)
+        self.level += num_points
+        if self.level > self.capacity:
+            self.overflow_points += self.level - self.capacity
+            self.level = self.capacity
+
+    def next_send_time(self, num_points: int = laser_point.POINTS_PER_PACKET) -> float:
+        """Returns when the queue will have drained enough that a packet brings it back to the target fill"""
+        if self.last_update is None:
+            return 0
+        return self.last_update + max(self.level + num_points - self.target_fill, 0) * self.point_period
@@ -0,0 +1,129 @@
+"""Resamples laser graphics into points using a simple model of the galvo mirrors
+
+interpolate_objects places a point every seg_dist units on every segment. Here lit
+segments instead follow a trapezoidal velocity profile: the galvos accelerate along
+straight runs up to a maximum step per point and slow down into corners, where a few
+points dwell in proportion to how sharp the turn is. Blanked jumps move in large steps
+and then hold on the destination for settle points in proportion to the jump length.
+
+All distances are in DAC units and all times in points, so velocities are in units per
+point and accelerations in units per point squared."""
+
+import math
+import numpy as np
+
+LIT_MAX_STEP = 12.0
+LIT_ACCELERATION = 4.0
+# Points held on a vertex where the path reverses, fewer for gentler turns
+CORNER_DWELL = 2
+BLANK_MAX_STEP = 48.0
+# A blanked jump holds on its destination for one point per this many units of travel
+BLANK_SETTLE_DISTANCE = 128.0
+
+def blank_jump_points(distance: float) -> int:
+    """Returns how many points resample spends on a blanked jump of a given length, moving and then settling"""
+    return max(1, math.ceil(distance / BLANK_MAX_STEP - 1e-9)) + math.ceil(distance / BLANK_SETTLE_DISTANCE)
+
+def parameters() -> tuple[float, ...]:
+    """Returns the settings that shape the resampled points, for caches of resampled graphics to key on"""
+    return (LIT_MAX_STEP, LIT_ACCELERATION, CORNER_DWELL, BLANK_MAX_STEP, BLANK_SETTLE_DISTANCE)
+
+def _corner_speeds(deltas: np.ndarray, lengths: np.ndarray, lit: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the speed allowed through each vertex and the turn angle at it, zero between unlit segments"""
+    speeds = np.zeros(len(lengths) + 1)
+    angles = np.zeros(len(lengths) + 1)
+    inner = lit[:-1] & lit[1:] & (lengths[:-1] > 0) & (lengths[1:] > 0)
+    if inner.any():
+        dots = np.einsum('ij,ij->i', deltas[:-1], deltas[1:])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cosines = np.clip(dots / (lengths[:-1] * lengths[1:]), -1, 1)
+        angles[1:-1] = np.where(inner, np.arccos(cosines), 0)
+        speeds[1:-1] = np.where(inner, LIT_MAX_STEP * np.maximum(cosines, 0), 0)
+
+    # Limit each speed to what the galvos can reach from the neighbouring vertices
+    for i in range(len(lengths)):
+        if lit[i]:
+            speeds[i + 1] = min(speeds[i + 1], math.sqrt(speeds[i] ** 2 + 2 * LIT_ACCELERATION * lengths[i]))
+    for i in reversed(range(len(lengths))):
+        if lit[i]:
+            speeds[i] = min(speeds[i], math.sqrt(speeds[i + 1] ** 2 + 2 * LIT_ACCELERATION * lengths[i]))
+    return speeds, angles
+
+def resample(obj: list[list[int]]) -> np.ndarray:
+    """Converts a list of x, y, on points into an (N, 3) array of points for the galvos to follow"""
+    points = np.asarray(obj)
+    deltas = np.diff(points[:, :2], axis=0).astype(np.float64)
+    lengths = np.hypot(deltas[:, 0], deltas[:, 1])
+    lit = points[1:, 2] != 0
+    speeds, angles = _corner_speeds(deltas, lengths, lit)
+    v0, v1 = speeds[:-1], speeds[1:]
+
+    # Peak speed of the trapezoid, lowered into a triangle when the segment is too short to reach the maximum
+    peak = np.minimum(LIT_MAX_STEP, np.sqrt(LIT_ACCELERATION * lengths + (v0 ** 2 + v1 ** 2) / 2))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        accelerate_time = (peak - v0) / LIT_ACCELERATION
+        decelerate_time = (peak - v1) / LIT_ACCELERATION
+        accelerate_distance = (peak ** 2 - v0 ** 2) / (2 * LIT_ACCELERATION)
+        decelerate_distance = (peak ** 2 - v1 ** 2) / (2 * LIT_ACCELERATION)
+        cruise_time = np.where(peak > 0, (lengths - accelerate_distance - decelerate_distance) / peak, 0)
+    duration = accelerate_time + cruise_time + decelerate_time
+    # Blanked segments take the same number of points as blank_jump_points gives
+    moves = np.maximum(1, np.ceil(np.where(lit, duration, lengths / BLANK_MAX_STEP) - 1e-9)).astype(np.int64)
+
+    # Blanked jumps are linear, which the trapezoid gives with no acceleration phases
+    acceleration = np.where(lit, LIT_ACCELERATION, 0)
+    v0 = np.where(lit, v0, lengths / moves)
+    peak = np.where(lit, peak, lengths / moves)
+    accelerate_time = np.where(lit, accelerate_time, 0)
+    accelerate_distance = np.where(lit, accelerate_distance, 0)
+    cruise_time = np.where(lit, cruise_time, moves)
+    duration = np.where(lit, duration, moves)
+
+    # Dwell on lit corners, and on the end of each lit run, then settle at the end of blanked jumps
+    run_ends = lit & ~np.append(lit[1:], False)
+    dwell = np.where(run_ends, CORNER_DWELL, np.rint(CORNER_DWELL * angles[1:] / np.pi)).astype(np.int64)
+    holds = np.where(lit, dwell, np.ceil(lengths / BLANK_SETTLE_DISTANCE)).astype(np.int64)
+
+    counts = moves + holds
+    segment = np.repeat(np.arange(len(counts)), counts)
+    k = np.arange(1, len(segment) + 1) - np.repeat(np.cumsum(counts) - counts, counts)
+    t = np.minimum(k, moves[segment]) * (duration / moves)[segment]
+
+    ta, tc, u0, vp, a = accelerate_time[segment], cruise_time[segment], v0[segment], peak[segment], acceleration[segment]
+    da = accelerate_distance[segment]
+    decelerating = t - ta - tc
+    s = np.where(t < ta, u0 * t + a * t ** 2 / 2,
+                 np.where(decelerating <= 0, da + vp * (t - ta),
+                          da + vp * tc + vp * decelerating - a * decelerating ** 2 / 2))
+    # Land exactly on each vertex, whatever rounding the profile picked up
+    s = np.where(k >= moves[segment], lengths[segment], np.minimum(s, lengths[segment]))
+
+    result = np.empty((len(segment) + 1, 3), dtype=np.int32)
+    result[0] = points[0]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        directions = np.where(lengths[:, None] > 0, deltas / lengths[:, None], 0)
+    result[1:, :2] = np.rint(points[:-1, :2][segment] + directions[segment] * s[:, None])
+    result[1:, 2] = points[1:, 2][segment]
+    return result
+
+if __name__ == '__main__':
+    import argparse
+    import build_laser_objects
+    import firmware_model
+    import laser_objects
+    parser = argparse.ArgumentParser(description='Compares the points drawn per loop with interpolate_objects')
+    parser.add_argument('--scale', type=float, default=0.5)
+    args = parser.parse_args()
+
+    print(f'{"graphic":>24} {"points":>7} {"resampled":>9} {"loop Hz":>8} {"resampled":>9} {"saved":>6} {"max step":>8}')
+    total, total_resampled = 0, 0
+    for name in build_laser_objects.parse_source():
+        obj = laser_objects.convert_to_xy(getattr(laser_objects, name), args.scale, args.scale)
+        points, resampled = laser_objects.interpolate_objects(obj), resample(obj)
+        total += len(points)
+        total_resampled += len(resampled)
+        steps = np.hypot(*np.diff(resampled[:, :2], axis=0).T)[resampled[1:, 2] != 0]
+        rate, resampled_rate = 1 / (len(points) * firmware_model.POINT_PERIOD), 1 / (len(resampled) * firmware_model.POINT_PERIOD)
+        print(f'{name:>24} {len(points):7d} {len(resampled):9d} {rate:8.1f} {resampled_rate:9.1f} '
+              f'{1 - len(resampled) / len(points):6.1%} {steps.max() if len(steps) else 0:8.1f}')
+    print(f'{"total":>24} {total:7d} {total_resampled:9d} {"":>8} {"":>9} {1 - total_resampled / total:6.1%}')
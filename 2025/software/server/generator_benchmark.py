@@ -0,0 +1,219 @@
+"""Benchmarks the laser generators headlessly and compares them against a stored baseline"""
+
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import time
+import numpy as np
+import firmware_model
+import laser_generators
+import laser_point
+import laser_server
+import packet_ring
+import packet_sender
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'generator_benchmark_baseline.json')
+NUM_LASERS = 3
+BENCHMARK_PACKETS = 200
+# Fast generators keep running past BENCHMARK_PACKETS until a run lasts this long, so timer noise stays small
+MIN_RUN_SECONDS = 0.25
+# Each benchmark is repeated and the median run is kept, to filter out scheduling noise
+REPEATS = 7
+# A generator fails if it runs this much slower than its baseline
+REGRESSION_TOLERANCE = 0.5
+REALTIME_PACKETS_PER_SECOND = 1 / firmware_model.PACKET_DELAY
+REALTIME_POINTS_PER_SECOND = REALTIME_PACKETS_PER_SECOND * laser_point.POINTS_PER_PACKET
+
+class FakeClock:
+    """Stands in for the time module so generators see time pass at the laser point rate"""
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def time(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+class StubSong:
+    """Song that plays a sine sweep instead of an audio file"""
+    def __init__(self, clock: FakeClock) -> None:
+        self.clock = clock
+        self.author = 'Stub Artist'
+        self.title = 'Sine Sweep'
+
+    def get_envelope(self, blocksize: int, interval: int, decay: float) -> list[float]:
+        phase = self.clock.time() * 2
+        return [abs(math.sin(phase + i / 16)) for i in range(blocksize // interval)]
+
+    def center_on_peak(self, data: list[float], search_area: int) -> list[float]:
+        return data
+
+class StubEffect:
+    """Effect that is always playing at a fixed amplitude"""
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def is_playing(self) -> bool:
+        return True
+
+    def get_amplitude(self, blocksize: int, interval: int) -> float:
+        return 0.5
+
+class StubWand:
+    """Wand that draws a circle on one laser"""
+    def __init__(self, laser_id: int, clock: FakeClock) -> None:
+        self.laser_id = laser_id
+        self.clock = clock
+        self.button = False
+
+    def get_laser_point(self) -> laser_point.LaserPoint:
+        angle = self.clock.time()
+        return laser_point.LaserPoint(self.laser_id, 2048 + 500 * math.cos(angle), 2048 + 500 * math.sin(angle), 255, 0, 0)
+
+class StubSoundPlayer:
+    def play_pong_sound(self, key: str) -> None:
+        pass
+
+class NullSocket:
+    """Connected socket that discards everything sent to it"""
+    def send(self, data) -> int:
+        return len(data)
+
+    def close(self) -> None:
+        pass
+
+def fireworks(num_lasers: int):
+    """Repeats add_fireworks, which otherwise ends after one burst"""
+    while True:
+        yield from laser_generators.add_fireworks(num_lasers, 0, 2048, 2048)
+
+GENERATORS = {
+    'audio_visualization': laser_generators.audio_visualization,
+    'equations': laser_generators.equations,
+    'spirograph': laser_generators.spirograph,
+    'pong': laser_generators.pong,
+    'drums_graphics': laser_generators.drums_graphics,
+    'wand_drawing': laser_generators.wand_drawing,
+    'calibration': laser_generators.calibration,
+    'song_ticker': laser_generators.song_ticker,
+    'sprites': laser_generators.sprites,
+    'add_fireworks': fireworks,
+}
+
+def clocked(gen, clock: FakeClock):
+    """Advances the clock by the time the lasers take to draw each item of gen"""
+    for item in gen:
+        yield item
+        count = item.shape[1] if isinstance(item, np.ndarray) else 1
+        clock.advance(count * firmware_model.POINT_PERIOD)
+
+def create(name: str, clock: FakeClock):
+    """Creates a generator with stubbed inputs and runs its setup, returning it and the setup time"""
+    random.seed(0)
+    laser_generators.time = clock
+    laser_generators.current_song = StubSong(clock)
+    laser_generators.current_effect = StubEffect('SOUND big gong')
+    laser_generators.current_wands = {i: StubWand(i, clock) for i in range(2)}
+    laser_generators.song_handler = StubSoundPlayer()
+    start = time.perf_counter()
+    gen = clocked(GENERATORS[name](NUM_LASERS), clock)
+    next(gen)
+    return gen, time.perf_counter() - start
+
+def benchmark_points(name: str) -> tuple[float, float]:
+    """Returns the setup time and the points per second of a generator on its own"""
+    clock = FakeClock()
+    gen, setup_time = create(name, clock)
+    target = BENCHMARK_PACKETS * laser_point.POINTS_PER_PACKET
+    rates = []
+    for _ in range(REPEATS):
+        points = 0
+        start = time.perf_counter()
+        while points < target or time.perf_counter() - start < MIN_RUN_SECONDS:
+            item = next(gen)
+            points += item.shape[1] if isinstance(item, np.ndarray) else 1
+        rates.append(points / (time.perf_counter() - start))
+    return setup_time, statistics.median(rates)
+
+def benchmark_packets(name: str) -> float:
+    """Returns the packets per second of a generator encoded into the ring and sent to null sockets"""
+    clock = FakeClock()
+    gen, _ = create(name, clock)
+    ring = packet_ring.PacketRing(4, NUM_LASERS)
+    encoder = laser_server.create_encoder(NUM_LASERS)
+    sender = packet_sender.PacketSender(ring, [], [NullSocket() for _ in range(NUM_LASERS)])
+    due = [True] * NUM_LASERS
+    rates = []
+    for _ in range(REPEATS):
+        packets = 0
+        start = time.perf_counter()
+        while packets < BENCHMARK_PACKETS or time.perf_counter() - start < MIN_RUN_SECONDS:
+            laser_server.fill_ring(ring, encoder, gen)
+            sender.send(due)
+            packets += 1
+        rates.append(packets / (time.perf_counter() - start))
+    sender.close()
+    return statistics.median(rates)
+
+def run() -> dict:
+    original_time = laser_generators.time
+    try:
+        results = {}
+        for name in GENERATORS:
+            setup_time, points_per_second = benchmark_points(name)
+            packets_per_second = benchmark_packets(name)
+            results[name] = {'setup_ms': setup_time * 1000,
+                             'points_per_second': points_per_second,
+                             'us_per_point': 1e6 / points_per_second,
+                             'packets_per_second': packets_per_second}
+        return results
+    finally:
+        laser_generators.time = original_time
+
+def check(results: dict, baseline: dict) -> list[str]:
+    """Returns a description of every generator that is below real-time or regressed from the baseline"""
+    failures = []
+    for name, result in results.items():
+        if result['packets_per_second'] < REALTIME_PACKETS_PER_SECOND:
+            failures.append(f'{name} sends {result["packets_per_second"]:.1f} packets/s, '
+                            f'below the real-time rate of {REALTIME_PACKETS_PER_SECOND:.1f}')
+        if name not in baseline:
+            continue
+        for key in ['points_per_second', 'packets_per_second']:
+            floor = baseline[name][key] * (1 - REGRESSION_TOLERANCE)
+            if result[key] < floor:
+                failures.append(f'{name} {key} dropped to {result[key]:.0f} from a baseline of {baseline[name][key]:.0f}')
+    return failures
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmarks the laser generators against a stored baseline')
+    parser.add_argument('--save', action='store_true', help='Store the results as the new baseline')
+    args = parser.parse_args()
+
+    results = run()
+    print(f'{"generator":>20} {"setup ms":>9} {"points/s":>10} {"us/point":>9} {"packets/s":>10}')
+    for name, result in results.items():
+        print(f'{name:>20} {result["setup_ms"]:9.1f} {result["points_per_second"]:10.0f} '
+              f'{result["us_per_point"]:9.2f} {result["packets_per_second"]:10.1f}')
+    print(f'Real-time needs {REALTIME_POINTS_PER_SECOND:.0f} points/s and {REALTIME_PACKETS_PER_SECOND:.1f} packets/s')
+
+    if args.save:
+        with open(BASELINE_PATH, 'w') as f:
+            json.dump(results, f, indent=4)
+        print(f'Saved baseline to {BASELINE_PATH}')
+        sys.exit(0)
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)
+    if failures := check(results, baseline):
+        for failure in failures:
+            print(f'FAIL: {failure}')
+        sys.exit(1)
+    print('All generators are within their baseline')
@@ -0,0 +1,81 @@
+"""Defines caches of graphics preprocessed and rendered to point arrays"""
+
+import glob
+import os
+import tempfile
+import zlib
+from collections import OrderedDict
+import numpy as np
+import galvo_resampler
+import laser_objects
+
+CACHE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'graphics_cache')
+# Bump when the code of convert_to_xy or galvo_resampler changes its output, changes to the
+# resampler's parameters are already part of the key
+CACHE_VERSION = 3
+
+def interpolated(name: str, graphic: list[int], scale: float) -> np.ndarray:
+    """Returns a graphic passed through convert_to_xy and galvo_resampler.resample as an (N, 3) array.
+
+    Results are kept on disk, keyed by a hash of the graphic's contents and the resampler
+    parameters so that editing either invalidates them."""
+    data = np.asarray(graphic, dtype=np.uint16).tobytes() + np.array(galvo_resampler.parameters(), dtype=np.float64).tobytes()
+    path = os.path.join(CACHE_DIRECTORY, f'{name}_{scale}_v{CACHE_VERSION}_{zlib.crc32(data):08x}.npy')
+    try:
+        return np.load(path)
+    except (OSError, ValueError):
+        pass
+
+    points = np.array(galvo_resampler.resample(laser_objects.convert_to_xy(graphic, scale, scale)), dtype=np.int32)
+    os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+    # Renders of this graphic and scale from any other version or parameters are stale. Other
+    # threads and processes may be storing the same graphic, so files they already removed or
+    # replaced are not an error, and each writer gets its own temp file
+    for stale in glob.glob(os.path.join(CACHE_DIRECTORY, f'{glob.escape(f"{name}_{scale}")}_*v*.npy')):
+        if stale != path:
+            try:
+                os.remove(stale)
+            except FileNotFoundError:
+                pass
+    fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=CACHE_DIRECTORY)
+    with os.fdopen(fd, 'wb') as f:
+        np.save(f, points)
+    try:
+        os.replace(temp_path, path)
+    except FileNotFoundError:
+        pass
+    return points
+
+class GraphicCache:
+    """LRU cache of interpolated graphics rendered to (N, 5) arrays of x, y, r, g, b values"""
+    def __init__(self, max_entries: int = 64) -> None:
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f'GraphicCache(Entries: {len(self.entries)}, Hits: {self.hits}, Misses: {self.misses})'
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0
+
+    def get(self, name: str, scale: float, color: list[int], graphic: list[list[int]]) -> np.ndarray:
+        """Returns the points of an interpolated graphic drawn in a color, rendering it on a miss"""
+        key = (name, scale, tuple(color))
+        if (points := self.entries.get(key)) is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return points
+
+        self.misses += 1
+        xyon = np.array(graphic, dtype=np.int32)
+        points = np.zeros((len(xyon), 5), dtype=np.int32)
+        points[:, :2] = xyon[:, :2]
+        points[:, 2:] = np.outer(xyon[:, 2] != 0, color)
+        self.entries[key] = points
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return points
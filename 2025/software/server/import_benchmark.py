@@ -0,0 +1,31 @@
+"""Measures how long the modules the server and simulators depend on take to import"""
+
+import argparse
+import subprocess
+import sys
+
+MODULES = ['sierpinski', 'laser_generators', 'wand', 'laser_server']
+REPEATS = 5
+
+def import_time(module: str) -> float:
+    """Returns the fastest of REPEATS imports of module in a fresh interpreter, in seconds"""
+    code = f'import time\nimport numpy\nstart = time.perf_counter()\nimport {module}\nprint(time.perf_counter() - start)'
+    best = None
+    for _ in range(REPEATS):
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+        if result.returncode != 0:
+            raise ImportError(result.stderr.strip().splitlines()[-1])
+        elapsed = float(result.stdout.strip().splitlines()[-1])
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measures the import time of each module, numpy excluded')
+    parser.add_argument('modules', nargs='*', default=MODULES)
+    args = parser.parse_args()
+
+    for module in args.modules:
+        try:
+            print(f'{module:>20} {import_time(module) * 1000:8.1f} ms')
+        except ImportError as e:
+            print(f'{module:>20} {"":>8}    {e}')
@@ -0,0 +1,99 @@
+"""This module emulates the receive queue of the laser firmware (laser.c) over local UDP"""
+
+import argparse
+import socket
+import threading
+import time
+import firmware_model
+
+class LaserEmulator:
+    """Receives packets like the firmware does and drains its point queue at a fixed rate"""
+    def __init__(self, laser_index: int, drift_ppm: float = 0,
+                 capacity: int = firmware_model.POINT_BUFFER_SIZE) -> None:
+        self.laser_index = laser_index
+        self.port = 8090 + laser_index
+        self.point_period = firmware_model.POINT_PERIOD / (1 + drift_ppm / 1e6)
+        self.capacity = capacity
+        self.level = 0
+        self.last_drain = time.monotonic()
+        self.curr_seq = 0
+        self.packets = 0
+        self.seq_drops = 0
+        self.overflow_points = 0
+        self.underrun_points = 0
+        self.lock = threading.Lock()
+        self.running = False
+        self.thread = threading.Thread(target=self._receive_thread, daemon=True)
+
+    def __repr__(self) -> str:
+        return (f'LaserEmulator(Laser: {self.laser_index}, Fill: {int(self.level)}, Packets: {self.packets}, '
+                f'Seq drops: {self.seq_drops}, Overflow: {int(self.overflow_points)}, Underrun: {int(self.underrun_points)})')
+
+    def start(self) -> None:
+        if not self.running:
+            self.running = True
+            self.thread.start()
+
+    def stop(self) -> None:
+        if self.running:
+            self.running = False
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.sendto(bytes([]), ('127.0.0.1', self.port))
+            sock.close()
+            self.thread.join()
+
+    def drain(self) -> float:
+        """Plays out the points that the firmware would have consumed since the last drain"""
+        with self.lock:
+            now = time.monotonic()
+            drained = (now - self.last_drain) / self.point_period
+            self.last_drain = now
+            # Only count starvation once the laser has started receiving data
+            if drained > self.level and self.packets > 0:
+                self.underrun_points += drained - self.level
+            self.level = max(self.level - drained, 0)
+            return self.level
+
+    def _receive_thread(self) -> None:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind(('127.0.0.1', self.port))
+        while self.running:
+            data, _ = sock.recvfrom(1024)
+            if len(data) == 0:
+                continue
+
+            # Same check as laser.c, where curr_seq + 1 is not wrapped to 8 bits
+            new_seq = data[0]
+            if new_seq != self.curr_seq + 1:
+                self.curr_seq = new_seq
+                self.seq_drops += 1
+                continue
+            self.curr_seq = new_seq
+
+            self.drain()
+            with self.lock:
+                self.packets += 1
+                self.level += (len(data) - 1) // 6
+                if self.level > self.capacity:
+                    self.overflow_points += self.level - self.capacity
+                    self.level = self.capacity
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Emulates laser firmware point queues on local UDP ports')
+    parser.add_argument('--lasers', type=int, default=3)
+    parser.add_argument('--drift', type=float, nargs='*', default=[], help='Clock drift in ppm for each laser')
+    args = parser.parse_args()
+
+    drifts = args.drift + [0] * (args.lasers - len(args.drift))
+    emulators = [LaserEmulator(i, drifts[i]) for i in range(args.lasers)]
+    for e in emulators:
+        e.start()
+    try:
+        while True:
+            time.sleep(1)
+            for e in emulators:
+                e.drain()
+                print(e)
+    except KeyboardInterrupt:
+        for e in emulators:
+            e.stop()
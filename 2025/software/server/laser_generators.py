@@ -7,15 +7,28 @@ import numpy as np
 from laser_point import *
 from laser_objects import *
 from typing import Generator
+import galvo_resampler
+import graphic_cache
+import laser_sprites
+import laser_text
 import sierpinski
+import surface_clipper
 
 song_handler = None
 current_effect = None
 current_song = None
 current_wands = None
+graphics = graphic_cache.GraphicCache()
+
+def copy_points(block: np.ndarray, start: int, points: np.ndarray, index: int, count: int, offset: list[int]) -> None:
+    """Copies count cached points from index into a laser's block row, shifted by offset"""
+    np.add(points[index:index + count, :2], offset, out=block[start:start + count, :2], casting='unsafe')
+    block[start:start + count, 2:] = points[index:index + count, 2:]
 
 def verify_points(points: list[LaserPoint]) -> list[LaserPoint]:
-    """Constrains point values to valid ranges"""
+    """Constrains point values to valid ranges, generators yielding a LaserFrame should use its clamp instead"""
+    if isinstance(points, LaserFrame):
+        return points.clamp()
     for p in points:
         p.x = int(min(max(p.x, 0), 4095))
         p.y = int(min(max(p.y, 0), 4095))
@@ -24,7 +37,7 @@ def verify_points(points: list[LaserPoint]) -> list[LaserPoint]:
         p.b = int(min(max(p.b, 0), 255))
     return points
 
-def drums_graphics(num_lasers: int) -> Generator[list[LaserPoint], None, None]:
+def drums_graphics(num_lasers: int) -> Generator[np.ndarray, None, None]:
     """Generates a graphic based on the audio played"""
     min_x, max_x, min_y, max_y = sierpinski.get_laser_min_max_interior()
     x_offset = (min_x + max_x) // 2
@@ -59,10 +72,10 @@ def drums_graphics(num_lasers: int) -> Generator[list[LaserPoint], None, None]:
     }
 
     for g in graphic_list:
-        graphic_list[g] = interpolate_objects(convert_to_xy(graphic_list[g], x_scale=0.4, y_scale=0.4))
+        graphic_list[g] = graphic_cache.interpolated(g, graphic_list[g], 0.4)
     
+    block = np.zeros((num_lasers, POINTS_PER_PACKET, 5), dtype=np.int32)
     point_idxs = [0 for _ in range(num_lasers)]
-    current_graphic = None
     current_color = None
     last_effect_name = None
     
@@ -72,18 +85,19 @@ def drums_graphics(num_lasers: int) -> Generator[list[LaserPoint], None, None]:
             if effect_name != last_effect_name:
                 last_effect_name = effect_name
                 point_idxs = [0 for _ in range(num_lasers)]
-                current_graphic = graphic_list[effect_name]
                 current_color = random.choice(colors)
-            output = []
+            points = graphics.get(effect_name, 0.4, current_color, graphic_list[effect_name])
             for i in range(num_lasers):
-                x, y, on = current_graphic[point_idxs[i]]
-                x += x_offset
-                y += y_offset
-                output.append(LaserPoint(i, x, y, *(current_color if on else [0, 0, 0])))
-                point_idxs[i] = (point_idxs[i] + 1) % len(current_graphic)
-            yield verify_points(output)
+                filled = 0
+                while filled < POINTS_PER_PACKET:
+                    count = min(POINTS_PER_PACKET - filled, len(points) - point_idxs[i])
+                    copy_points(block[i], filled, points, point_idxs[i], count, [x_offset, y_offset])
+                    filled += count
+                    point_idxs[i] = (point_idxs[i] + count) % len(points)
+            np.clip(block[:, :, :2], 0, 4095, out=block[:, :, :2])
         else:
-            yield verify_points([LaserPoint(i) for i in range(num_lasers)])
+            block[:] = 0
+        yield block
 
 def drums_simple(num_lasers: int) -> Generator[list[LaserPoint], None, None]:
     """Generates an audio-reactive rgb circle"""
@@ -110,7 +124,7 @@ def drums_simple(num_lasers: int) -> Generator[list[LaserPoint], None, None]:
         yield verify_points([LaserPoint(i, x, y, r * 255, g * 255, b * 255) for i in range(num_lasers)])
         d = (d + 8) % 360
 
-def equations(num_lasers: int) -> Generator[list[LaserPoint], None, None]:
+def equations(num_lasers: int) -> Generator[np.ndarray, None, None]:
     """Generates equation graphics on three lasers"""
     min_x, max_x, min_y, max_y = sierpinski.get_laser_min_max_interior()
     colors = [[0, 0, 255], [0, 255, 0], [255, 0, 0], [0, 255, 255], [255, 255, 0], [255, 0, 255], [255, 255, 255]]
@@ -121,9 +135,10 @@ def equations(num_lasers: int) -> Generator[list[LaserPoint], None, None]:
                       EQN_25, EQN_26, EQN_27, EQN_28, EQN_29, EQN_30, EQN_31, EQN_32, 
                       EQN_33, EQN_34, EQN_35, EQN_36 ]
     
-    scaled_equations = [interpolate_objects(convert_to_xy(eq, x_scale=0.5, y_scale=0.5)) for eq in equation_list]
+    scaled_equations = [graphic_cache.interpolated(f'EQN_{i + 1:02d}', eq, 0.5) for i, eq in enumerate(equation_list)]
     equation_sizes = [get_size(eq) for eq in scaled_equations]
     
+    block = np.zeros((num_lasers, POINTS_PER_PACKET, 5), dtype=np.int32)
     point_idxs = [0 for _ in range(num_lasers)]
     offsets = [[(min_x + max_x) // 2, (min_y + max_y) // 2] for _ in range(num_lasers)]
     dirs = [[2, 2] for _ in range(num_lasers)]
@@ -139,27 +154,98 @@ def equations(num_lasers: int) -> Generator[list[LaserPoint], None, None]:
                 point_idxs[i] = 0
             next_update = time.time() + 30
 
-        output = []
         for i in range(num_lasers):
-            x, y, on = scaled_equations[eqn_idxs[i]][point_idxs[i]]
-            x += offsets[i][0]
-            y += offsets[i][1]
-            output.append(LaserPoint(i, x, y, *(colors[color_idxs[i]] if on else [0, 0, 0])))
-
-            point_idxs[i] = (point_idxs[i] + 1) % len(scaled_equations[eqn_idxs[i]])
-            if point_idxs[i] == 0:
-                offsets[i][0] += dirs[i][0]
-                offsets[i][1] += dirs[i][1]
-                if offsets[i][0] + equation_sizes[eqn_idxs[i]][0] / 2 > max_x and dirs[i][0] > 0:
-                    dirs[i][0] *= -1
-                elif offsets[i][0] - equation_sizes[eqn_idxs[i]][0] / 2 < min_x and dirs[i][0] < 0:
-                    dirs[i][0] *= -1
-                if offsets[i][1] + equation_sizes[eqn_idxs[i]][1] / 2 > max_y and dirs[i][1] > 0:
-                    dirs[i][1] *= -1
-                elif offsets[i][1] - equation_sizes[eqn_idxs[i]][1] / 2 < min_y and dirs[i][1] < 0:
-                    dirs[i][1] *= -1
-
-        yield verify_points(output)
+            points = graphics.get(f'EQN_{eqn_idxs[i] + 1:02d}', 0.5, colors[color_idxs[i]], scaled_equations[eqn_idxs[i]])
+            filled = 0
+            while filled < POINTS_PER_PACKET:
+                count = min(POINTS_PER_PACKET - filled, len(points) - point_idxs[i])
+                copy_points(block[i], filled, points, point_idxs[i], count, offsets[i])
+                filled += count
+
+                point_idxs[i] = (point_idxs[i] + count) % len(points)
+                if point_idxs[i] == 0:
+                    offsets[i][0] += dirs[i][0]
+                    offsets[i][1] += dirs[i][1]
+                    if offsets[i][0] + equation_sizes[eqn_idxs[i]][0] / 2 > max_x and dirs[i][0] > 0:
+                        dirs[i][0] *= -1
+                    elif offsets[i][0] - equation_sizes[eqn_idxs[i]][0] / 2 < min_x and dirs[i][0] < 0:
+                        dirs[i][0] *= -1
+                    if offsets[i][1] + equation_sizes[eqn_idxs[i]][1] / 2 > max_y and dirs[i][1] > 0:
+                        dirs[i][1] *= -1
+                    elif offsets[i][1] - equation_sizes[eqn_idxs[i]][1] / 2 < min_y and dirs[i][1] < 0:
+                        dirs[i][1] *= -1
+
+        np.clip(block[:, :, :2], 0, 4095, out=block[:, :, :2])
+        yield block
+
+def song_ticker(num_lasers: int) -> Generator[np.ndarray, None, None]:
+    """Scrolls the artist and title of the current song across every laser"""
+    min_x, max_x, min_y, max_y = sierpinski.get_laser_min_max_interior()
+    scale = 0.25
+    speed = 400
+    y_offset = (min_y + max_y - laser_text.GLYPH_HEIGHT * scale) // 2
+    colors = np.array([[0, 0, 255], [0, 255, 0], [255, 0, 0]])[np.arange(num_lasers) % 3]
+
+    block = np.zeros((num_lasers, POINTS_PER_PACKET, 5), dtype=np.int32)
+    song_text = None
+    while True:
+        if (new_text := f'{current_song.author} {current_song.title}' if current_song else 'Jukebox') != song_text:
+            song_text = new_text
+            text = ''.join(map(laser_text.glyph_char, song_text))
+            positions, width = laser_text.layout(text)
+            start_time = time.time()
+            window = None
+
+        # The text moves on every block, and only the characters inside the window are drawn
+        left = max_x - (time.time() - start_time) * speed % (width * scale + max_x - min_x)
+        visible = [i for i, p in enumerate(positions)
+                   if left + p * scale < max_x and left + (p + laser_text.glyph_width(text[i])) * scale > min_x]
+        if (new_window := (visible[0], visible[-1] + 1) if visible else (0, 0)) != window:
+            # Each run of characters is compiled once, and drawing restarts from its first point
+            window = new_window
+            points = laser_text.compile_text(text[window[0]:window[1]], scale)
+            index = 0
+        offset = [left + positions[window[0]] * scale, y_offset]
+
+        filled = 0
+        while filled < POINTS_PER_PACKET:
+            count = min(POINTS_PER_PACKET - filled, len(points) - index)
+            block[:, filled:filled + count, :2] = points[index:index + count, :2] + offset
+            block[:, filled:filled + count, 2:] = points[index:index + count, 2, None] * colors[:, None, :]
+            filled += count
+            index = (index + count) % len(points)
+
+        # Characters crossing the edges of the window are cut off by blanking their points outside it
+        outside = (block[:, :, 0] < min_x) | (block[:, :, 0] > max_x)
+        block[outside, 2:] = 0
+        np.clip(block[:, :, :2], 0, 4095, out=block[:, :, :2])
+        yield block
+
+def sprites(num_lasers: int) -> Generator[np.ndarray, None, None]:
+    """Plays a sprite animation on each laser, drifting along its own Lissajous path"""
+    min_x, max_x, min_y, max_y = sierpinski.get_laser_min_max_interior()
+    names = list(laser_sprites.ANIMATIONS)
+    animations = [laser_sprites.compile_sprite(names[i % len(names)], 0.3) for i in range(num_lasers)]
+    # Frequencies of the x and y motion in Hz, and the phase each laser starts at
+    motions = [(0.05 + 0.02 * i, 0.13 + 0.03 * i, i * np.pi / 3) for i in range(num_lasers)]
+
+    block = np.zeros((num_lasers, POINTS_PER_PACKET, 5), dtype=np.int32)
+    point_idxs = [0 for _ in range(num_lasers)]
+    start_time = time.time()
+    while True:
+        t = time.time() - start_time
+        for i, sprite in enumerate(animations):
+            fx, fy, phase = motions[i]
+            offset = [(min_x + max_x) / 2 + max(0, max_x - min_x - sprite.size[0]) / 2 * np.sin(2 * np.pi * fx * t + phase),
+                      (min_y + max_y) / 2 + max(0, max_y - min_y - sprite.size[1]) / 2 * np.sin(2 * np.pi * fy * t + phase)]
+            filled = 0
+            while filled < POINTS_PER_PACKET:
+                count = min(POINTS_PER_PACKET - filled, len(sprite.timeline) - point_idxs[i])
+                copy_points(block[i], filled, sprite.timeline, point_idxs[i], count, offset)
+                filled += count
+                point_idxs[i] = (point_idxs[i] + count) % len(sprite.timeline)
+        np.clip(block[:, :, :2], 0, 4095, out=block[:, :, :2])
+        yield block
 
 class Spirograph:
     def __init__(self, r1: float, r2: float, a: float, t_d: float) -> None:
@@ -196,7 +282,7 @@ class Spirograph:
         self.y = y * y_scale + y_offset
         return (self.x, self.y)
 
-def spirograph(num_lasers: int) -> Generator[list[LaserPoint], None, None]:
+def spirograph(num_lasers: int) -> Generator[LaserFrame, None, None]:
     """Generates random spirographs"""
     min_x, max_x, min_y, max_y = sierpinski.get_laser_min_max_interior()
 
@@ -220,6 +306,7 @@ def spirograph(num_lasers: int) -> Generator[list[LaserPoint], None, None]:
     iteration = 0
     point_mode = True
     next_update = 0
+    frame = LaserFrame(num_lasers)
 
     while True:
         if time.time() > next_update:
@@ -227,18 +314,17 @@ def spirograph(num_lasers: int) -> Generator[list[LaserPoint], None, None]:
             next_update = time.time() + 30
 
         iteration += 1
-        output = []
 
         for i in range(num_lasers):  
             r, g, b = colorsys.hsv_to_rgb(colors[i], 1, 1)
             if not point_mode:
-                output.append(LaserPoint(i, *spiros[i].update(xs, ys, offsets[i][0], offsets[i][1]), r * 255, g * 255, b * 255))
+                frame.set(i, *spiros[i].update(xs, ys, offsets[i][0], offsets[i][1]), r * 255, g * 255, b * 255)
             elif iteration % 3 == 0:
-                output.append(LaserPoint(i, spiros[i].x, spiros[i].y, 0, 0, 0))  
+                frame.set(i, spiros[i].x, spiros[i].y)
             elif iteration % 3 == 1:
-                output.append(LaserPoint(i, spiros[i].x, spiros[i].y, r * 255, g * 255, b * 255))
+                frame.set(i, spiros[i].x, spiros[i].y, r * 255, g * 255, b * 255)
             else:
-                output.append(LaserPoint(i, *spiros[i].update(xs, ys, offsets[i][0], offsets[i][1]), 0, 0, 0))
+                frame.set(i, *spiros[i].update(xs, ys, offsets[i][0], offsets[i][1]))
             
             colors[i] += 0.00001
             if colors[i] > 1:
@@ -255,13 +341,13 @@ def spirograph(num_lasers: int) -> Generator[list[LaserPoint], None, None]:
             elif spiros[i].y < min_y and dirs[i][1] < 0:
                 dirs[i][1] *= -1
 
-        yield verify_points(output)
+        yield frame.clamp()
         
 
 def pong(num_lasers: int) -> Generator[list[LaserPoint], None, None]:
     START_SPEED = 6
+    LEFT_EDGE, RIGHT_EDGE = 0, 2
     bounds = sierpinski.get_laser_coordinate_bounds()
-    _xs = sorted([b[0] for b in bounds])
     min_x, max_x = min(b[0] for b in bounds), max(b[0] for b in bounds)
     min_y, max_y = min(b[1] for b in bounds), max(b[1] for b in bounds)
     center_x = (max_x + min_x) // 2
@@ -302,16 +388,14 @@ def pong(num_lasers: int) -> Generator[list[LaserPoint], None, None]:
             ball_x += dx
             ball_y += dy
 
-            if _xs[0] <= ball_x <= _xs[1]:
-                y_limit = np.interp(ball_x, [_xs[0], _xs[1]], [min_y, max_y])
-                if ball_y > y_limit:
-                    ball_laser = (ball_laser + num_lasers - 1) % num_lasers
-                    ball_x = np.interp(ball_y, [min_y, max_y], [_xs[3], _xs[2]])
-            elif _xs[2] <= ball_x <= _xs[3]:
-                y_limit = np.interp(ball_x, [_xs[2], _xs[3]], [max_y, min_y])
-                if ball_y > y_limit:
-                    ball_laser = (ball_laser + 1) % num_lasers
-                    ball_x = np.interp(ball_y, [min_y, max_y], [_xs[0], _xs[1]])
+            # The ball rolls over the slanted left and right edges onto the neighbouring faces
+            left, _, right, _ = surface_clipper.edge_distances([ball_x, ball_y])
+            if left < 0:
+                ball_laser = (ball_laser + num_lasers - 1) % num_lasers
+                ball_x = surface_clipper.edge_x(RIGHT_EDGE, ball_y)
+            elif right < 0:
+                ball_laser = (ball_laser + 1) % num_lasers
+                ball_x = surface_clipper.edge_x(LEFT_EDGE, ball_y)
 
             if (ball_y + ball_radius > max_y and dy > 0) or (ball_y - ball_radius < min_y and dy < 0):
                 dy *= -1
@@ -352,11 +436,9 @@ def pong(num_lasers: int) -> Generator[list[LaserPoint], None, None]:
             paddle_points.append([int(x), int(y), 0])
         else:
             paddle_points.insert(0, [int(center_x + paddle_gap), int(right_paddle - paddle_half_height), 0])
-        paddle_points = interpolate_objects(paddle_points)
-
-        for paddle_point in paddle_points:
-            color = 255 * paddle_point[2]
-            p = LaserPoint(0, paddle_point[0], paddle_point[1], color, color, color)
+        for paddle_x, paddle_y, on in galvo_resampler.resample(paddle_points).tolist():
+            color = 255 * on
+            p = LaserPoint(0, paddle_x, paddle_y, color, color, color)
             yield verify_points([LaserPoint(i) if i > 0 else p for i in range(num_lasers)])
 
         if not score_timeout:
@@ -430,7 +512,7 @@ def audio_visualization_circle(num_lasers: int) -> Generator[list[LaserPoint], N
         index = (index + 1) % sample_blocksize
         color_delta += 0.002
 
-def audio_visualization(num_lasers: int) -> Generator[list[LaserPoint], None, None]:
+def audio_visualization(num_lasers: int) -> Generator[LaserFrame, None, None]:
     """Generates an audio visualization"""
     min_x, max_x, min_y, max_y = sierpinski.get_laser_min_max_interior()
     base_y = (max_y + min_y) / 2
@@ -440,6 +522,7 @@ def audio_visualization(num_lasers: int) -> Generator[list[LaserPoint], None, No
     ys = [base_y for _ in range(sample_blocksize)]
     index = 0
     color_delta = 360
+    frame = LaserFrame(num_lasers)
 
     def scale(v, factor=12):
         if v < 0:
@@ -458,11 +541,14 @@ def audio_visualization(num_lasers: int) -> Generator[list[LaserPoint], None, No
                 ys = [base_y for _ in range(sample_blocksize)]
         
         if index == 0:
-            yield verify_points([LaserPoint(i, xs[-1], ys[-1], 0, 0, 0) for i in range(num_lasers)])
-            yield verify_points([LaserPoint(i, xs[0], ys[0], 0, 0, 0) for i in range(num_lasers)])
+            frame.values[:] = (xs[-1], ys[-1], 0, 0, 0)
+            yield frame.clamp()
+            frame.values[:] = (xs[0], ys[0], 0, 0, 0)
+            yield frame.clamp()
         else:
             r, g, b = colorsys.hsv_to_rgb((int(index + color_delta) % 360) / 360, 1, 1)
-            yield verify_points([LaserPoint(i, xs[index], ys[index], r * 255, g * 255, b * 255) for i in range(num_lasers)])
+            frame.values[:] = (xs[index], ys[index], r * 255, g * 255, b * 255)
+            yield frame.clamp()
         index = (index + 1) % sample_blocksize
         color_delta += 0.002
 
@@ -518,19 +604,20 @@ def wand_drawing(num_lasers: int) -> Generator[list[LaserPoint], None, None]:
             if (path_index := (path_index + 1) % len(p)) == 0:
                 current_path = (current_path + 1) % len(paths)
 
-def calibration(num_lasers: int) -> Generator[list[LaserPoint], None, None]:
+def calibration(num_lasers: int) -> Generator[np.ndarray, None, None]:
+    """Outlines the projectable surface in green on every laser"""
     bounds = sierpinski.get_laser_coordinate_bounds()
     points = [[int(b[0]), int(b[1]), 1] for b in bounds]
     points.append(points[0])
-    points = interpolate_objects(points)
-    index = 0
+    points = galvo_resampler.resample(points)
+    block = np.zeros((num_lasers, len(points), 5), dtype=np.int32)
+    block[:, :, :2] = points[:, :2]
+    block[:, :, 3] = np.where(points[:, 2] != 0, 255, 0)
     while True:
-        x, y, on = points[index]
-        yield [LaserPoint(i, x, y, 0, 255 if on else 0, 0) for i in range(num_lasers)]
-        index = (index + 1) % len(points)
+        yield block
 
-def add_fireworks(num_lasers: int, laser_id: int, x_offset: int, y_offset: int) -> Generator[list[LaserPoint], None, None]:
-    data = [LaserPoint(i) for i in range(num_lasers)]
+def add_fireworks(num_lasers: int, laser_id: int, x_offset: int, y_offset: int) -> Generator[LaserFrame, None, None]:
+    frame = LaserFrame(num_lasers)
     for _ in range(20):
         for rotation in range(0, 360 * 4, 8):
             radius = rotation / 16
@@ -540,8 +627,8 @@ def add_fireworks(num_lasers: int, laser_id: int, x_offset: int, y_offset: int)
                 r, g, b = 0, 0, 0
             else:
                 r, g, b = colorsys.hsv_to_rgb(random.uniform(0, 1), 1, 1)
-            data[laser_id] = LaserPoint(laser_id, x, y, r * 255, g * 255, b * 255)
-            yield verify_points(data)
+            frame.set(laser_id, x, y, r * 255, g * 255, b * 255)
+            yield frame.clamp()
 
 def firework_test(num_lasers: int) -> Generator[list[LaserPoint], None, None]:
     min_x, max_x, min_y, max_y = sierpinski.get_laser_min_max_interior()
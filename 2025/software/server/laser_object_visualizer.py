@@ -1,6 +1,8 @@
 from matplotlib import pyplot as plt
 from matplotlib import animation
 from laser_objects import *
+import build_laser_objects
+import path_simplifier
 
 # X and Y values should range from 0 to 1100
 
@@ -76,6 +78,26 @@ def plot_animated(graphic):
     ani = animation.FuncAnimation(fig, animate, interval=250, cache_frame_data=False)
     plt.show()
 
+def plot_simplified(name, tolerance=path_simplifier.DEFAULT_TOLERANCE):
+    # The built graphics are already simplified, so compare against the source
+    original = build_laser_objects.parse_source()[name]
+    simplified = path_simplifier.simplify(original, tolerance)
+    fig = plt.figure()
+    ax = fig.add_subplot(111)
+    ax.set_xlim([0, 4095])
+    ax.set_ylim([0, 4095])
+    ax.set_aspect('equal')
+    ax.set_title(f'{name}: {len(original) // 2} vertices, {len(simplified) // 2} simplified')
+    for g, cc, width in [(original, 'lightgray', 4), (simplified, 'r', 1)]:
+        for i in range(2, len(g), 2):
+            if g[i] & 0x8000:
+                ax.plot([(g[i - 2] & 0x7FFF) + x_offset, (g[i] & 0x7FFF) + x_offset],
+                        [g[i - 1] + y_offset, g[i + 1] + y_offset], c=cc, linewidth=width)
+        ax.scatter([(g[i] & 0x7FFF) + x_offset for i in range(0, len(g), 2)],
+                   [g[i] + y_offset for i in range(1, len(g), 2)], c=cc, s=width * 2)
+    plt.show()
+
 
 plot_all(eqns)
 #plot_animated(EFFECT_BICYCLE_HORN)
+#plot_simplified('EFFECT_BICYCLE_HORN', tolerance=2)
@@ -0,0 +1,9910 @@
+"""Source data for the laser graphics, compiled into laser_objects.bin by build_laser_objects.py.
+
+Each graphic is a flat list of x, y pairs where bit 15 of x turns the laser on for the
+segment ending at that point. Add new graphics here (see convert_graphic.py).
+"""
+
+CHAR_A = [
+    0x17c,0x3e8,
+    0x8000,0x0,
+    0x17c,0x3e8,
+    0x82f9,0x0,
+    0x8e,0x14d,
+    0x826b,0x14d
+]
+
+CHAR_B = [
+    0x0,0x3e8,
+    0x8000,0x0,
+    0x0,0x3e8,
+    0x81ac,0x3e8,
+    0x823b,0x3b8,
+    0x826b,0x388,
+    0x829a,0x329,
+    0x829a,0x2ca,
+    0x826b,0x26b,
+    0x823b,0x23b,
+    0x81ac,0x20b,
+    0x0,0x20b,
+    0x81ac,0x20b,
+    0x823b,0x1dc,
+    0x826b,0x1ac,
+    0x829a,0x14d,
+    0x829a,0xbe,
+    0x826b,0x5f,
+    0x823b,0x2f,
+    0x81ac,0x0,
+    0x8000,0x0
+]
+
+CHAR_C = [
+    0x2ca,0x2f9,
+    0x829a,0x359,
+    0x823b,0x3b8,
+    0x81dc,0x3e8,
+    0x811d,0x3e8,
+    0x80be,0x3b8,
+    0x805f,0x359,
+    0x802f,0x2f9,
+    0x8000,0x26b,
+    0x8000,0x17c,
+    0x802f,0xee,
+    0x805f,0x8e,
+    0x80be,0x2f,
+    0x811d,0x0,
+    0x81dc,0x0,
+    0x823b,0x2f,
+    0x829a,0x8e,
+    0x82ca,0xee
+]
+
+CHAR_D = [
+    0x0,0x3e8,
+    0x8000,0x0,
+    0x0,0x3e8,
+    0x814d,0x3e8,
+    0x81dc,0x3b8,
+    0x823b,0x359,
+    0x826b,0x2f9,
+    0x829a,0x26b,
+    0x829a,0x17c,
+    0x826b,0xee,
+    0x823b,0x8e,
+    0x81dc,0x2f,
+    0x814d,0x0,
+    0x8000,0x0
+]
+
+CHAR_E = [
+    0x0,0x3e8,
+    0x8000,0x0,
+    0x0,0x3e8,
+    0x826b,0x3e8,
+    0x0,0x20b,
+    0x817c,0x20b,
+    0x0,0x0,
+    0x826b,0x0
+]
+
+CHAR_F = [
+    0x0,0x3e8,
+    0x8000,0x0,
+    0x0,0x3e8,
+    0x826b,0x3e8,
+    0x0,0x20b,
+    0x817c,0x20b
+]
+
+CHAR_G = [
+    0x2ca,0x2f9,
+    0x829a,0x359,
+    0x823b,0x3b8,
+    0x81dc,0x3e8,
+    0x811d,0x3e8,
+    0x80be,0x3b8,
+    0x805f,0x359,
+    0x802f,0x2f9,
+    0x8000,0x26b,
+    0x8000,0x17c,
+    0x802f,0xee,
+    0x805f,0x8e,
+    0x80be,0x2f,
+    0x811d,0x0,
+    0x81dc,0x0,
+    0x823b,0x2f,
+    0x829a,0x8e,
+    0x82ca,0xee,
+    0x82ca,0x17c,
+    0x1dc,0x17c,
+    0x82ca,0x17c
+]
+
+CHAR_H = [
+    0x0,0x3e8,
+    0x8000,0x0,
+    0x29a,0x3e8,
+    0x829a,0x0,
+    0x0,0x20b,
+    0x829a,0x20b
+]
+
+CHAR_I = [
+    0x0,0x3e8,
+    0x8000,0x0
+]
+
+CHAR_J = [
+    0x1dc,0x3e8,
+    0x81dc,0xee,
+    0x81ac,0x5f,
+    0x817c,0x2f,
+    0x811d,0x0,
+    0x80be,0x0,
+    0x805f,0x2f,
+    0x802f,0x5f,
+    0x8000,0xee,
+    0x8000,0x14d
+]
+
+CHAR_K = [
+    0x0,0x3e8,
+    0x8000,0x0,
+    0x29a,0x3e8,
+    0x8000,0x14d,
+    0xee,0x23b,
+    0x829a,0x0
+]
+
+CHAR_L = [
+    0x0,0x3e8,
+    0x8000,0x0,
+    0x823b,0x0
+]
+
+CHAR_M = [
+    0x0,0x3e8,
+    0x8000,0x0,
+    0x0,0x3e8,
+    0x817c,0x0,
+    0x2f9,0x3e8,
+    0x817c,0x0,
+    0x2f9,0x3e8,
+    0x82f9,0x0
+]
+
+CHAR_N = [
+    0x0,0x3e8,
+    0x8000,0x0,
+    0x0,0x3e8,
+    0x829a,0x0,
+    0x29a,0x3e8,
+    0x829a,0x0
+]
+
+CHAR_O = [
+    0x11d,0x3e8,
+    0x80be,0x3b8,
+    0x805f,0x359,
+    0x802f,0x2f9,
+    0x8000,0x26b,
+    0x8000,0x17c,
+    0x802f,0xee,
+    0x805f,0x8e,
+    0x80be,0x2f,
+    0x811d,0x0,
+    0x81dc,0x0,
+    0x823b,0x2f,
+    0x829a,0x8e,
+    0x82ca,0xee,
+    0x82f9,0x17c,
+    0x82f9,0x26b,
+    0x82ca,0x2f9,
+    0x829a,0x359,
+    0x823b,0x3b8,
+    0x81dc,0x3e8,
+    0x811d,0x3e8
+]
+
+CHAR_P = [
+    0x0,0x3e8,
+    0x8000,0x0,
+    0x0,0x3e8,
+    0x81ac,0x3e8,
+    0x823b,0x3b8,
+    0x826b,0x388,
+    0x829a,0x329,
+    0x829a,0x29a,
+    0x826b,0x23b,
+    0x823b,0x20b,
+    0x81ac,0x1dc,
+    0x8000,0x1dc
+]
+
+CHAR_Q = [
+    0x11d,0x447,
+    0x80be,0x417,
+    0x805f,0x3b8,
+    0x802f,0x359,
+    0x8000,0x2ca,
+    0x8000,0x1dc,
+    0x802f,0x14d,
+    0x805f,0xee,
+    0x80be,0x8e,
+    0x811d,0x5f,
+    0x81dc,0x5f,
+    0x823b,0x8e,
+    0x829a,0xee,
+    0x82ca,0x14d,
+    0x82f9,0x1dc,
+    0x82f9,0x2ca,
+    0x82ca,0x359,
+    0x829a,0x3b8,
+    0x823b,0x417,
+    0x81dc,0x447,
+    0x811d,0x447,
+    0x1ac,0x11d,
+    0x82ca,0x0
+]
+
+CHAR_R = [
+    0x0,0x3e8,
+    0x8000,0x0,
+    0x0,0x3e8,
+    0x81ac,0x3e8,
+    0x823b,0x3b8,
+    0x826b,0x388,
+    0x829a,0x329,
+    0x829a,0x2ca,
+    0x826b,0x26b,
+    0x823b,0x23b,
+    0x81ac,0x20b,
+    0x8000,0x20b,
+    0x14d,0x20b,
+    0x829a,0x0
+]
+
+CHAR_S = [
+    0x29a,0x359,
+    0x823b,0x3b8,
+    0x81ac,0x3e8,
+    0x80ee,0x3e8,
+    0x805f,0x3b8,
+    0x8000,0x359,
+    0x8000,0x2f9,
+    0x802f,0x29a,
+    0x805f,0x26b,
+    0x80be,0x23b,
+    0x81dc,0x1dc,
+    0x823b,0x1ac,
+    0x826b,0x17c,
+    0x829a,0x11d,
+    0x829a,0x8e,
+    0x823b,0x2f,
+    0x81ac,0x0,
+    0x80ee,0x0,
+    0x805f,0x2f,
+    0x8000,0x8e
+]
+
+CHAR_T = [
+    0x14d,0x3e8,
+    0x814d,0x0,
+    0x0,0x3e8,
+    0x829a,0x3e8
+]
+
+CHAR_U = [
+    0x0,0x3e8,
+    0x8000,0x11d,
+    0x802f,0x8e,
+    0x808e,0x2f,
+    0x811d,0x0,
+    0x817c,0x0,
+    0x820b,0x2f,
+    0x826b,0x8e,
+    0x829a,0x11d,
+    0x829a,0x3e8
+]
+
+CHAR_V = [
+    0x0,0x3e8,
+    0x817c,0x0,
+    0x2f9,0x3e8,
+    0x817c,0x0
+]
+
+CHAR_W = [
+    0x0,0x3e8,
+    0x80ee,0x0,
+    0x1dc,0x3e8,
+    0x80ee,0x0,
+    0x1dc,0x3e8,
+    0x82ca,0x0,
+    0x3b8,0x3e8,
+    0x82ca,0x0
+]
+
+CHAR_X = [
+    0x0,0x3e8,
+    0x829a,0x0,
+    0x29a,0x3e8,
+    0x8000,0x0
+]
+
+CHAR_Y = [
+    0x0,0x3e8,
+    0x817c,0x20b,
+    0x817c,0x0,
+    0x2f9,0x3e8,
+    0x817c,0x20b
+]
+
+CHAR_Z = [
+    0x29a,0x3e8,
+    0x8000,0x0,
+    0x0,0x3e8,
+    0x829a,0x3e8,
+    0x0,0x0,
+    0x829a,0x0
+]
+
+CHAR_0 = [
+    0x11d,0x3e8,
+    0x808e,0x3b8,
+    0x802f,0x329,
+    0x8000,0x23b,
+    0x8000,0x1ac,
+    0x802f,0xbe,
+    0x808e,0x2f,
+    0x811d,0x0,
+    0x817c,0x0,
+    0x820b,0x2f,
+    0x826b,0xbe,
+    0x829a,0x1ac,
+    0x829a,0x23b,
+    0x826b,0x329,
+    0x820b,0x3b8,
+    0x817c,0x3e8,
+    0x811d,0x3e8
+]
+
+CHAR_1 = [
+    0x0,0x329,
+    0x805f,0x359,
+    0x80ee,0x3e8,
+    0x80ee,0x0
+]
+
+CHAR_2 = [
+    0x2f,0x2f9,
+    0x802f,0x329,
+    0x805f,0x388,
+    0x808e,0x3b8,
+    0x80ee,0x3e8,
+    0x81ac,0x3e8,
+    0x820b,0x3b8,
+    0x823b,0x388,
+    0x826b,0x329,
+    0x826b,0x2ca,
+    0x823b,0x26b,
+    0x81dc,0x1dc,
+    0x8000,0x0,
+    0x829a,0x0
+]
+
+CHAR_3 = [
+    0x5f,0x3e8,
+    0x826b,0x3e8,
+    0x814d,0x26b,
+    0x81dc,0x26b,
+    0x823b,0x23b,
+    0x826b,0x20b,
+    0x829a,0x17c,
+    0x829a,0x11d,
+    0x826b,0x8e,
+    0x820b,0x2f,
+    0x817c,0x0,
+    0x80ee,0x0,
+    0x805f,0x2f,
+    0x802f,0x5f,
+    0x8000,0xbe
+]
+
+CHAR_4 = [
+    0x1dc,0x3e8,
+    0x8000,0x14d,
+    0x82ca,0x14d,
+    0x1dc,0x3e8,
+    0x81dc,0x0
+]
+
+CHAR_5 = [
+    0x23b,0x3e8,
+    0x805f,0x3e8,
+    0x802f,0x23b,
+    0x805f,0x26b,
+    0x80ee,0x29a,
+    0x817c,0x29a,
+    0x820b,0x26b,
+    0x826b,0x20b,
+    0x829a,0x17c,
+    0x829a,0x11d,
+    0x826b,0x8e,
+    0x820b,0x2f,
+    0x817c,0x0,
+    0x80ee,0x0,
+    0x805f,0x2f,
+    0x802f,0x5f,
+    0x8000,0xbe
+]
+
+CHAR_6 = [
+    0x23b,0x359,
+    0x820b,0x3b8,
+    0x817c,0x3e8,
+    0x811d,0x3e8,
+    0x808e,0x3b8,
+    0x802f,0x329,
+    0x8000,0x23b,
+    0x8000,0x14d,
+    0x802f,0x8e,
+    0x808e,0x2f,
+    0x811d,0x0,
+    0x814d,0x0,
+    0x81dc,0x2f,
+    0x823b,0x8e,
+    0x826b,0x11d,
+    0x826b,0x14d,
+    0x823b,0x1dc,
+    0x81dc,0x23b,
+    0x814d,0x26b,
+    0x811d,0x26b,
+    0x808e,0x23b,
+    0x802f,0x1dc,
+    0x8000,0x14d
+]
+
+CHAR_7 = [
+    0x29a,0x3e8,
+    0x80be,0x0,
+    0x0,0x3e8,
+    0x829a,0x3e8
+]
+
+CHAR_8 = [
+    0xee,0x3e8,
+    0x805f,0x3b8,
+    0x802f,0x359,
+    0x802f,0x2f9,
+    0x805f,0x29a,
+    0x80be,0x26b,
+    0x817c,0x23b,
+    0x820b,0x20b,
+    0x826b,0x1ac,
+    0x829a,0x14d,
+    0x829a,0xbe,
+    0x826b,0x5f,
+    0x823b,0x2f,
+    0x81ac,0x0,
+    0x80ee,0x0,
+    0x805f,0x2f,
+    0x802f,0x5f,
+    0x8000,0xbe,
+    0x8000,0x14d,
+    0x802f,0x1ac,
+    0x808e,0x20b,
+    0x811d,0x23b,
+    0x81dc,0x26b,
+    0x823b,0x29a,
+    0x826b,0x2f9,
+    0x826b,0x359,
+    0x823b,0x3b8,
+    0x81ac,0x3e8,
+    0x80ee,0x3e8
+]
+
+CHAR_9 = [
+    0x26b,0x29a,
+    0x823b,0x20b,
+    0x81dc,0x1ac,
+    0x814d,0x17c,
+    0x811d,0x17c,
+    0x808e,0x1ac,
+    0x802f,0x20b,
+    0x8000,0x29a,
+    0x8000,0x2ca,
+    0x802f,0x359,
+    0x808e,0x3b8,
+    0x811d,0x3e8,
+    0x814d,0x3e8,
+    0x81dc,0x3b8,
+    0x823b,0x359,
+    0x826b,0x29a,
+    0x826b,0x1ac,
+    0x823b,0xbe,
+    0x81dc,0x2f,
+    0x814d,0x0,
+    0x80ee,0x0,
+    0x805f,0x2f,
+    0x802f,0x8e
+]
+
+IMG_HEART = [
+    0x330,0x23e,
+    0x82fa,0x192,
+    0x825a,0xe3,
+    0x81b4,0x6d,
+    0x80ea,0x0,
+    0x80f0,0x29,
+    0x80f2,0x50,
+    0x80e3,0xae,
+    0x80b4,0x103,
+    0x8079,0x144,
+    0x803e,0x185,
+    0x800f,0x1d7,
+    0x8000,0x231,
+    0x800f,0x285,
+    0x803d,0x2c8,
+    0x8083,0x2f5,
+    0x80d8,0x303,
+    0x8115,0x2fb,
+    0x814d,0x2e2,
+    0x817e,0x2b9,
+    0x8198,0x284,
+    0x81e9,0x2e4,
+    0x8258,0x303,
+    0x82a7,0x2f6,
+    0x82ed,0x2cc,
+    0x831f,0x28c,
+    0x8330,0x23e,
+    0x8330,0x23e
+]
+
+IMG_ISLAND = [
+    0x440,0x0,
+    0x8000,0x0,
+    0x8000,0x1fa,
+    0x80e0,0x1fa,
+    0x8172,0x215,
+    0x821f,0x21e,
+    0x8242,0x21e,
+    0x8263,0x21d,
+    0x824d,0x2bb,
+    0x822a,0x345,
+    0x8207,0x338,
+    0x81e6,0x321,
+    0x81bc,0x2e5,
+    0x81a4,0x292,
+    0x8197,0x2c9,
+    0x8193,0x2fc,
+    0x819a,0x330,
+    0x81b0,0x352,
+    0x81cd,0x363,
+    0x81f8,0x371,
+    0x81e3,0x372,
+    0x81cb,0x373,
+    0x819c,0x370,
+    0x815b,0x364,
+    0x8196,0x3a2,
+    0x81cb,0x3b7,
+    0x81ec,0x3b1,
+    0x8215,0x39f,
+    0x820f,0x3b3,
+    0x8206,0x3c9,
+    0x81fe,0x3d9,
+    0x81f0,0x3f0,
+    0x8214,0x3f7,
+    0x822f,0x3f9,
+    0x8249,0x3f6,
+    0x826c,0x3ed,
+    0x8260,0x3e1,
+    0x8250,0x3cd,
+    0x824d,0x3c3,
+    0x824c,0x3b5,
+    0x8279,0x3d5,
+    0x82a6,0x3dd,
+    0x82db,0x3bf,
+    0x830c,0x36e,
+    0x82d3,0x399,
+    0x82a6,0x3a5,
+    0x828a,0x39a,
+    0x8269,0x380,
+    0x82df,0x365,
+    0x8307,0x30e,
+    0x82fc,0x2d8,
+    0x82d9,0x293,
+    0x82d6,0x2b9,
+    0x82d0,0x2db,
+    0x82bb,0x316,
+    0x8299,0x33c,
+    0x827e,0x347,
+    0x8256,0x34d,
+    0x8262,0x32c,
+    0x826d,0x309,
+    0x824c,0x303,
+    0x824d,0x2fa,
+    0x8270,0x301,
+    0x8279,0x2e3,
+    0x8281,0x2c5,
+    0x825f,0x2c0,
+    0x825f,0x2b7,
+    0x8283,0x2ba,
+    0x828b,0x29c,
+    0x8292,0x27d,
+    0x826f,0x279,
+    0x826f,0x270,
+    0x8293,0x272,
+    0x8299,0x256,
+    0x82a0,0x231,
+    0x8278,0x22f,
+    0x8277,0x226,
+    0x82a2,0x227,
+    0x82a4,0x21a,
+    0x82bc,0x217,
+    0x82d5,0x215,
+    0x82ef,0x22c,
+    0x82e3,0x213,
+    0x8328,0x207,
+    0x8360,0x1fa,
+    0x8440,0x1fa,
+    0x8440,0x0,
+    0x2ce,0x20e,
+    0x82b9,0x211,
+    0x82a4,0x213,
+    0x82a6,0x206,
+    0x82a7,0x1fb,
+    0x82a9,0x1ed,
+    0x82ce,0x20e,
+    0x3da,0x198,
+    0x83c8,0x1bc,
+    0x8394,0x1dd,
+    0x8345,0x1f9,
+    0x82e0,0x20c,
+    0x82d0,0x1ec,
+    0x82fa,0x1fa,
+    0x82d6,0x1d6,
+    0x82b7,0x1cb,
+    0x828b,0x1c8,
+    0x8269,0x1cd,
+    0x824d,0x1da,
+    0x8239,0x20e,
+    0x8267,0x1ec,
+    0x8265,0x204,
+    0x8263,0x217,
+    0x8242,0x219,
+    0x821f,0x219,
+    0x8175,0x210,
+    0x80e6,0x1f3,
+    0x8085,0x1ca,
+    0x8065,0x198,
+    0x8085,0x167,
+    0x80e6,0x13e,
+    0x8175,0x122,
+    0x821f,0x118,
+    0x82c9,0x122,
+    0x8358,0x13e,
+    0x83b9,0x167,
+    0x83da,0x198,
+    0x83da,0x198
+]
+
+IMG_BIKE = [
+    0x321,0xa5,
+    0x8315,0x65,
+    0x82f1,0x30,
+    0x82bc,0xc,
+    0x827c,0x0,
+    0x823d,0xc,
+    0x8207,0x30,
+    0x81e3,0x65,
+    0x81d7,0xa5,
+    0x81de,0xd4,
+    0x81f2,0xff,
+    0x8211,0x122,
+    0x8238,0x13b,
+    0x822c,0x15c,
+    0x8177,0x83,
+    0x8147,0x88,
+    0x8134,0x53,
+    0x810f,0x27,
+    0x80dd,0x9,
+    0x80a4,0x0,
+    0x8065,0xc,
+    0x8030,0x30,
+    0x800c,0x65,
+    0x8000,0xa5,
+    0x800c,0xe4,
+    0x8030,0x119,
+    0x8065,0x13e,
+    0x80a5,0x14a,
+    0x80c6,0x146,
+    0x80e5,0x13d,
+    0x810d,0x195,
+    0x80fe,0x1be,
+    0x8101,0x1bf,
+    0x80f7,0x1dc,
+    0x80e7,0x1dd,
+    0x80da,0x1e0,
+    0x80cc,0x1e6,
+    0x80c7,0x1f1,
+    0x80cb,0x202,
+    0x80d7,0x207,
+    0x80e2,0x206,
+    0x80ef,0x203,
+    0x80fc,0x200,
+    0x8105,0x1ff,
+    0x810e,0x200,
+    0x8119,0x201,
+    0x8123,0x202,
+    0x8128,0x203,
+    0x812f,0x200,
+    0x8131,0x1f7,
+    0x812d,0x1f2,
+    0x8120,0x1ea,
+    0x8110,0x1e2,
+    0x8102,0x1dd,
+    0x810d,0x1c2,
+    0x810f,0x1c4,
+    0x8119,0x1a7,
+    0x8211,0x1a7,
+    0x81fc,0x1e0,
+    0x81fc,0x1f2,
+    0x825c,0x1f2,
+    0x825c,0x1e0,
+    0x820e,0x1e0,
+    0x8248,0x141,
+    0x8262,0x148,
+    0x827c,0x14a,
+    0x82bc,0x13e,
+    0x82f1,0x11a,
+    0x8315,0xe4,
+    0x8321,0xa5,
+    0x8321,0xa5,
+    0x30f,0xa5,
+    0x8304,0xdd,
+    0x82e4,0x10d,
+    0x82b5,0x12d,
+    0x827c,0x138,
+    0x8265,0x136,
+    0x824e,0x130,
+    0x8265,0xef,
+    0x8278,0xbe,
+    0x8284,0xa0,
+    0x8282,0x9b,
+    0x827d,0x99,
+    0x8274,0xa1,
+    0x826a,0xb7,
+    0x823f,0x12a,
+    0x81ff,0xf5,
+    0x81ea,0xa5,
+    0x81f4,0x6d,
+    0x8215,0x3d,
+    0x8244,0x1d,
+    0x827c,0x12,
+    0x82b5,0x1d,
+    0x82e4,0x3d,
+    0x8304,0x6d,
+    0x830f,0xa5,
+    0x830f,0xa5,
+    0x226,0x16e,
+    0x8217,0x195,
+    0x8120,0x195,
+    0x817a,0xa1,
+    0x8226,0x16e,
+    0x16a,0x98,
+    0x8115,0x17e,
+    0x80f5,0x135,
+    0x8134,0xf9,
+    0x814a,0xa5,
+    0x814a,0x9a,
+    0x816a,0x98,
+    0x137,0x9c,
+    0x8137,0xa5,
+    0x8124,0xef,
+    0x80ed,0x124,
+    0x80b5,0xa9,
+    0x8137,0x9c,
+    0x135,0x8a,
+    0x809a,0x98,
+    0x80dd,0x12c,
+    0x80c1,0x135,
+    0x80a5,0x138,
+    0x806d,0x12d,
+    0x803d,0x10d,
+    0x801d,0xdd,
+    0x8012,0xa5,
+    0x801d,0x6d,
+    0x803d,0x3d,
+    0x806c,0x1d,
+    0x80a4,0x12,
+    0x80d7,0x1b,
+    0x8103,0x34,
+    0x8124,0x5b,
+    0x8135,0x8a,
+    0x8135,0x8a
+]
+
+IMG_PLANE = [
+    0x27c,0xd7,
+    0x8270,0xc7,
+    0x8230,0xce,
+    0x81eb,0xd7,
+    0x81eb,0xd8,
+    0x81ea,0xd8,
+    0x81ef,0xdb,
+    0x81fc,0xdf,
+    0x827c,0xd7,
+    0x3b3,0x26,
+    0x8398,0xe,
+    0x8386,0x7,
+    0x8307,0xc,
+    0x81c4,0x18,
+    0x81b1,0x11,
+    0x819e,0xc,
+    0x8175,0x3,
+    0x8151,0x0,
+    0x80ff,0x5,
+    0x80c5,0x19,
+    0x80e1,0x1c,
+    0x80ed,0x27,
+    0x80ee,0x2b,
+    0x80ef,0x2e,
+    0x80e6,0x43,
+    0x80cc,0x4f,
+    0x80b1,0x4f,
+    0x80a1,0x40,
+    0x809e,0x36,
+    0x80a2,0x2d,
+    0x809c,0x33,
+    0x8095,0x3f,
+    0x80b2,0x65,
+    0x810f,0x8e,
+    0x813f,0xbd,
+    0x8172,0xcb,
+    0x81b1,0xc5,
+    0x81fc,0xbb,
+    0x8238,0xb4,
+    0x8263,0xb2,
+    0x8283,0xd9,
+    0x82c3,0x14b,
+    0x82cf,0x14b,
+    0x82d8,0x14a,
+    0x82df,0x148,
+    0x82e8,0x145,
+    0x82cf,0xd2,
+    0x8372,0xc2,
+    0x836e,0xbd,
+    0x8367,0xb9,
+    0x8334,0xb9,
+    0x82c7,0xbd,
+    0x82ba,0x8f,
+    0x82a5,0x7c,
+    0x8283,0x5f,
+    0x826e,0x51,
+    0x8250,0x41,
+    0x83b3,0x26,
+    0xe8,0x85,
+    0x80d6,0x7e,
+    0x80bc,0x73,
+    0x80af,0x6a,
+    0x809d,0x5c,
+    0x8059,0x83,
+    0x8002,0xb3,
+    0x8000,0xb5,
+    0x8000,0xb6,
+    0x8011,0xbd,
+    0x8045,0xc2,
+    0x80e8,0x85,
+    0xde,0x2b,
+    0x80d4,0x20,
+    0x80b4,0x1c,
+    0x80a7,0x1f,
+    0x80a2,0x27,
+    0x80ab,0x3c,
+    0x80c5,0x42,
+    0x80d8,0x3b,
+    0x80de,0x2b,
+    0x80de,0x2b,
+    0x1ea,0x76,
+    0x81df,0xa5,
+    0x81b6,0xab,
+    0x81c9,0x71,
+    0x81ea,0x76,
+    0x1bb,0x6f,
+    0x81aa,0xab,
+    0x81a4,0x6b,
+    0x81bb,0x6f,
+    0x1a0,0xad,
+    0x817b,0xb7,
+    0x815b,0xbb,
+    0x8150,0xba,
+    0x8147,0xb9,
+    0x8133,0xab,
+    0x8119,0x8d,
+    0x812e,0x8c,
+    0x814e,0x88,
+    0x8172,0x7e,
+    0x8198,0x6f,
+    0x81a0,0xad
+]
+
+IMG_CATBODY = [
+    0x304,0x33B,
+    0x8308,0x32B,
+    0x8317,0x320,
+    0x8329,0x329,
+    0x832F,0x33B,
+    0x387,0x33F,
+    0x836B,0x33C,
+    0x833A,0x33C,
+    0x832F,0x33C,
+    0x8324,0x33C,
+    0x8307,0x33C,
+    0x82F0,0x33D,
+    0x2CB,0x347,
+    0x82E0,0x33D,
+    0x82EE,0x33A,
+    0x82EA,0x32B,
+    0x82DC,0x322,
+    0x82D0,0x323,
+    0x82C6,0x32C,
+    0x82C5,0x33A,
+    0x82C7,0x347,
+    0x82C1,0x355,
+    0x82C0,0x36C,
+    0x82BE,0x379,
+    0x82A7,0x38D,
+    0x826C,0x3BD,
+    0x8263,0x3CA,
+    0x8265,0x3DA,
+    0x8278,0x3E3,
+    0x8284,0x3DE,
+    0x82C0,0x3B0,
+    0x82BF,0x3C0,
+    0x82C0,0x3D3,
+    0x82C0,0x422,
+    0x82C0,0x42C,
+    0x82CD,0x446,
+    0x82E0,0x44C,
+    0x82EC,0x44C,
+    0x831A,0x44C,
+    0x83B0,0x44C,
+    0x83D7,0x44C,
+    0x83E3,0x44C,
+    0x83F5,0x446,
+    0x8401,0x437,
+    0x8403,0x42C,
+    0x8403,0x422,
+    0x8403,0x3F3,
+    0x8405,0x3DE,
+    0x841A,0x3F8,
+    0x842A,0x3F8,
+    0x8435,0x3F7,
+    0x8437,0x3EE,
+    0x843A,0x3CA,
+    0x844B,0x3AA,
+    0x844C,0x3A0,
+    0x844B,0x396,
+    0x844B,0x373,
+    0x844A,0x360,
+    0x843F,0x34D,
+    0x842C,0x33F,
+    0x8416,0x338,
+    0x8409,0x338,
+    0x83FA,0x337,
+    0x83D7,0x338,
+    0x38F,0x3A3,
+    0x839A,0x3A4,
+    0x83A8,0x3A2,
+    0x83A8,0x386,
+    0x838E,0x386,
+    0x838C,0x396,
+    0x838F,0x3A3,
+    0x3D6,0x337,
+    0x83CC,0x337,
+    0x83C3,0x338,
+    0x83B2,0x337,
+    0x8393,0x33A,
+    0x838B,0x33D,
+    0x8380,0x343,
+    0x836A,0x35F,
+    0x8368,0x370,
+    0x8368,0x397,
+    0x8369,0x3A0,
+    0x836A,0x3AB,
+    0x8379,0x3C4,
+    0x837E,0x3F6,
+    0x8392,0x3F8,
+    0x839A,0x3F8,
+    0x83A1,0x3F0,
+    0x83B4,0x3D6,
+    0x83BD,0x3CC,
+    0x83C6,0x3CA,
+    0x83DA,0x3C7,
+    0x83EF,0x3CA,
+    0x83FD,0x3D3,
+    0x8405,0x3DE,
+    0x39A,0x337,
+    0x839E,0x326,
+    0x83AE,0x31B,
+    0x83BF,0x325,
+    0x83C4,0x337,
+    0x3DB,0x373,
+    0x83DA,0x366,
+    0x83DA,0x35B,
+    0x3B4,0x373,
+    0x83B4,0x367,
+    0x83B7,0x35C,
+    0x83CF,0x35B,
+    0x83DA,0x35B,
+    0x83E4,0x35B,
+    0x83FE,0x35C,
+    0x8402,0x366,
+    0x8402,0x373,
+    0x3DC,0x337,
+    0x83E1,0x325,
+    0x83F2,0x31B,
+    0x8403,0x326,
+    0x8407,0x337,
+    0x40C,0x3A3,
+    0x8416,0x3A4,
+    0x8426,0x3A3,
+    0x8429,0x392,
+    0x8426,0x386,
+    0x840C,0x386,
+    0x840A,0x394,
+    0x840C,0x3A3
+]
+
+IMG_CATTAIL1 = [
+    0x0,0x41F,
+    0x8035,0x42B,
+    0x8040,0x430,
+    0x8061,0x439,
+    0x8084,0x439,
+    0x80B2,0x42B,
+    0x80CA,0x422,
+    0x80DE,0x41F,
+    0x80E9,0x41F,
+    0x80F1,0x41F,
+    0x811C,0x42B,
+    0x8130,0x433,
+    0x8163,0x43A,
+    0x818C,0x431,
+    0x819B,0x42B,
+    0x81A5,0x426,
+    0x81C4,0x41F,
+    0x81CF,0x41F,
+    0x81DB,0x41F,
+    0x8203,0x42B,
+    0x820E,0x430,
+    0x8228,0x438,
+    0x8256,0x438,
+    0x8282,0x42B,
+    0x828B,0x427,
+    0x82B7,0x41F
+]
+
+IMG_CATTAIL2 = [
+    0x4,0x3F5,
+    0x801F,0x3F8,
+    0x8039,0x401,
+    0x8045,0x407,
+    0x8083,0x410,
+    0x80AC,0x406,
+    0x80B8,0x401,
+    0x80DC,0x3F6,
+    0x80EC,0x3F5,
+    0x80FA,0x3F6,
+    0x8122,0x402,
+    0x8141,0x40C,
+    0x8163,0x410,
+    0x818E,0x408,
+    0x81A1,0x401,
+    0x81C6,0x3F6,
+    0x81D3,0x3F5,
+    0x81DE,0x3F5,
+    0x81EF,0x3F8,
+    0x8207,0x401,
+    0x8229,0x40D,
+    0x8259,0x40F,
+    0x8286,0x401,
+    0x8291,0x3FD,
+    0x82BC,0x3F5
+]
+
+IMG_CATTAIL3 = [
+    0x6,0x3CA,
+    0x8033,0x3D3,
+    0x803D,0x3D7,
+    0x8064,0x3E3,
+    0x808D,0x3E4,
+    0x80B0,0x3DB,
+    0x80BA,0x3D7,
+    0x80D5,0x3CD,
+    0x80F6,0x3CA,
+    0x8122,0x3D7,
+    0x8130,0x3DC,
+    0x8164,0x3E6,
+    0x8195,0x3DC,
+    0x81A1,0x3D7,
+    0x81AC,0x3D2,
+    0x81C3,0x3CC,
+    0x81D7,0x3CA,
+    0x81E0,0x3CB,
+    0x8209,0x3D7,
+    0x8215,0x3DC,
+    0x822B,0x3E2,
+    0x8250,0x3E6,
+    0x826D,0x3E2
+]
+
+IMG_CATTAIL4 = [
+    0x5,0x39C,
+    0x803B,0x3A9,
+    0x8048,0x3AE,
+    0x8069,0x3B7,
+    0x808C,0x3B6,
+    0x80B8,0x3A9,
+    0x80C3,0x3A4,
+    0x80E1,0x39D,
+    0x80EF,0x39C,
+    0x810B,0x3A0,
+    0x8123,0x3A9,
+    0x8147,0x3B4,
+    0x816C,0x3B7,
+    0x81A0,0x3A9,
+    0x81BE,0x39E,
+    0x81CC,0x39C,
+    0x81D6,0x39C,
+    0x81DF,0x39C,
+    0x8209,0x3A9,
+    0x8213,0x3AD,
+    0x8236,0x3B6,
+    0x8258,0x3B5,
+    0x8277,0x3B0
+]
+
+IMG_CATTAIL5 = [
+    0x6,0x373,
+    0x802E,0x379,
+    0x803C,0x37F,
+    0x804D,0x386,
+    0x806F,0x38D,
+    0x8092,0x38C,
+    0x80B0,0x383,
+    0x80BB,0x37E,
+    0x80CB,0x378,
+    0x80E3,0x373,
+    0x80F0,0x373,
+    0x80FB,0x373,
+    0x8123,0x37F,
+    0x812F,0x384,
+    0x815B,0x38E,
+    0x817F,0x38A,
+    0x81A2,0x37F,
+    0x81C8,0x373,
+    0x81D6,0x373,
+    0x81E4,0x373,
+    0x820A,0x37F,
+    0x8214,0x383,
+    0x823B,0x38D,
+    0x8263,0x38B,
+    0x8289,0x37F,
+    0x8293,0x37A,
+    0x82BE,0x373
+]
+
+IMG_CATTAIL6 = [
+    0x5,0x348,
+    0x8020,0x34A,
+    0x803B,0x354,
+    0x804C,0x35B,
+    0x8081,0x362,
+    0x80AF,0x358,
+    0x80B9,0x353,
+    0x80CB,0x34C,
+    0x80E4,0x347,
+    0x80F0,0x348,
+    0x8118,0x350,
+    0x8123,0x354,
+    0x8141,0x35F,
+    0x8162,0x363,
+    0x8194,0x359,
+    0x81A2,0x353,
+    0x81CB,0x347,
+    0x81D5,0x348,
+    0x81EE,0x34A,
+    0x820A,0x354,
+    0x822D,0x360,
+    0x8251,0x362,
+    0x8275,0x35B,
+    0x8289,0x353,
+    0x82A3,0x34A,
+    0x82BD,0x348
+]
+
+IMG_TOAST = [
+    0x98,0x1A0,
+    0x8098,0x152,
+    0x809B,0x13A,
+    0x80A9,0x120,
+    0x80C2,0x103,
+    0x811B,0xAC,
+    0x8180,0x62,
+    0x81C5,0x39,
+    0x81DD,0x2E,
+    0x8208,0x1F,
+    0x8245,0x25,
+    0x825C,0x2E,
+    0x8373,0xAC,
+    0x83BE,0xCE,
+    0x83DE,0xDE,
+    0x83FD,0x106,
+    0x83FE,0x163,
+    0x24E,0x295,
+    0x82A8,0x286,
+    0x82BE,0x27A,
+    0x83A4,0x1D5,
+    0x83E7,0x1A6,
+    0x83FA,0x18C,
+    0x83FC,0x172,
+    0x83D1,0x144,
+    0x8393,0x129,
+    0x82AB,0xBF,
+    0x8271,0xA5,
+    0x8259,0x9B,
+    0x822B,0x8D,
+    0x81DA,0x9E,
+    0x8152,0xEF,
+    0x80DA,0x157,
+    0x80AE,0x187,
+    0x8098,0x1C0,
+    0x809F,0x1E3,
+    0x80C6,0x207,
+    0x8109,0x221,
+    0x81DD,0x26F,
+    0x822E,0x28E,
+    0x824E,0x295
+]
+
+IMG_TOASTER = [
+    0x5F,0x304,
+    0x8062,0x304,
+    0xB0,0x2C7,
+    0x80B3,0x2C7,
+    0x278,0x3BE,
+    0x8241,0x3B3,
+    0x81BB,0x394,
+    0x8152,0x36B,
+    0x80F0,0x331,
+    0x8093,0x2E8,
+    0x8076,0x2F0,
+    0x8062,0x304,
+    0x80A5,0x33D,
+    0x812D,0x38E,
+    0x81A0,0x3BC,
+    0x8218,0x3D5,
+    0x824F,0x3DB,
+    0x8264,0x3CE,
+    0x8281,0x3BB,
+    0xDF,0x5D,
+    0x80DF,0xC5,
+    0x80DF,0x19F,
+    0x80DF,0x1D0,
+    0x80DF,0x1E8,
+    0x80E6,0x21A,
+    0x80FD,0x24A,
+    0x8110,0x260,
+    0x8173,0x2B2,
+    0x81E2,0x2F6,
+    0x825A,0x329,
+    0x82D8,0x347,
+    0x8346,0x352,
+    0x8360,0x355,
+    0x8394,0x345,
+    0x83AF,0x321,
+    0x83B6,0x2FE,
+    0x83B4,0x2D0,
+    0x83AC,0x1C5,
+    0x83A9,0x165,
+    0x83A4,0x147,
+    0x8380,0x139,
+    0x830F,0x113,
+    0x8187,0x93,
+    0x810D,0x6B,
+    0x80DF,0x5D,
+    0x80A8,0x85,
+    0x803A,0xDB,
+    0x8004,0x108,
+    0x8000,0x142,
+    0x8000,0x1EA,
+    0x8000,0x28D,
+    0x8000,0x2A7,
+    0x800C,0x2E7,
+    0x8039,0x323,
+    0x8079,0x356,
+    0x810F,0x3AD,
+    0x81B3,0x3E3,
+    0x8212,0x3F3,
+    0x8232,0x3F7,
+    0x824A,0x3F8,
+    0x829D,0x3ED,
+    0x82BB,0x3D9,
+    0x831D,0x395,
+    0x8357,0x36D,
+    0x8369,0x35B,
+    0x2C9,0x384,
+    0x8289,0x376,
+    0x820A,0x357,
+    0x81A4,0x32E,
+    0x8144,0x2F7,
+    0x80EB,0x2B1,
+    0x80CD,0x2B0,
+    0x80B3,0x2C7,
+    0x80F0,0x2FC,
+    0x8170,0x34C,
+    0x824C,0x394,
+    0x828F,0x39E,
+    0x82A3,0x39E,
+    0x82B8,0x390,
+    0x82D2,0x381,
+    0x36F,0x35B,
+    0x8377,0x358
+]
+
+IMG_WINGDOWN = [
+    0x216,0x1B9,
+    0x8242,0x1A5,
+    0x8295,0x165,
+    0x830A,0x13B,
+    0x8386,0x13C,
+    0x83E6,0x15B,
+    0x8400,0x163,
+    0x8428,0x157,
+    0x8438,0x140,
+    0x843A,0x124,
+    0x8431,0x10F,
+    0x8427,0xFB,
+    0x83D4,0x7B,
+    0x83AD,0x51,
+    0x8372,0x33,
+    0x833B,0x38,
+    0x8324,0x43,
+    0x8297,0x9C,
+    0x8229,0x11B,
+    0x8200,0x169,
+    0x81F8,0x17E,
+    0x81F7,0x1A3,
+    0x8216,0x1B9
+]
+
+IMG_WINGMID = [
+    0x21A,0x1BC,
+    0x823A,0x1B5,
+    0x829D,0x182,
+    0x8310,0x165,
+    0x8385,0x165,
+    0x83DC,0x177,
+    0x83F4,0x17F,
+    0x8413,0x179,
+    0x8421,0x162,
+    0x8418,0x14A,
+    0x83FC,0x12E,
+    0x83A8,0xF2,
+    0x8348,0xD0,
+    0x8337,0xD0,
+    0x8323,0xD0,
+    0x82E9,0xDA,
+    0x828A,0xFD,
+    0x8239,0x139,
+    0x81FE,0x17E,
+    0x81FB,0x1A5,
+    0x821A,0x1BC
+]
+
+IMG_WINGTOP = [
+    0xA5,0x373,
+    0x80D7,0x3D0,
+    0x8113,0x40E,
+    0x815C,0x43C,
+    0x8179,0x449,
+    0x8193,0x44C,
+    0x81B7,0x444,
+    0x81D4,0x42D,
+    0x81E4,0x3F0,
+    0x304,0x337,
+    0x832C,0x339,
+    0x8358,0x339,
+    0x8389,0x338,
+    0x83E9,0x333,
+    0x8412,0x330,
+    0x8438,0x31D,
+    0x844C,0x2F6,
+    0x8443,0x2CF,
+    0x8426,0x2B4,
+    0x83E9,0x297,
+    0x833F,0x239,
+    0x82A1,0x1C9,
+    0x8259,0x18B,
+    0x8243,0x176,
+    0x8224,0x169,
+    0x8204,0x17B,
+    0x81FE,0x1A0,
+    0x821B,0x1F4,
+    0x8264,0x28B,
+    0x82C4,0x313,
+    0x8304,0x337
+]
+
+EQN_01 = [
+    0x4,0x3e2,
+    0x8010,0x3e5,
+    0x801d,0x3e8,
+    0x802c,0x3e6,
+    0x8037,0x3e0,
+    0x803f,0x3d4,
+    0x8042,0x3c2,
+    0x8041,0x3aa,
+    0x8041,0x39b,
+    0x8042,0x38f,
+    0x3f,0x39a,
+    0x8029,0x395,
+    0x8014,0x392,
+    0x8006,0x396,
+    0x8000,0x3a3,
+    0x8004,0x3b0,
+    0x8010,0x3b7,
+    0x8025,0x3bc,
+    0x803f,0x3bc,
+    0x72,0x446,
+    0x807a,0x44a,
+    0x8089,0x44c,
+    0x8097,0x447,
+    0x809c,0x441,
+    0x809e,0x439,
+    0x809d,0x42f,
+    0x8096,0x41f,
+    0x808f,0x416,
+    0x8086,0x40d,
+    0x807b,0x400,
+    0x8079,0x3f7,
+    0x8088,0x3f6,
+    0x8098,0x3f7,
+    0x80a9,0x3f7,
+    0x132,0x3df,
+    0x8132,0x3c6,
+    0x8132,0x3b5,
+    0x8132,0x394,
+    0x10d,0x3b5,
+    0x8123,0x3b5,
+    0x8132,0x3b5,
+    0x8141,0x3b5,
+    0x8155,0x3b5,
+    0x1c1,0x416,
+    0x81c0,0x3d4,
+    0x81bf,0x3b3,
+    0x81bf,0x3a6,
+    0x81c4,0x397,
+    0x81cb,0x392,
+    0x81d9,0x390,
+    0x81e7,0x391,
+    0x81f0,0x394,
+    0x8200,0x3a1,
+    0x8204,0x3ab,
+    0x8207,0x3c0,
+    0x8205,0x3d3,
+    0x81fe,0x3df,
+    0x81f4,0x3e3,
+    0x81e4,0x3e3,
+    0x81da,0x3e0,
+    0x81c4,0x3d5,
+    0x234,0x443,
+    0x823f,0x44a,
+    0x824a,0x44c,
+    0x8255,0x44a,
+    0x825e,0x440,
+    0x8260,0x434,
+    0x825b,0x427,
+    0x8250,0x418,
+    0x8246,0x40c,
+    0x8241,0x402,
+    0x823d,0x3f6,
+    0x8253,0x3f6,
+    0x8269,0x3f6,
+    0x2de,0x3ce,
+    0x8303,0x3ce,
+    0x8329,0x3ce,
+    0x2e1,0x3a1,
+    0x8303,0x3a1,
+    0x8327,0x3a1,
+    0x3ea,0x394,
+    0x83e0,0x392,
+    0x83d1,0x38f,
+    0x83bf,0x392,
+    0x83b1,0x39d,
+    0x83a9,0x3a8,
+    0x83a4,0x3ba,
+    0x83a6,0x3c5,
+    0x83aa,0x3ce,
+    0x83b4,0x3dc,
+    0x83c2,0x3e4,
+    0x83c8,0x3e5,
+    0x83d9,0x3e5,
+    0x83e7,0x3e2,
+    0x417,0x446,
+    0x8423,0x44a,
+    0x8432,0x44a,
+    0x843d,0x442,
+    0x8441,0x435,
+    0x843d,0x425,
+    0x8435,0x419,
+    0x8427,0x407,
+    0x841e,0x3f6,
+    0x8435,0x3f6,
+    0x844c,0x3f6
+]
+
+EQN_02 = [
+    0x1d,0x41a,
+    0x8027,0x419,
+    0x802f,0x416,
+    0x8039,0x40a,
+    0x803e,0x3f5,
+    0x803c,0x3e6,
+    0x8036,0x3d5,
+    0x8029,0x3c9,
+    0x801d,0x3c6,
+    0x8011,0x3c9,
+    0x8007,0x3d4,
+    0x8001,0x3e3,
+    0x8000,0x3f6,
+    0x8005,0x409,
+    0x8010,0x415,
+    0x801c,0x419,
+    0x90,0x3ed,
+    0x80a2,0x3ed,
+    0x80b5,0x3ed,
+    0x80c8,0x3ed,
+    0x90,0x3d2,
+    0x80a0,0x3d2,
+    0x80c8,0x3d2,
+    0x128,0x403,
+    0x8136,0x404,
+    0x8141,0x403,
+    0x8147,0x3ff,
+    0x814c,0x3f5,
+    0x814d,0x3e6,
+    0x814d,0x3db,
+    0x814c,0x3d2,
+    0x814c,0x3c4,
+    0x149,0x3ce,
+    0x813c,0x3ca,
+    0x812e,0x3c7,
+    0x8127,0x3c8,
+    0x8122,0x3cd,
+    0x8121,0x3d7,
+    0x8126,0x3df,
+    0x812b,0x3e2,
+    0x8136,0x3e6,
+    0x8143,0x3e6,
+    0x814b,0x3e5,
+    0x17b,0x405,
+    0x8187,0x3f4,
+    0x819a,0x3db,
+    0x81ab,0x3c5,
+    0x178,0x3c5,
+    0x8189,0x3da,
+    0x819c,0x3f4,
+    0x81a8,0x405,
+    0x1ce,0x448,
+    0x81d5,0x44b,
+    0x81df,0x44c,
+    0x81e8,0x447,
+    0x81ea,0x43d,
+    0x81e7,0x42f,
+    0x81e0,0x425,
+    0x81db,0x41d,
+    0x81d3,0x411,
+    0x81e2,0x411,
+    0x81f1,0x411,
+    0x25b,0x3fb,
+    0x825b,0x3e6,
+    0x825b,0x3cd,
+    0x240,0x3e3,
+    0x825b,0x3e3,
+    0x8276,0x3e3,
+    0x2c1,0x425,
+    0x82bf,0x402,
+    0x82bd,0x3e8,
+    0x82be,0x3d3,
+    0x82c3,0x3cc,
+    0x82cb,0x3c6,
+    0x82d9,0x3c6,
+    0x82e2,0x3c8,
+    0x82ee,0x3d1,
+    0x82f5,0x3e5,
+    0x82f5,0x3f1,
+    0x82f1,0x3fc,
+    0x82ed,0x401,
+    0x82e5,0x404,
+    0x82d7,0x404,
+    0x82cb,0x3fe,
+    0x82c0,0x3f2,
+    0x34e,0x408,
+    0x8341,0x3f5,
+    0x8337,0x3e9,
+    0x8327,0x3d5,
+    0x8319,0x3c5,
+    0x31b,0x405,
+    0x832c,0x3ef,
+    0x833e,0x3d7,
+    0x834b,0x3c5,
+    0x3b3,0x3fb,
+    0x83b3,0x3e3,
+    0x83b3,0x3cb,
+    0x396,0x3e3,
+    0x83b3,0x3e3,
+    0x83ce,0x3e3,
+    0x44c,0x3c8,
+    0x843f,0x3c7,
+    0x8434,0x3c7,
+    0x842a,0x3cc,
+    0x8423,0x3d3,
+    0x841d,0x3dd,
+    0x841c,0x3e8,
+    0x841f,0x3f3,
+    0x8428,0x3fd,
+    0x8431,0x403,
+    0x843e,0x405,
+    0x844c,0x405
+]
+
+EQN_03 = [
+    0x1,0x3a0,
+    0x800e,0x38c,
+    0x8014,0x386,
+    0x801b,0x37e,
+    0x8026,0x373,
+    0x22,0x3a0,
+    0x8019,0x394,
+    0x8010,0x386,
+    0x8008,0x37b,
+    0x8000,0x372,
+    0x65,0x390,
+    0x807a,0x391,
+    0x808f,0x391,
+    0x65,0x37b,
+    0x807a,0x37b,
+    0x808f,0x37b,
+    0xe4,0x3e2,
+    0x80f9,0x3e2,
+    0x810f,0x3e2,
+    0x135,0x413,
+    0x8135,0x401,
+    0x8135,0x3f3,
+    0x8135,0x3e4,
+    0x8136,0x3d2,
+    0x8140,0x3cc,
+    0x814f,0x3d2,
+    0x8159,0x3e0,
+    0x8158,0x3f0,
+    0x8153,0x3f8,
+    0x8145,0x3fa,
+    0x8139,0x3f3,
+    0x1a5,0x3fd,
+    0x81a5,0x3f4,
+    0x81a5,0x3ec,
+    0x81a5,0x3e1,
+    0x81a5,0x3d8,
+    0x192,0x3ec,
+    0x819c,0x3eb,
+    0x81ab,0x3eb,
+    0x81b7,0x3ec,
+    0x190,0x3cc,
+    0x81a4,0x3cc,
+    0x81b7,0x3cc,
+    0x200,0x3f3,
+    0x8212,0x3fc,
+    0x8220,0x3df,
+    0x822f,0x3bb,
+    0x8232,0x3c6,
+    0x8238,0x3da,
+    0x8241,0x3ff,
+    0x8247,0x420,
+    0x824d,0x437,
+    0x8256,0x44c,
+    0x8275,0x44c,
+    0x82be,0x44c,
+    0x8302,0x44c,
+    0x837b,0x44c,
+    0x83c7,0x44c,
+    0x83eb,0x44c,
+    0x83fa,0x44c,
+    0x843c,0x44c,
+    0x26f,0x413,
+    0x826f,0x3ff,
+    0x826f,0x3f3,
+    0x826f,0x3e4,
+    0x8270,0x3d2,
+    0x8277,0x3cd,
+    0x8283,0x3cd,
+    0x828f,0x3d3,
+    0x8295,0x3e0,
+    0x8295,0x3eb,
+    0x828e,0x3f8,
+    0x8287,0x3fb,
+    0x827f,0x3fa,
+    0x8271,0x3f3,
+    0x2ac,0x421,
+    0x82b6,0x425,
+    0x82bc,0x425,
+    0x82c3,0x41d,
+    0x82c2,0x414,
+    0x82bc,0x40b,
+    0x82b5,0x404,
+    0x82af,0x3f9,
+    0x82bc,0x3fa,
+    0x82c8,0x3f9,
+    0x2ff,0x3e2,
+    0x8315,0x3e2,
+    0x832b,0x3e2,
+    0x38c,0x3dc,
+    0x837e,0x3dc,
+    0x8370,0x3dc,
+    0x8361,0x3dc,
+    0x8366,0x3ea,
+    0x836e,0x3fa,
+    0x837e,0x409,
+    0x837e,0x3fb,
+    0x837e,0x3ea,
+    0x837e,0x3de,
+    0x837e,0x3d0,
+    0x3c3,0x3fb,
+    0x83d1,0x3fc,
+    0x83dd,0x3f9,
+    0x83e4,0x3f1,
+    0x83e6,0x3e8,
+    0x83e6,0x3db,
+    0x83e5,0x3ce,
+    0x3e3,0x3d5,
+    0x83d5,0x3ce,
+    0x83cc,0x3cd,
+    0x83c6,0x3cf,
+    0x83c3,0x3d6,
+    0x83c5,0x3de,
+    0x83cb,0x3e2,
+    0x83d7,0x3e4,
+    0x83e3,0x3e4,
+    0x426,0x3ce,
+    0x841a,0x3ce,
+    0x840f,0x3d1,
+    0x8408,0x3d8,
+    0x8405,0x3e4,
+    0x8406,0x3ed,
+    0x840c,0x3f5,
+    0x8417,0x3fa,
+    0x8426,0x3fb,
+    0xda,0x395,
+    0x81ba,0x395,
+    0x8278,0x395,
+    0x832d,0x395,
+    0x8349,0x395,
+    0x83d9,0x395,
+    0x844c,0x395,
+    0x251,0x34d,
+    0x825b,0x34f,
+    0x8266,0x34f,
+    0x8270,0x34b,
+    0x8273,0x340,
+    0x826d,0x332,
+    0x8265,0x328,
+    0x825b,0x31c,
+    0x8254,0x310,
+    0x8265,0x310,
+    0x8279,0x310,
+    0x2b4,0x33f,
+    0x82c5,0x33f,
+    0x82cc,0x33c,
+    0x82d1,0x339,
+    0x82d4,0x334,
+    0x82d5,0x32c,
+    0x82d6,0x326,
+    0x82d6,0x320,
+    0x82d6,0x317,
+    0x82d6,0x310,
+    0x2d4,0x31d,
+    0x82cc,0x315,
+    0x82c5,0x312,
+    0x82ba,0x313,
+    0x82b6,0x315,
+    0x82b2,0x31b,
+    0x82b4,0x322,
+    0x82bd,0x329,
+    0x82c7,0x32b,
+    0x82d4,0x328
+]
+
+EQN_04 = [
+    0x3,0x416,
+    0x800d,0x416,
+    0x8016,0x417,
+    0x801f,0x419,
+    0x8021,0x41f,
+    0x801b,0x429,
+    0x8012,0x42c,
+    0x8008,0x42a,
+    0x8001,0x422,
+    0x8000,0x415,
+    0x8002,0x40a,
+    0x8009,0x405,
+    0x8014,0x403,
+    0x8020,0x404,
+    0x3a,0x44b,
+    0x8044,0x44a,
+    0x8045,0x43b,
+    0x8045,0x430,
+    0x3a,0x42f,
+    0x8045,0x42f,
+    0x8051,0x42f,
+    0x62,0x44c,
+    0x8068,0x444,
+    0x8072,0x437,
+    0x807a,0x42d,
+    0x7c,0x44c,
+    0x8075,0x444,
+    0x8069,0x436,
+    0x8062,0x42d,
+    0x96,0x41e,
+    0x80a8,0x41e,
+    0x80be,0x41e,
+    0x96,0x40b,
+    0x80aa,0x40b,
+    0x80be,0x40b,
+    0xfb,0x404,
+    0x80eb,0x405,
+    0x80e1,0x40a,
+    0x80da,0x411,
+    0x80d6,0x41d,
+    0x80d8,0x428,
+    0x80de,0x432,
+    0x80e9,0x437,
+    0x80f9,0x439,
+    0x11e,0x42a,
+    0x8126,0x42c,
+    0x812f,0x42a,
+    0x8136,0x424,
+    0x8139,0x41c,
+    0x8138,0x412,
+    0x8134,0x40a,
+    0x812d,0x404,
+    0x8125,0x402,
+    0x811b,0x405,
+    0x8116,0x40b,
+    0x8113,0x413,
+    0x8113,0x417,
+    0x8114,0x41f,
+    0x8118,0x426,
+    0x811d,0x429,
+    0x154,0x406,
+    0x8161,0x403,
+    0x816c,0x407,
+    0x816d,0x410,
+    0x816a,0x414,
+    0x8162,0x418,
+    0x815a,0x41a,
+    0x8153,0x421,
+    0x8156,0x429,
+    0x8160,0x42c,
+    0x816b,0x429,
+    0x1ae,0x43b,
+    0x81a4,0x426,
+    0x81a0,0x413,
+    0x81a3,0x404,
+    0x81ae,0x3ed,
+    0x1cf,0x42f,
+    0x81d8,0x422,
+    0x81e1,0x417,
+    0x81e8,0x40d,
+    0x81f1,0x400,
+    0x1ce,0x401,
+    0x81da,0x410,
+    0x81e2,0x41a,
+    0x81e8,0x422,
+    0x81f1,0x42e,
+    0x210,0x439,
+    0x821b,0x425,
+    0x821f,0x413,
+    0x8219,0x3fe,
+    0x8210,0x3ed,
+    0x260,0x426,
+    0x8260,0x415,
+    0x8260,0x404,
+    0x24d,0x415,
+    0x825f,0x415,
+    0x8272,0x415,
+    0x291,0x42d,
+    0x8299,0x42d,
+    0x82a1,0x42d,
+    0x82a1,0x422,
+    0x82a1,0x416,
+    0x82a1,0x40d,
+    0x82a1,0x402,
+    0x28d,0x402,
+    0x829b,0x402,
+    0x82ae,0x402,
+    0x308,0x405,
+    0x8313,0x403,
+    0x831c,0x404,
+    0x8325,0x407,
+    0x8328,0x411,
+    0x8325,0x417,
+    0x831d,0x41d,
+    0x8313,0x421,
+    0x830d,0x425,
+    0x8309,0x42d,
+    0x830d,0x438,
+    0x8317,0x43b,
+    0x8321,0x439,
+    0x345,0x42d,
+    0x8353,0x42d,
+    0x8353,0x41d,
+    0x8353,0x40d,
+    0x8353,0x402,
+    0x342,0x402,
+    0x834f,0x402,
+    0x8357,0x402,
+    0x8363,0x402,
+    0x37e,0x42d,
+    0x837f,0x423,
+    0x837f,0x414,
+    0x837f,0x404,
+    0x37f,0x424,
+    0x8389,0x429,
+    0x8394,0x42b,
+    0x839c,0x427,
+    0x839f,0x420,
+    0x839f,0x414,
+    0x839f,0x404,
+    0x3db,0x439,
+    0x83d1,0x426,
+    0x83cd,0x415,
+    0x83d0,0x404,
+    0x83dc,0x3eb,
+    0x3fc,0x42f,
+    0x8407,0x41f,
+    0x8414,0x40e,
+    0x841e,0x400,
+    0x3fc,0x401,
+    0x8408,0x411,
+    0x8412,0x41f,
+    0x841e,0x42f,
+    0x43e,0x439,
+    0x8444,0x42e,
+    0x8448,0x425,
+    0x844b,0x41b,
+    0x844c,0x410,
+    0x8449,0x405,
+    0x8444,0x3f8,
+    0x843c,0x3eb
+]
+
+EQN_05 = [
+    0x3,0x3cb,
+    0x801b,0x3cb,
+    0x802d,0x3cb,
+    0x8046,0x3cf,
+    0x804a,0x3de,
+    0x803f,0x3f4,
+    0x8025,0x3fb,
+    0x8007,0x3ea,
+    0x8000,0x3cd,
+    0x8002,0x3ba,
+    0x800b,0x3a9,
+    0x8017,0x39f,
+    0x8028,0x39c,
+    0x8045,0x39e,
+    0xb9,0x40c,
+    0x8099,0x40c,
+    0x807b,0x40c,
+    0x7b,0x44c,
+    0x809b,0x44c,
+    0x809c,0x434,
+    0x809b,0x420,
+    0x809b,0x40d,
+    0xd7,0x447,
+    0x80f2,0x447,
+    0x810d,0x447,
+    0x8130,0x447,
+    0x10d,0x445,
+    0x8110,0x43c,
+    0x8112,0x431,
+    0x8115,0x41f,
+    0x811a,0x40c,
+    0xf2,0x444,
+    0x80f0,0x436,
+    0x80ed,0x42a,
+    0x80e3,0x41a,
+    0x80d7,0x40c,
+    0x1bc,0x3ec,
+    0x81bc,0x3d3,
+    0x81bc,0x3b8,
+    0x81bc,0x39e,
+    0x19a,0x3c4,
+    0x81ad,0x3c4,
+    0x81bf,0x3c4,
+    0x81dc,0x3c4,
+    0x257,0x3ff,
+    0x826a,0x409,
+    0x827f,0x413,
+    0x8280,0x401,
+    0x8280,0x3d3,
+    0x8280,0x3bb,
+    0x827f,0x39d,
+    0x2a3,0x39b,
+    0x827c,0x39c,
+    0x8256,0x39c,
+    0x324,0x3db,
+    0x834b,0x3dc,
+    0x8371,0x3db,
+    0x326,0x3ad,
+    0x834b,0x3ad,
+    0x8370,0x3ad,
+    0x40e,0x419,
+    0x841f,0x41d,
+    0x842f,0x41a,
+    0x843e,0x40f,
+    0x8445,0x404,
+    0x844a,0x3ef,
+    0x844c,0x3db,
+    0x844a,0x3c9,
+    0x8443,0x3b3,
+    0x842f,0x39f,
+    0x841b,0x39b,
+    0x8409,0x3a1,
+    0x83fe,0x3ac,
+    0x83f4,0x3be,
+    0x83f0,0x3d7,
+    0x83f1,0x3ed,
+    0x83fb,0x407,
+    0x840e,0x419
+]
+
+EQN_06 = [
+    0x3,0x3d9,
+    0x8024,0x3d9,
+    0x8076,0x3d9,
+    0x0,0x372,
+    0x8000,0x3b8,
+    0x8000,0x3dc,
+    0x8000,0x40a,
+    0x8000,0x42b,
+    0x8000,0x44c,
+    0x8021,0x44c,
+    0x8076,0x44c,
+    0x169,0x3d9,
+    0x81a8,0x3d9,
+    0x81e6,0x3d9,
+    0x169,0x38a,
+    0x81a8,0x38a,
+    0x81e6,0x38a,
+    0x2ca,0x369,
+    0x82ca,0x3af,
+    0x82cd,0x3f7,
+    0x82d4,0x405,
+    0x82e3,0x410,
+    0x82fd,0x413,
+    0x830f,0x40c,
+    0x8318,0x3fc,
+    0x831c,0x3d6,
+    0x831d,0x3ab,
+    0x831d,0x36b,
+    0x31a,0x3f6,
+    0x8329,0x409,
+    0x833e,0x410,
+    0x8356,0x411,
+    0x836d,0x406,
+    0x8371,0x3f0,
+    0x8371,0x3c8,
+    0x8371,0x39c,
+    0x8371,0x36c,
+    0x3c6,0x40a,
+    0x83e2,0x40f,
+    0x840f,0x413,
+    0x843c,0x406,
+    0x8449,0x3df,
+    0x844b,0x3c4,
+    0x844c,0x3a8,
+    0x8444,0x375,
+    0x8426,0x36a,
+    0x83fd,0x369,
+    0x83d1,0x37b,
+    0x83c8,0x39b,
+    0x83d3,0x3b1,
+    0x83ec,0x3bc,
+    0x8428,0x3be,
+    0x8448,0x3bb
+]
+
+EQN_07 = [
+    0x81,0x43c,
+    0x808d,0x43d,
+    0x8094,0x43b,
+    0x8098,0x436,
+    0x8099,0x42c,
+    0x8099,0x424,
+    0x8097,0x420,
+    0x8091,0x41e,
+    0x808b,0x41d,
+    0x8083,0x421,
+    0x8083,0x427,
+    0x8086,0x42b,
+    0x808c,0x42c,
+    0x8097,0x42d,
+    0x0,0x3f8,
+    0x804b,0x3f8,
+    0x80b1,0x3f8,
+    0x8117,0x3f8,
+    0x5,0x3a4,
+    0x800d,0x3a3,
+    0x8016,0x3a3,
+    0x801b,0x3a7,
+    0x801c,0x3ab,
+    0x8017,0x3af,
+    0x8010,0x3b2,
+    0x8008,0x3b8,
+    0x800a,0x3be,
+    0x8013,0x3c1,
+    0x801a,0x3c1,
+    0x32,0x3c1,
+    0x8040,0x3c1,
+    0x8040,0x3b1,
+    0x8040,0x3a3,
+    0x32,0x3a3,
+    0x803f,0x3a3,
+    0x804c,0x3a3,
+    0x5f,0x3be,
+    0x8066,0x3c0,
+    0x806c,0x3c1,
+    0x8072,0x3bf,
+    0x8076,0x3ba,
+    0x8077,0x3b0,
+    0x8077,0x3a3,
+    0x5f,0x3c2,
+    0x805e,0x3b6,
+    0x805e,0x3ad,
+    0x805e,0x3a3,
+    0xb3,0x3ca,
+    0x80ac,0x3ba,
+    0x80ab,0x3b0,
+    0x80ad,0x3a4,
+    0x80b5,0x393,
+    0xcc,0x3c0,
+    0x80d6,0x3c2,
+    0x80e1,0x3bf,
+    0x80e4,0x3b9,
+    0x80e4,0x3af,
+    0x80e2,0x3a6,
+    0x80de,0x3a3,
+    0x80d6,0x3a3,
+    0x80cf,0x3a5,
+    0x80cd,0x3ab,
+    0x80d1,0x3b0,
+    0x80d9,0x3b2,
+    0x80e2,0x3b2,
+    0xfa,0x3cc,
+    0x8100,0x3c3,
+    0x8105,0x3b3,
+    0x8103,0x3a6,
+    0x80fd,0x395,
+    0x14c,0x3f8,
+    0x8159,0x3f8,
+    0x8165,0x3f8,
+    0x14c,0x3ea,
+    0x8159,0x3ea,
+    0x8165,0x3ea,
+    0x21a,0x44c,
+    0x821b,0x439,
+    0x821a,0x42c,
+    0x821c,0x420,
+    0x8223,0x41d,
+    0x822c,0x421,
+    0x8232,0x428,
+    0x8233,0x433,
+    0x822d,0x43b,
+    0x8223,0x43b,
+    0x821c,0x439,
+    0x19a,0x3f8,
+    0x81f7,0x3f8,
+    0x8256,0x3f8,
+    0x82b2,0x3f8,
+    0x19e,0x3a7,
+    0x81a6,0x3a6,
+    0x81ae,0x3a6,
+    0x81b3,0x3aa,
+    0x81b4,0x3ae,
+    0x81af,0x3b2,
+    0x81a9,0x3b6,
+    0x81a1,0x3bb,
+    0x81a3,0x3c1,
+    0x81ac,0x3c4,
+    0x81b3,0x3c5,
+    0x1ca,0x3c5,
+    0x81d8,0x3c4,
+    0x81d8,0x3b4,
+    0x81d9,0x3a6,
+    0x1ca,0x3a6,
+    0x81d8,0x3a6,
+    0x81e5,0x3a6,
+    0x1f8,0x3c1,
+    0x81fe,0x3c3,
+    0x8204,0x3c4,
+    0x820b,0x3c2,
+    0x820e,0x3bd,
+    0x8210,0x3b3,
+    0x8210,0x3a6,
+    0x1f7,0x3c5,
+    0x81f7,0x3ba,
+    0x81f7,0x3b0,
+    0x81f7,0x3a6,
+    0x24c,0x3cd,
+    0x8245,0x3be,
+    0x8243,0x3b3,
+    0x8246,0x3a7,
+    0x824d,0x397,
+    0x265,0x3cc,
+    0x8265,0x3b8,
+    0x8265,0x3ac,
+    0x8266,0x3a0,
+    0x826d,0x39d,
+    0x8277,0x3a0,
+    0x827d,0x3a8,
+    0x827d,0x3b2,
+    0x8278,0x3ba,
+    0x826d,0x3ba,
+    0x8266,0x3b8,
+    0x28e,0x3d0,
+    0x8294,0x3c7,
+    0x8299,0x3b7,
+    0x8298,0x3aa,
+    0x8291,0x399,
+    0x2e6,0x3fa,
+    0x82f3,0x3fa,
+    0x82ff,0x3fa,
+    0x2e6,0x3ec,
+    0x82f3,0x3ec,
+    0x82ff,0x3ec,
+    0x3cd,0x421,
+    0x83c3,0x41f,
+    0x83b9,0x422,
+    0x83b5,0x42d,
+    0x83b7,0x436,
+    0x83bb,0x43a,
+    0x83c3,0x43d,
+    0x83cd,0x43a,
+    0x334,0x3f8,
+    0x838a,0x3f8,
+    0x83f4,0x3f8,
+    0x844c,0x3f8,
+    0x33d,0x3a7,
+    0x8345,0x3a6,
+    0x834e,0x3a6,
+    0x8353,0x3aa,
+    0x8354,0x3ae,
+    0x834f,0x3b2,
+    0x8348,0x3b5,
+    0x8340,0x3bb,
+    0x8342,0x3c1,
+    0x834b,0x3c4,
+    0x8352,0x3c4,
+    0x36a,0x3c4,
+    0x8378,0x3c4,
+    0x8378,0x3b4,
+    0x8378,0x3a6,
+    0x36a,0x3a6,
+    0x8378,0x3a6,
+    0x8384,0x3a6,
+    0x397,0x3c1,
+    0x839e,0x3c3,
+    0x83a4,0x3c4,
+    0x83ab,0x3c2,
+    0x83ae,0x3bd,
+    0x83af,0x3b3,
+    0x83af,0x3a6,
+    0x397,0x3c5,
+    0x8396,0x3ba,
+    0x8396,0x3b0,
+    0x8396,0x3a6,
+    0x3eb,0x3cd,
+    0x83e4,0x3bd,
+    0x83e3,0x3b3,
+    0x83e5,0x3a7,
+    0x83ed,0x396,
+    0x416,0x3a4,
+    0x840c,0x3a3,
+    0x8403,0x3a5,
+    0x83ff,0x3b0,
+    0x8400,0x3b9,
+    0x8404,0x3be,
+    0x840d,0x3c1,
+    0x8416,0x3bd,
+    0x424,0x3cf,
+    0x842a,0x3c6,
+    0x842f,0x3b5,
+    0x842e,0x3a8,
+    0x8427,0x397
+]
+
+EQN_08 = [
+    0x19,0x3f8,
+    0x800e,0x3f6,
+    0x8004,0x3f9,
+    0x8000,0x405,
+    0x8001,0x40f,
+    0x8006,0x414,
+    0x800f,0x417,
+    0x8019,0x413,
+    0x27,0x44b,
+    0x8031,0x44a,
+    0x8036,0x447,
+    0x8039,0x440,
+    0x8032,0x434,
+    0x802d,0x42f,
+    0x8029,0x428,
+    0x8033,0x428,
+    0x803b,0x428,
+    0x7e,0x411,
+    0x808c,0x411,
+    0x8099,0x411,
+    0x7e,0x402,
+    0x808c,0x402,
+    0x8099,0x402,
+    0xbe,0x41b,
+    0x80cb,0x41c,
+    0x80d3,0x41a,
+    0x80d7,0x414,
+    0x80d9,0x409,
+    0x80d8,0x400,
+    0x80d6,0x3fc,
+    0x80cf,0x3fa,
+    0x80c9,0x3f9,
+    0x80c0,0x3fe,
+    0x80c0,0x404,
+    0x80c3,0x408,
+    0x80ca,0x40a,
+    0x80d6,0x40a,
+    0xeb,0x44c,
+    0x80f5,0x44c,
+    0x80fa,0x449,
+    0x80fe,0x442,
+    0x80f7,0x436,
+    0x80f1,0x431,
+    0x80ed,0x42a,
+    0x80f7,0x42a,
+    0x8100,0x42a,
+    0x142,0x415,
+    0x8142,0x409,
+    0x8142,0x402,
+    0x136,0x40d,
+    0x8140,0x40d,
+    0x814e,0x40d,
+    0x18a,0x42e,
+    0x818a,0x418,
+    0x818a,0x40b,
+    0x818b,0x3fd,
+    0x8193,0x3fa,
+    0x819e,0x3fe,
+    0x81a4,0x406,
+    0x81a4,0x412,
+    0x819f,0x41a,
+    0x8193,0x41b,
+    0x818b,0x418,
+    0x1ac,0x44c,
+    0x81b6,0x44c,
+    0x81bb,0x449,
+    0x81bf,0x442,
+    0x81b8,0x436,
+    0x81b2,0x431,
+    0x81ae,0x42a,
+    0x81b8,0x42a,
+    0x81c0,0x42a,
+    0x1f7,0x40d,
+    0x8208,0x40d,
+    0x8218,0x40d,
+    0x245,0x436,
+    0x8258,0x435,
+    0x8261,0x42f,
+    0x8267,0x425,
+    0x825a,0x413,
+    0x8250,0x40b,
+    0x8249,0x400,
+    0x825b,0x400,
+    0x826a,0x400,
+    0x285,0x421,
+    0x8292,0x422,
+    0x829a,0x420,
+    0x829e,0x41b,
+    0x829f,0x410,
+    0x829f,0x407,
+    0x829d,0x403,
+    0x8296,0x400,
+    0x828f,0x400,
+    0x8287,0x404,
+    0x8286,0x40a,
+    0x828a,0x40f,
+    0x8291,0x411,
+    0x829d,0x411,
+    0x2c4,0x431,
+    0x82c5,0x41b,
+    0x82c4,0x40e,
+    0x82c6,0x400,
+    0x82ce,0x3fd,
+    0x82d8,0x401,
+    0x82de,0x409,
+    0x82df,0x415,
+    0x82d9,0x41d,
+    0x82ce,0x41d,
+    0x82c6,0x41b,
+    0x331,0x3ff,
+    0x8326,0x3fd,
+    0x831c,0x400,
+    0x8318,0x40c,
+    0x8319,0x416,
+    0x831e,0x41b,
+    0x8327,0x41e,
+    0x8331,0x41a,
+    0x34a,0x41c,
+    0x8355,0x41f,
+    0x835e,0x41c,
+    0x8363,0x411,
+    0x8362,0x406,
+    0x8353,0x3fd,
+    0x8347,0x405,
+    0x8344,0x40f,
+    0x834a,0x41c,
+    0x377,0x400,
+    0x8380,0x3fe,
+    0x8389,0x3ff,
+    0x838f,0x402,
+    0x8390,0x407,
+    0x838a,0x40b,
+    0x8383,0x40f,
+    0x837a,0x415,
+    0x837c,0x41c,
+    0x8386,0x41f,
+    0x838e,0x420,
+    0x3e4,0x42d,
+    0x83dd,0x41c,
+    0x83db,0x411,
+    0x83de,0x403,
+    0x83e6,0x3f1,
+    0x410,0x428,
+    0x8420,0x420,
+    0x8423,0x410,
+    0x841d,0x3ff,
+    0x8410,0x3fa,
+    0x8403,0x400,
+    0x83fe,0x411,
+    0x8402,0x421,
+    0x8410,0x428,
+    0x3fe,0x412,
+    0x8410,0x412,
+    0x8423,0x412,
+    0x440,0x42b,
+    0x8447,0x421,
+    0x844c,0x40f,
+    0x844a,0x401,
+    0x8443,0x3ee
+]
+
+EQN_09 = [
+    0x1e,0x3f3,
+    0x8011,0x3f1,
+    0x8005,0x3f4,
+    0x8000,0x403,
+    0x8001,0x40f,
+    0x8007,0x414,
+    0x8012,0x418,
+    0x801d,0x413,
+    0x3b,0x416,
+    0x8048,0x419,
+    0x8052,0x415,
+    0x8058,0x409,
+    0x8057,0x3fc,
+    0x8045,0x3f1,
+    0x8038,0x3fa,
+    0x8034,0x407,
+    0x803a,0x415,
+    0x70,0x3f4,
+    0x807a,0x3f2,
+    0x8085,0x3f3,
+    0x808c,0x3f7,
+    0x808d,0x3fd,
+    0x8086,0x402,
+    0x807e,0x406,
+    0x8074,0x40e,
+    0x8076,0x415,
+    0x8081,0x41a,
+    0x808a,0x41a,
+    0xa1,0x445,
+    0x80ac,0x445,
+    0x80b2,0x440,
+    0x80b6,0x439,
+    0x80ae,0x42c,
+    0x80a8,0x426,
+    0x80a3,0x41e,
+    0x80af,0x41e,
+    0x80b8,0x41e,
+    0xef,0x429,
+    0x80e6,0x416,
+    0x80e4,0x40a,
+    0x80e7,0x3fb,
+    0x80f0,0x3e6,
+    0x123,0x41c,
+    0x811a,0x40f,
+    0x810d,0x3ff,
+    0x8103,0x3f2,
+    0x103,0x41c,
+    0x810d,0x40f,
+    0x811a,0x3fe,
+    0x8123,0x3f2,
+    0x135,0x42c,
+    0x813c,0x421,
+    0x8142,0x40c,
+    0x8140,0x3fc,
+    0x8138,0x3e7,
+    0x1aa,0x415,
+    0x81aa,0x407,
+    0x81aa,0x400,
+    0x19b,0x40b,
+    0x81a7,0x40b,
+    0x81b7,0x40b,
+    0x1f8,0x3f8,
+    0x8202,0x3f6,
+    0x820d,0x3f6,
+    0x8213,0x3fb,
+    0x8214,0x400,
+    0x820e,0x405,
+    0x8206,0x409,
+    0x81fc,0x410,
+    0x81ff,0x417,
+    0x820a,0x41b,
+    0x8212,0x41c,
+    0x22f,0x41c,
+    0x8241,0x41b,
+    0x8241,0x407,
+    0x8241,0x3f6,
+    0x22f,0x3f6,
+    0x8240,0x3f6,
+    0x8250,0x3f6,
+    0x267,0x418,
+    0x826f,0x41a,
+    0x8277,0x41b,
+    0x827f,0x419,
+    0x8283,0x412,
+    0x8285,0x407,
+    0x8285,0x3f6,
+    0x266,0x41c,
+    0x8266,0x40e,
+    0x8266,0x402,
+    0x8266,0x3f6,
+    0x2a0,0x44c,
+    0x82ab,0x44c,
+    0x82b1,0x448,
+    0x82b5,0x440,
+    0x82ad,0x434,
+    0x82a6,0x42e,
+    0x82a2,0x425,
+    0x82ad,0x425,
+    0x82b7,0x425,
+    0x2f9,0x42d,
+    0x82f1,0x41a,
+    0x82ef,0x40d,
+    0x82f2,0x3ff,
+    0x82fb,0x3ea,
+    0x32e,0x41f,
+    0x8325,0x413,
+    0x8318,0x403,
+    0x830e,0x3f6,
+    0x30e,0x41f,
+    0x8318,0x413,
+    0x8325,0x402,
+    0x832e,0x3f6,
+    0x340,0x42f,
+    0x8347,0x424,
+    0x834c,0x410,
+    0x834b,0x400,
+    0x8343,0x3eb,
+    0x3bc,0x414,
+    0x83cc,0x414,
+    0x83db,0x414,
+    0x3bc,0x403,
+    0x83cc,0x403,
+    0x83db,0x403,
+    0x41c,0x41d,
+    0x8435,0x42d,
+    0x8435,0x40f,
+    0x8435,0x3f7,
+    0x41b,0x3f6,
+    0x8434,0x3f7,
+    0x844c,0x3f6
+]
+
+EQN_10 = [
+    0x0,0x384,
+    0x800c,0x382,
+    0x8019,0x385,
+    0x8022,0x391,
+    0x8025,0x3a0,
+    0x8025,0x3bf,
+    0x8025,0x3da,
+    0x8024,0x3f9,
+    0x8025,0x423,
+    0x802c,0x434,
+    0x8039,0x43b,
+    0x8049,0x435,
+    0x5b,0x44c,
+    0x805b,0x43e,
+    0x805b,0x434,
+    0x805c,0x42b,
+    0x8061,0x428,
+    0x8069,0x42b,
+    0x806d,0x431,
+    0x806d,0x439,
+    0x8069,0x43f,
+    0x8061,0x43f,
+    0x805c,0x43e,
+    0x36,0x387,
+    0x803e,0x389,
+    0x8045,0x386,
+    0x8048,0x382,
+    0x8048,0x37a,
+    0x8047,0x373,
+    0x8044,0x371,
+    0x803d,0x370,
+    0x8038,0x372,
+    0x8037,0x377,
+    0x8039,0x37a,
+    0x803f,0x37c,
+    0x8047,0x37c,
+    0x81,0x3ec,
+    0x808a,0x3ec,
+    0x8092,0x3ec,
+    0x809e,0x3ec,
+    0xa0,0x402,
+    0x8098,0x401,
+    0x8093,0x3fe,
+    0x8090,0x3f8,
+    0x808f,0x3eb,
+    0x808f,0x3dd,
+    0x808f,0x3d1,
+    0xd1,0x404,
+    0x80c9,0x3f2,
+    0x80c7,0x3e6,
+    0x80ca,0x3d7,
+    0x80d3,0x3c3,
+    0x104,0x3f7,
+    0x80fb,0x3eb,
+    0x80ee,0x3db,
+    0x80e5,0x3cf,
+    0xe5,0x3f7,
+    0x80ef,0x3eb,
+    0x80fb,0x3db,
+    0x8104,0x3cf,
+    0x115,0x407,
+    0x811d,0x3fc,
+    0x8122,0x3e8,
+    0x8121,0x3d8,
+    0x8119,0x3c4,
+    0x1a0,0x3ff,
+    0x81a0,0x3f1,
+    0x81a0,0x3e2,
+    0x819c,0x3d5,
+    0x8193,0x3d1,
+    0x8187,0x3d4,
+    0x8182,0x3e0,
+    0x8187,0x3ec,
+    0x8194,0x3f1,
+    0x819f,0x3f1,
+    0x1d0,0x3f7,
+    0x81c7,0x3eb,
+    0x81bb,0x3db,
+    0x81b1,0x3cf,
+    0x1b1,0x3f7,
+    0x81bb,0x3eb,
+    0x81c7,0x3db,
+    0x81d0,0x3cf,
+    0x200,0x3e9,
+    0x820f,0x3e9,
+    0x821e,0x3e9,
+    0x200,0x3d8,
+    0x820f,0x3d8,
+    0x821e,0x3d8,
+    0x255,0x3d2,
+    0x8255,0x3e1,
+    0x8255,0x3ef,
+    0x8256,0x3fd,
+    0x8261,0x3fd,
+    0x826d,0x3fd,
+    0x256,0x3e4,
+    0x8261,0x3e4,
+    0x826e,0x3e5,
+    0x2a1,0x405,
+    0x8298,0x3f3,
+    0x8296,0x3e6,
+    0x8299,0x3d8,
+    0x82a2,0x3c4,
+    0x2bf,0x404,
+    0x82bf,0x3ed,
+    0x82bf,0x3de,
+    0x82c0,0x3cf,
+    0x82c9,0x3cb,
+    0x82d4,0x3cf,
+    0x82db,0x3d9,
+    0x82dc,0x3e5,
+    0x82d6,0x3ef,
+    0x82c9,0x3ef,
+    0x82c0,0x3ed,
+    0x2f0,0x409,
+    0x82f7,0x3ff,
+    0x82fd,0x3ea,
+    0x82fb,0x3db,
+    0x82f4,0x3c7,
+    0x347,0x3e6,
+    0x8357,0x3e6,
+    0x8363,0x3e6,
+    0x39d,0x3d4,
+    0x839d,0x3e2,
+    0x839e,0x3f1,
+    0x839e,0x3fe,
+    0x83a9,0x3ff,
+    0x83b5,0x3ff,
+    0x39e,0x3e6,
+    0x83a9,0x3e6,
+    0x83b6,0x3e6,
+    0x3ea,0x407,
+    0x83e2,0x3f5,
+    0x83e0,0x3e8,
+    0x83e3,0x3da,
+    0x83ec,0x3c6,
+    0x408,0x3fb,
+    0x8414,0x3fe,
+    0x8420,0x3fa,
+    0x8424,0x3f3,
+    0x8424,0x3e7,
+    0x8423,0x3dd,
+    0x841e,0x3d9,
+    0x8414,0x3d8,
+    0x840c,0x3db,
+    0x8409,0x3e2,
+    0x840d,0x3e8,
+    0x8417,0x3ea,
+    0x8423,0x3eb,
+    0x43f,0x40a,
+    0x8446,0x3ff,
+    0x844c,0x3eb,
+    0x844a,0x3dc,
+    0x8442,0x3c8
+]
+
+EQN_11 = [
+    0x5f,0x2d6,
+    0x8024,0x2d5,
+    0x8000,0x2d5,
+    0x8000,0x2f8,
+    0x8000,0x31e,
+    0x8001,0x33b,
+    0x8000,0x355,
+    0x8000,0x390,
+    0x8021,0x390,
+    0x805f,0x390,
+    0x4,0x338,
+    0x802e,0x338,
+    0x805f,0x338,
+    0x11b,0x345,
+    0x8157,0x345,
+    0x8191,0x345,
+    0x11c,0x303,
+    0x8157,0x303,
+    0x8191,0x303,
+    0x248,0x2dc,
+    0x8248,0x308,
+    0x8248,0x32e,
+    0x824a,0x34a,
+    0x8250,0x357,
+    0x8279,0x35e,
+    0x828d,0x34f,
+    0x828d,0x32e,
+    0x828d,0x2dc,
+    0x28f,0x347,
+    0x82a4,0x357,
+    0x82ba,0x35f,
+    0x82ca,0x357,
+    0x82d1,0x33d,
+    0x82d0,0x31b,
+    0x82d0,0x2dd,
+    0x3b9,0x2e7,
+    0x838a,0x2e1,
+    0x835e,0x2ec,
+    0x834a,0x320,
+    0x8351,0x34c,
+    0x8364,0x360,
+    0x838c,0x36e,
+    0x83b8,0x35e,
+    0x3f4,0x44c,
+    0x8420,0x44c,
+    0x8436,0x43b,
+    0x8444,0x41e,
+    0x8426,0x3ed,
+    0x840d,0x3d6,
+    0x83fd,0x3b6,
+    0x8428,0x3b6,
+    0x844c,0x3b6
+]
+
+EQN_12 = [
+    0x0,0x312,
+    0x8000,0x339,
+    0x8000,0x362,
+    0x8000,0x387,
+    0x801f,0x388,
+    0x8042,0x388,
+    0x1,0x343,
+    0x8021,0x344,
+    0x8043,0x344,
+    0xd0,0x35d,
+    0x80fa,0x35d,
+    0x8124,0x35d,
+    0xd1,0x32f,
+    0x80fb,0x32f,
+    0x8124,0x32f,
+    0x22a,0x425,
+    0x8208,0x40b,
+    0x81ec,0x3f7,
+    0x820a,0x3dc,
+    0x8228,0x3c5,
+    0x1e9,0x44c,
+    0x81e9,0x414,
+    0x81ea,0x3f6,
+    0x81e9,0x3c5,
+    0x2aa,0x3ce,
+    0x828c,0x3c8,
+    0x8270,0x3cd,
+    0x8261,0x3fa,
+    0x8278,0x41c,
+    0x8296,0x421,
+    0x82a9,0x41c,
+    0x82ad,0x3e9,
+    0x82ac,0x3d2,
+    0x82ad,0x3a3,
+    0x2e8,0x3c3,
+    0x830b,0x3da,
+    0x830b,0x3b0,
+    0x830c,0x38e,
+    0x2e7,0x38d,
+    0x830a,0x38e,
+    0x832b,0x38d,
+    0x3c5,0x3d0,
+    0x83a7,0x3ca,
+    0x838b,0x3cf,
+    0x837d,0x3fc,
+    0x8393,0x41e,
+    0x83b1,0x423,
+    0x83c4,0x41e,
+    0x83c8,0x3eb,
+    0x83c8,0x3d4,
+    0x83c8,0x3a5,
+    0x3fe,0x3e2,
+    0x8417,0x3e2,
+    0x8423,0x3d9,
+    0x842b,0x3c9,
+    0x841a,0x3ae,
+    0x840c,0x3a2,
+    0x8403,0x390,
+    0x841b,0x390,
+    0x842e,0x390,
+    0x1d5,0x354,
+    0x82b1,0x354,
+    0x8388,0x354,
+    0x844c,0x354,
+    0x2ba,0x23d,
+    0x82ba,0x25b,
+    0x82ba,0x27e,
+    0x82ba,0x286,
+    0x2bb,0x27b,
+    0x82cf,0x287,
+    0x82da,0x28b,
+    0x82f4,0x286,
+    0x8303,0x279,
+    0x330,0x2d7,
+    0x8347,0x2d7,
+    0x8352,0x2ce,
+    0x835a,0x2bf,
+    0x834a,0x2a5,
+    0x833d,0x29a,
+    0x8335,0x289,
+    0x834b,0x289,
+    0x835e,0x289
+]
+
+EQN_13 = [
+    0x0,0x329,
+    0x8000,0x351,
+    0x8000,0x37a,
+    0x8000,0x39f,
+    0x801f,0x3a0,
+    0x8042,0x3a0,
+    0x1,0x35b,
+    0x8021,0x35c,
+    0x8043,0x35c,
+    0xd0,0x375,
+    0x80fa,0x375,
+    0x8124,0x375,
+    0xd1,0x347,
+    0x80fb,0x347,
+    0x8124,0x347,
+    0x1f1,0x413,
+    0x8214,0x413,
+    0x8213,0x3f2,
+    0x820b,0x3db,
+    0x81f1,0x3ce,
+    0x81d7,0x3d2,
+    0x81c0,0x3ef,
+    0x81bc,0x413,
+    0x81ce,0x43f,
+    0x81eb,0x44c,
+    0x820b,0x447,
+    0x25c,0x3d9,
+    0x825c,0x3f8,
+    0x825c,0x413,
+    0x825d,0x427,
+    0x8262,0x430,
+    0x827f,0x435,
+    0x828d,0x42a,
+    0x828d,0x413,
+    0x828d,0x3d9,
+    0x28e,0x425,
+    0x829c,0x430,
+    0x82ac,0x435,
+    0x82b8,0x430,
+    0x82bc,0x41e,
+    0x82bc,0x406,
+    0x82bc,0x3da,
+    0x2e8,0x3db,
+    0x830b,0x3f2,
+    0x830b,0x3c8,
+    0x830c,0x3a6,
+    0x2e7,0x3a5,
+    0x830a,0x3a5,
+    0x832b,0x3a5,
+    0x35a,0x3dc,
+    0x835a,0x3fb,
+    0x835a,0x416,
+    0x835c,0x429,
+    0x8360,0x432,
+    0x837d,0x438,
+    0x838b,0x42d,
+    0x838b,0x416,
+    0x838b,0x3dc,
+    0x38c,0x427,
+    0x839b,0x432,
+    0x83aa,0x438,
+    0x83b6,0x432,
+    0x83bb,0x420,
+    0x83ba,0x408,
+    0x83ba,0x3dd,
+    0x3fe,0x3fa,
+    0x8417,0x3fa,
+    0x8422,0x3f1,
+    0x842a,0x3e1,
+    0x841a,0x3c6,
+    0x840c,0x3ba,
+    0x8403,0x3a8,
+    0x841b,0x3a8,
+    0x842e,0x3a8,
+    0x1d5,0x36c,
+    0x82b1,0x36c,
+    0x8388,0x36c,
+    0x844c,0x36c,
+    0x2be,0x290,
+    0x82be,0x2ae,
+    0x82be,0x2d1,
+    0x82be,0x2d9,
+    0x2bf,0x2ce,
+    0x82d2,0x2da,
+    0x82de,0x2dd,
+    0x82f7,0x2d9,
+    0x8307,0x2cb,
+    0x334,0x32a,
+    0x834b,0x329,
+    0x8356,0x321,
+    0x835e,0x311,
+    0x834e,0x2f8,
+    0x8341,0x2ec,
+    0x8339,0x2dc,
+    0x834f,0x2dc,
+    0x8361,0x2dc
+]
+
+EQN_14 = [
+    0x0,0x3eb,
+    0x8000,0x405,
+    0x8000,0x41e,
+    0x8000,0x436,
+    0x8014,0x436,
+    0x802a,0x436,
+    0x1,0x40b,
+    0x8014,0x40b,
+    0x802a,0x40b,
+    0x74,0x419,
+    0x808f,0x419,
+    0x80a9,0x419,
+    0x75,0x3fc,
+    0x808f,0x3fc,
+    0x80a9,0x3fc,
+    0xe9,0x3ef,
+    0x80e9,0x403,
+    0x80e9,0x414,
+    0x80e9,0x420,
+    0x80ec,0x426,
+    0x80fe,0x429,
+    0x8107,0x423,
+    0x8107,0x414,
+    0x8107,0x3ef,
+    0x108,0x41f,
+    0x8111,0x426,
+    0x811b,0x42a,
+    0x8122,0x426,
+    0x8125,0x41b,
+    0x8125,0x40b,
+    0x8125,0x3f0,
+    0x193,0x431,
+    0x8185,0x41d,
+    0x8171,0x404,
+    0x8161,0x3f1,
+    0x162,0x431,
+    0x8172,0x41e,
+    0x8185,0x403,
+    0x8193,0x3f1,
+    0x16b,0x446,
+    0x8174,0x446,
+    0x8175,0x44c,
+    0x816b,0x44c,
+    0x816b,0x446,
+    0x186,0x446,
+    0x818f,0x446,
+    0x818f,0x44c,
+    0x8185,0x44c,
+    0x8186,0x446,
+    0x1f5,0x41f,
+    0x81f5,0x408,
+    0x81f5,0x3fb,
+    0x1dd,0x40e,
+    0x81f2,0x40e,
+    0x820d,0x40e,
+    0x28b,0x3f3,
+    0x8276,0x3f0,
+    0x8263,0x3f5,
+    0x825a,0x40c,
+    0x825d,0x41f,
+    0x8266,0x428,
+    0x8277,0x42f,
+    0x828b,0x427,
+    0x301,0x42d,
+    0x82f3,0x419,
+    0x82df,0x400,
+    0x82cf,0x3ed,
+    0x2cf,0x42d,
+    0x82df,0x41a,
+    0x82f3,0x3ff,
+    0x8301,0x3ed,
+    0x2e2,0x441,
+    0x82eb,0x441,
+    0x82eb,0x448,
+    0x82e2,0x448,
+    0x82e2,0x441,
+    0x375,0x41d,
+    0x8375,0x405,
+    0x8375,0x3f8,
+    0x35d,0x40c,
+    0x8372,0x40c,
+    0x838d,0x40c,
+    0x3e6,0x42b,
+    0x83d1,0x41a,
+    0x83bf,0x40e,
+    0x83d2,0x3fd,
+    0x83e5,0x3ee,
+    0x3bd,0x444,
+    0x83bd,0x420,
+    0x83be,0x40d,
+    0x83bd,0x3ee,
+    0x44b,0x430,
+    0x843d,0x41c,
+    0x8429,0x403,
+    0x841a,0x3ef,
+    0x41a,0x42f,
+    0x842a,0x41c,
+    0x843d,0x401,
+    0x844c,0x3ef
+]
+
+EQN_15 = [
+    0x16,0x3f3,
+    0x8026,0x41c,
+    0x8038,0x448,
+    0x804a,0x41d,
+    0x805b,0x3f3,
+    0x4d,0x413,
+    0x8038,0x413,
+    0x8023,0x413,
+    0x7e,0x437,
+    0x808d,0x408,
+    0x809d,0x3f9,
+    0x80ac,0x40e,
+    0x80bd,0x437,
+    0x10d,0x420,
+    0x812e,0x420,
+    0x814f,0x420,
+    0x10d,0x3fc,
+    0x812e,0x3fc,
+    0x814f,0x3fc,
+    0x1c0,0x44c,
+    0x81dc,0x446,
+    0x81e3,0x43d,
+    0x81e7,0x430,
+    0x81e9,0x414,
+    0x81ef,0x3fa,
+    0x8205,0x3f0,
+    0x1e8,0x41a,
+    0x81dc,0x40c,
+    0x81d0,0x3fa,
+    0x81bd,0x3f5,
+    0x222,0x436,
+    0x8231,0x407,
+    0x8242,0x3f8,
+    0x8250,0x40d,
+    0x8262,0x436,
+    0xf,0x344,
+    0x8010,0x305,
+    0x800f,0x2c6,
+    0x54,0x2db,
+    0x8064,0x304,
+    0x8077,0x330,
+    0x8088,0x305,
+    0x809a,0x2db,
+    0x8b,0x2fb,
+    0x8076,0x2fb,
+    0x8061,0x2fa,
+    0xec,0x30c,
+    0x8115,0x30c,
+    0x8139,0x30c,
+    0x18a,0x344,
+    0x81a7,0x33e,
+    0x81ae,0x335,
+    0x81b2,0x327,
+    0x81b4,0x30b,
+    0x81ba,0x2f1,
+    0x81d0,0x2e8,
+    0x1b3,0x311,
+    0x81a6,0x303,
+    0x819a,0x2f2,
+    0x8188,0x2ed,
+    0x1ef,0x348,
+    0x8208,0x348,
+    0x821f,0x348,
+    0x20a,0x347,
+    0x820b,0x32b,
+    0x820a,0x30b,
+    0x820b,0x2e9,
+    0x1ef,0x2e8,
+    0x8208,0x2e9,
+    0x821f,0x2e8,
+    0x265,0x358,
+    0x8266,0x319,
+    0x8265,0x2da,
+    0x2eb,0x313,
+    0x830c,0x313,
+    0x832c,0x313,
+    0x2eb,0x2ef,
+    0x830c,0x2ef,
+    0x832c,0x2ef,
+    0x3ac,0x346,
+    0x83c4,0x33a,
+    0x83ce,0x31a,
+    0x83c6,0x2fa,
+    0x83ba,0x2ed,
+    0x83aa,0x2e8,
+    0x839c,0x2ed,
+    0x8393,0x2f9,
+    0x838e,0x31a,
+    0x8396,0x339,
+    0x83ac,0x346,
+    0x16,0x253,
+    0x8004,0x22b,
+    0x8000,0x210,
+    0x8006,0x1f1,
+    0x801a,0x1c5,
+    0x51,0x1e8,
+    0x8061,0x211,
+    0x8074,0x23d,
+    0x8086,0x212,
+    0x8097,0x1e8,
+    0x88,0x208,
+    0x8073,0x208,
+    0x805e,0x207,
+    0xe9,0x216,
+    0x8112,0x216,
+    0x8137,0x216,
+    0x180,0x238,
+    0x819c,0x232,
+    0x81a4,0x229,
+    0x81a8,0x21c,
+    0x81aa,0x200,
+    0x81b0,0x1e6,
+    0x81c6,0x1dc,
+    0x1a9,0x206,
+    0x819c,0x1f8,
+    0x8190,0x1e6,
+    0x817e,0x1e1,
+    0x1ef,0x23e,
+    0x8208,0x23e,
+    0x821f,0x23e,
+    0x20a,0x23e,
+    0x820b,0x221,
+    0x820b,0x201,
+    0x820b,0x1df,
+    0x1ef,0x1df,
+    0x8208,0x1df,
+    0x821f,0x1df,
+    0x254,0x257,
+    0x8264,0x23f,
+    0x826f,0x213,
+    0x826d,0x1f1,
+    0x825b,0x1c5,
+    0x2d5,0x22f,
+    0x82e4,0x1ff,
+    0x82f4,0x1f0,
+    0x8303,0x205,
+    0x8314,0x22f,
+    0x37e,0x21a,
+    0x839f,0x21a,
+    0x83c0,0x21a,
+    0x37e,0x1f5,
+    0x839f,0x1f5,
+    0x83c0,0x1f5,
+    0x429,0x23b,
+    0x8441,0x22f,
+    0x844c,0x20f,
+    0x8444,0x1ef,
+    0x8437,0x1e2,
+    0x8427,0x1dd,
+    0x8419,0x1e2,
+    0x8410,0x1ee,
+    0x840b,0x20f,
+    0x8413,0x22e,
+    0x8429,0x23b
+]
+
+EQN_16 = [
+    0x2,0x3d7,
+    0x800f,0x3d9,
+    0x8015,0x3dd,
+    0x8017,0x3e2,
+    0x8014,0x3ee,
+    0x800b,0x3f3,
+    0x8000,0x3ef,
+    0x8000,0x3e5,
+    0x8000,0x3d5,
+    0x8000,0x3c8,
+    0x52,0x3f9,
+    0x804b,0x3e8,
+    0x8049,0x3dd,
+    0x804c,0x3d0,
+    0x8054,0x3be,
+    0x72,0x3ce,
+    0x8079,0x3df,
+    0x8080,0x3f1,
+    0x8088,0x3df,
+    0x808f,0x3ce,
+    0x89,0x3db,
+    0x8080,0x3db,
+    0x8077,0x3db,
+    0xc1,0x3fc,
+    0x80c1,0x3d9,
+    0x80c1,0x3b1,
+    0xfa,0x3f3,
+    0x8105,0x3f3,
+    0x810b,0x3f1,
+    0x810f,0x3ec,
+    0x8110,0x3e7,
+    0x810b,0x3df,
+    0xf8,0x3f3,
+    0x80f8,0x3cd,
+    0x8102,0x3cc,
+    0x810b,0x3cd,
+    0x810e,0x3d5,
+    0x810d,0x3da,
+    0x810b,0x3de,
+    0x8104,0x3df,
+    0x80f9,0x3de,
+    0x139,0x3fc,
+    0x8140,0x3f2,
+    0x8144,0x3e0,
+    0x8143,0x3d2,
+    0x813c,0x3c0,
+    0x183,0x3e5,
+    0x8191,0x3e5,
+    0x819e,0x3e5,
+    0x183,0x3d6,
+    0x8191,0x3d6,
+    0x819e,0x3d6,
+    0x1f3,0x421,
+    0x8200,0x422,
+    0x8206,0x426,
+    0x8208,0x42b,
+    0x8205,0x438,
+    0x81fd,0x43c,
+    0x81f1,0x438,
+    0x81f1,0x42e,
+    0x81f1,0x41e,
+    0x81f1,0x412,
+    0x23e,0x442,
+    0x8237,0x432,
+    0x8235,0x427,
+    0x8238,0x41a,
+    0x8240,0x408,
+    0x26d,0x439,
+    0x8277,0x439,
+    0x827d,0x437,
+    0x8282,0x432,
+    0x8282,0x42d,
+    0x827e,0x425,
+    0x26b,0x439,
+    0x826b,0x413,
+    0x8274,0x413,
+    0x827d,0x414,
+    0x8281,0x41b,
+    0x8280,0x420,
+    0x827e,0x424,
+    0x8276,0x425,
+    0x826c,0x425,
+    0x2b2,0x449,
+    0x82b2,0x427,
+    0x82b2,0x3ff,
+    0x2e7,0x419,
+    0x82ee,0x429,
+    0x82f5,0x43c,
+    0x82fd,0x42a,
+    0x8304,0x419,
+    0x2fe,0x426,
+    0x82f5,0x426,
+    0x82ec,0x426,
+    0x32b,0x445,
+    0x8332,0x43c,
+    0x8337,0x42a,
+    0x8336,0x41c,
+    0x832e,0x40a,
+    0x378,0x424,
+    0x8385,0x426,
+    0x838b,0x42a,
+    0x838d,0x42f,
+    0x838a,0x43b,
+    0x8382,0x440,
+    0x8376,0x43c,
+    0x8376,0x432,
+    0x8376,0x422,
+    0x8376,0x415,
+    0x3c7,0x449,
+    0x83bf,0x439,
+    0x83be,0x42e,
+    0x83c0,0x421,
+    0x83c8,0x40f,
+    0x3f2,0x418,
+    0x83f9,0x429,
+    0x8401,0x43b,
+    0x8408,0x429,
+    0x840f,0x418,
+    0x409,0x425,
+    0x8401,0x425,
+    0x83f8,0x425,
+    0x42a,0x44c,
+    0x8431,0x443,
+    0x8436,0x431,
+    0x8435,0x423,
+    0x842d,0x411,
+    0x1d5,0x3e9,
+    0x827c,0x3e9,
+    0x833c,0x3e9,
+    0x83d2,0x3e9,
+    0x844c,0x3e9,
+    0x2bf,0x390,
+    0x82cc,0x391,
+    0x82d2,0x395,
+    0x82d4,0x39b,
+    0x82d1,0x3a7,
+    0x82c9,0x3ac,
+    0x82bd,0x3a7,
+    0x82bd,0x39e,
+    0x82bd,0x38e,
+    0x82bd,0x381,
+    0x2fe,0x3b0,
+    0x82f7,0x3a0,
+    0x82f5,0x395,
+    0x82f8,0x388,
+    0x8300,0x376,
+    0x329,0x3ad,
+    0x8334,0x3ad,
+    0x833a,0x3ab,
+    0x833e,0x3a6,
+    0x833f,0x3a1,
+    0x833a,0x399,
+    0x327,0x3ad,
+    0x8327,0x387,
+    0x8331,0x386,
+    0x833a,0x387,
+    0x833d,0x38f,
+    0x833c,0x394,
+    0x833a,0x398,
+    0x8333,0x399,
+    0x8328,0x398,
+    0x35e,0x3b4,
+    0x8365,0x3aa,
+    0x836a,0x398,
+    0x8369,0x38a,
+    0x8361,0x378
+]
+
+EQN_17 = [
+    0x45,0x34e,
+    0x804f,0x34d,
+    0x805a,0x34d,
+    0x8061,0x352,
+    0x8062,0x357,
+    0x805c,0x35c,
+    0x8053,0x360,
+    0x8049,0x367,
+    0x804c,0x36f,
+    0x8057,0x373,
+    0x8060,0x373,
+    0x0,0x34f,
+    0x8014,0x34b,
+    0x8027,0x357,
+    0x802e,0x371,
+    0x802e,0x3a7,
+    0x802d,0x3dd,
+    0x802f,0x401,
+    0x8035,0x425,
+    0x8045,0x439,
+    0x805d,0x436,
+    0xbb,0x3a0,
+    0x80aa,0x39f,
+    0x8099,0x39f,
+    0x8099,0x3ba,
+    0x8099,0x3d2,
+    0x8099,0x3e2,
+    0x80b0,0x3e2,
+    0x80bc,0x3e2,
+    0xb6,0x3bf,
+    0x80aa,0x3bf,
+    0x809b,0x3be,
+    0x100,0x3c9,
+    0x810b,0x3b6,
+    0x80f5,0x3b6,
+    0x8100,0x3c9,
+    0x16a,0x3e8,
+    0x816a,0x3c6,
+    0x8168,0x3b0,
+    0x8159,0x3a9,
+    0x8148,0x3b1,
+    0x8145,0x3c7,
+    0x8153,0x3d4,
+    0x8168,0x3d5,
+    0x184,0x3aa,
+    0x8194,0x3a8,
+    0x81a4,0x3a8,
+    0x81ae,0x3af,
+    0x81af,0x3b7,
+    0x81a6,0x3bf,
+    0x8199,0x3c5,
+    0x818a,0x3d0,
+    0x818e,0x3dc,
+    0x819f,0x3e2,
+    0x81ac,0x3e2,
+    0x1e2,0x3c8,
+    0x81fa,0x3c8,
+    0x8212,0x3c8,
+    0x1e3,0x3ae,
+    0x81fb,0x3ae,
+    0x8212,0x3ae,
+    0x285,0x423,
+    0x8298,0x434,
+    0x8298,0x415,
+    0x8299,0x3fc,
+    0x285,0x3fc,
+    0x8298,0x3fc,
+    0x82a9,0x3fc,
+    0x25b,0x3c8,
+    0x8293,0x3c8,
+    0x82cf,0x3c8,
+    0x293,0x345,
+    0x827f,0x341,
+    0x8274,0x343,
+    0x826c,0x34a,
+    0x8268,0x357,
+    0x826e,0x361,
+    0x8275,0x367,
+    0x827d,0x369,
+    0x8293,0x366,
+    0x26a,0x355,
+    0x827b,0x355,
+    0x828a,0x355,
+    0x2b2,0x353,
+    0x82bd,0x34e,
+    0x82c2,0x33e,
+    0x82be,0x32f,
+    0x82b8,0x329,
+    0x82b0,0x327,
+    0x82aa,0x329,
+    0x82a6,0x32f,
+    0x82a3,0x33f,
+    0x82a7,0x34d,
+    0x82b1,0x353,
+    0x34a,0x37b,
+    0x8352,0x36a,
+    0x835b,0x356,
+    0x8363,0x36a,
+    0x836a,0x37b,
+    0x30b,0x362,
+    0x831f,0x35e,
+    0x8332,0x36b,
+    0x8339,0x384,
+    0x8339,0x3bb,
+    0x8339,0x3f0,
+    0x833a,0x414,
+    0x8340,0x438,
+    0x8351,0x44c,
+    0x8368,0x449,
+    0x39c,0x3aa,
+    0x83ae,0x3a4,
+    0x83c0,0x3ac,
+    0x83c5,0x3b9,
+    0x83c2,0x3c4,
+    0x83b8,0x3ca,
+    0x83a8,0x3c8,
+    0x83a0,0x3bd,
+    0x8398,0x3a9,
+    0x8390,0x397,
+    0x40a,0x3ed,
+    0x840a,0x3ca,
+    0x8409,0x3b5,
+    0x83f9,0x3ad,
+    0x83e8,0x3b6,
+    0x83e6,0x3cb,
+    0x83f3,0x3d8,
+    0x8409,0x3d9,
+    0x424,0x3df,
+    0x842d,0x3c8,
+    0x8437,0x3ad,
+    0x8442,0x3c8,
+    0x844c,0x3df
+]
+
+EQN_18 = [
+    0x74,0x2c3,
+    0x8085,0x2c0,
+    0x8097,0x2c1,
+    0x80a2,0x2c9,
+    0x80a4,0x2d2,
+    0x809a,0x2da,
+    0x808b,0x2e1,
+    0x807a,0x2ed,
+    0x807f,0x2fa,
+    0x8091,0x301,
+    0x80a0,0x301,
+    0x0,0x2c4,
+    0x8022,0x2be,
+    0x8042,0x2d2,
+    0x804e,0x2fe,
+    0x804d,0x358,
+    0x804c,0x3b2,
+    0x804e,0x3ee,
+    0x8059,0x42a,
+    0x8074,0x44c,
+    0x809c,0x446,
+    0x120,0x3ba,
+    0x813f,0x3ba,
+    0x8151,0x3b5,
+    0x815d,0x3a5,
+    0x8160,0x397,
+    0x8153,0x380,
+    0x119,0x3bb,
+    0x8119,0x34a,
+    0x8136,0x349,
+    0x8151,0x34b,
+    0x815c,0x362,
+    0x8159,0x371,
+    0x8151,0x37d,
+    0x813c,0x37f,
+    0x811c,0x37e,
+    0x1d8,0x38a,
+    0x81e9,0x369,
+    0x81c5,0x369,
+    0x81d7,0x389,
+    0x279,0x3c4,
+    0x8279,0x38a,
+    0x8276,0x366,
+    0x825c,0x35a,
+    0x8240,0x368,
+    0x823b,0x38c,
+    0x8253,0x3a2,
+    0x8276,0x3a4,
+    0x2b1,0x35f,
+    0x82cb,0x35b,
+    0x82e6,0x35c,
+    0x82f6,0x367,
+    0x82f8,0x375,
+    0x82e9,0x381,
+    0x82d4,0x38d,
+    0x82ba,0x39e,
+    0x82c1,0x3b2,
+    0x82dd,0x3bc,
+    0x82f3,0x3bd,
+    0x34a,0x39e,
+    0x8373,0x39e,
+    0x839a,0x39e,
+    0x34b,0x372,
+    0x8373,0x372,
+    0x839a,0x372,
+    0x422,0x3c3,
+    0x843f,0x3b5,
+    0x844c,0x38e,
+    0x8442,0x367,
+    0x8432,0x357,
+    0x841f,0x351,
+    0x840e,0x358,
+    0x8403,0x366,
+    0x83fd,0x38e,
+    0x8407,0x3b4,
+    0x8421,0x3c3
+]
+
+EQN_19 = [
+    0x41,0x384,
+    0x8041,0x373,
+    0x8041,0x360,
+    0x804c,0x360,
+    0x8058,0x35f,
+    0x0,0x36a,
+    0x8012,0x366,
+    0x8024,0x372,
+    0x802b,0x389,
+    0x802b,0x3bc,
+    0x802a,0x3ed,
+    0x802b,0x40e,
+    0x8031,0x430,
+    0x8040,0x443,
+    0x8056,0x440,
+    0x95,0x3c3,
+    0x8086,0x3c3,
+    0x8076,0x3c3,
+    0x8076,0x3db,
+    0x8076,0x3f2,
+    0x8076,0x401,
+    0x808b,0x401,
+    0x8096,0x401,
+    0x91,0x3e0,
+    0x8086,0x3e0,
+    0x8078,0x3e0,
+    0xe2,0x3df,
+    0x80ec,0x3cd,
+    0x80d8,0x3cd,
+    0x80e2,0x3df,
+    0x13e,0x3fd,
+    0x813f,0x3dd,
+    0x813d,0x3c9,
+    0x812e,0x3c2,
+    0x811f,0x3ca,
+    0x811c,0x3de,
+    0x8129,0x3ea,
+    0x813d,0x3eb,
+    0x160,0x3fa,
+    0x8160,0x3c7,
+    0x817d,0x3c6,
+    0x1bb,0x3e1,
+    0x81d2,0x3e1,
+    0x81e8,0x3e1,
+    0x1bb,0x3c9,
+    0x81d2,0x3c9,
+    0x81e8,0x3c9,
+    0x26a,0x440,
+    0x826a,0x41f,
+    0x8269,0x40b,
+    0x825a,0x404,
+    0x824a,0x40c,
+    0x8248,0x420,
+    0x8255,0x42c,
+    0x8269,0x42d,
+    0x21e,0x3e0,
+    0x8257,0x3e0,
+    0x8295,0x3e0,
+    0x24e,0x39d,
+    0x824e,0x37d,
+    0x824c,0x369,
+    0x823e,0x362,
+    0x822e,0x36a,
+    0x822c,0x37e,
+    0x8239,0x38a,
+    0x824c,0x38b,
+    0x275,0x39b,
+    0x8274,0x37e,
+    0x8275,0x36d,
+    0x827b,0x367,
+    0x8289,0x367,
+    0x261,0x38f,
+    0x8278,0x38f,
+    0x828c,0x38f,
+    0x30c,0x373,
+    0x8315,0x371,
+    0x831f,0x372,
+    0x8326,0x376,
+    0x8326,0x37b,
+    0x8321,0x37f,
+    0x8319,0x383,
+    0x8310,0x38a,
+    0x8312,0x391,
+    0x831c,0x395,
+    0x8324,0x395,
+    0x2cb,0x373,
+    0x82de,0x370,
+    0x82f0,0x37b,
+    0x82f7,0x393,
+    0x82f7,0x3c5,
+    0x82f6,0x3f7,
+    0x82f7,0x418,
+    0x82fd,0x43a,
+    0x830c,0x44c,
+    0x8322,0x449,
+    0x34d,0x3f8,
+    0x835e,0x3f8,
+    0x8368,0x3f5,
+    0x836f,0x3ed,
+    0x8370,0x3e5,
+    0x8369,0x3d8,
+    0x349,0x3f8,
+    0x8349,0x3ba,
+    0x8359,0x3b9,
+    0x8368,0x3bb,
+    0x836e,0x3c7,
+    0x836c,0x3cf,
+    0x8368,0x3d6,
+    0x835c,0x3d7,
+    0x834b,0x3d7,
+    0x3a8,0x3db,
+    0x83b1,0x3c9,
+    0x839d,0x3c9,
+    0x83a7,0x3db,
+    0x401,0x3f9,
+    0x8401,0x3d9,
+    0x8400,0x3c5,
+    0x83f1,0x3be,
+    0x83e1,0x3c6,
+    0x83df,0x3da,
+    0x83ec,0x3e6,
+    0x8400,0x3e7,
+    0x424,0x3c7,
+    0x8432,0x3c5,
+    0x8441,0x3c5,
+    0x844a,0x3cb,
+    0x844c,0x3d3,
+    0x8443,0x3da,
+    0x8437,0x3e0,
+    0x8429,0x3ea,
+    0x842d,0x3f5,
+    0x843c,0x3fa,
+    0x8449,0x3fa
+]
+
+EQN_20 = [
+    0x23,0x3e5,
+    0x8023,0x3db,
+    0x8023,0x3d1,
+    0x8029,0x3d1,
+    0x8030,0x3d1,
+    0x0,0x3d6,
+    0x800a,0x3d5,
+    0x8014,0x3db,
+    0x8017,0x3e8,
+    0x8017,0x403,
+    0x8017,0x41e,
+    0x8017,0x430,
+    0x801a,0x442,
+    0x8023,0x44c,
+    0x802f,0x44b,
+    0x48,0x418,
+    0x8051,0x418,
+    0x8057,0x416,
+    0x805b,0x412,
+    0x805b,0x40d,
+    0x8058,0x406,
+    0x46,0x418,
+    0x8046,0x3f6,
+    0x804f,0x3f6,
+    0x8057,0x3f6,
+    0x805a,0x3fd,
+    0x8059,0x402,
+    0x8057,0x405,
+    0x8051,0x406,
+    0x8047,0x406,
+    0x7c,0x409,
+    0x8081,0x3ff,
+    0x8076,0x3ff,
+    0x807b,0x409,
+    0xb1,0x41b,
+    0x80b1,0x409,
+    0x80b0,0x3ff,
+    0x80a8,0x3fb,
+    0x80a0,0x3ff,
+    0x809f,0x40a,
+    0x80a6,0x410,
+    0x80b0,0x411,
+    0xc3,0x418,
+    0x80c3,0x3fc,
+    0x80d3,0x3fc,
+    0xef,0x40c,
+    0x80fb,0x40c,
+    0x8107,0x40c,
+    0xef,0x3fe,
+    0x80fb,0x3fe,
+    0x8107,0x3fe,
+    0x12b,0x40e,
+    0x8126,0x3ff,
+    0x8127,0x3fb,
+    0x812f,0x3fa,
+    0x8136,0x3fd,
+    0x813a,0x405,
+    0x813c,0x40f,
+    0x137,0x3fe,
+    0x813c,0x3fa,
+    0x14e,0x3fc,
+    0x8153,0x3f9,
+    0x8156,0x3f2,
+    0x8154,0x3ea,
+    0x8151,0x3e7,
+    0x814d,0x3e6,
+    0x814a,0x3e7,
+    0x8148,0x3ea,
+    0x8146,0x3f2,
+    0x8148,0x3f9,
+    0x814d,0x3fc,
+    0x18a,0x446,
+    0x8181,0x430,
+    0x8180,0x422,
+    0x817f,0x401,
+    0x8181,0x3e2,
+    0x818a,0x3c8,
+    0x1c1,0x3d6,
+    0x81c6,0x3d5,
+    0x81cb,0x3d5,
+    0x81ce,0x3d7,
+    0x81cf,0x3da,
+    0x81cc,0x3dc,
+    0x81c8,0x3df,
+    0x81c3,0x3e2,
+    0x81c4,0x3e6,
+    0x81c9,0x3e8,
+    0x81ce,0x3e8,
+    0x19e,0x3d6,
+    0x81a8,0x3d4,
+    0x81b2,0x3da,
+    0x81b5,0x3e7,
+    0x81b5,0x402,
+    0x81b5,0x41d,
+    0x81b5,0x42f,
+    0x81b8,0x442,
+    0x81c1,0x44c,
+    0x81cd,0x44a,
+    0x1d8,0x41a,
+    0x81e9,0x41a,
+    0x81e9,0x40d,
+    0x81e9,0x404,
+    0x81e7,0x3ff,
+    0x81e0,0x3fc,
+    0x81d8,0x3fe,
+    0x20b,0x40b,
+    0x8210,0x401,
+    0x8205,0x401,
+    0x820a,0x40b,
+    0x240,0x41b,
+    0x8241,0x409,
+    0x8240,0x3ff,
+    0x8238,0x3fb,
+    0x822f,0x3ff,
+    0x822e,0x40a,
+    0x8235,0x410,
+    0x8240,0x411,
+    0x24e,0x3fd,
+    0x8256,0x3fb,
+    0x825e,0x3fc,
+    0x8263,0x3ff,
+    0x8264,0x403,
+    0x825f,0x407,
+    0x8259,0x40a,
+    0x8251,0x410,
+    0x8253,0x416,
+    0x825b,0x419,
+    0x8262,0x419,
+    0x28c,0x411,
+    0x828c,0x406,
+    0x828c,0x400,
+    0x281,0x409,
+    0x828a,0x409,
+    0x8297,0x409,
+    0x2d0,0x403,
+    0x82c6,0x400,
+    0x82c0,0x402,
+    0x82bc,0x405,
+    0x82ba,0x40b,
+    0x82bd,0x411,
+    0x82c0,0x414,
+    0x82c5,0x415,
+    0x82cf,0x413,
+    0x2bb,0x40b,
+    0x82c3,0x40b,
+    0x82cb,0x40b,
+    0x2df,0x40a,
+    0x82e5,0x407,
+    0x82e7,0x3ff,
+    0x82e5,0x3f7,
+    0x82e2,0x3f4,
+    0x82df,0x3f3,
+    0x82db,0x3f4,
+    0x82d9,0x3f7,
+    0x82d8,0x3ff,
+    0x82da,0x407,
+    0x82df,0x40a,
+    0x32f,0x443,
+    0x832f,0x431,
+    0x832e,0x426,
+    0x8327,0x423,
+    0x831e,0x427,
+    0x831d,0x432,
+    0x8324,0x438,
+    0x832e,0x439,
+    0x306,0x40c,
+    0x8324,0x40c,
+    0x8344,0x40c,
+    0x31c,0x3e9,
+    0x831c,0x3d8,
+    0x831b,0x3cd,
+    0x8313,0x3c9,
+    0x830b,0x3cd,
+    0x830a,0x3d8,
+    0x8311,0x3df,
+    0x831b,0x3df,
+    0x333,0x3e6,
+    0x8333,0x3d6,
+    0x8334,0x3cd,
+    0x8337,0x3ca,
+    0x833e,0x3ca,
+    0x329,0x3e0,
+    0x8335,0x3e0,
+    0x8340,0x3e0,
+    0x388,0x3cb,
+    0x838d,0x3ca,
+    0x8392,0x3cb,
+    0x8396,0x3cd,
+    0x8396,0x3d0,
+    0x8393,0x3d2,
+    0x838f,0x3d4,
+    0x838a,0x3d8,
+    0x838b,0x3dc,
+    0x8391,0x3de,
+    0x8395,0x3de,
+    0x365,0x3cc,
+    0x836f,0x3ca,
+    0x8379,0x3d0,
+    0x837c,0x3dd,
+    0x837c,0x3f8,
+    0x837c,0x413,
+    0x837c,0x425,
+    0x8380,0x437,
+    0x8388,0x442,
+    0x8394,0x440,
+    0x3b9,0x3f9,
+    0x83b0,0x3f8,
+    0x83a8,0x3f8,
+    0x83a8,0x406,
+    0x83a8,0x412,
+    0x83a8,0x41a,
+    0x83b3,0x41a,
+    0x83ba,0x41a,
+    0x3b7,0x408,
+    0x83b1,0x408,
+    0x83a9,0x408,
+    0x3dc,0x40a,
+    0x83e1,0x401,
+    0x83d6,0x401,
+    0x83db,0x40a,
+    0x40f,0x41c,
+    0x840f,0x40b,
+    0x840e,0x400,
+    0x8406,0x3fc,
+    0x83fd,0x401,
+    0x83fc,0x40c,
+    0x8403,0x412,
+    0x840e,0x413,
+    0x41e,0x3ff,
+    0x8426,0x3fe,
+    0x842e,0x3fe,
+    0x8433,0x401,
+    0x8433,0x405,
+    0x842f,0x409,
+    0x8428,0x40d,
+    0x8421,0x412,
+    0x8423,0x418,
+    0x842b,0x41b,
+    0x8432,0x41b,
+    0x440,0x446,
+    0x844b,0x426,
+    0x844c,0x3f9,
+    0x844a,0x3e0,
+    0x8440,0x3c8
+]
+
+EQN_21 = [
+    0x2e,0x346,
+    0x801a,0x378,
+    0x8000,0x3b8,
+    0x802c,0x3b8,
+    0x8060,0x3b8,
+    0x8048,0x37a,
+    0x8033,0x344,
+    0x107,0x387,
+    0x811b,0x363,
+    0x80f2,0x363,
+    0x8106,0x387,
+    0x1db,0x347,
+    0x81bb,0x346,
+    0x819c,0x346,
+    0x819c,0x378,
+    0x819c,0x3a7,
+    0x819c,0x3c4,
+    0x81c6,0x3c4,
+    0x81dd,0x3c5,
+    0x1d3,0x382,
+    0x81bc,0x381,
+    0x819f,0x381,
+    0x263,0x38d,
+    0x8290,0x38d,
+    0x82bd,0x38d,
+    0x263,0x35b,
+    0x8290,0x35b,
+    0x82bd,0x35b,
+    0x39e,0x40f,
+    0x83c0,0x405,
+    0x83e1,0x412,
+    0x83eb,0x42b,
+    0x83e5,0x440,
+    0x83d3,0x44c,
+    0x83b5,0x448,
+    0x83a5,0x433,
+    0x8396,0x40e,
+    0x8387,0x3eb,
+    0x350,0x396,
+    0x83c3,0x396,
+    0x844c,0x396,
+    0x3cd,0x2dd,
+    0x83a7,0x2d4,
+    0x8392,0x2d9,
+    0x8384,0x2e5,
+    0x837c,0x2fe,
+    0x8386,0x311,
+    0x8394,0x31c,
+    0x83a4,0x320,
+    0x83cc,0x31b,
+    0x380,0x2fa,
+    0x839f,0x2fa,
+    0x83bc,0x2fa,
+    0x406,0x2f7,
+    0x841c,0x2ed,
+    0x8425,0x2d0,
+    0x841e,0x2b3,
+    0x8412,0x2a7,
+    0x8404,0x2a3,
+    0x83f8,0x2a8,
+    0x83f0,0x2b3,
+    0x83eb,0x2d0,
+    0x83f2,0x2ec,
+    0x8406,0x2f7
+]
+
+EQN_22 = [
+    0x3a,0x3b6,
+    0x8021,0x3f5,
+    0x8000,0x446,
+    0x8038,0x446,
+    0x8079,0x446,
+    0x805b,0x3f7,
+    0x8041,0x3b4,
+    0x13a,0x41a,
+    0x8153,0x3ed,
+    0x811f,0x3ed,
+    0x8138,0x41a,
+    0x1cc,0x44b,
+    0x81f9,0x44c,
+    0x8212,0x445,
+    0x8224,0x42e,
+    0x8228,0x41a,
+    0x8215,0x3f9,
+    0x1c3,0x44c,
+    0x81c3,0x3ac,
+    0x81ec,0x3aa,
+    0x8213,0x3ae,
+    0x8222,0x3ce,
+    0x821d,0x3e3,
+    0x8213,0x3f5,
+    0x81f5,0x3f8,
+    0x81c7,0x3f7,
+    0x2c9,0x41b,
+    0x8302,0x41b,
+    0x833b,0x41b,
+    0x2ca,0x3dc,
+    0x8303,0x3dc,
+    0x833b,0x3dc,
+    0x40c,0x44a,
+    0x843b,0x438,
+    0x844c,0x3fb,
+    0x8443,0x3d4,
+    0x8416,0x3b8,
+    0x83e3,0x3d3,
+    0x83d4,0x3ff,
+    0x83e7,0x438,
+    0x840b,0x44a
+]
+
+EQN_23 = [
+    0x28,0x32b,
+    0x8016,0x357,
+    0x8000,0x38f,
+    0x8026,0x38f,
+    0x8054,0x38f,
+    0x803f,0x358,
+    0x802d,0x32a,
+    0xb5,0x375,
+    0x80c6,0x363,
+    0x80e5,0x343,
+    0xe3,0x374,
+    0x80d3,0x362,
+    0x80b5,0x342,
+    0x18a,0x328,
+    0x816e,0x327,
+    0x8153,0x327,
+    0x8153,0x353,
+    0x8154,0x37c,
+    0x8154,0x395,
+    0x8178,0x396,
+    0x818c,0x396,
+    0x183,0x35b,
+    0x816f,0x35b,
+    0x8156,0x35b,
+    0x1f3,0x36f,
+    0x821a,0x36f,
+    0x8241,0x36f,
+    0x1f3,0x344,
+    0x821b,0x344,
+    0x8241,0x344,
+    0x2d3,0x35d,
+    0x82ee,0x35d,
+    0x830b,0x35d,
+    0x3bf,0x449,
+    0x83c0,0x40f,
+    0x83bd,0x3ec,
+    0x83a3,0x3e0,
+    0x8387,0x3ee,
+    0x8383,0x411,
+    0x839a,0x426,
+    0x83bd,0x428,
+    0x3f9,0x44c,
+    0x8418,0x44c,
+    0x842a,0x447,
+    0x8436,0x438,
+    0x8439,0x429,
+    0x842c,0x413,
+    0x3f3,0x44c,
+    0x83f3,0x3de,
+    0x8410,0x3dc,
+    0x842a,0x3df,
+    0x8435,0x3f5,
+    0x8431,0x404,
+    0x842a,0x410,
+    0x8415,0x412,
+    0x83f6,0x411,
+    0x365,0x379,
+    0x83cc,0x379,
+    0x844c,0x379,
+    0x3aa,0x31a,
+    0x83aa,0x2e0,
+    0x83a7,0x2bd,
+    0x838d,0x2b1,
+    0x8371,0x2bf,
+    0x836d,0x2e2,
+    0x8384,0x2f7,
+    0x83a7,0x2f9,
+    0x3f6,0x310,
+    0x83f5,0x2dc,
+    0x83f6,0x2bd,
+    0x8401,0x2b4,
+    0x841a,0x2b3,
+    0x3d2,0x2fb,
+    0x83fc,0x2fb,
+    0x841f,0x2fb
+]
+
+EQN_24 = [
+    0x15,0x3c0,
+    0x800b,0x3d7,
+    0x8000,0x3f4,
+    0x8014,0x3f4,
+    0x802b,0x3f4,
+    0x8020,0x3d8,
+    0x8017,0x3bf,
+    0x65,0x3e7,
+    0x806e,0x3dd,
+    0x807e,0x3cd,
+    0x7d,0x3e6,
+    0x8075,0x3dd,
+    0x8065,0x3cc,
+    0xb8,0x3f5,
+    0x80c8,0x3f5,
+    0x80d1,0x3f2,
+    0x80d7,0x3ea,
+    0x80d9,0x3e3,
+    0x80d2,0x3d7,
+    0xb5,0x3f5,
+    0x80b5,0x3bb,
+    0x80c3,0x3bb,
+    0x80d1,0x3bc,
+    0x80d7,0x3c7,
+    0x80d5,0x3cf,
+    0x80d1,0x3d5,
+    0x80c6,0x3d7,
+    0x80b6,0x3d6,
+    0x12b,0x3e7,
+    0x8140,0x3e7,
+    0x8154,0x3e7,
+    0x12c,0x3d0,
+    0x8140,0x3d0,
+    0x8154,0x3d0,
+    0x18e,0x3eb,
+    0x8186,0x3d2,
+    0x8187,0x3cb,
+    0x8193,0x3c9,
+    0x81a1,0x3cf,
+    0x81a7,0x3dc,
+    0x81aa,0x3ed,
+    0x1a2,0x3d0,
+    0x81aa,0x3c9,
+    0x1c8,0x3cd,
+    0x81d2,0x3c8,
+    0x81d6,0x3bb,
+    0x81d3,0x3ae,
+    0x81ce,0x3a9,
+    0x81c7,0x3a7,
+    0x81c2,0x3a9,
+    0x81be,0x3ae,
+    0x81bc,0x3bb,
+    0x81bf,0x3c8,
+    0x81c8,0x3cd,
+    0x223,0x445,
+    0x8214,0x420,
+    0x8211,0x408,
+    0x8211,0x3cf,
+    0x8213,0x39a,
+    0x8223,0x36f,
+    0x248,0x3f3,
+    0x8265,0x3f3,
+    0x8266,0x3de,
+    0x8265,0x3cd,
+    0x8262,0x3c6,
+    0x8257,0x3c1,
+    0x8248,0x3c3,
+    0x2b0,0x3e3,
+    0x82b0,0x3d9,
+    0x82b0,0x3c8,
+    0x2a1,0x3d4,
+    0x82b4,0x3d4,
+    0x82bf,0x3d4,
+    0x32e,0x3d4,
+    0x8319,0x3cf,
+    0x830e,0x3d2,
+    0x8306,0x3d8,
+    0x8302,0x3e6,
+    0x8307,0x3f1,
+    0x830e,0x3f6,
+    0x8317,0x3f8,
+    0x832d,0x3f6,
+    0x304,0x3e4,
+    0x8315,0x3e4,
+    0x8324,0x3e4,
+    0x34d,0x3e3,
+    0x8358,0x3dd,
+    0x835d,0x3cd,
+    0x8359,0x3bd,
+    0x8353,0x3b7,
+    0x834b,0x3b5,
+    0x8345,0x3b7,
+    0x8340,0x3bd,
+    0x833e,0x3cd,
+    0x8342,0x3dc,
+    0x834c,0x3e3,
+    0x3ba,0x444,
+    0x83ba,0x426,
+    0x83b9,0x414,
+    0x83ac,0x40d,
+    0x839d,0x415,
+    0x839b,0x427,
+    0x83a7,0x432,
+    0x83b9,0x433,
+    0x3f8,0x413,
+    0x83e9,0x413,
+    0x83db,0x413,
+    0x83db,0x42a,
+    0x83db,0x43f,
+    0x83db,0x44c,
+    0x83ee,0x44c,
+    0x83f9,0x44c,
+    0x3f4,0x42e,
+    0x83ea,0x42e,
+    0x83dd,0x42e,
+    0x392,0x3e3,
+    0x83cb,0x3e3,
+    0x8409,0x3e3,
+    0x3b9,0x3c9,
+    0x83b9,0x3ab,
+    0x83b8,0x399,
+    0x83ab,0x392,
+    0x839c,0x39a,
+    0x839a,0x3ac,
+    0x83a6,0x3b7,
+    0x83b8,0x3b8,
+    0x3e1,0x3c4,
+    0x83e1,0x3a9,
+    0x83e1,0x399,
+    0x83e7,0x394,
+    0x83f4,0x394,
+    0x3ce,0x3b9,
+    0x83e4,0x3b9,
+    0x83f7,0x3b9,
+    0x439,0x437,
+    0x844a,0x3ff,
+    0x844c,0x3b4,
+    0x8449,0x389,
+    0x8439,0x361
+]
+
+EQN_25 = [
+    0x49,0x44a,
+    0x8049,0x41a,
+    0x8047,0x3fd,
+    0x8031,0x3f2,
+    0x801a,0x3fe,
+    0x8017,0x41c,
+    0x802a,0x42e,
+    0x8047,0x42f,
+    0x78,0x43e,
+    0x8092,0x43e,
+    0x80ab,0x43e,
+    0x8096,0x41f,
+    0x807e,0x3fb,
+    0x80ae,0x3fc,
+    0x0,0x3aa,
+    0x8052,0x3aa,
+    0x80bd,0x3aa,
+    0x38,0x336,
+    0x8038,0x306,
+    0x8036,0x2e9,
+    0x8020,0x2de,
+    0x8009,0x2ea,
+    0x8005,0x308,
+    0x8018,0x31a,
+    0x8036,0x31b,
+    0xad,0x327,
+    0x809e,0x313,
+    0x8085,0x2f4,
+    0x8075,0x2de,
+    0x77,0x327,
+    0x8086,0x314,
+    0x809d,0x2f6,
+    0x80ac,0x2df,
+    0x131,0x3be,
+    0x8153,0x3be,
+    0x8173,0x3be,
+    0x132,0x399,
+    0x8153,0x399,
+    0x8173,0x399,
+    0x21a,0x443,
+    0x821a,0x413,
+    0x8218,0x3f5,
+    0x8202,0x3eb,
+    0x81eb,0x3f7,
+    0x81e7,0x415,
+    0x81fb,0x426,
+    0x8218,0x428,
+    0x249,0x437,
+    0x8263,0x437,
+    0x827c,0x437,
+    0x8266,0x418,
+    0x824f,0x3f4,
+    0x827f,0x3f5,
+    0x1d9,0x3aa,
+    0x8237,0x3aa,
+    0x829a,0x3aa,
+    0x217,0x33c,
+    0x8217,0x30c,
+    0x8215,0x2ee,
+    0x81ff,0x2e4,
+    0x81e8,0x2f0,
+    0x81e4,0x30e,
+    0x81f8,0x31f,
+    0x8215,0x321,
+    0x290,0x327,
+    0x827b,0x2fb,
+    0x826d,0x2e1,
+    0x8263,0x2c8,
+    0x824a,0x2bb,
+    0x24f,0x322,
+    0x826d,0x2e3,
+    0x30a,0x3b9,
+    0x8318,0x39f,
+    0x82fa,0x39f,
+    0x8309,0x3b9,
+    0x3c0,0x44c,
+    0x83c1,0x41d,
+    0x83be,0x3ff,
+    0x83a9,0x3f5,
+    0x8391,0x401,
+    0x838e,0x41e,
+    0x83a1,0x430,
+    0x83be,0x432,
+    0x439,0x438,
+    0x8424,0x40c,
+    0x8416,0x3f1,
+    0x840d,0x3d8,
+    0x83f3,0x3cc,
+    0x3f8,0x433,
+    0x8416,0x3f4,
+    0x38e,0x3aa,
+    0x83e1,0x3aa,
+    0x844c,0x3aa,
+    0x3bc,0x339,
+    0x83bd,0x309,
+    0x83ba,0x2ec,
+    0x83a5,0x2e1,
+    0x838d,0x2ed,
+    0x838a,0x30b,
+    0x839d,0x31d,
+    0x83ba,0x31e,
+    0x3eb,0x32d,
+    0x8405,0x32d,
+    0x841e,0x32d,
+    0x8409,0x30e,
+    0x83f2,0x2ea,
+    0x8421,0x2eb
+]
+
+EQN_26 = [
+    0x1b,0x3e6,
+    0x8024,0x3ea,
+    0x802d,0x3f0,
+    0x8031,0x3fb,
+    0x802d,0x40a,
+    0x8022,0x411,
+    0x8017,0x413,
+    0x800c,0x410,
+    0x8003,0x407,
+    0x8001,0x3fe,
+    0x8006,0x3ed,
+    0x8016,0x3e6,
+    0x0,0x3c4,
+    0x8009,0x3c2,
+    0x8012,0x3c4,
+    0x8018,0x3cd,
+    0x8019,0x3e2,
+    0x8019,0x3fe,
+    0x8019,0x417,
+    0x801a,0x429,
+    0x801e,0x436,
+    0x8026,0x43a,
+    0x8030,0x437,
+    0x4d,0x412,
+    0x8049,0x407,
+    0x8047,0x3fb,
+    0x804b,0x3ef,
+    0x8051,0x3e6,
+    0x6e,0x40e,
+    0x806e,0x3f1,
+    0x807e,0x3f1,
+    0x98,0x40f,
+    0x80a0,0x410,
+    0x80a7,0x40e,
+    0x80ab,0x405,
+    0x80a7,0x3f9,
+    0x80a3,0x3f3,
+    0x809c,0x3f1,
+    0x8095,0x3f4,
+    0x8093,0x3fb,
+    0x8097,0x403,
+    0x809e,0x407,
+    0x80a9,0x405,
+    0xcd,0x40c,
+    0x80c8,0x406,
+    0x80c0,0x3fc,
+    0x80bb,0x3f5,
+    0xbc,0x40c,
+    0x80c0,0x406,
+    0x80c8,0x3fc,
+    0x80cd,0x3f5,
+    0xf1,0x407,
+    0x80f1,0x3fd,
+    0x80f1,0x3f8,
+    0xe8,0x400,
+    0x80f0,0x400,
+    0x80fb,0x400,
+    0x12f,0x3f4,
+    0x812f,0x40f,
+    0x8124,0x404,
+    0x8118,0x40e,
+    0x8118,0x3f4,
+    0x154,0x411,
+    0x815d,0x412,
+    0x8163,0x410,
+    0x8167,0x407,
+    0x8164,0x3fb,
+    0x815f,0x3f5,
+    0x8159,0x3f3,
+    0x8152,0x3f6,
+    0x8150,0x3fd,
+    0x8153,0x405,
+    0x815b,0x409,
+    0x8166,0x407,
+    0x189,0x40e,
+    0x8182,0x3ff,
+    0x817d,0x3f7,
+    0x817a,0x3ef,
+    0x8172,0x3eb,
+    0x173,0x40c,
+    0x817d,0x3f8,
+    0x198,0x412,
+    0x819d,0x407,
+    0x819f,0x3fe,
+    0x819d,0x3f3,
+    0x8198,0x3e8,
+    0x1c7,0x404,
+    0x81d1,0x404,
+    0x81dc,0x404,
+    0x1c7,0x3f8,
+    0x81d2,0x3f8,
+    0x81dc,0x3f8,
+    0x207,0x3dc,
+    0x8210,0x3da,
+    0x8219,0x3e0,
+    0x821c,0x3eb,
+    0x821c,0x403,
+    0x821b,0x41b,
+    0x821c,0x42b,
+    0x821f,0x43b,
+    0x8226,0x444,
+    0x8231,0x443,
+    0x226,0x3db,
+    0x822f,0x3d9,
+    0x8238,0x3df,
+    0x823b,0x3ea,
+    0x823b,0x402,
+    0x823a,0x41a,
+    0x823b,0x42a,
+    0x823e,0x43a,
+    0x8245,0x443,
+    0x8250,0x442,
+    0x247,0x3d7,
+    0x8247,0x3e8,
+    0x824e,0x3e8,
+    0x8250,0x3e6,
+    0x8253,0x3e1,
+    0x8251,0x3da,
+    0x824e,0x3d7,
+    0x8247,0x3d7,
+    0x27f,0x447,
+    0x8276,0x434,
+    0x8275,0x427,
+    0x8275,0x40a,
+    0x8276,0x3ee,
+    0x827f,0x3d8,
+    0x297,0x44b,
+    0x829f,0x44c,
+    0x82a6,0x44a,
+    0x82aa,0x441,
+    0x82a6,0x435,
+    0x82a1,0x430,
+    0x829b,0x42e,
+    0x8294,0x431,
+    0x8292,0x437,
+    0x8296,0x440,
+    0x829d,0x443,
+    0x82a8,0x442,
+    0x2bb,0x431,
+    0x82bb,0x44b,
+    0x82c5,0x43f,
+    0x82d2,0x44b,
+    0x82d2,0x42f,
+    0x28d,0x413,
+    0x82af,0x413,
+    0x82d4,0x413,
+    0x298,0x3f2,
+    0x82a0,0x3f3,
+    0x82a7,0x3f1,
+    0x82ab,0x3e8,
+    0x82a8,0x3dc,
+    0x82a3,0x3d6,
+    0x829d,0x3d4,
+    0x8296,0x3d7,
+    0x8294,0x3de,
+    0x8297,0x3e6,
+    0x829e,0x3ea,
+    0x82a9,0x3e8,
+    0x2cd,0x3ec,
+    0x82c8,0x3e5,
+    0x82c0,0x3db,
+    0x82bb,0x3d5,
+    0x2bc,0x3ec,
+    0x82c0,0x3e6,
+    0x82c8,0x3dc,
+    0x82cd,0x3d5,
+    0x2f7,0x40b,
+    0x8300,0x40b,
+    0x8309,0x40b,
+    0x33a,0x44a,
+    0x8343,0x44b,
+    0x8349,0x449,
+    0x834d,0x440,
+    0x834a,0x434,
+    0x8345,0x42e,
+    0x833f,0x42c,
+    0x8338,0x430,
+    0x8336,0x436,
+    0x8339,0x43e,
+    0x8341,0x442,
+    0x834c,0x441,
+    0x35e,0x449,
+    0x835e,0x42d,
+    0x836e,0x42d,
+    0x32c,0x413,
+    0x834d,0x413,
+    0x8371,0x413,
+    0x339,0x3f1,
+    0x8341,0x3f2,
+    0x8348,0x3f0,
+    0x834b,0x3e7,
+    0x8348,0x3db,
+    0x8343,0x3d5,
+    0x833d,0x3d3,
+    0x8336,0x3d7,
+    0x8334,0x3dd,
+    0x8338,0x3e5,
+    0x833f,0x3e9,
+    0x834a,0x3e8,
+    0x36b,0x3f1,
+    0x8364,0x3e2,
+    0x835f,0x3da,
+    0x835c,0x3d2,
+    0x8354,0x3ce,
+    0x356,0x3ef,
+    0x8360,0x3db,
+    0x384,0x447,
+    0x838d,0x42a,
+    0x838d,0x403,
+    0x838c,0x3ed,
+    0x8384,0x3d8,
+    0x3c2,0x41e,
+    0x83ca,0x41f,
+    0x83d1,0x41d,
+    0x83d4,0x414,
+    0x83d1,0x408,
+    0x83cc,0x402,
+    0x83c6,0x400,
+    0x83bf,0x403,
+    0x83bd,0x40a,
+    0x83c0,0x412,
+    0x83c8,0x416,
+    0x83d3,0x414,
+    0x3f2,0x41b,
+    0x83ed,0x414,
+    0x83e5,0x40a,
+    0x83e0,0x403,
+    0x3e1,0x41b,
+    0x83e6,0x414,
+    0x83ed,0x40b,
+    0x83f2,0x403,
+    0x415,0x420,
+    0x841d,0x421,
+    0x8424,0x41f,
+    0x8428,0x416,
+    0x8425,0x40a,
+    0x8420,0x404,
+    0x841a,0x402,
+    0x8413,0x405,
+    0x8411,0x40c,
+    0x8414,0x414,
+    0x841b,0x418,
+    0x8426,0x416,
+    0x44c,0x422,
+    0x8445,0x414,
+    0x8440,0x40b,
+    0x843d,0x403,
+    0x8435,0x3ff,
+    0x436,0x420,
+    0x8440,0x40c
+]
+
+EQN_27 = [
+    0x14,0x426,
+    0x800b,0x425,
+    0x8003,0x427,
+    0x8000,0x431,
+    0x8001,0x438,
+    0x8004,0x43c,
+    0x800c,0x43f,
+    0x8013,0x43c,
+    0x27,0x43d,
+    0x802f,0x440,
+    0x8036,0x43d,
+    0x803a,0x434,
+    0x8039,0x42c,
+    0x802e,0x425,
+    0x8025,0x42b,
+    0x8022,0x433,
+    0x8026,0x43d,
+    0x4a,0x427,
+    0x8051,0x426,
+    0x8058,0x426,
+    0x805c,0x429,
+    0x805d,0x42d,
+    0x8059,0x430,
+    0x8053,0x433,
+    0x804c,0x438,
+    0x804e,0x43d,
+    0x8056,0x440,
+    0x805c,0x440,
+    0x75,0x445,
+    0x8070,0x439,
+    0x806e,0x431,
+    0x8070,0x427,
+    0x8076,0x419,
+    0x84,0x43c,
+    0x808e,0x43d,
+    0x8094,0x43b,
+    0x8097,0x437,
+    0x8098,0x42f,
+    0x8098,0x428,
+    0x8096,0x425,
+    0x8091,0x424,
+    0x808c,0x423,
+    0x8086,0x426,
+    0x8085,0x42b,
+    0x8088,0x42e,
+    0x808d,0x430,
+    0x8096,0x430,
+    0xb1,0x435,
+    0x80b1,0x42c,
+    0x80b1,0x427,
+    0xa7,0x42e,
+    0x80af,0x42e,
+    0x80ba,0x42e,
+    0xc7,0x448,
+    0x80c7,0x438,
+    0x80c7,0x42e,
+    0x80c8,0x424,
+    0x80cd,0x422,
+    0x80d5,0x424,
+    0x80da,0x42b,
+    0x80da,0x433,
+    0x80d6,0x43a,
+    0x80cd,0x43a,
+    0x80c8,0x438,
+    0xe3,0x447,
+    0x80e8,0x440,
+    0x80ec,0x432,
+    0x80eb,0x428,
+    0x80e6,0x41a,
+    0x102,0x43b,
+    0x810c,0x43b,
+    0x8116,0x43b,
+    0x102,0x42f,
+    0x810c,0x42f,
+    0x8116,0x42f,
+    0x149,0x429,
+    0x8141,0x427,
+    0x8139,0x429,
+    0x8135,0x433,
+    0x8137,0x43b,
+    0x813a,0x43e,
+    0x8141,0x441,
+    0x8149,0x43e,
+    0x15d,0x440,
+    0x8165,0x442,
+    0x816c,0x43f,
+    0x8170,0x437,
+    0x816f,0x42e,
+    0x8164,0x427,
+    0x815a,0x42d,
+    0x8158,0x436,
+    0x815c,0x43f,
+    0x180,0x429,
+    0x8186,0x428,
+    0x818e,0x428,
+    0x8192,0x42b,
+    0x8193,0x42f,
+    0x818f,0x432,
+    0x8189,0x435,
+    0x8182,0x43a,
+    0x8184,0x43f,
+    0x818b,0x442,
+    0x8191,0x442,
+    0x1ab,0x448,
+    0x81a5,0x43b,
+    0x81a4,0x433,
+    0x81a6,0x429,
+    0x81ac,0x41b,
+    0x1ba,0x43e,
+    0x81c4,0x43f,
+    0x81ca,0x43e,
+    0x81cc,0x43a,
+    0x81ce,0x431,
+    0x81cd,0x42b,
+    0x81cc,0x428,
+    0x81c7,0x426,
+    0x81c2,0x425,
+    0x81bc,0x429,
+    0x81bb,0x42d,
+    0x81be,0x431,
+    0x81c3,0x432,
+    0x81cc,0x432,
+    0x1da,0x44a,
+    0x81df,0x442,
+    0x81e2,0x435,
+    0x81e1,0x42a,
+    0x81dc,0x41c,
+    0x20e,0x428,
+    0x8205,0x427,
+    0x81fd,0x429,
+    0x81fa,0x432,
+    0x81fb,0x43a,
+    0x81ff,0x43e,
+    0x8206,0x440,
+    0x820e,0x43d,
+    0x221,0x43f,
+    0x822a,0x441,
+    0x8231,0x43f,
+    0x8235,0x436,
+    0x8234,0x42e,
+    0x8228,0x427,
+    0x821f,0x42d,
+    0x821c,0x435,
+    0x8221,0x43f,
+    0x244,0x429,
+    0x824b,0x428,
+    0x8252,0x428,
+    0x8257,0x42b,
+    0x8257,0x42e,
+    0x8253,0x432,
+    0x824e,0x435,
+    0x8247,0x439,
+    0x8249,0x43f,
+    0x8250,0x441,
+    0x8256,0x441,
+    0x270,0x447,
+    0x826a,0x43b,
+    0x8269,0x432,
+    0x826b,0x428,
+    0x8271,0x41b,
+    0x27d,0x448,
+    0x827d,0x438,
+    0x827d,0x42e,
+    0x827e,0x424,
+    0x8284,0x422,
+    0x828c,0x424,
+    0x8290,0x42b,
+    0x8291,0x433,
+    0x828d,0x439,
+    0x8284,0x43a,
+    0x827e,0x438,
+    0x29e,0x449,
+    0x82a3,0x442,
+    0x82a7,0x434,
+    0x82a6,0x42a,
+    0x82a0,0x41c,
+    0x2b5,0x434,
+    0x82bd,0x434,
+    0x82c5,0x434,
+    0x2db,0x42a,
+    0x82e1,0x429,
+    0x82e8,0x429,
+    0x82ec,0x42c,
+    0x82ed,0x42f,
+    0x82e9,0x433,
+    0x82e4,0x435,
+    0x82dd,0x43a,
+    0x82df,0x43f,
+    0x82e6,0x441,
+    0x82ec,0x442,
+    0x2ff,0x442,
+    0x830a,0x441,
+    0x830a,0x434,
+    0x830b,0x429,
+    0x2ff,0x429,
+    0x830a,0x429,
+    0x8314,0x429,
+    0x324,0x43f,
+    0x8329,0x440,
+    0x832e,0x441,
+    0x8334,0x440,
+    0x8336,0x43c,
+    0x8338,0x434,
+    0x8338,0x429,
+    0x323,0x442,
+    0x8323,0x439,
+    0x8323,0x431,
+    0x8323,0x429,
+    0x350,0x44a,
+    0x834a,0x43e,
+    0x8349,0x436,
+    0x834b,0x42c,
+    0x8351,0x41e,
+    0x35f,0x441,
+    0x8369,0x442,
+    0x836f,0x440,
+    0x8371,0x43d,
+    0x8373,0x434,
+    0x8372,0x42e,
+    0x8370,0x42a,
+    0x836c,0x429,
+    0x8367,0x428,
+    0x8360,0x42c,
+    0x8360,0x430,
+    0x8363,0x433,
+    0x8368,0x435,
+    0x8371,0x435,
+    0x37e,0x44c,
+    0x8383,0x445,
+    0x8387,0x437,
+    0x8386,0x42d,
+    0x8381,0x41f,
+    0x398,0x429,
+    0x839f,0x427,
+    0x83a6,0x428,
+    0x83aa,0x42b,
+    0x83ab,0x42e,
+    0x83a7,0x431,
+    0x83a1,0x434,
+    0x839b,0x439,
+    0x839c,0x43e,
+    0x83a4,0x440,
+    0x83a9,0x440,
+    0x3bd,0x440,
+    0x83c8,0x440,
+    0x83c8,0x433,
+    0x83c8,0x428,
+    0x3bd,0x427,
+    0x83c8,0x428,
+    0x83d2,0x427,
+    0x3e2,0x43e,
+    0x83e7,0x43f,
+    0x83ec,0x440,
+    0x83f1,0x43f,
+    0x83f4,0x43a,
+    0x83f5,0x432,
+    0x83f5,0x428,
+    0x3e1,0x441,
+    0x83e1,0x437,
+    0x83e1,0x430,
+    0x83e1,0x427,
+    0x415,0x44a,
+    0x840f,0x43d,
+    0x840e,0x435,
+    0x8410,0x42b,
+    0x8416,0x41e,
+    0x422,0x44b,
+    0x8422,0x43b,
+    0x8422,0x431,
+    0x8423,0x427,
+    0x8429,0x424,
+    0x8431,0x427,
+    0x8435,0x42d,
+    0x8436,0x436,
+    0x8431,0x43c,
+    0x8429,0x43d,
+    0x8423,0x43b,
+    0x443,0x44c,
+    0x8448,0x445,
+    0x844c,0x437,
+    0x844b,0x42c,
+    0x8445,0x41f
+]
+
+EQN_28 = [
+    0x0,0x424,
+    0x8006,0x423,
+    0x800d,0x423,
+    0x8011,0x426,
+    0x8012,0x42a,
+    0x800e,0x42d,
+    0x8008,0x430,
+    0x8002,0x434,
+    0x8004,0x439,
+    0x800b,0x43c,
+    0x8011,0x43c,
+    0x24,0x43c,
+    0x802f,0x43c,
+    0x802f,0x42e,
+    0x802f,0x423,
+    0x24,0x423,
+    0x802f,0x423,
+    0x8039,0x423,
+    0x49,0x439,
+    0x804e,0x43b,
+    0x8053,0x43c,
+    0x8059,0x43a,
+    0x805b,0x436,
+    0x805d,0x42e,
+    0x805c,0x423,
+    0x48,0x43c,
+    0x8048,0x433,
+    0x8048,0x42b,
+    0x8048,0x423,
+    0x75,0x445,
+    0x806f,0x439,
+    0x806e,0x430,
+    0x8070,0x427,
+    0x8076,0x419,
+    0x83,0x43c,
+    0x808d,0x43d,
+    0x8093,0x43b,
+    0x8096,0x437,
+    0x8097,0x42f,
+    0x8097,0x428,
+    0x8095,0x425,
+    0x8090,0x423,
+    0x808b,0x423,
+    0x8085,0x426,
+    0x8085,0x42b,
+    0x8087,0x42e,
+    0x808d,0x42f,
+    0x8095,0x430,
+    0xb0,0x435,
+    0x80b0,0x42c,
+    0x80b0,0x426,
+    0xa7,0x42e,
+    0x80af,0x42e,
+    0x80b9,0x42e,
+    0xc6,0x448,
+    0x80c6,0x438,
+    0x80c6,0x42e,
+    0x80c7,0x424,
+    0x80cd,0x422,
+    0x80d5,0x424,
+    0x80d9,0x42b,
+    0x80da,0x433,
+    0x80d5,0x439,
+    0x80cd,0x43a,
+    0x80c7,0x438,
+    0xe3,0x447,
+    0x80e8,0x440,
+    0x80eb,0x432,
+    0x80eb,0x428,
+    0x80e5,0x41a,
+    0x101,0x43b,
+    0x810b,0x43b,
+    0x8116,0x43b,
+    0x101,0x42f,
+    0x810b,0x42f,
+    0x8116,0x42f,
+    0x149,0x428,
+    0x8140,0x427,
+    0x8138,0x429,
+    0x8135,0x433,
+    0x8136,0x43b,
+    0x813a,0x43e,
+    0x8141,0x441,
+    0x8149,0x43e,
+    0x15c,0x43f,
+    0x8165,0x442,
+    0x816c,0x43f,
+    0x8170,0x437,
+    0x816f,0x42e,
+    0x8163,0x427,
+    0x815a,0x42d,
+    0x8157,0x435,
+    0x815c,0x43f,
+    0x17f,0x429,
+    0x8186,0x428,
+    0x818d,0x428,
+    0x8192,0x42b,
+    0x8192,0x42f,
+    0x818e,0x432,
+    0x8188,0x435,
+    0x8182,0x43a,
+    0x8183,0x43f,
+    0x818b,0x442,
+    0x8191,0x442,
+    0x1ab,0x447,
+    0x81a5,0x43b,
+    0x81a4,0x433,
+    0x81a6,0x429,
+    0x81ac,0x41b,
+    0x1bb,0x44c,
+    0x81bb,0x43d,
+    0x81bb,0x432,
+    0x81bc,0x429,
+    0x81c2,0x426,
+    0x81ca,0x429,
+    0x81ce,0x42f,
+    0x81cf,0x438,
+    0x81cb,0x43e,
+    0x81c2,0x43e,
+    0x81bc,0x43d,
+    0x1d9,0x44a,
+    0x81de,0x442,
+    0x81e2,0x434,
+    0x81e1,0x42a,
+    0x81db,0x41c,
+    0x1f7,0x429,
+    0x81fd,0x428,
+    0x8204,0x428,
+    0x8208,0x42b,
+    0x8209,0x42e,
+    0x8205,0x431,
+    0x8200,0x434,
+    0x81f9,0x439,
+    0x81fb,0x43e,
+    0x8202,0x440,
+    0x8208,0x440,
+    0x21b,0x440,
+    0x8226,0x440,
+    0x8227,0x433,
+    0x8227,0x428,
+    0x21b,0x427,
+    0x8226,0x428,
+    0x8231,0x427,
+    0x240,0x43e,
+    0x8245,0x43f,
+    0x824a,0x440,
+    0x8250,0x43f,
+    0x8252,0x43a,
+    0x8254,0x433,
+    0x8254,0x428,
+    0x240,0x441,
+    0x823f,0x438,
+    0x823f,0x430,
+    0x823f,0x427,
+    0x26f,0x447,
+    0x826a,0x43a,
+    0x8268,0x432,
+    0x826b,0x428,
+    0x8271,0x41b,
+    0x27d,0x440,
+    0x8287,0x441,
+    0x828c,0x43f,
+    0x828f,0x43b,
+    0x8290,0x433,
+    0x8290,0x42c,
+    0x828e,0x429,
+    0x828a,0x427,
+    0x8285,0x427,
+    0x827e,0x42a,
+    0x827e,0x42f,
+    0x8281,0x432,
+    0x8286,0x433,
+    0x828f,0x433,
+    0x29e,0x449,
+    0x82a3,0x442,
+    0x82a6,0x434,
+    0x82a6,0x429,
+    0x82a0,0x41c,
+    0x2c0,0x43d,
+    0x82c0,0x432,
+    0x82c0,0x42b,
+    0x2b4,0x434,
+    0x82be,0x434,
+    0x82cb,0x434,
+    0x2f3,0x428,
+    0x82ea,0x427,
+    0x82e2,0x429,
+    0x82de,0x432,
+    0x82e0,0x43a,
+    0x82e3,0x43e,
+    0x82ea,0x440,
+    0x82f2,0x43d,
+    0x306,0x43f,
+    0x830e,0x441,
+    0x8315,0x43f,
+    0x8319,0x436,
+    0x8318,0x42e,
+    0x830d,0x427,
+    0x8304,0x42d,
+    0x8301,0x435,
+    0x8305,0x43f,
+    0x329,0x429,
+    0x8330,0x427,
+    0x8337,0x428,
+    0x833b,0x42b,
+    0x833c,0x42e,
+    0x8338,0x432,
+    0x8332,0x435,
+    0x832b,0x439,
+    0x832d,0x43f,
+    0x8335,0x441,
+    0x833b,0x441,
+    0x350,0x44a,
+    0x834a,0x43e,
+    0x8349,0x436,
+    0x834b,0x42c,
+    0x8351,0x41e,
+    0x35f,0x441,
+    0x8369,0x442,
+    0x836e,0x440,
+    0x8371,0x43d,
+    0x8372,0x434,
+    0x8372,0x42d,
+    0x8370,0x42a,
+    0x836b,0x429,
+    0x8367,0x428,
+    0x8360,0x42b,
+    0x8360,0x430,
+    0x8363,0x433,
+    0x8368,0x435,
+    0x8370,0x435,
+    0x37e,0x44c,
+    0x8383,0x445,
+    0x8387,0x437,
+    0x8386,0x42d,
+    0x8381,0x41f,
+    0x398,0x428,
+    0x839f,0x427,
+    0x83a6,0x428,
+    0x83aa,0x42a,
+    0x83aa,0x42e,
+    0x83a7,0x431,
+    0x83a1,0x434,
+    0x839b,0x439,
+    0x839c,0x43e,
+    0x83a3,0x440,
+    0x83a9,0x440,
+    0x3bc,0x440,
+    0x83c8,0x440,
+    0x83c8,0x433,
+    0x83c8,0x427,
+    0x3bc,0x427,
+    0x83c8,0x427,
+    0x83d2,0x427,
+    0x3e2,0x43e,
+    0x83e7,0x43f,
+    0x83ec,0x440,
+    0x83f1,0x43e,
+    0x83f4,0x43a,
+    0x83f5,0x432,
+    0x83f5,0x427,
+    0x3e1,0x441,
+    0x83e1,0x437,
+    0x83e1,0x430,
+    0x83e1,0x427,
+    0x415,0x44a,
+    0x840f,0x43d,
+    0x840e,0x435,
+    0x8410,0x42b,
+    0x8416,0x41e,
+    0x422,0x44b,
+    0x8422,0x43b,
+    0x8422,0x431,
+    0x8423,0x427,
+    0x8429,0x424,
+    0x8431,0x427,
+    0x8435,0x42d,
+    0x8436,0x436,
+    0x8431,0x43c,
+    0x8429,0x43d,
+    0x8423,0x43b,
+    0x443,0x44c,
+    0x8448,0x444,
+    0x844c,0x437,
+    0x844b,0x42c,
+    0x8445,0x41e
+]
+
+EQN_29 = [
+    0x0,0x3ae,
+    0x8000,0x3c5,
+    0x8000,0x3dc,
+    0x8000,0x3f2,
+    0x8012,0x3f2,
+    0x8026,0x3f2,
+    0x0,0x3cb,
+    0x8012,0x3cb,
+    0x8026,0x3cb,
+    0x5f,0x3fa,
+    0x8054,0x3e1,
+    0x8052,0x3d1,
+    0x8056,0x3be,
+    0x8061,0x3a4,
+    0x82,0x3e2,
+    0x807c,0x3d4,
+    0x807b,0x3c8,
+    0x8084,0x3be,
+    0x808c,0x3c4,
+    0x8091,0x3d6,
+    0xa3,0x3e2,
+    0x80a6,0x3d6,
+    0x80a3,0x3c7,
+    0x8097,0x3bf,
+    0x808c,0x3c2,
+    0xba,0x3fe,
+    0x80c4,0x3ef,
+    0x80ca,0x3d5,
+    0x80c9,0x3c0,
+    0x80be,0x3a5,
+    0xeb,0x3dc,
+    0x80ff,0x3dc,
+    0x8113,0x3dc,
+    0xec,0x3c6,
+    0x8100,0x3c6,
+    0x8113,0x3c6,
+    0x11e,0x363,
+    0x8133,0x35f,
+    0x8146,0x36b,
+    0x814d,0x385,
+    0x814d,0x3bb,
+    0x814c,0x3f0,
+    0x814d,0x414,
+    0x8154,0x438,
+    0x8164,0x44c,
+    0x817c,0x449,
+    0x19c,0x427,
+    0x81a4,0x431,
+    0x81af,0x438,
+    0x81b5,0x436,
+    0x81b6,0x430,
+    0x81b4,0x42a,
+    0x81ae,0x427,
+    0x81a8,0x428,
+    0x8199,0x437,
+    0x8192,0x438,
+    0x818c,0x434,
+    0x818f,0x42b,
+    0x8194,0x427,
+    0x819b,0x427,
+    0x154,0x366,
+    0x8164,0x366,
+    0x816d,0x366,
+    0x189,0x35e,
+    0x8191,0x368,
+    0x819c,0x36f,
+    0x81a2,0x36e,
+    0x81a4,0x367,
+    0x81a1,0x361,
+    0x819b,0x35f,
+    0x8195,0x35f,
+    0x8186,0x36e,
+    0x817f,0x36f,
+    0x8179,0x36c,
+    0x817c,0x363,
+    0x8181,0x35f,
+    0x8188,0x35e,
+    0x1f3,0x3ad,
+    0x81f3,0x3c6,
+    0x81f4,0x3dc,
+    0x81fb,0x3e8,
+    0x820c,0x3ec,
+    0x1e2,0x3d2,
+    0x81ed,0x3d2,
+    0x81ff,0x3d2,
+    0x820c,0x3d2,
+    0x242,0x3f9,
+    0x8237,0x3e0,
+    0x8234,0x3d0,
+    0x8239,0x3bd,
+    0x8244,0x3a2,
+    0x270,0x3e6,
+    0x8270,0x3c7,
+    0x8270,0x3b4,
+    0x8277,0x3ae,
+    0x8286,0x3ae,
+    0x25b,0x3d9,
+    0x8274,0x3d9,
+    0x8289,0x3d9,
+    0x29d,0x3fd,
+    0x82a6,0x3ee,
+    0x82ad,0x3d4,
+    0x82ab,0x3bf,
+    0x82a1,0x3a4,
+    0x2f9,0x3c9,
+    0x8309,0x3ca,
+    0x831c,0x3ca,
+    0x831a,0x3d7,
+    0x8310,0x3e0,
+    0x8302,0x3df,
+    0x82f9,0x3d6,
+    0x82f8,0x3c8,
+    0x82fc,0x3bc,
+    0x830b,0x3b5,
+    0x831e,0x3bb,
+    0x31a,0x413,
+    0x8329,0x413,
+    0x8333,0x413,
+    0x359,0x420,
+    0x8359,0x417,
+    0x8359,0x40a,
+    0x8357,0x405,
+    0x834e,0x401,
+    0x8347,0x408,
+    0x375,0x41f,
+    0x8371,0x414,
+    0x8370,0x40a,
+    0x8377,0x403,
+    0x837d,0x408,
+    0x8381,0x416,
+    0x38f,0x41f,
+    0x8391,0x415,
+    0x838f,0x40a,
+    0x8385,0x403,
+    0x837d,0x406,
+    0x3b2,0x42f,
+    0x83b2,0x417,
+    0x83b2,0x408,
+    0x83b7,0x404,
+    0x83c3,0x404,
+    0x3a1,0x425,
+    0x83b5,0x425,
+    0x83c5,0x425,
+    0x404,0x3fa,
+    0x8404,0x3d7,
+    0x8403,0x3c2,
+    0x83f3,0x3ba,
+    0x83e2,0x3c3,
+    0x83e0,0x3d8,
+    0x83ee,0x3e5,
+    0x8403,0x3e6,
+    0x433,0x3f4,
+    0x8432,0x3d5,
+    0x8433,0x3c2,
+    0x8439,0x3bc,
+    0x8448,0x3bc,
+    0x41d,0x3e7,
+    0x8436,0x3e7,
+    0x844c,0x3e7
+]
+
+EQN_30 = [
+    0x0,0x429,
+    0x802b,0x428,
+    0x804c,0x428,
+    0x8026,0x3f0,
+    0x8002,0x3bf,
+    0x8027,0x3c0,
+    0x804f,0x3bf,
+    0x84,0x3c5,
+    0x808f,0x3c8,
+    0x809a,0x3ca,
+    0x80a7,0x3c7,
+    0x80ad,0x3be,
+    0x80af,0x3ac,
+    0x80af,0x394,
+    0x83,0x3cb,
+    0x8082,0x3b7,
+    0x8082,0x3a6,
+    0x8082,0x394,
+    0xe0,0x3bc,
+    0x80e0,0x3a3,
+    0x80e0,0x396,
+    0xc7,0x3aa,
+    0x80dc,0x3aa,
+    0x80f8,0x3aa,
+    0x11c,0x3c2,
+    0x813a,0x3d6,
+    0x813a,0x3b2,
+    0x813b,0x394,
+    0x11b,0x393,
+    0x8139,0x394,
+    0x8155,0x393,
+    0x1a9,0x3fa,
+    0x81c6,0x3fa,
+    0x81e2,0x3fa,
+    0x1a9,0x3db,
+    0x81c6,0x3db,
+    0x81e2,0x3db,
+    0x240,0x421,
+    0x826c,0x420,
+    0x828d,0x420,
+    0x8267,0x3e8,
+    0x8243,0x3b7,
+    0x8268,0x3b7,
+    0x8290,0x3b7,
+    0x2c2,0x44c,
+    0x82d6,0x44c,
+    0x82e0,0x445,
+    0x82e6,0x438,
+    0x82d9,0x422,
+    0x82cd,0x418,
+    0x82c6,0x40a,
+    0x82d9,0x40a,
+    0x82e9,0x409,
+    0x2bc,0x3ba,
+    0x82c8,0x3bd,
+    0x82d3,0x3bf,
+    0x82df,0x3bc,
+    0x82e5,0x3b2,
+    0x82e8,0x3a1,
+    0x82e8,0x389,
+    0x2bb,0x3c0,
+    0x82bb,0x3ac,
+    0x82bb,0x39b,
+    0x82bb,0x388,
+    0x376,0x401,
+    0x8376,0x3e2,
+    0x8376,0x3d1,
+    0x357,0x3eb,
+    0x8372,0x3eb,
+    0x8395,0x3eb,
+    0x44c,0x3b2,
+    0x8423,0x3ac,
+    0x83fd,0x3b6,
+    0x83ec,0x3e2,
+    0x83f2,0x408,
+    0x8402,0x41a,
+    0x8425,0x426,
+    0x844a,0x418
+]
+
+EQN_31 = [
+    0xb,0x3c6,
+    0x8049,0x3cd,
+    0x8066,0x3e0,
+    0x8071,0x3fa,
+    0x8061,0x436,
+    0x8038,0x44c,
+    0x8000,0x439,
+    0x8000,0x409,
+    0x8001,0x3ba,
+    0x8000,0x37d,
+    0x100,0x3fa,
+    0x8137,0x3fa,
+    0x816e,0x3fa,
+    0x101,0x3bd,
+    0x8138,0x3bd,
+    0x816e,0x3bd,
+    0x204,0x446,
+    0x8247,0x445,
+    0x8268,0x430,
+    0x827e,0x40b,
+    0x8250,0x3cc,
+    0x822b,0x3af,
+    0x8212,0x386,
+    0x8253,0x386,
+    0x8289,0x386,
+    0x2de,0x3fc,
+    0x8338,0x3fa,
+    0x8380,0x3fc,
+    0x31e,0x3f8,
+    0x82fd,0x3a3,
+    0x82e2,0x394,
+    0x356,0x3f5,
+    0x834e,0x3a5,
+    0x8358,0x393,
+    0x3d9,0x38c,
+    0x83d8,0x3bb,
+    0x83d8,0x3f3,
+    0x83d9,0x3ff,
+    0x3da,0x3ee,
+    0x83f9,0x401,
+    0x840a,0x407,
+    0x8433,0x400,
+    0x844c,0x3ea
+]
+
+EQN_32 = [
+    0x16,0x3fb,
+    0x8040,0x402,
+    0x8062,0x3f6,
+    0x8075,0x3c8,
+    0x8065,0x38c,
+    0x804c,0x370,
+    0x802e,0x366,
+    0x800a,0x376,
+    0x8000,0x398,
+    0x8011,0x3c0,
+    0x8035,0x3d4,
+    0x806c,0x3cc,
+    0xc7,0x38f,
+    0x80b6,0x378,
+    0x809a,0x355,
+    0x8088,0x33e,
+    0x8b,0x38f,
+    0x809b,0x379,
+    0x80b5,0x358,
+    0x80c6,0x33f,
+    0x128,0x3b5,
+    0x815f,0x3b5,
+    0x819c,0x3b7,
+    0x8196,0x3e1,
+    0x8174,0x3fe,
+    0x8148,0x3fa,
+    0x812b,0x3df,
+    0x8125,0x3b0,
+    0x8133,0x388,
+    0x8165,0x373,
+    0x81a1,0x386,
+    0x214,0x44c,
+    0x8202,0x436,
+    0x81e7,0x413,
+    0x81d5,0x3fc,
+    0x1d8,0x44c,
+    0x81e8,0x437,
+    0x8202,0x416,
+    0x8213,0x3fd,
+    0x27f,0x3cf,
+    0x82ad,0x3cf,
+    0x82d9,0x3cf,
+    0x280,0x39d,
+    0x82ad,0x39d,
+    0x82d9,0x39d,
+    0x360,0x3b3,
+    0x8397,0x3b3,
+    0x83d4,0x3b4,
+    0x83cd,0x3df,
+    0x83ac,0x3fc,
+    0x8380,0x3f8,
+    0x8363,0x3dd,
+    0x835d,0x3ae,
+    0x836b,0x386,
+    0x839d,0x371,
+    0x83d9,0x383,
+    0x44c,0x44a,
+    0x843a,0x434,
+    0x841f,0x411,
+    0x840d,0x3fa,
+    0x40f,0x44a,
+    0x8420,0x435,
+    0x843a,0x414,
+    0x844b,0x3fb
+]
+
+EQN_33 = [
+    0x0,0x35a,
+    0x8015,0x356,
+    0x8029,0x363,
+    0x8030,0x37e,
+    0x8030,0x3b6,
+    0x802f,0x3ed,
+    0x8030,0x412,
+    0x8037,0x437,
+    0x8048,0x44c,
+    0x8060,0x449,
+    0xc1,0x41f,
+    0x80d4,0x430,
+    0x80d5,0x411,
+    0x80d5,0x3f7,
+    0xc0,0x3f6,
+    0x80d4,0x3f6,
+    0x80e6,0x3f6,
+    0x95,0x3c1,
+    0x80cf,0x3c1,
+    0x810d,0x3c1,
+    0xeb,0x397,
+    0x80dc,0x383,
+    0x80c8,0x369,
+    0x80b7,0x355,
+    0xb8,0x397,
+    0x80c8,0x383,
+    0x80dc,0x368,
+    0x80eb,0x355,
+    0x18c,0x3f0,
+    0x818b,0x3da,
+    0x818c,0x3c0,
+    0x8185,0x3ac,
+    0x8176,0x3a5,
+    0x8162,0x3aa,
+    0x815a,0x3be,
+    0x8163,0x3d1,
+    0x8178,0x3da,
+    0x8189,0x3da,
+    0x1da,0x3e4,
+    0x81cb,0x3d0,
+    0x81b7,0x3b6,
+    0x81a7,0x3a2,
+    0x1a7,0x3e4,
+    0x81b8,0x3d0,
+    0x81cb,0x3b5,
+    0x81da,0x3a2,
+    0x240,0x3d8,
+    0x8255,0x3d8,
+    0x8269,0x3d8,
+    0x240,0x3c2,
+    0x8255,0x3c2,
+    0x8269,0x3c2,
+    0x2a7,0x41c,
+    0x82a7,0x3db,
+    0x82a7,0x3aa,
+    0x82e7,0x3aa,
+    0x301,0x3e1,
+    0x8316,0x3e7,
+    0x8327,0x3e1,
+    0x8331,0x3cc,
+    0x832f,0x3b7,
+    0x8312,0x3a6,
+    0x82fc,0x3b4,
+    0x82f5,0x3c9,
+    0x8300,0x3e1,
+    0x389,0x3bb,
+    0x836e,0x3b1,
+    0x8354,0x3ba,
+    0x8356,0x3d8,
+    0x8371,0x3e8,
+    0x838a,0x3d9,
+    0x838f,0x3be,
+    0x8391,0x3ab,
+    0x838a,0x393,
+    0x8374,0x381,
+    0x8354,0x38e,
+    0x3b7,0x382,
+    0x83cc,0x382,
+    0x83e3,0x383,
+    0x83e0,0x393,
+    0x83d4,0x39d,
+    0x83c3,0x39c,
+    0x83b8,0x392,
+    0x83b6,0x380,
+    0x83bb,0x371,
+    0x83ce,0x369,
+    0x83e5,0x370,
+    0x44b,0x3e3,
+    0x843d,0x3cf,
+    0x8428,0x3b5,
+    0x8418,0x3a1,
+    0x418,0x3e3,
+    0x8429,0x3cf,
+    0x843d,0x3b4,
+    0x844c,0x3a1
+]
+
+EQN_34 = [
+    0xd0,0x448,
+    0x80f8,0x44c,
+    0x817d,0x44a,
+    0x82ce,0x44a,
+    0x834e,0x44a,
+    0x838a,0x445,
+    0x839a,0x430,
+    0x83a2,0x3f9,
+    0x839c,0x3be,
+    0x838f,0x3ab,
+    0x8366,0x39f,
+    0x82f6,0x39e,
+    0x82c7,0x397,
+    0x82b9,0x375,
+    0x82b4,0x32d,
+    0x82ac,0x2d0,
+    0x82a9,0x241,
+    0x82b1,0x1cd,
+    0x82cb,0x1aa,
+    0x8305,0x192,
+    0x8335,0x1a5,
+    0x8360,0x1ec,
+    0x8386,0x1f6,
+    0x8398,0x1e4,
+    0x838d,0x184,
+    0x8365,0x129,
+    0x8323,0xe6,
+    0x82d6,0xcd,
+    0x829d,0xd2,
+    0x8253,0x105,
+    0x822c,0x14c,
+    0x8219,0x1a2,
+    0x8213,0x1fd,
+    0x8218,0x282,
+    0x8222,0x2e9,
+    0x8230,0x36e,
+    0x8232,0x385,
+    0x8225,0x39b,
+    0x81ed,0x3a2,
+    0x81a5,0x39e,
+    0x817b,0x394,
+    0x8175,0x362,
+    0x816d,0x2ed,
+    0x8168,0x290,
+    0x8158,0x205,
+    0x813b,0x174,
+    0x811f,0x128,
+    0x80e4,0xdd,
+    0x809c,0xce,
+    0x805c,0x103,
+    0x805d,0x154,
+    0x8088,0x1a4,
+    0x80bb,0x1f9,
+    0x80e4,0x284,
+    0x80f5,0x315,
+    0x80ff,0x38d,
+    0x80f6,0x39a,
+    0x80d4,0x39f,
+    0x8090,0x388,
+    0x8075,0x36f,
+    0x8046,0x335,
+    0x8028,0x323,
+    0x800e,0x322,
+    0x8000,0x336,
+    0x8000,0x34e,
+    0x8013,0x38e,
+    0x804e,0x3f3,
+    0x8099,0x434,
+    0x80d0,0x448,
+    0x1,0x2,
+    0x8016,0x63,
+    0x803c,0xf,
+    0x8063,0x61,
+    0x8077,0x2,
+    0x9a,0x2,
+    0x80ab,0x24,
+    0x80ba,0x44,
+    0x80c7,0x5f,
+    0x80d3,0x45,
+    0x80e0,0x29,
+    0x80f2,0x2,
+    0xa8,0x1c,
+    0x80c8,0x1c,
+    0x80e5,0x1c,
+    0x129,0x63,
+    0x8129,0x35,
+    0x8129,0x4,
+    0x112,0x64,
+    0x8129,0x64,
+    0x8140,0x64,
+    0x166,0x66,
+    0x8166,0x48,
+    0x8167,0x38,
+    0x8166,0x28,
+    0x8166,0x5,
+    0x1a6,0x66,
+    0x81a6,0x48,
+    0x81a5,0x36,
+    0x81a6,0x25,
+    0x81a6,0x3,
+    0x167,0x39,
+    0x8185,0x39,
+    0x81a5,0x38,
+    0x228,0xc,
+    0x821a,0x5,
+    0x8203,0x0,
+    0x81e2,0xd,
+    0x81d4,0x21,
+    0x81d2,0x36,
+    0x81d4,0x46,
+    0x81e5,0x5f,
+    0x81fd,0x69,
+    0x8211,0x68,
+    0x8229,0x5d,
+    0x25a,0x9,
+    0x826a,0x2c,
+    0x827a,0x4c,
+    0x8286,0x66,
+    0x8293,0x4c,
+    0x829f,0x30,
+    0x82b2,0x9,
+    0x267,0x23,
+    0x8288,0x23,
+    0x82a4,0x23,
+    0x2d1,0x7,
+    0x82e6,0x68,
+    0x830c,0x14,
+    0x8333,0x67,
+    0x8347,0x7,
+    0x36e,0x38,
+    0x8380,0x38,
+    0x8390,0x3b,
+    0x8399,0x42,
+    0x839d,0x51,
+    0x8399,0x5c,
+    0x838e,0x64,
+    0x8380,0x66,
+    0x836d,0x65,
+    0x836d,0x54,
+    0x836d,0x37,
+    0x836d,0x7
+]
+
+EQN_35 = [
+    0x0,0x3f1,
+    0x8011,0x447,
+    0x8034,0x3fd,
+    0x8055,0x446,
+    0x8068,0x3f1,
+    0x87,0x3f1,
+    0x8095,0x410,
+    0x80a3,0x42c,
+    0x80ae,0x443,
+    0x80b9,0x42c,
+    0x80c4,0x414,
+    0x80d4,0x3f1,
+    0x92,0x408,
+    0x80af,0x408,
+    0x80c9,0x408,
+    0x104,0x447,
+    0x8104,0x41f,
+    0x8104,0x3f3,
+    0xf0,0x448,
+    0x8104,0x448,
+    0x8119,0x448,
+    0x13b,0x44a,
+    0x813b,0x42f,
+    0x813b,0x421,
+    0x813b,0x413,
+    0x813b,0x3f4,
+    0x173,0x44a,
+    0x8173,0x42f,
+    0x8173,0x420,
+    0x8173,0x410,
+    0x8173,0x3f3,
+    0x13b,0x422,
+    0x8156,0x422,
+    0x8172,0x421,
+    0x1e6,0x3fa,
+    0x81d9,0x3f4,
+    0x81c5,0x3f0,
+    0x81a8,0x3fb,
+    0x819c,0x40d,
+    0x819a,0x420,
+    0x819b,0x42e,
+    0x81ab,0x444,
+    0x81c0,0x44c,
+    0x81d2,0x44c,
+    0x81e7,0x442,
+    0x212,0x3f8,
+    0x8221,0x416,
+    0x822e,0x433,
+    0x8239,0x44a,
+    0x8244,0x433,
+    0x824f,0x41b,
+    0x8260,0x3f8,
+    0x21e,0x40f,
+    0x823a,0x40f,
+    0x8254,0x40f,
+    0x27c,0x3f6,
+    0x828e,0x44c,
+    0x82b0,0x401,
+    0x82d2,0x44a,
+    0x82e4,0x3f6,
+    0x306,0x421,
+    0x8316,0x421,
+    0x8324,0x424,
+    0x832c,0x42a,
+    0x832f,0x437,
+    0x832c,0x441,
+    0x8323,0x448,
+    0x8316,0x44a,
+    0x8305,0x449,
+    0x8305,0x43a,
+    0x8305,0x420,
+    0x8305,0x3f6,
+    0x26d,0x394,
+    0x8257,0x362,
+    0x822c,0x326,
+    0x820c,0x2ea,
+    0x81e0,0x281,
+    0x81ce,0x221,
+    0x81d6,0x1b0,
+    0x81f9,0x12e,
+    0x8217,0xdb,
+    0x822e,0xa0,
+    0x8250,0x51,
+    0x8264,0x1,
+    0x823c,0x3b,
+    0x820f,0x97,
+    0x81f3,0xcf,
+    0x81ce,0x124,
+    0x81a6,0x1a0,
+    0x8198,0x221,
+    0x81b6,0x291,
+    0x81f3,0x2ff,
+    0x8219,0x337,
+    0x823f,0x36a,
+    0x826d,0x394,
+    0x17e,0x2c0,
+    0x8153,0x2fb,
+    0x8134,0x326,
+    0x8122,0x34c,
+    0x8144,0x361,
+    0x8159,0x36a,
+    0x817c,0x372,
+    0x81a1,0x36a,
+    0x81b3,0x363,
+    0x81da,0x348,
+    0x81c4,0x321,
+    0x81aa,0x2fd,
+    0x817e,0x2c0,
+    0x8f,0x394,
+    0x80bd,0x369,
+    0x80e6,0x333,
+    0x8116,0x2e9,
+    0x813d,0x2a2,
+    0x8156,0x263,
+    0x8164,0x20f,
+    0x8161,0x1df,
+    0x8155,0x19d,
+    0x812a,0x11d,
+    0x80eb,0x93,
+    0x80ab,0x1c,
+    0x8098,0x1,
+    0x809c,0x2d,
+    0x80b9,0x74,
+    0x80d0,0xa9,
+    0x8104,0x135,
+    0x8124,0x1ab,
+    0x812d,0x1eb,
+    0x812e,0x221,
+    0x8126,0x25b,
+    0x8112,0x29b,
+    0x80f9,0x2d8,
+    0x80d1,0x321,
+    0x80ac,0x355,
+    0x808f,0x394
+]
+
+EQN_36 = [
+    0x43e,0x3c2,
+    0x844a,0x3ad,
+    0x844c,0x35f,
+    0x8425,0x339,
+    0x840a,0x336,
+    0x83b8,0x334,
+    0x8387,0x33d,
+    0x836e,0x358,
+    0x8365,0x381,
+    0x836b,0x3ad,
+    0x8379,0x3c4,
+    0x837f,0x3f9,
+    0x839b,0x3f7,
+    0x83bd,0x3cc,
+    0x83cf,0x3ca,
+    0x83f3,0x3cd,
+    0x8407,0x3dc,
+    0x841d,0x3f7,
+    0x842d,0x3f7,
+    0x8438,0x3f7,
+    0x843e,0x3c2,
+    0x3ad,0x385,
+    0x838e,0x385,
+    0x838e,0x3a2,
+    0x83ad,0x3a2,
+    0x83ad,0x385,
+    0x428,0x386,
+    0x8409,0x387,
+    0x8409,0x3a4,
+    0x8428,0x3a3,
+    0x8428,0x386,
+    0x3b5,0x371,
+    0x83b5,0x359,
+    0x83db,0x359,
+    0x8402,0x359,
+    0x8402,0x372,
+    0x3db,0x372,
+    0x83db,0x35b,
+    0x405,0x3e5,
+    0x8404,0x430,
+    0x83f8,0x442,
+    0x83e9,0x44a,
+    0x83b6,0x44b,
+    0x830e,0x44b,
+    0x82ec,0x44c,
+    0x82cb,0x444,
+    0x82c1,0x435,
+    0x82be,0x41e,
+    0x82be,0x3d5,
+    0x82be,0x3b1,
+    0x8281,0x3de,
+    0x8267,0x3de,
+    0x8262,0x3cc,
+    0x826d,0x3b8,
+    0x82a0,0x390,
+    0x82c0,0x374,
+    0x82c0,0x35e,
+    0x82ca,0x345,
+    0x82d9,0x33e,
+    0x82ed,0x33b,
+    0x832d,0x33a,
+    0x835e,0x33a,
+    0x8383,0x33c,
+    0x2cb,0x342,
+    0x82c7,0x338,
+    0x82c8,0x327,
+    0x82d3,0x31e,
+    0x82db,0x31d,
+    0x82e8,0x324,
+    0x82f1,0x33a,
+    0x305,0x339,
+    0x830a,0x327,
+    0x8315,0x31e,
+    0x831d,0x31d,
+    0x832a,0x324,
+    0x8332,0x338,
+    0x399,0x338,
+    0x839d,0x324,
+    0x83a8,0x31b,
+    0x83b0,0x31a,
+    0x83bd,0x321,
+    0x83c5,0x333,
+    0x3e1,0x334,
+    0x83e5,0x323,
+    0x83ef,0x31a,
+    0x83f7,0x319,
+    0x8405,0x320,
+    0x840d,0x334,
+    0x0,0x424,
+    0x8034,0x430,
+    0x806e,0x43f,
+    0x809a,0x43a,
+    0x80b6,0x430,
+    0x80e1,0x424,
+    0x810e,0x42c,
+    0x8152,0x43f,
+    0x817e,0x43b,
+    0x81a0,0x430,
+    0x81c9,0x424,
+    0x81f0,0x427,
+    0x820f,0x432,
+    0x8235,0x43e,
+    0x8265,0x43b,
+    0x8287,0x430,
+    0x82a1,0x427,
+    0x82bd,0x424,
+    0x0,0x3f7,
+    0x8034,0x403,
+    0x806e,0x412,
+    0x8099,0x40c,
+    0x80b6,0x403,
+    0x80e1,0x3f7,
+    0x810e,0x3fe,
+    0x8152,0x411,
+    0x817d,0x40e,
+    0x81a0,0x403,
+    0x81c9,0x3f7,
+    0x81ef,0x3fa,
+    0x820f,0x405,
+    0x8235,0x411,
+    0x8265,0x40e,
+    0x8287,0x403,
+    0x82a1,0x3fa,
+    0x82bc,0x3f7,
+    0x3,0x3c8,
+    0x8037,0x3d4,
+    0x8072,0x3e3,
+    0x809d,0x3dd,
+    0x80ba,0x3d4,
+    0x80e5,0x3c8,
+    0x8112,0x3cf,
+    0x8156,0x3e2,
+    0x8181,0x3df,
+    0x81a3,0x3d4,
+    0x81cc,0x3c8,
+    0x81f3,0x3cb,
+    0x8212,0x3d6,
+    0x8239,0x3e2,
+    0x8262,0x3df,
+    0x2,0x399,
+    0x8036,0x3a5,
+    0x8071,0x3b4,
+    0x809c,0x3af,
+    0x80b8,0x3a5,
+    0x80e4,0x399,
+    0x8110,0x3a1,
+    0x8154,0x3b4,
+    0x8180,0x3b0,
+    0x81a2,0x3a5,
+    0x81cb,0x399,
+    0x81f2,0x39c,
+    0x8211,0x3a8,
+    0x8238,0x3b3,
+    0x8270,0x3af,
+    0x1,0x370,
+    0x8035,0x37c,
+    0x8070,0x38a,
+    0x809b,0x385,
+    0x80b8,0x37c,
+    0x80e3,0x370,
+    0x810f,0x377,
+    0x8153,0x38a,
+    0x817f,0x387,
+    0x81a1,0x37c,
+    0x81ca,0x370,
+    0x81f1,0x373,
+    0x8210,0x37e,
+    0x8237,0x38a,
+    0x8267,0x387,
+    0x8289,0x37c,
+    0x82a2,0x373,
+    0x82be,0x370,
+    0x3,0x349,
+    0x8037,0x355,
+    0x8072,0x364,
+    0x809d,0x35f,
+    0x80ba,0x355,
+    0x80e5,0x34a,
+    0x8111,0x351,
+    0x8155,0x364,
+    0x8181,0x360,
+    0x81a3,0x355,
+    0x81cc,0x34a,
+    0x81f3,0x34c,
+    0x8212,0x358,
+    0x8239,0x363,
+    0x8269,0x360,
+    0x828b,0x355,
+    0x82a5,0x34d,
+    0x82c0,0x349
+]
+
+EFFECT_BICYCLE_HORN = [
+    0x42b,0x44b,
+    0x843e,0x44c,
+    0x8449,0x44a,
+    0x844c,0x438,
+    0x844c,0x3ff,
+    0x844c,0x2ec,
+    0x844c,0x299,
+    0x8445,0x283,
+    0x841f,0x28c,
+    0x83bc,0x2c5,
+    0x8301,0x305,
+    0x829b,0x31e,
+    0x823e,0x32e,
+    0x8210,0x335,
+    0x81ff,0x340,
+    0x81f6,0x34c,
+    0x81f4,0x376,
+    0x81f6,0x382,
+    0x8202,0x391,
+    0x8225,0x39e,
+    0x828b,0x3ad,
+    0x831b,0x3d1,
+    0x83c0,0x40b,
+    0x8408,0x432,
+    0x842b,0x44b,
+    0x1f6,0x349,
+    0x81e9,0x343,
+    0x81c0,0x33e,
+    0x81ba,0x333,
+    0x81b1,0x32a,
+    0x81a5,0x31c,
+    0x816e,0x31c,
+    0x815d,0x321,
+    0x8138,0x310,
+    0x80e6,0x2d9,
+    0x8096,0x2c9,
+    0x804b,0x2e1,
+    0x8008,0x332,
+    0x8000,0x357,
+    0x800a,0x3a1,
+    0x8015,0x3b7,
+    0x806f,0x3ff,
+    0x808e,0x405,
+    0x80d3,0x3fd,
+    0x8131,0x3c1,
+    0x815b,0x3ac,
+    0x816c,0x3b2,
+    0x81a5,0x3b2,
+    0x81b1,0x3a3,
+    0x81ba,0x39c,
+    0x81bf,0x390,
+    0x81e8,0x38b,
+    0x81f6,0x385
+]
+
+EFFECT_BIG_GONG = [
+    0x2c5,0x30d,
+    0x82b6,0x315,
+    0x82a6,0x31d,
+    0x8286,0x37d,
+    0x8266,0x3dd,
+    0x8273,0x3dd,
+    0x8281,0x3dd,
+    0x82a3,0x375,
+    0x82c5,0x30d,
+    0x188,0x30d,
+    0x8198,0x315,
+    0x81a8,0x31d,
+    0x81c8,0x37d,
+    0x81e8,0x3dd,
+    0x81da,0x3dd,
+    0x81cd,0x3dd,
+    0x81ab,0x375,
+    0x8188,0x30d,
+    0x3c7,0x3dc,
+    0x83c5,0x358,
+    0x83c4,0x2d3,
+    0x83b8,0x2c9,
+    0x83ac,0x2be,
+    0x83ac,0x294,
+    0x83ac,0x26b,
+    0x83a3,0x25f,
+    0x8399,0x253,
+    0x839a,0x1c4,
+    0x839b,0x134,
+    0x838a,0xdf,
+    0x8378,0x8b,
+    0x83d0,0x8b,
+    0x8429,0x8c,
+    0x8419,0xdf,
+    0x8409,0x133,
+    0x8405,0x1c7,
+    0x8402,0x25b,
+    0x83fa,0x265,
+    0x83f3,0x270,
+    0x83f3,0x298,
+    0x83f2,0x2c0,
+    0x83e9,0x2ca,
+    0x83df,0x2d3,
+    0x83df,0x358,
+    0x83df,0x3dc,
+    0x83d3,0x3dc,
+    0x83c7,0x3dc,
+    0x7f,0x3db,
+    0x807e,0x356,
+    0x807d,0x2d2,
+    0x8071,0x2c7,
+    0x8065,0x2bd,
+    0x8065,0x293,
+    0x8065,0x26a,
+    0x805c,0x25e,
+    0x8052,0x252,
+    0x8053,0x1c3,
+    0x8053,0x133,
+    0x8042,0xde,
+    0x8031,0x8a,
+    0x8089,0x8a,
+    0x80e1,0x8b,
+    0x80d1,0xde,
+    0x80c1,0x132,
+    0x80be,0x1c5,
+    0x80ba,0x259,
+    0x80b3,0x264,
+    0x80ac,0x26f,
+    0x80ac,0x297,
+    0x80ab,0x2bf,
+    0x80a2,0x2c9,
+    0x8098,0x2d2,
+    0x8098,0x356,
+    0x8098,0x3db,
+    0x808c,0x3db,
+    0x807f,0x3db,
+    0x2c,0x3e2,
+    0x8016,0x417,
+    0x8000,0x44c,
+    0x8035,0x43b,
+    0x806a,0x429,
+    0x80bd,0x421,
+    0x8110,0x41b,
+    0x8160,0x416,
+    0x81b0,0x414,
+    0x821a,0x413,
+    0x8283,0x414,
+    0x82f1,0x417,
+    0x835f,0x41d,
+    0x83ab,0x427,
+    0x83f6,0x430,
+    0x8421,0x43a,
+    0x844c,0x443,
+    0x8436,0x413,
+    0x8421,0x3e2,
+    0x8324,0x3e2,
+    0x8227,0x3e2,
+    0x812a,0x3e2,
+    0x802c,0x3e2,
+    0x25a,0x213,
+    0x8256,0x1ff,
+    0x824b,0x1ef,
+    0x823b,0x1e4,
+    0x8227,0x1e0,
+    0x8214,0x1e4,
+    0x8204,0x1ef,
+    0x81f9,0x1ff,
+    0x81f5,0x213,
+    0x81f9,0x226,
+    0x8204,0x236,
+    0x8214,0x241,
+    0x8227,0x245,
+    0x823b,0x241,
+    0x824b,0x236,
+    0x8256,0x226,
+    0x825a,0x213,
+    0x2ec,0x213,
+    0x82e8,0x1ec,
+    0x82dc,0x1c7,
+    0x82ca,0x1a5,
+    0x82b2,0x188,
+    0x8295,0x170,
+    0x8273,0x15e,
+    0x824e,0x153,
+    0x8227,0x14f,
+    0x81ff,0x153,
+    0x81da,0x15e,
+    0x81b8,0x170,
+    0x819b,0x188,
+    0x8183,0x1a5,
+    0x8171,0x1c7,
+    0x8166,0x1ec,
+    0x8162,0x213,
+    0x8166,0x23b,
+    0x8171,0x260,
+    0x8183,0x282,
+    0x819b,0x29f,
+    0x81b8,0x2b7,
+    0x81da,0x2c9,
+    0x81ff,0x2d4,
+    0x8227,0x2d8,
+    0x824e,0x2d4,
+    0x8273,0x2c9,
+    0x8295,0x2b7,
+    0x82b2,0x29f,
+    0x82ca,0x282,
+    0x82dc,0x260,
+    0x82e8,0x23b,
+    0x82ec,0x213,
+    0x34b,0x209,
+    0x8345,0x1cd,
+    0x8334,0x196,
+    0x8319,0x164,
+    0x82f5,0x138,
+    0x82c9,0x114,
+    0x8297,0xf9,
+    0x8260,0xe8,
+    0x8224,0xe2,
+    0x81e9,0xe8,
+    0x81b1,0xf9,
+    0x817f,0x114,
+    0x8154,0x138,
+    0x8130,0x164,
+    0x8115,0x196,
+    0x8103,0x1cd,
+    0x80fd,0x209,
+    0x8103,0x244,
+    0x8115,0x27c,
+    0x8130,0x2ae,
+    0x8154,0x2da,
+    0x817f,0x2fe,
+    0x81b1,0x319,
+    0x81e9,0x32a,
+    0x8224,0x330,
+    0x8260,0x32a,
+    0x8297,0x319,
+    0x82c9,0x2fe,
+    0x82f5,0x2da,
+    0x8319,0x2ae,
+    0x8334,0x27c,
+    0x8345,0x244,
+    0x834b,0x209
+]
+
+EFFECT_BONGO_DRUMS = [
+    0x2bd,0x330,
+    0x8283,0x330,
+    0x8249,0x331,
+    0x820f,0x332,
+    0x81d5,0x332,
+    0x1e7,0x3a8,
+    0x8217,0x3a7,
+    0x8248,0x3a6,
+    0x8278,0x3a5,
+    0x82a9,0x3a4,
+    0x436,0x3cc,
+    0x8424,0x366,
+    0x840e,0x2ef,
+    0x83f7,0x2e7,
+    0x83df,0x2dc,
+    0x83a5,0x2d8,
+    0x836c,0x2d3,
+    0x8333,0x2d8,
+    0x82f9,0x2dc,
+    0x82e1,0x2e7,
+    0x82c9,0x2f1,
+    0x82b5,0x36b,
+    0x82a6,0x3c5,
+    0x1ec,0x3bf,
+    0x81dd,0x35b,
+    0x81c8,0x2cb,
+    0x81ad,0x2c1,
+    0x8192,0x2b5,
+    0x8151,0x2b0,
+    0x810c,0x2a8,
+    0x80cc,0x2ad,
+    0x808b,0x2b2,
+    0x8070,0x2be,
+    0x8054,0x2ca,
+    0x8038,0x349,
+    0x801d,0x3c3,
+    0x41f,0x424,
+    0x8430,0x41e,
+    0x8439,0x417,
+    0x8435,0x412,
+    0x8429,0x40d,
+    0x8415,0x408,
+    0x83fb,0x404,
+    0x83dc,0x401,
+    0x83b8,0x3fe,
+    0x8390,0x3fd,
+    0x8365,0x3fc,
+    0x833a,0x3fd,
+    0x8312,0x3fe,
+    0x82ee,0x401,
+    0x82cf,0x404,
+    0x82b5,0x408,
+    0x82a1,0x40d,
+    0x8295,0x412,
+    0x8291,0x417,
+    0x829a,0x41e,
+    0x82ab,0x424,
+    0x44c,0x40e,
+    0x844b,0x3f8,
+    0x844b,0x3e3,
+    0x8446,0x3dc,
+    0x8439,0x3d5,
+    0x8424,0x3cf,
+    0x8408,0x3ca,
+    0x83e6,0x3c6,
+    0x83bf,0x3c2,
+    0x8393,0x3c0,
+    0x8365,0x3bf,
+    0x8337,0x3c0,
+    0x830b,0x3c2,
+    0x82e4,0x3c6,
+    0x82c2,0x3ca,
+    0x82a6,0x3cf,
+    0x8291,0x3d5,
+    0x8284,0x3dc,
+    0x827f,0x3e3,
+    0x827e,0x3f6,
+    0x827d,0x40a,
+    0x438,0x41c,
+    0x8445,0x417,
+    0x844a,0x411,
+    0x8445,0x40b,
+    0x8438,0x405,
+    0x8422,0x400,
+    0x8406,0x3fc,
+    0x83e4,0x3f9,
+    0x83bd,0x3f6,
+    0x8392,0x3f4,
+    0x8364,0x3f4,
+    0x8335,0x3f4,
+    0x830a,0x3f6,
+    0x82e3,0x3f9,
+    0x82c1,0x3fc,
+    0x82a5,0x400,
+    0x828f,0x405,
+    0x8282,0x40b,
+    0x827d,0x411,
+    0x8282,0x417,
+    0x828f,0x41c,
+    0x41e,0x429,
+    0x841a,0x423,
+    0x840f,0x41e,
+    0x83fe,0x419,
+    0x83e7,0x415,
+    0x83cc,0x411,
+    0x83ac,0x40f,
+    0x8389,0x40d,
+    0x8364,0x40c,
+    0x833e,0x40d,
+    0x831b,0x40f,
+    0x82fb,0x411,
+    0x82e0,0x415,
+    0x82c9,0x419,
+    0x82b8,0x41e,
+    0x82ad,0x423,
+    0x82a9,0x429,
+    0x82ad,0x42f,
+    0x82b8,0x434,
+    0x82c9,0x439,
+    0x82e0,0x43e,
+    0x82fb,0x441,
+    0x831b,0x444,
+    0x833e,0x445,
+    0x8364,0x446,
+    0x8389,0x445,
+    0x83ac,0x444,
+    0x83cc,0x441,
+    0x83e7,0x43e,
+    0x83fe,0x439,
+    0x840f,0x434,
+    0x841a,0x42f,
+    0x841e,0x429,
+    0x1d7,0x426,
+    0x81eb,0x41f,
+    0x81f5,0x417,
+    0x81f0,0x411,
+    0x81e2,0x40c,
+    0x81cc,0x407,
+    0x81af,0x402,
+    0x818c,0x3fe,
+    0x8163,0x3fc,
+    0x8136,0x3fa,
+    0x8105,0x3f9,
+    0x80d5,0x3fa,
+    0x80a8,0x3fc,
+    0x807f,0x3fe,
+    0x805c,0x402,
+    0x803f,0x407,
+    0x8028,0x40c,
+    0x801a,0x411,
+    0x8016,0x417,
+    0x8020,0x41f,
+    0x8033,0x426,
+    0x20a,0x40e,
+    0x820a,0x3f5,
+    0x8209,0x3dc,
+    0x8204,0x3d4,
+    0x81f5,0x3cd,
+    0x81dd,0x3c6,
+    0x81bd,0x3c0,
+    0x8197,0x3bb,
+    0x816b,0x3b8,
+    0x813a,0x3b5,
+    0x8120,0x3b5,
+    0x8105,0x3b5,
+    0x80eb,0x3b5,
+    0x80d1,0x3b5,
+    0x80a0,0x3b8,
+    0x8074,0x3bb,
+    0x804e,0x3c0,
+    0x802e,0x3c6,
+    0x8016,0x3cd,
+    0x8007,0x3d4,
+    0x8001,0x3dc,
+    0x8001,0x3f3,
+    0x8000,0x409,
+    0x1f3,0x41d,
+    0x8203,0x417,
+    0x8208,0x411,
+    0x8203,0x40a,
+    0x81f3,0x404,
+    0x81db,0x3fe,
+    0x81bc,0x3f9,
+    0x8195,0x3f5,
+    0x8169,0x3f2,
+    0x8138,0x3f0,
+    0x8104,0x3ef,
+    0x80cf,0x3f0,
+    0x809e,0x3f2,
+    0x8072,0x3f5,
+    0x804c,0x3f9,
+    0x802c,0x3fe,
+    0x8014,0x404,
+    0x8005,0x40a,
+    0x8000,0x411,
+    0x8005,0x417,
+    0x8014,0x41d,
+    0x1d6,0x42c,
+    0x81d2,0x425,
+    0x81c6,0x41f,
+    0x81b2,0x41a,
+    0x8199,0x415,
+    0x817a,0x411,
+    0x8156,0x40e,
+    0x812e,0x40c,
+    0x8104,0x40b,
+    0x80d9,0x40c,
+    0x80b2,0x40e,
+    0x808e,0x411,
+    0x806f,0x415,
+    0x8055,0x41a,
+    0x8041,0x41f,
+    0x8035,0x425,
+    0x8031,0x42c,
+    0x8035,0x432,
+    0x8041,0x439,
+    0x8055,0x43e,
+    0x806f,0x443,
+    0x808e,0x447,
+    0x80b2,0x44a,
+    0x80d9,0x44c,
+    0x8104,0x44c,
+    0x812e,0x44c,
+    0x8156,0x44a,
+    0x817a,0x447,
+    0x8199,0x443,
+    0x81b2,0x43e,
+    0x81c6,0x439,
+    0x81d2,0x432,
+    0x81d6,0x42c
+]
+
+EFFECT_BREAKING_GLASS = [
+    0x411,0x3a5,
+    0x83ea,0x3be,
+    0x83c8,0x3e5,
+    0x83b6,0x40c,
+    0x83b4,0x422,
+    0x83c5,0x442,
+    0x83e1,0x44c,
+    0x83fd,0x448,
+    0x8416,0x43b,
+    0x8435,0x41c,
+    0x844a,0x3f6,
+    0x844c,0x3c8,
+    0x843a,0x3af,
+    0x8423,0x3a3,
+    0x8406,0x391,
+    0x83ed,0x37b,
+    0x83a2,0x325,
+    0x8372,0x2f6,
+    0x832a,0x2b7,
+    0x82d0,0x2c1,
+    0x82e5,0x321,
+    0x82c9,0x360,
+    0x82de,0x37c,
+    0x8280,0x37c,
+    0x3cc,0x42c,
+    0x83de,0x438,
+    0x8403,0x42d,
+    0x8418,0x41d,
+    0x8430,0x3fe,
+    0x8438,0x3d3,
+    0x8435,0x3cb,
+    0x8427,0x3bc,
+    0x8400,0x3c8,
+    0x83e4,0x3e6,
+    0x83cc,0x412,
+    0x83cc,0x42c,
+    0x83e4,0x422,
+    0x8406,0x40a,
+    0x8413,0x3fc,
+    0x8420,0x3e2,
+    0x8423,0x3c1,
+    0x3eb,0x383,
+    0x83d4,0x391,
+    0x83ad,0x3b7,
+    0x8399,0x3d2,
+    0x838e,0x400,
+    0x8397,0x414,
+    0x83b1,0x422,
+    0x28b,0x37f,
+    0x82dc,0x3b7,
+    0x8323,0x3dc,
+    0x838b,0x409,
+    0x1d0,0x386,
+    0x820e,0x3b3,
+    0x8253,0x37f,
+    0x81c6,0x386,
+    0x20e,0x341,
+    0x8249,0x32b,
+    0x82ad,0x325,
+    0x828d,0x2c8,
+    0x8238,0x2dc,
+    0x81e1,0x2c5,
+    0x81f5,0x309,
+    0x820e,0x341,
+    0x1bf,0x330,
+    0x819f,0x2f9,
+    0x8169,0x2e0,
+    0x8153,0x2ef,
+    0x812e,0x2ee,
+    0x8140,0x314,
+    0x817a,0x336,
+    0x81bf,0x330,
+    0x101,0x29f,
+    0x811c,0x2b0,
+    0x8123,0x283,
+    0x8165,0x2a9,
+    0x8170,0x253,
+    0x81a3,0x233,
+    0x8194,0x212,
+    0x81aa,0x200,
+    0x81e8,0x1e1,
+    0x822a,0x1e4,
+    0x820a,0x1ad,
+    0x8213,0x18b,
+    0x81c6,0x153,
+    0x813c,0xf4,
+    0x80ec,0xc2,
+    0x80b1,0xcf,
+    0x808b,0xe9,
+    0x8050,0x123,
+    0x801c,0x168,
+    0x8001,0x1a2,
+    0x8000,0x1cf,
+    0x803c,0x210,
+    0x80b8,0x271,
+    0x8101,0x29f,
+    0x80ec,0x266,
+    0x80e8,0x242,
+    0x8103,0x238,
+    0x8120,0x237,
+    0x8101,0x207,
+    0x8140,0x210,
+    0x816c,0x21f,
+    0x1a3,0x2a5,
+    0x81e1,0x28a,
+    0x81bd,0x268,
+    0x81a0,0x274,
+    0x81a3,0x2a5,
+    0x238,0x2a2,
+    0x8254,0x26d,
+    0x8299,0x253,
+    0x8252,0x22d,
+    0x8219,0x22a,
+    0x81f4,0x23c,
+    0x8201,0x259,
+    0x8238,0x2a2,
+    0x318,0x1ee,
+    0x82d7,0x216,
+    0x82d8,0x249,
+    0x82e7,0x270,
+    0x8315,0x277,
+    0x8332,0x241,
+    0x831b,0x21f,
+    0x8318,0x1ee,
+    0x299,0x253,
+    0x82a0,0x253,
+    0x16c,0x218,
+    0x815b,0x1c7,
+    0x816e,0x19b,
+    0x8194,0x1a1,
+    0x81b8,0x1ae,
+    0x81d8,0x18e,
+    0x8215,0x191,
+    0x26e,0x1d7,
+    0x8260,0x1ad,
+    0x828e,0x191,
+    0x8293,0x1c5,
+    0x8290,0x1fe,
+    0x826e,0x1d7
+]
+
+EFFECT_CAR_HORN = [
+    0x5a,0x3b1,
+    0x8000,0x3ac,
+    0x69,0x3c0,
+    0x801f,0x3d1,
+    0x7f,0x3c7,
+    0x8039,0x3f9,
+    0x56,0x387,
+    0x80aa,0x3c3,
+    0x80d2,0x3c8,
+    0x80fb,0x3c6,
+    0x8124,0x3c6,
+    0x814c,0x3ce,
+    0x8186,0x3ed,
+    0x81bf,0x40f,
+    0x8269,0x44c,
+    0x831c,0x448,
+    0x8371,0x41e,
+    0x83c2,0x3ed,
+    0x83f7,0x3e8,
+    0x8428,0x3df,
+    0x844c,0x383,
+    0x8441,0x34d,
+    0x842a,0x323,
+    0x840c,0x30d,
+    0x83ea,0x301,
+    0x83e8,0x302,
+    0x83e7,0x304,
+    0x83e7,0x321,
+    0x83dc,0x33f,
+    0x83ba,0x360,
+    0x838d,0x36b,
+    0x835f,0x35b,
+    0x8341,0x336,
+    0x833b,0x319,
+    0x833b,0x2fe,
+    0x82ef,0x2fc,
+    0x82a0,0x2f8,
+    0x8225,0x2f2,
+    0x81a9,0x2f1,
+    0x8171,0x2f3,
+    0x813a,0x2f1,
+    0x8131,0x2ed,
+    0x8129,0x2e6,
+    0x8123,0x2dd,
+    0x811d,0x2d6,
+    0x8104,0x2c5,
+    0x80f7,0x2c0,
+    0x80e8,0x2be,
+    0x80c9,0x2c0,
+    0x80af,0x2cf,
+    0x809a,0x2e5,
+    0x808b,0x2fe,
+    0x8064,0x2f8,
+    0x803f,0x2ff,
+    0x803b,0x322,
+    0x8049,0x342,
+    0x8052,0x37c,
+    0x8064,0x385,
+    0x8081,0x38d,
+    0x809c,0x38c,
+    0x80a8,0x380,
+    0x809c,0x36b,
+    0x8084,0x369,
+    0x8069,0x372,
+    0x8059,0x380,
+    0x380,0x3f1,
+    0x835c,0x3e8,
+    0x8335,0x3e7,
+    0x82f1,0x3e1,
+    0x82ac,0x3de,
+    0x828b,0x3dd,
+    0x826b,0x3db,
+    0x8277,0x40d,
+    0x8291,0x438,
+    0x82ac,0x43d,
+    0x82c8,0x43b,
+    0x82fc,0x438,
+    0x832e,0x42b,
+    0x835b,0x413,
+    0x8380,0x3f1,
+    0x268,0x3d8,
+    0x824e,0x3d7,
+    0x8233,0x3d5,
+    0x81fb,0x3d1,
+    0x81c2,0x3ce,
+    0x81a7,0x3cd,
+    0x8191,0x3ce,
+    0x81b0,0x3eb,
+    0x81d8,0x403,
+    0x820c,0x41a,
+    0x8242,0x42b,
+    0x8265,0x433,
+    0x8287,0x438,
+    0x2b2,0x435,
+    0x82ac,0x40b,
+    0x82a6,0x3e1,
+    0x438,0x3cb,
+    0x841b,0x3ae,
+    0x8410,0x38c,
+    0x842a,0x385,
+    0x8448,0x38a,
+    0x8e,0x301,
+    0x808e,0x31b,
+    0x8090,0x336,
+    0x8099,0x347,
+    0x80a9,0x357,
+    0x80bc,0x363,
+    0x80cf,0x36a,
+    0x80ee,0x36a,
+    0x810a,0x360,
+    0x8132,0x333,
+    0x8136,0x322,
+    0x8137,0x313,
+    0x8135,0x304,
+    0x8133,0x2f4,
+    0xdc,0x343,
+    0x80ff,0x339,
+    0x810e,0x319,
+    0x8106,0x2f8,
+    0x80e5,0x2e5,
+    0x80c2,0x2f0,
+    0x80b3,0x30f,
+    0x80bb,0x331,
+    0x80dc,0x343,
+    0x38d,0x343,
+    0x83b0,0x339,
+    0x83be,0x31a,
+    0x83b6,0x2f8,
+    0x8396,0x2e5,
+    0x8373,0x2f0,
+    0x8364,0x30f,
+    0x836c,0x331,
+    0x838d,0x343,
+    0x50,0x336,
+    0x806c,0x334,
+    0x8088,0x333,
+    0x3e4,0x2fe,
+    0x83c7,0x2d2,
+    0x8393,0x2bd,
+    0x8375,0x2c2,
+    0x835b,0x2d0,
+    0x8349,0x2e4,
+    0x833f,0x2fa
+]
+
+EFFECT_COW = [
+    0xff,0x357,
+    0x80ec,0x356,
+    0x80e3,0x355,
+    0x80db,0x357,
+    0x80d7,0x35b,
+    0x80cf,0x36d,
+    0x80be,0x393,
+    0x80b6,0x3bc,
+    0x80b5,0x3e5,
+    0x80ba,0x40f,
+    0x80be,0x41e,
+    0x80c3,0x42f,
+    0x80ca,0x43f,
+    0x80d5,0x449,
+    0x80e1,0x44c,
+    0x80ec,0x44a,
+    0x80f6,0x443,
+    0x80fe,0x43a,
+    0x810e,0x425,
+    0x811f,0x410,
+    0x8131,0x3fd,
+    0x8144,0x3eb,
+    0x8155,0x3de,
+    0x8165,0x3d4,
+    0x8175,0x3cb,
+    0x8181,0x3c2,
+    0x8174,0x3b9,
+    0x8164,0x3b0,
+    0x8153,0x3a7,
+    0x8141,0x39b,
+    0x8134,0x390,
+    0x8126,0x383,
+    0x811a,0x375,
+    0x810f,0x367,
+    0x8107,0x35e,
+    0x80ff,0x354,
+    0x80f8,0x344,
+    0x80f1,0x332,
+    0x80e0,0x2f5,
+    0x80dc,0x2b4,
+    0x80dd,0x272,
+    0x80df,0x232,
+    0x80df,0x213,
+    0x35b,0x35a,
+    0x834f,0x367,
+    0x8342,0x376,
+    0x8334,0x386,
+    0x8323,0x395,
+    0x8310,0x3a2,
+    0x82fb,0x3ae,
+    0x82e8,0x3b8,
+    0x82d9,0x3c2,
+    0x82e7,0x3cb,
+    0x82f7,0x3d5,
+    0x8309,0x3e1,
+    0x831b,0x3ee,
+    0x832f,0x3ff,
+    0x8340,0x413,
+    0x8350,0x428,
+    0x8360,0x43c,
+    0x8369,0x445,
+    0x8372,0x44b,
+    0x837d,0x44c,
+    0x8388,0x448,
+    0x8393,0x43e,
+    0x8399,0x42f,
+    0x839e,0x41e,
+    0x83a0,0x40f,
+    0x83a6,0x3e1,
+    0x83a4,0x3ae,
+    0x8399,0x37d,
+    0x8382,0x358,
+    0x837d,0x356,
+    0x8378,0x355,
+    0x8369,0x357,
+    0x835e,0x357,
+    0x8364,0x343,
+    0x836c,0x32b,
+    0x8375,0x311,
+    0x837a,0x2f8,
+    0x837e,0x2bf,
+    0x837e,0x284,
+    0x837c,0x24a,
+    0x837b,0x213,
+    0x181,0x3c2,
+    0x8197,0x3c2,
+    0x81ac,0x3c5,
+    0x81c3,0x3c8,
+    0x81dc,0x3ca,
+    0x8206,0x3ca,
+    0x8230,0x3ca,
+    0x825a,0x3ca,
+    0x8284,0x3ca,
+    0x829b,0x3c9,
+    0x82b0,0x3c6,
+    0x82c4,0x3c3,
+    0x82d9,0x3c2,
+    0x381,0x355,
+    0x8394,0x347,
+    0x83a8,0x33b,
+    0x83be,0x32f,
+    0x83d3,0x320,
+    0x83f5,0x302,
+    0x8413,0x2df,
+    0x842c,0x2b8,
+    0x8440,0x290,
+    0x844a,0x273,
+    0x844c,0x264,
+    0x844a,0x255,
+    0x8432,0x239,
+    0x8407,0x22c,
+    0x83d7,0x229,
+    0x83b0,0x22b,
+    0x838a,0x22f,
+    0x837e,0x230,
+    0xd7,0x352,
+    0x80c6,0x345,
+    0x80b2,0x339,
+    0x809b,0x32d,
+    0x8087,0x31f,
+    0x806c,0x307,
+    0x8054,0x2ea,
+    0x803e,0x2cc,
+    0x802a,0x2b0,
+    0x800d,0x28b,
+    0x8000,0x26a,
+    0x8007,0x24e,
+    0x8027,0x238,
+    0x8042,0x232,
+    0x8062,0x22b,
+    0x8080,0x22a,
+    0x80a1,0x22c,
+    0x80c2,0x22e,
+    0x80dc,0x230,
+    0x177,0x2e0,
+    0x8192,0x2df,
+    0x81a3,0x2cd,
+    0x81a4,0x2b4,
+    0x8191,0x2a0,
+    0x8176,0x2a1,
+    0x8165,0x2b3,
+    0x8163,0x2cd,
+    0x8177,0x2e0,
+    0x2cc,0x2e0,
+    0x82e7,0x2df,
+    0x82f7,0x2cc,
+    0x82f7,0x2b3,
+    0x82e3,0x2a0,
+    0x82c9,0x2a1,
+    0x82b8,0x2b4,
+    0x82b8,0x2cd,
+    0x82cc,0x2e0,
+    0x201,0x25c,
+    0x8267,0x25d,
+    0x82d0,0x248,
+    0x8332,0x21d,
+    0x8380,0x1dd,
+    0x839d,0x1b1,
+    0x83ae,0x180,
+    0x83b0,0x14c,
+    0x83a2,0x118,
+    0x8389,0xef,
+    0x8367,0xcb,
+    0x8340,0xad,
+    0x8316,0x95,
+    0x82f5,0x86,
+    0x82d2,0x7a,
+    0x82ad,0x70,
+    0x8289,0x69,
+    0x8226,0x63,
+    0x81c2,0x6c,
+    0x8163,0x87,
+    0x810c,0xb7,
+    0x80fc,0xc4,
+    0x80ec,0xd3,
+    0x80dd,0xe2,
+    0x80d0,0xf3,
+    0x80c6,0x102,
+    0x80bd,0x112,
+    0x80b6,0x122,
+    0x80b0,0x133,
+    0x80ad,0x186,
+    0x80d2,0x1cf,
+    0x810f,0x209,
+    0x8157,0x233,
+    0x8180,0x242,
+    0x81aa,0x24e,
+    0x81d5,0x256,
+    0x8201,0x25c,
+    0x17f,0x16c,
+    0x819f,0x16b,
+    0x81b2,0x155,
+    0x81b2,0x138,
+    0x819c,0x122,
+    0x817d,0x123,
+    0x816b,0x139,
+    0x8169,0x156,
+    0x817f,0x16c,
+    0x2c1,0x16c,
+    0x82e1,0x168,
+    0x82f2,0x151,
+    0x82f1,0x135,
+    0x82d9,0x120,
+    0x82bb,0x124,
+    0x82a9,0x13b,
+    0x82aa,0x158,
+    0x82c1,0x16c
+]
+
+EFFECT_CYMBAL_HIFREQ = [
+    0xc1,0x107,
+    0x80bf,0x9e,
+    0x80a5,0x9e,
+    0x80a5,0x10a,
+    0xdf,0x346,
+    0x80b6,0x2ca,
+    0x80ba,0x204,
+    0x80bd,0x13d,
+    0x80f2,0xf4,
+    0x8127,0xac,
+    0x815d,0x63,
+    0x8192,0x1b,
+    0x8176,0x0,
+    0x80b0,0x11d,
+    0x808e,0xe2,
+    0x806c,0xa6,
+    0x804a,0x6a,
+    0x8028,0x2e,
+    0x8007,0x48,
+    0x802e,0x86,
+    0x8056,0xc4,
+    0x807d,0x102,
+    0x80a5,0x140,
+    0x80a4,0x211,
+    0x80a3,0x2e2,
+    0x80c8,0x34e,
+    0x10b,0x408,
+    0x8107,0x400,
+    0x8100,0x3fe,
+    0x136,0x3e8,
+    0x8133,0x3ec,
+    0x8132,0x3f0,
+    0x8135,0x3f6,
+    0x813c,0x3f8,
+    0x150,0x415,
+    0x814d,0x409,
+    0x8146,0x3ff,
+    0x813a,0x3f8,
+    0x812c,0x3f6,
+    0x811e,0x3f8,
+    0x8112,0x3ff,
+    0x810b,0x409,
+    0x8108,0x415,
+    0x810b,0x421,
+    0x8112,0x42b,
+    0x811e,0x432,
+    0x812c,0x435,
+    0x813a,0x432,
+    0x8146,0x42b,
+    0x814d,0x421,
+    0x8150,0x415,
+    0x136,0x3e8,
+    0x813d,0x3e1,
+    0x8146,0x3d6,
+    0x8147,0x3d1,
+    0x8147,0x3cc,
+    0x8144,0x3c7,
+    0x8140,0x3c4,
+    0x8132,0x3c1,
+    0x8121,0x3c3,
+    0x810c,0x3c9,
+    0x80f9,0x3d2,
+    0x80eb,0x3dd,
+    0x80e2,0x3e8,
+    0x80e1,0x3ed,
+    0x80e1,0x3f3,
+    0x80e4,0x3f7,
+    0x80e8,0x3fa,
+    0x80f5,0x3fd,
+    0x80f9,0x3fd,
+    0x8101,0x3fd,
+    0x150,0x414,
+    0x8187,0x3f9,
+    0x81cf,0x3c2,
+    0x81f9,0x389,
+    0x8201,0x370,
+    0x81fe,0x356,
+    0x81f0,0x341,
+    0x81db,0x332,
+    0x8199,0x324,
+    0x8140,0x32b,
+    0x80da,0x348,
+    0x807a,0x377,
+    0x8031,0x3ae,
+    0x8007,0x3e7,
+    0x8000,0x400,
+    0x8002,0x41a,
+    0x8010,0x42f,
+    0x8025,0x43e,
+    0x8068,0x44c,
+    0x80c1,0x445,
+    0x8115,0x42e
+]
+
+EFFECT_CYMBAL_LOFREQ = [
+    0x0,0x2fc,
+    0x800b,0x33b,
+    0x8050,0x384,
+    0x80c1,0x3cd,
+    0x8156,0x40f,
+    0x81f1,0x43c,
+    0x8278,0x44c,
+    0x82db,0x441,
+    0x830c,0x418,
+    0x8300,0x3da,
+    0x82bc,0x391,
+    0x824a,0x347,
+    0x81b6,0x306,
+    0x811a,0x2d9,
+    0x8094,0x2c8,
+    0x8031,0x2d4,
+    0x8000,0x2fc,
+    0x1d3,0xf3,
+    0x81d5,0x92,
+    0x81ed,0x92,
+    0x81ed,0xf6,
+    0x1b7,0x305,
+    0x81dd,0x293,
+    0x81da,0x1dc,
+    0x81d7,0x125,
+    0x81a5,0xe2,
+    0x8174,0x9f,
+    0x8143,0x5c,
+    0x8112,0x19,
+    0x812c,0x0,
+    0x81e2,0x107,
+    0x8202,0xd0,
+    0x8221,0x99,
+    0x8241,0x62,
+    0x8260,0x2b,
+    0x827f,0x42,
+    0x825a,0x7c,
+    0x8236,0xb5,
+    0x8211,0xee,
+    0x81ed,0x128,
+    0x81ed,0x1e8,
+    0x81ee,0x2a9,
+    0x81cc,0x30c,
+    0x17f,0x3d4,
+    0x8182,0x3cc,
+    0x8189,0x3ca,
+    0x157,0x3b6,
+    0x8159,0x3ba,
+    0x815a,0x3bd,
+    0x8158,0x3c3,
+    0x8151,0x3c5,
+    0x13f,0x3e0,
+    0x8141,0x3d4,
+    0x8149,0x3cb,
+    0x8153,0x3c5,
+    0x8160,0x3c3,
+    0x816d,0x3c5,
+    0x8178,0x3cb,
+    0x817f,0x3d4,
+    0x8182,0x3e0,
+    0x817f,0x3eb,
+    0x8178,0x3f4,
+    0x816d,0x3fb,
+    0x8160,0x3fd,
+    0x8153,0x3fb,
+    0x8149,0x3f4,
+    0x8141,0x3eb,
+    0x813f,0x3e0,
+    0x157,0x3b6,
+    0x8150,0x3b0,
+    0x8148,0x3a5,
+    0x8147,0x3a1,
+    0x8147,0x39c,
+    0x814a,0x398,
+    0x814e,0x395,
+    0x815a,0x392,
+    0x816b,0x394,
+    0x817d,0x399,
+    0x818f,0x3a2,
+    0x819d,0x3ac,
+    0x81a4,0x3b6,
+    0x81a6,0x3bb,
+    0x81a5,0x3c0,
+    0x81a3,0x3c4,
+    0x819f,0x3c7,
+    0x8192,0x3c9,
+    0x818f,0x3ca,
+    0x8188,0x3ca
+]
+
+EFFECT_DRUM = [
+    0x1b1,0x2e0,
+    0x8158,0x339,
+    0x8100,0x392,
+    0x80a7,0x3eb,
+    0x804f,0x444,
+    0x8046,0x44b,
+    0x803b,0x44c,
+    0x8030,0x449,
+    0x8027,0x443,
+    0x8021,0x43a,
+    0x801f,0x42f,
+    0x8021,0x425,
+    0x8026,0x41a,
+    0x8084,0x3c7,
+    0x80e2,0x373,
+    0x8140,0x31f,
+    0x819e,0x2cc,
+    0x1ab,0x2db,
+    0x81be,0x2de,
+    0x81cd,0x2d4,
+    0x81cf,0x2c2,
+    0x81c4,0x2b3,
+    0x81b2,0x2b0,
+    0x81a3,0x2ba,
+    0x81a0,0x2cc,
+    0x81ab,0x2db,
+    0x266,0x2b9,
+    0x82d5,0x2f4,
+    0x8344,0x32f,
+    0x83b3,0x36a,
+    0x8422,0x3a5,
+    0x842b,0x3ab,
+    0x842f,0x3b6,
+    0x842f,0x3c1,
+    0x842c,0x3cc,
+    0x8424,0x3d5,
+    0x841b,0x3d9,
+    0x8411,0x3db,
+    0x8405,0x3d9,
+    0x839a,0x397,
+    0x832f,0x354,
+    0x82c4,0x312,
+    0x8258,0x2d0,
+    0x264,0x2bf,
+    0x8261,0x2ad,
+    0x8253,0x2a1,
+    0x824a,0x2a1,
+    0x8241,0x2a4,
+    0x8236,0x2b3,
+    0x8238,0x2c6,
+    0x8246,0x2d1,
+    0x8258,0x2ce,
+    0x8264,0x2bf,
+    0x1d,0x17f,
+    0x8034,0xf5,
+    0x804c,0x6c,
+    0x8074,0xd3,
+    0x809b,0x13a,
+    0x80bc,0xb6,
+    0x80dd,0x32,
+    0x8115,0xa7,
+    0x814c,0x11c,
+    0x8171,0x9e,
+    0x8197,0x20,
+    0x81cc,0xa2,
+    0x8202,0x124,
+    0x8232,0xb6,
+    0x8262,0x48,
+    0x827d,0xcc,
+    0x8298,0x150,
+    0x82bb,0xfb,
+    0x82df,0xa6,
+    0x2e0,0xb0,
+    0x82df,0xa4,
+    0x82db,0x99,
+    0x82d4,0x8c,
+    0x82ca,0x80,
+    0x82bc,0x73,
+    0x82ab,0x67,
+    0x8297,0x5b,
+    0x8280,0x50,
+    0x824b,0x3c,
+    0x820d,0x2d,
+    0x81c7,0x23,
+    0x817d,0x20,
+    0x8132,0x23,
+    0x80ed,0x2d,
+    0x80af,0x3c,
+    0x807a,0x50,
+    0x8063,0x5b,
+    0x804f,0x67,
+    0x803e,0x73,
+    0x8030,0x80,
+    0x8026,0x8c,
+    0x801f,0x99,
+    0x801b,0xa4,
+    0x8019,0xb0,
+    0x2e3,0x184,
+    0x82e2,0x10b,
+    0x82e0,0x91,
+    0x82de,0x85,
+    0x82da,0x79,
+    0x82d3,0x6d,
+    0x82c9,0x61,
+    0x82bb,0x54,
+    0x82aa,0x47,
+    0x8296,0x3b,
+    0x8280,0x30,
+    0x824a,0x1d,
+    0x820c,0xe,
+    0x81c7,0x4,
+    0x817c,0x0,
+    0x8132,0x4,
+    0x80ed,0xe,
+    0x80ae,0x1d,
+    0x8079,0x30,
+    0x8062,0x3b,
+    0x804e,0x47,
+    0x803d,0x54,
+    0x8030,0x61,
+    0x8025,0x6d,
+    0x801e,0x79,
+    0x801a,0x85,
+    0x8019,0x91,
+    0x8019,0x109,
+    0x8019,0x181,
+    0x2de,0x1d6,
+    0x82db,0x1dd,
+    0x82d7,0x1e4,
+    0x82d1,0x1eb,
+    0x82cb,0x1f1,
+    0x82be,0x1fe,
+    0x82ad,0x20b,
+    0x8299,0x217,
+    0x8282,0x222,
+    0x824d,0x235,
+    0x820e,0x244,
+    0x81c9,0x24e,
+    0x817f,0x252,
+    0x8134,0x24e,
+    0x80ef,0x244,
+    0x80b1,0x235,
+    0x807b,0x222,
+    0x8065,0x217,
+    0x8051,0x20b,
+    0x8040,0x1fe,
+    0x8032,0x1f1,
+    0x802c,0x1eb,
+    0x8027,0x1e4,
+    0x8023,0x1dd,
+    0x801f,0x1d6,
+    0x2fb,0x1ce,
+    0x82fb,0x1cb,
+    0x82fb,0x1c9,
+    0x82fb,0x1c6,
+    0x82fb,0x1c3,
+    0x82dd,0x181,
+    0x828b,0x14b,
+    0x8212,0x126,
+    0x817d,0x119,
+    0x80e9,0x126,
+    0x806f,0x14b,
+    0x801e,0x181,
+    0x8000,0x1c3,
+    0x8000,0x1c7,
+    0x8000,0x1cb,
+    0x8000,0x1cf,
+    0x8001,0x1d3,
+    0x2fd,0x1e4,
+    0x82df,0x1a2,
+    0x828d,0x16b,
+    0x8214,0x147,
+    0x817f,0x139,
+    0x80ea,0x147,
+    0x8071,0x16b,
+    0x801f,0x1a2,
+    0x8001,0x1e4,
+    0x801f,0x226,
+    0x8071,0x25d,
+    0x80ea,0x281,
+    0x817f,0x28f,
+    0x8214,0x281,
+    0x828d,0x25d,
+    0x82df,0x226,
+    0x82fd,0x1e4,
+    0x17f,0x274,
+    0x8134,0x271,
+    0x80ef,0x267,
+    0x80b1,0x258,
+    0x807c,0x245,
+    0x8065,0x239,
+    0x8051,0x22d,
+    0x8040,0x221,
+    0x8032,0x214,
+    0x8028,0x208,
+    0x8021,0x1fc,
+    0x801d,0x1f0,
+    0x801c,0x1e4,
+    0x801d,0x1d8,
+    0x8021,0x1cc,
+    0x8028,0x1c0,
+    0x8032,0x1b4,
+    0x8040,0x1a7,
+    0x8051,0x19b,
+    0x8065,0x18f,
+    0x807c,0x183,
+    0x80b1,0x170,
+    0x80ef,0x161,
+    0x8134,0x157,
+    0x817f,0x154,
+    0x81ca,0x157,
+    0x820f,0x161,
+    0x824d,0x170,
+    0x8282,0x183,
+    0x8299,0x18f,
+    0x82ad,0x19b,
+    0x82be,0x1a7,
+    0x82cc,0x1b4,
+    0x82d6,0x1c0,
+    0x82dd,0x1cc,
+    0x82e1,0x1d8,
+    0x82e2,0x1e4,
+    0x82e1,0x1f0,
+    0x82dd,0x1fc,
+    0x82d6,0x208,
+    0x82cc,0x214,
+    0x82be,0x221,
+    0x82ad,0x22d,
+    0x8299,0x239,
+    0x8282,0x245,
+    0x824d,0x258,
+    0x820f,0x267,
+    0x81ca,0x271,
+    0x817f,0x274
+]
+
+EFFECT_DUCK = [
+    0x99,0x280,
+    0x80fb,0x280,
+    0x814c,0x28c,
+    0x816c,0x29a,
+    0x8187,0x2af,
+    0x8192,0x2cd,
+    0x8190,0x2eb,
+    0x8166,0x301,
+    0x8136,0x30f,
+    0x80ed,0x340,
+    0x809f,0x367,
+    0x8082,0x36f,
+    0x807c,0x38b,
+    0x80a6,0x3fd,
+    0x810c,0x441,
+    0x8196,0x44c,
+    0x8218,0x422,
+    0x826d,0x3bf,
+    0x8273,0x33d,
+    0x824c,0x2df,
+    0x820f,0x28d,
+    0x820b,0x275,
+    0x822a,0x270,
+    0x82bb,0x25c,
+    0x8341,0x222,
+    0x8391,0x218,
+    0x83df,0x232,
+    0x840c,0x242,
+    0x843a,0x23e,
+    0x844c,0x211,
+    0x844a,0x1de,
+    0x8437,0x16d,
+    0x8412,0x100,
+    0x83e1,0xa4,
+    0x83a0,0x52,
+    0x836b,0x2a,
+    0x832e,0xf,
+    0x82d4,0x2,
+    0x8279,0x1,
+    0x81d3,0x1,
+    0x812d,0x4,
+    0x80e5,0xf,
+    0x80a3,0x2b,
+    0x8042,0x8c,
+    0x801a,0x110,
+    0x8034,0x1ce,
+    0x809c,0x26f,
+    0x8092,0x28c,
+    0x8068,0x29b,
+    0x8054,0x2b3,
+    0x8059,0x2c5,
+    0x8064,0x2ce,
+    0x808d,0x2cb,
+    0x80b6,0x2c4,
+    0x80ea,0x2c5,
+    0x811c,0x2ce,
+    0x12a,0x3d1,
+    0x8143,0x3c5,
+    0x814f,0x3ad,
+    0x814c,0x393,
+    0x813b,0x381,
+    0x8122,0x37d,
+    0x810e,0x38c,
+    0x8107,0x3a7,
+    0x810e,0x3c3,
+    0x811c,0x3ca,
+    0x812a,0x3d1,
+    0x63,0x2d3,
+    0x8035,0x2fc,
+    0x800c,0x32a,
+    0x8000,0x345,
+    0x8001,0x364,
+    0x801a,0x36e,
+    0x8035,0x364,
+    0x8056,0x35a,
+    0x8075,0x369,
+    0x8079,0x36c,
+    0x807c,0x36f,
+    0x281,0xe9,
+    0x82d3,0xe6,
+    0x8325,0xea,
+    0x8306,0xb4,
+    0x82c8,0x9b,
+    0x8248,0x98,
+    0x81cb,0xb6,
+    0x8195,0xd0,
+    0x8166,0xf3,
+    0x8149,0x10d,
+    0x8136,0x12e,
+    0x8124,0x156,
+    0x8120,0x180,
+    0x8127,0x1a4,
+    0x813b,0x1c5,
+    0x815c,0x1de,
+    0x8183,0x1ee,
+    0x8201,0x1f3,
+    0x827a,0x1c8,
+    0x82c4,0x1ae,
+    0x8312,0x1b0,
+    0x834c,0x1b8,
+    0x8382,0x1a7,
+    0x8385,0x17d,
+    0x8367,0x15b,
+    0x832e,0x13b,
+    0x82eb,0x131,
+    0x82be,0x132,
+    0x8292,0x13b,
+    0x350,0x13e,
+    0x834c,0x10d,
+    0x8327,0xec,
+    0x91,0xef,
+    0x80bb,0xb0,
+    0x80fc,0x8b,
+    0x80fd,0x8a,
+    0x80fe,0x8a
+]
+
+EFFECT_FART = [
+    0x20c,0x44c,
+    0x8209,0x422,
+    0x820d,0x40b,
+    0x823b,0x3de,
+    0x8274,0x368,
+    0x827a,0x340,
+    0x8278,0x32c,
+    0x8275,0x31b,
+    0x8260,0x2d7,
+    0x823b,0x2a0,
+    0x822b,0x28a,
+    0x8213,0x27f,
+    0x81be,0x263,
+    0x81af,0x261,
+    0x819d,0x263,
+    0x8169,0x26d,
+    0x8152,0x26f,
+    0x8139,0x266,
+    0x810e,0x251,
+    0x80d5,0x243,
+    0x80a5,0x243,
+    0xa,0x445,
+    0x8000,0x384,
+    0x8006,0x2d5,
+    0x800f,0x1eb,
+    0x198,0x3cd,
+    0x817d,0x3a7,
+    0x8172,0x398,
+    0x815f,0x3a5,
+    0x8141,0x3c0,
+    0x173,0x395,
+    0x818d,0x352,
+    0x8191,0x334,
+    0x8195,0x30e,
+    0x8193,0x2fa,
+    0x8187,0x2c3,
+    0x8162,0x287,
+    0x815a,0x273,
+    0x366,0x30c,
+    0x838e,0x322,
+    0x83b9,0x322,
+    0x83d7,0x32b,
+    0x8409,0x31f,
+    0x841b,0x302,
+    0x8425,0x2eb,
+    0x8442,0x2c5,
+    0x844c,0x296,
+    0x843d,0x277,
+    0x8428,0x25c,
+    0x8422,0x243,
+    0x8415,0x22b,
+    0x83ff,0x21a,
+    0x83de,0x213,
+    0x83b6,0x218,
+    0x8395,0x214,
+    0x8363,0x231,
+    0x2aa,0x2ca,
+    0x82dc,0x2cb,
+    0x8307,0x2cd,
+    0x8330,0x2d2,
+    0x8361,0x2e3,
+    0x298,0x2af,
+    0x82c0,0x2ac,
+    0x831d,0x2a5,
+    0x8331,0x2a5,
+    0x8363,0x2a2,
+    0x28e,0x293,
+    0x82d2,0x289,
+    0x8304,0x280,
+    0x8334,0x273,
+    0x835e,0x25c,
+    0x22c,0x289,
+    0x822f,0x25e,
+    0x822d,0x24d,
+    0x822c,0x236,
+    0x822b,0x222,
+    0x822a,0x1fd,
+    0x152,0x269,
+    0x8152,0x254,
+    0x8151,0x23b,
+    0x8150,0x225,
+    0x8150,0x1f5
+]
+
+EFFECT_FAUCET = [
+    0x1d9,0x338,
+    0x81ca,0x37d,
+    0x81a3,0x395,
+    0x816a,0x395,
+    0x8128,0x392,
+    0x8110,0x398,
+    0x80fc,0x3a6,
+    0x80f2,0x3ba,
+    0x80f5,0x3d3,
+    0x811a,0x3f1,
+    0x814e,0x3f0,
+    0x8184,0x3e7,
+    0x81b1,0x3eb,
+    0x81c8,0x404,
+    0x81dc,0x428,
+    0x81f3,0x446,
+    0x8214,0x44c,
+    0x822d,0x439,
+    0x823d,0x41a,
+    0x824c,0x3fb,
+    0x8260,0x3e8,
+    0x8290,0x3e9,
+    0x82d1,0x3f1,
+    0x830a,0x3ec,
+    0x8323,0x3c5,
+    0x831a,0x3a7,
+    0x8303,0x398,
+    0x82e4,0x393,
+    0x82c6,0x395,
+    0x828d,0x39b,
+    0x8261,0x394,
+    0x8244,0x379,
+    0x8239,0x340,
+    0x326,0x1e4,
+    0x8306,0x1e5,
+    0x82e3,0x1e7,
+    0x82c1,0x1e6,
+    0x82a2,0x1e0,
+    0x8273,0x1c9,
+    0x824a,0x1b4,
+    0x821f,0x1a5,
+    0x81e8,0x1a2,
+    0x81a8,0x1b5,
+    0x816c,0x1d5,
+    0x812e,0x1ea,
+    0x80e6,0x1e0,
+    0x80cc,0x1bd,
+    0x80ce,0x188,
+    0x80d9,0x151,
+    0x80d9,0x125,
+    0x80ba,0x111,
+    0x8080,0x109,
+    0x8042,0x10a,
+    0x8016,0x112,
+    0x8003,0x125,
+    0x8000,0x141,
+    0x8004,0x160,
+    0x8007,0x17c,
+    0x8006,0x1ca,
+    0x800c,0x21b,
+    0x8025,0x262,
+    0x8060,0x296,
+    0x809c,0x2a6,
+    0x80dc,0x2a6,
+    0x811d,0x2a4,
+    0x815b,0x2ac,
+    0x8178,0x2bd,
+    0x8185,0x2d5,
+    0x818f,0x2ee,
+    0x81a1,0x304,
+    0x81c7,0x310,
+    0x81fe,0x313,
+    0x8235,0x310,
+    0x825e,0x30a,
+    0x8272,0x2fd,
+    0x827d,0x2e8,
+    0x8287,0x2d1,
+    0x8294,0x2bd,
+    0x82b2,0x2ab,
+    0x82d6,0x2a4,
+    0x82fb,0x2a4,
+    0x831e,0x2a4,
+    0x378,0x306,
+    0x8390,0x306,
+    0x839d,0x2f8,
+    0x83a3,0x2e1,
+    0x83a4,0x2c9,
+    0x83a4,0x290,
+    0x83a4,0x257,
+    0x83a4,0x21d,
+    0x83a4,0x1e4,
+    0x83a5,0x1cc,
+    0x83a5,0x1af,
+    0x839e,0x195,
+    0x838c,0x187,
+    0x8372,0x188,
+    0x8361,0x197,
+    0x8356,0x1ad,
+    0x8353,0x1c6,
+    0x8351,0x203,
+    0x8350,0x240,
+    0x8351,0x27e,
+    0x8352,0x2bb,
+    0x8354,0x2d1,
+    0x8359,0x2e7,
+    0x8364,0x2fa,
+    0x8377,0x306,
+    0x6f,0xc4,
+    0x805f,0xa2,
+    0x8047,0x76,
+    0x8038,0x45,
+    0x8043,0x14,
+    0x805a,0x1,
+    0x8076,0x0,
+    0x808f,0xf,
+    0x809e,0x28,
+    0x809e,0x4a,
+    0x8092,0x6c,
+    0x8080,0x8c,
+    0x806f,0xa6
+]
+
+EFFECT_FIREWORK = [
+    0x72,0x44c,
+    0x8087,0x43f,
+    0x80ab,0x418,
+    0x80f2,0x3ce,
+    0x8104,0x3ba,
+    0x8117,0x3a6,
+    0x8126,0x395,
+    0x8134,0x386,
+    0x8155,0x357,
+    0x8132,0x326,
+    0x811e,0x30e,
+    0x8108,0x306,
+    0x80e3,0x2f4,
+    0x8068,0x2d1,
+    0x8045,0x2d0,
+    0x8032,0x2d3,
+    0x8000,0x30d,
+    0x802a,0x398,
+    0x8037,0x3bd,
+    0x8043,0x3df,
+    0x8062,0x438,
+    0x8072,0x44c,
+    0x126,0x30b,
+    0x813e,0x2b2,
+    0x8143,0x28b,
+    0x8130,0x27b,
+    0x80e3,0x254,
+    0x8097,0x24d,
+    0x8074,0x252,
+    0x805e,0x24f,
+    0x8053,0x277,
+    0x8045,0x2cd,
+    0x146,0x288,
+    0x8151,0x268,
+    0x8152,0x255,
+    0x813c,0x245,
+    0x8126,0x235,
+    0x80f7,0x221,
+    0x80ab,0x219,
+    0x8081,0x220,
+    0x806a,0x21e,
+    0x805e,0x24f,
+    0x157,0x24f,
+    0x816a,0x20f,
+    0x8171,0x1ed,
+    0x815c,0x1db,
+    0x8148,0x1cf,
+    0x811c,0x1bb,
+    0x80ab,0x1b1,
+    0x808d,0x1b0,
+    0x808d,0x19b,
+    0x8096,0x181,
+    0x80ad,0x17a,
+    0x80d7,0x174,
+    0x8130,0x184,
+    0x816b,0x1a6,
+    0x8181,0x1b4,
+    0x8194,0x179,
+    0x819a,0x147,
+    0x8193,0x12a,
+    0x816b,0x102,
+    0x813c,0xf1,
+    0x8141,0xe0,
+    0x814f,0xaf,
+    0x817f,0x6c,
+    0x81cb,0x4c,
+    0x81e1,0x51,
+    0x81f3,0x4d,
+    0x820d,0x36,
+    0x81fe,0x7,
+    0x822b,0x1b,
+    0x8237,0x11,
+    0x8246,0x0,
+    0x8251,0xe,
+    0x8258,0x31,
+    0x827e,0x36,
+    0x8269,0x4c,
+    0x8277,0x62,
+    0x8278,0x6d,
+    0x8269,0x71,
+    0x8253,0x72,
+    0x8241,0xb1,
+    0x8235,0xa2,
+    0x8221,0x70,
+    0x8211,0x63,
+    0x81e1,0x56,
+    0x6a,0x21e,
+    0x806c,0x212,
+    0x8073,0x1f9,
+    0x8081,0x1c3,
+    0x808a,0x1af,
+    0x172,0x1e8,
+    0x8181,0x1b4,
+    0x99,0x17b,
+    0x80a7,0x13e,
+    0x80cb,0x105,
+    0x80fe,0xf1,
+    0x813a,0xf4
+]
+
+EFFECT_GONG_BELL = [
+    0x106,0x3d7,
+    0x8108,0x3f2,
+    0x810c,0x411,
+    0x8116,0x42f,
+    0x8128,0x445,
+    0x8137,0x44a,
+    0x8148,0x44c,
+    0x8159,0x44b,
+    0x8169,0x44b,
+    0x8192,0x44b,
+    0x81bc,0x44b,
+    0x81e5,0x44b,
+    0x820e,0x44b,
+    0x8221,0x44c,
+    0x8235,0x44c,
+    0x8249,0x44b,
+    0x8259,0x445,
+    0x8265,0x437,
+    0x826b,0x422,
+    0x8270,0x40c,
+    0x8273,0x3f8,
+    0x8276,0x3ef,
+    0x8278,0x3e7,
+    0x827b,0x3e0,
+    0x8280,0x3d9,
+    0x8289,0x3d1,
+    0x8293,0x3ca,
+    0x829e,0x3c2,
+    0x82a8,0x3bb,
+    0x82bd,0x3a6,
+    0x82d1,0x38e,
+    0x82e2,0x374,
+    0x82ed,0x358,
+    0x830b,0x2cb,
+    0x8324,0x23b,
+    0x833a,0x1aa,
+    0x8351,0x11b,
+    0x835a,0xe8,
+    0x8363,0xb5,
+    0x836c,0x82,
+    0x8375,0x4f,
+    0x8378,0x3e,
+    0x837b,0x2b,
+    0x837b,0x1a,
+    0x8373,0xd,
+    0x834d,0x1,
+    0x831a,0x0,
+    0x82e5,0x5,
+    0x82b9,0x7,
+    0x824a,0x7,
+    0x81da,0x7,
+    0x816a,0x7,
+    0x80fb,0x7,
+    0x80d2,0x5,
+    0x80a1,0x1,
+    0x8071,0x2,
+    0x804c,0xd,
+    0x8032,0x2b,
+    0x801b,0x5c,
+    0x8008,0x90,
+    0x8000,0xb8,
+    0x8002,0xee,
+    0x800f,0x129,
+    0x801f,0x164,
+    0x802e,0x19a,
+    0x8041,0x1f2,
+    0x8054,0x24a,
+    0x8067,0x2a2,
+    0x807a,0x2fa,
+    0x8082,0x329,
+    0x808b,0x35a,
+    0x8095,0x38a,
+    0x80a3,0x3b6,
+    0x80b4,0x3cb,
+    0x80cc,0x3d2,
+    0x80e6,0x3d3,
+    0x8100,0x3d1,
+    0x8103,0x3c0,
+    0x810a,0x3ad,
+    0x8119,0x3a3,
+    0x812f,0x3ab,
+    0x8137,0x3b5,
+    0x813c,0x3c0,
+    0x813f,0x3cc,
+    0x8142,0x3d7,
+    0x8167,0x3d1,
+    0x8193,0x3d0,
+    0x81c1,0x3d1,
+    0x81ed,0x3d1,
+    0x81ff,0x3d0,
+    0x8212,0x3cf,
+    0x8223,0x3d1,
+    0x8233,0x3d7,
+    0x8239,0x3e0,
+    0x823a,0x3ed,
+    0x8238,0x3fb,
+    0x8232,0x407,
+    0x8223,0x412,
+    0x820e,0x415,
+    0x81f6,0x414,
+    0x81e2,0x414,
+    0x81c1,0x415,
+    0x8199,0x418,
+    0x8173,0x417,
+    0x8155,0x40e,
+    0x8149,0x402,
+    0x8144,0x3f5,
+    0x8142,0x3e6,
+    0x8142,0x3d7,
+    0x23a,0x3d7,
+    0x823f,0x3cc,
+    0x8244,0x3c0,
+    0x824a,0x3b4,
+    0x8253,0x3ab,
+    0x826a,0x3a4,
+    0x8279,0x3ae,
+    0x8280,0x3c1,
+    0x8282,0x3d1,
+    0xc4,0x3ab,
+    0x80ca,0x3a1,
+    0x80d1,0x398,
+    0x80d8,0x38e,
+    0x80df,0x384,
+    0x10b,0x374,
+    0x8174,0x374,
+    0x81dd,0x374,
+    0x8245,0x374,
+    0x82ae,0x374,
+    0xdf,0x353,
+    0x80cb,0x2df,
+    0x80b7,0x26b,
+    0x80a3,0x1f7,
+    0x808f,0x184,
+    0x8080,0x135,
+    0x8072,0xe7,
+    0x8064,0x98,
+    0x8055,0x4a
+]
+
+EFFECT_KICK_DRUM = [
+    0x1d3,0xed,
+    0x8174,0x118,
+    0x814a,0x138,
+    0x8126,0x15e,
+    0x8106,0x18d,
+    0x80ee,0x1c1,
+    0x23d,0x39f,
+    0x8276,0x38c,
+    0x82ad,0x377,
+    0x82d9,0x351,
+    0x8305,0x32a,
+    0x8323,0x2f4,
+    0x833f,0x2bd,
+    0x834a,0x27f,
+    0x8353,0x241,
+    0x8339,0x1b9,
+    0x82f4,0x14b,
+    0x8287,0xfa,
+    0x124,0x328,
+    0x8137,0x33c,
+    0x814b,0x350,
+    0x8160,0x362,
+    0x8177,0x372,
+    0x818a,0x37e,
+    0x819f,0x388,
+    0x81ca,0x397,
+    0x81e8,0x39d,
+    0x8207,0x3a2,
+    0xdf,0x1f8,
+    0x80d7,0x23b,
+    0x80dc,0x27d,
+    0x80ec,0x2be,
+    0x8106,0x2fc,
+    0x38,0x3b0,
+    0x805f,0x3e1,
+    0x808f,0x40b,
+    0x8101,0x43e,
+    0xd,0x27c,
+    0x8000,0x2c0,
+    0x8000,0x306,
+    0x800b,0x34a,
+    0x8024,0x38b,
+    0x1d5,0xfd,
+    0x816f,0x118,
+    0x281,0x389,
+    0x82cd,0x351,
+    0x8303,0x301,
+    0x8325,0x293,
+    0x8324,0x220,
+    0x8302,0x1b2,
+    0x82be,0x155,
+    0x8282,0x126,
+    0x29a,0x37f,
+    0x8250,0x3bc,
+    0x8202,0x3f4,
+    0x81da,0x410,
+    0x81ad,0x42e,
+    0x816c,0x43f,
+    0x812e,0x443,
+    0x165,0x11a,
+    0x80d8,0x18a,
+    0x804d,0x1fe,
+    0x8034,0x222,
+    0x8020,0x248,
+    0x330,0x1a3,
+    0x8339,0x175,
+    0x831e,0x17d,
+    0x325,0x2fb,
+    0x8347,0x2ef,
+    0x8349,0x2cd,
+    0x8343,0x2cb,
+    0x833c,0x2ca,
+    0x199,0xff,
+    0x817d,0xfc,
+    0x816d,0x115,
+    0x240,0x396,
+    0x8230,0x385,
+    0x8211,0x397,
+    0x8216,0x3b5,
+    0x8225,0x3b5,
+    0x8233,0x3ae,
+    0x8240,0x396,
+    0x137,0x42d,
+    0x8128,0x41c,
+    0x8108,0x42e,
+    0x810e,0x44c,
+    0x811d,0x44c,
+    0x812b,0x445,
+    0x8137,0x42d,
+    0x11f,0x325,
+    0x8128,0x31b,
+    0x812b,0x30d,
+    0x8128,0x302,
+    0x811c,0x2fc,
+    0x810a,0x300,
+    0x80fd,0x30e,
+    0x80f8,0x31e,
+    0x8102,0x32d,
+    0x810a,0x32d,
+    0x8111,0x32c,
+    0x8118,0x329,
+    0x811f,0x325,
+    0xfe,0x1d3,
+    0x80ef,0x1c2,
+    0x80d0,0x1d4,
+    0x80d5,0x1f3,
+    0x80e4,0x1f2,
+    0x80f2,0x1eb,
+    0x80fe,0x1d3,
+    0x4c,0x39f,
+    0x8050,0x392,
+    0x804c,0x386,
+    0x8040,0x381,
+    0x802f,0x385,
+    0x8021,0x392,
+    0x801c,0x3a2,
+    0x8026,0x3b1,
+    0x802e,0x3b2,
+    0x8036,0x3b0,
+    0x803d,0x3ad,
+    0x8044,0x3a9,
+    0x804c,0x39f,
+    0x30,0x26a,
+    0x8033,0x25c,
+    0x8030,0x251,
+    0x8024,0x24b,
+    0x8012,0x24f,
+    0x8005,0x25d,
+    0x8000,0x26d,
+    0x800a,0x27b,
+    0x8012,0x27c,
+    0x8019,0x27b,
+    0x8021,0x278,
+    0x8027,0x274,
+    0x8030,0x26a,
+    0x1f5,0xc4,
+    0x81fa,0x1a0,
+    0x81d9,0x190,
+    0x81d3,0xc0,
+    0x82d3,0x0,
+    0x8314,0x1b,
+    0x8315,0x33,
+    0x82d4,0x18,
+    0x8295,0x4c,
+    0x82e7,0x66,
+    0x8314,0x3b,
+    0x25f,0x1b1,
+    0x827b,0x196,
+    0x8286,0x100,
+    0x82e4,0x6c,
+    0x292,0x51,
+    0x821f,0xe9,
+    0x820e,0x147,
+    0x823b,0x148,
+    0x8284,0x103,
+    0x262,0x1b4,
+    0x8262,0x126,
+    0x1fb,0x192,
+    0x825e,0x19c,
+    0x1f6,0x1a3,
+    0x8262,0x1af,
+    0x263,0x1db,
+    0x823b,0x1bb,
+    0x823a,0x1af,
+    0x25d,0x1e4,
+    0x8227,0x1c2,
+    0x8227,0x1af,
+    0x1f3,0xc5,
+    0x8227,0xd8,
+    0x25a,0x1f7,
+    0x8272,0x1c6,
+    0x82af,0x1d9,
+    0x829d,0x20b,
+    0x825a,0x1f7
+]
+
+EFFECT_SCREAM = [
+    0x37b,0x265,
+    0x839c,0x244,
+    0x838c,0x222,
+    0x8379,0x203,
+    0x835f,0x1f8,
+    0x833e,0x1f0,
+    0x8324,0x1dc,
+    0x831e,0x1c4,
+    0x8322,0x1a2,
+    0x8323,0x18a,
+    0x830b,0x163,
+    0x82ec,0x11b,
+    0x82bd,0x113,
+    0x828a,0x12b,
+    0x826f,0x13a,
+    0x823e,0x147,
+    0x821c,0x134,
+    0x81ed,0xf5,
+    0x81b5,0xaa,
+    0x817d,0x112,
+    0x8121,0x193,
+    0x80f0,0x1cc,
+    0x8123,0x21e,
+    0x8106,0x25a,
+    0x80f8,0x28b,
+    0x80f6,0x2b7,
+    0x80fc,0x325,
+    0x8113,0x371,
+    0x8164,0x400,
+    0x81aa,0x434,
+    0x81f1,0x44a,
+    0x8243,0x44c,
+    0x82a0,0x440,
+    0x82dd,0x42b,
+    0x831d,0x408,
+    0x8359,0x3c9,
+    0x836a,0x392,
+    0x8379,0x357,
+    0x8385,0x31f,
+    0x8386,0x303,
+    0x8382,0x2e9,
+    0x8376,0x2d5,
+    0x8360,0x2c6,
+    0x8339,0x2b7,
+    0xc4,0x1dc,
+    0x8088,0x1c0,
+    0x8067,0x1b4,
+    0x8041,0x1ac,
+    0x801b,0x1ac,
+    0x8000,0x1b6,
+    0x8022,0x1ff,
+    0x8031,0x234,
+    0x803b,0x2af,
+    0x804b,0x345,
+    0x8085,0x3aa,
+    0x80da,0x3d7,
+    0x8132,0x3be,
+    0x132,0x219,
+    0x815a,0x1fb,
+    0x819f,0x1ef,
+    0x81d4,0x204,
+    0x8202,0x22d,
+    0x821e,0x265,
+    0x8228,0x2f0,
+    0x825c,0x2e7,
+    0x82a5,0x2b6,
+    0x82c7,0x2fe,
+    0x82f2,0x371,
+    0x832e,0x3a7,
+    0x8365,0x392,
+    0xf0,0x32a,
+    0x80ed,0x347,
+    0x80ed,0x36a,
+    0x80f9,0x383,
+    0x8116,0x382,
+    0x329,0x2de,
+    0x8346,0x2ed,
+    0x835e,0x2ef,
+    0x8371,0x2e4,
+    0x8380,0x2cd,
+    0x233,0x2d8,
+    0x8246,0x2d0,
+    0x8247,0x2bb,
+    0x8245,0x2a1,
+    0x824e,0x28b,
+    0x386,0x2c8,
+    0x8399,0x2a8,
+    0x83b4,0x279,
+    0x83bd,0x254,
+    0x83b8,0x24e,
+    0x83b1,0x24c,
+    0x839c,0x24f,
+    0x22d,0x276,
+    0x8260,0x24e,
+    0x8256,0x215,
+    0x824a,0x1ed,
+    0x824b,0x1bc,
+    0x8274,0x15f,
+    0x111,0x234,
+    0x80c4,0x1e2,
+    0x3ee,0x1fd,
+    0x83a7,0x1ea,
+    0x8360,0x1d7,
+    0xca,0x1d7,
+    0x8093,0x17f,
+    0x80e8,0x126,
+    0x811f,0xe1,
+    0x816d,0x4c,
+    0x818f,0x0,
+    0x81b3,0x32,
+    0x81be,0x74,
+    0x81b5,0xa5,
+    0xcf,0x1d1,
+    0x80eb,0x1d1,
+    0x34f,0x1b6,
+    0x83a5,0x1a2,
+    0x83f3,0x18a,
+    0x34f,0x195,
+    0x8383,0x164,
+    0x83b7,0x133
+]
+
+EFFECT_SNEEZE = [
+    0x2ea,0x224,
+    0x8311,0x233,
+    0x832d,0x24b,
+    0x833e,0x26b,
+    0x8344,0x295,
+    0x8343,0x2a6,
+    0x8341,0x2b6,
+    0x833a,0x2c4,
+    0x832c,0x2cf,
+    0x830d,0x2d6,
+    0x82ed,0x2d1,
+    0x82ce,0x2c6,
+    0x82b3,0x2bc,
+    0x82b0,0x2d1,
+    0x82b0,0x2e8,
+    0x82ae,0x2ff,
+    0x82a7,0x316,
+    0x8296,0x327,
+    0x8281,0x32f,
+    0x826b,0x335,
+    0x8258,0x342,
+    0x824c,0x356,
+    0x8249,0x36c,
+    0x8249,0x384,
+    0x8244,0x39a,
+    0x8237,0x3ad,
+    0x8223,0x3be,
+    0x820c,0x3cc,
+    0x81f8,0x3d5,
+    0x81f5,0x3e0,
+    0x81f1,0x3eb,
+    0x81ee,0x3f7,
+    0x81f0,0x403,
+    0x8209,0x41d,
+    0x822d,0x430,
+    0x8256,0x43c,
+    0x8279,0x443,
+    0x82d8,0x44c,
+    0x833b,0x448,
+    0x839a,0x430,
+    0x83eb,0x3ff,
+    0x8427,0x3b6,
+    0x8446,0x363,
+    0x844c,0x309,
+    0x843d,0x2ac,
+    0x842c,0x278,
+    0x8412,0x246,
+    0x83ed,0x220,
+    0x83bd,0x210,
+    0x83bd,0x1e0,
+    0x83bd,0x1af,
+    0x83bd,0x17e,
+    0x83bd,0x14d,
+    0x83be,0x13d,
+    0x83bf,0x128,
+    0x83be,0x114,
+    0x83b9,0x106,
+    0x83ad,0xff,
+    0x839b,0xfe,
+    0x8389,0xfe,
+    0x837a,0xff,
+    0x8350,0x101,
+    0x831f,0x104,
+    0x82ef,0x104,
+    0x82c8,0xfe,
+    0x82c0,0xf4,
+    0x82c4,0xe2,
+    0x82cf,0xcf,
+    0x82d7,0xc1,
+    0x82db,0xba,
+    0x82df,0xb1,
+    0x82e0,0xa9,
+    0x82dc,0xa2,
+    0x82cd,0x9c,
+    0x82ba,0x9b,
+    0x82a5,0x9d,
+    0x8294,0x9e,
+    0x8265,0x9d,
+    0x8237,0x9c,
+    0x8208,0x9b,
+    0x81d9,0x9a,
+    0x81c8,0x99,
+    0x81b5,0x99,
+    0x81a4,0x9d,
+    0x8196,0xa6,
+    0x8183,0xc0,
+    0x8178,0xdb,
+    0x817a,0xf4,
+    0x818f,0x10a,
+    0x81b6,0x11d,
+    0x81e2,0x131,
+    0x820b,0x147,
+    0x822e,0x162,
+    0x8234,0x16e,
+    0x8233,0x17a,
+    0x8230,0x187,
+    0x822e,0x193,
+    0x8230,0x1a8,
+    0x8234,0x1bc,
+    0x8239,0x1d0,
+    0x823a,0x1e5,
+    0x8234,0x20b,
+    0x8225,0x239,
+    0x820c,0x256,
+    0x81eb,0x246,
+    0x81e3,0x23a,
+    0x81df,0x22d,
+    0x81de,0x220,
+    0x81de,0x214,
+    0x81de,0x20a,
+    0x81e0,0x200,
+    0x81e3,0x1f8,
+    0x81e5,0x1f1,
+    0x1f8,0x3d5,
+    0x81e5,0x3ba,
+    0x81d2,0x398,
+    0x81c3,0x371,
+    0x81bb,0x34c,
+    0x81bc,0x331,
+    0x81c2,0x316,
+    0x81c8,0x2fc,
+    0x81c7,0x2e3,
+    0x81c1,0x2d3,
+    0x81b9,0x2c3,
+    0x81b0,0x2b3,
+    0x81a7,0x2a5,
+    0x81a3,0x29d,
+    0x819e,0x296,
+    0x819a,0x28e,
+    0x8198,0x285,
+    0x819a,0x277,
+    0x81a1,0x269,
+    0x81a9,0x25c,
+    0x81b1,0x24f,
+    0x81bb,0x23c,
+    0x81c4,0x22e,
+    0x81cc,0x223,
+    0x81d5,0x218,
+    0x8e,0x3ae,
+    0x80bf,0x3a7,
+    0x80ef,0x3a0,
+    0x8120,0x399,
+    0x8151,0x392,
+    0xcc,0x350,
+    0x80ed,0x350,
+    0x810e,0x350,
+    0x8130,0x350,
+    0x8151,0x350,
+    0x126,0x302,
+    0x8132,0x304,
+    0x813d,0x306,
+    0x8149,0x308,
+    0x8155,0x30a,
+    0x227,0x2a8,
+    0x8222,0x2b1,
+    0x821d,0x2ba,
+    0x8219,0x2c3,
+    0x8214,0x2cc,
+    0x821f,0x2d0,
+    0x822b,0x2d5,
+    0x8237,0x2da,
+    0x8242,0x2df,
+    0x11a,0x281,
+    0x8107,0x289,
+    0x80f2,0x28d,
+    0x80db,0x28d,
+    0x80c4,0x289,
+    0x809b,0x278,
+    0x8076,0x260,
+    0x8052,0x243,
+    0x8030,0x226,
+    0x8023,0x21d,
+    0x8015,0x212,
+    0x8007,0x205,
+    0x8000,0x1f8,
+    0x8004,0x1e9,
+    0x8013,0x1db,
+    0x8026,0x1ce,
+    0x8033,0x1c2,
+    0x803c,0x1ab,
+    0x8042,0x190,
+    0x804a,0x177,
+    0x8058,0x164,
+    0x806b,0x15c,
+    0x8080,0x159,
+    0x8095,0x156,
+    0x80a8,0x14e,
+    0x80b7,0x140,
+    0x80c3,0x12e,
+    0x80cf,0x11e,
+    0x80e0,0x114,
+    0x80e8,0x115,
+    0x80ee,0x11a,
+    0x80f3,0x122,
+    0x80f7,0x12a,
+    0x80fe,0x13a,
+    0x8106,0x14b,
+    0x810d,0x15d,
+    0x810e,0x16c,
+    0x80fd,0x198,
+    0x80e4,0x1c7,
+    0x80d0,0x1f6,
+    0x80d1,0x224,
+    0x80da,0x237,
+    0x80e8,0x248,
+    0x80f7,0x257,
+    0x8107,0x266,
+    0x810d,0x26d,
+    0x8114,0x275,
+    0x811b,0x27c,
+    0x8123,0x283,
+    0x8130,0x28e,
+    0x813f,0x297,
+    0x814f,0x29e,
+    0x8160,0x2a0,
+    0x816f,0x29e,
+    0x817b,0x29a,
+    0x8185,0x294,
+    0x818f,0x28d,
+    0x373,0x224,
+    0x8384,0x220,
+    0x8396,0x21c,
+    0x83a7,0x218,
+    0x83b9,0x214,
+    0x311,0x1ca,
+    0x82f7,0x1a9,
+    0x82d5,0x186,
+    0x82ad,0x16b,
+    0x8285,0x162,
+    0x827d,0x165,
+    0x8276,0x16c,
+    0x8270,0x172,
+    0x8268,0x177,
+    0x825d,0x178,
+    0x8251,0x174,
+    0x8245,0x16e,
+    0x823b,0x169,
+    0x112,0x165,
+    0x8130,0x158,
+    0x8157,0x141,
+    0x8179,0x127,
+    0x818b,0x10f,
+    0x281,0x15d,
+    0x828b,0x143,
+    0x8299,0x128,
+    0x82aa,0x10e,
+    0x82bb,0xf7
+]
+
+EFFECT_SPRING = [
+    0x1f3,0x429,
+    0x81e5,0x438,
+    0x81d7,0x444,
+    0x81c6,0x44b,
+    0x81b0,0x44c,
+    0x819b,0x44a,
+    0x8189,0x444,
+    0x817c,0x43a,
+    0x8172,0x42a,
+    0x816d,0x41c,
+    0x816a,0x40e,
+    0x8168,0x3ff,
+    0x8168,0x3f2,
+    0x816a,0x3e5,
+    0x816e,0x3d9,
+    0x8174,0x3ce,
+    0x817c,0x3c3,
+    0x8197,0x3b6,
+    0x81b7,0x3b5,
+    0x81cf,0x3c2,
+    0x81d2,0x3e0,
+    0x81c1,0x3fa,
+    0x81a5,0x408,
+    0x8183,0x40f,
+    0x815f,0x410,
+    0x813e,0x40b,
+    0x811e,0x3fd,
+    0x8105,0x3e4,
+    0x80f7,0x3bf,
+    0x80f3,0x3b2,
+    0x80f1,0x3a5,
+    0x80f1,0x399,
+    0x80f1,0x38b,
+    0x80fb,0x36e,
+    0x8117,0x355,
+    0x8138,0x34c,
+    0x8156,0x361,
+    0x8154,0x37e,
+    0x8137,0x397,
+    0x810d,0x3a9,
+    0x80e9,0x3af,
+    0x80c1,0x3a8,
+    0x809d,0x397,
+    0x807f,0x37c,
+    0x8069,0x354,
+    0x8064,0x346,
+    0x8061,0x337,
+    0x8060,0x329,
+    0x8062,0x31c,
+    0x807d,0x2f9,
+    0x80a5,0x2db,
+    0x80ce,0x2d6,
+    0x80e7,0x2ff,
+    0x80dd,0x325,
+    0x80b6,0x330,
+    0x8086,0x32c,
+    0x8060,0x323,
+    0x8058,0x31a,
+    0x8052,0x311,
+    0x804c,0x308,
+    0x8047,0x301,
+    0x8027,0x2d2,
+    0x800e,0x2a1,
+    0x8005,0x26f,
+    0x8016,0x23d,
+    0x8024,0x22a,
+    0x8032,0x216,
+    0x8042,0x204,
+    0x8057,0x1f9,
+    0x8073,0x1f6,
+    0x808f,0x1fe,
+    0x80a5,0x210,
+    0x80b3,0x22b,
+    0x80b1,0x24a,
+    0x809f,0x264,
+    0x8082,0x274,
+    0x8063,0x278,
+    0x804a,0x271,
+    0x8031,0x264,
+    0x801b,0x254,
+    0x800b,0x23f,
+    0x8000,0x211,
+    0x8000,0x1d5,
+    0x8008,0x199,
+    0x8015,0x169,
+    0x801a,0x15a,
+    0x8020,0x14a,
+    0x802c,0x13d,
+    0x8043,0x133,
+    0x8065,0x12b,
+    0x8092,0x12d,
+    0x80b7,0x140,
+    0x80c2,0x16f,
+    0x80b6,0x189,
+    0x80a0,0x197,
+    0x8084,0x198,
+    0x8069,0x18f,
+    0x8053,0x17f,
+    0x8044,0x16d,
+    0x803a,0x15a,
+    0x8033,0x146,
+    0x8034,0x137,
+    0x8037,0x123,
+    0x803b,0x10f,
+    0x803f,0x101,
+    0x8049,0xe7,
+    0x8055,0xcd,
+    0x8063,0xb6,
+    0x8075,0xa3,
+    0x8081,0x9c,
+    0x808e,0x97,
+    0x809b,0x94,
+    0x80a8,0x92,
+    0x80b6,0x91,
+    0x80c2,0x91,
+    0x80ce,0x93,
+    0x80dc,0x97,
+    0x80f6,0xab,
+    0x810d,0xc8,
+    0x8114,0xe7,
+    0x8100,0x101,
+    0x80dd,0x105,
+    0x80c4,0xee,
+    0x80b5,0xce,
+    0x80b1,0xb3,
+    0x80b3,0xa7,
+    0x80b5,0x9a,
+    0x80b6,0x8e,
+    0x80b8,0x82,
+    0x80bd,0x6e,
+    0x80c5,0x5c,
+    0x80d2,0x4c,
+    0x80e8,0x3d,
+    0x80f2,0x39,
+    0x80fd,0x36,
+    0x8108,0x34,
+    0x8113,0x34,
+    0x811e,0x34,
+    0x8127,0x35,
+    0x8131,0x38,
+    0x813d,0x3c,
+    0x8146,0x3f,
+    0x814e,0x42,
+    0x8155,0x45,
+    0x815b,0x49,
+    0x8168,0x54,
+    0x8176,0x63,
+    0x8180,0x75,
+    0x8181,0x87,
+    0x8175,0x98,
+    0x8164,0x9a,
+    0x8151,0x91,
+    0x8144,0x82,
+    0x813e,0x6a,
+    0x813c,0x5b,
+    0x813e,0x50,
+    0x8140,0x45,
+    0x8152,0x1c,
+    0x8174,0x2,
+    0x81a1,0x0,
+    0x81d5,0x21
+]
+
+EFFECT_TRIANGLE = [
+    0x341,0x237,
+    0x8352,0x218,
+    0x8363,0x1f8,
+    0x8374,0x1d8,
+    0x8385,0x1b8,
+    0x8399,0x18f,
+    0x83b0,0x166,
+    0x83c6,0x13c,
+    0x83d7,0x111,
+    0x83d3,0xff,
+    0x83cc,0xf5,
+    0x83b1,0xf3,
+    0x8397,0x105,
+    0x837d,0x12e,
+    0x836a,0x156,
+    0x8357,0x17e,
+    0x8341,0x1a5,
+    0x832c,0x1cc,
+    0x831b,0x1f4,
+    0x8361,0x271,
+    0x83a7,0x2ed,
+    0x83ed,0x36a,
+    0x8433,0x3e7,
+    0x8449,0x407,
+    0x844c,0x42d,
+    0x843a,0x444,
+    0x8414,0x43a,
+    0x83fb,0x411,
+    0x83e4,0x3e7,
+    0x83cc,0x3bc,
+    0x83b4,0x392,
+    0x8384,0x33d,
+    0x8354,0x2e7,
+    0x8324,0x291,
+    0x82f2,0x23c,
+    0x82c3,0x295,
+    0x8294,0x2ee,
+    0x8265,0x347,
+    0x8237,0x3a0,
+    0x8229,0x3b8,
+    0x8225,0x3be,
+    0x8220,0x3c8,
+    0x820d,0x3ec,
+    0x81fe,0x3fe,
+    0x81f2,0x3fd,
+    0x81e8,0x3f3,
+    0x81e2,0x3e9,
+    0x81c0,0x3b0,
+    0x819d,0x374,
+    0x817b,0x338,
+    0x815d,0x2ff,
+    0x8118,0x276,
+    0x80d4,0x1ed,
+    0x8090,0x164,
+    0x804c,0xdb,
+    0x804b,0xb6,
+    0x8065,0xa0,
+    0x808b,0x96,
+    0x80b1,0x97,
+    0x815b,0x97,
+    0x8206,0x97,
+    0x82b0,0x97,
+    0x835b,0x96,
+    0x8375,0x7c,
+    0x836c,0x61,
+    0x8350,0x4f,
+    0x832b,0x51,
+    0x8280,0x51,
+    0x81d6,0x51,
+    0x812c,0x51,
+    0x8081,0x52,
+    0x8054,0x59,
+    0x802a,0x6c,
+    0x800b,0x8d,
+    0x8000,0xb9,
+    0x800e,0xf7,
+    0x8028,0x131,
+    0x8046,0x16a,
+    0x8061,0x1a3,
+    0x80ac,0x237,
+    0x80f6,0x2cc,
+    0x8140,0x360,
+    0x818a,0x3f5,
+    0x8198,0x410,
+    0x81aa,0x429,
+    0x81c1,0x43d,
+    0x81dd,0x449,
+    0x81ef,0x44c,
+    0x8200,0x44a,
+    0x820e,0x445,
+    0x8218,0x43f,
+    0x8238,0x41e,
+    0x8253,0x3f9,
+    0x8269,0x3d1,
+    0x8280,0x3aa,
+    0x82a6,0x360,
+    0x82cc,0x317,
+    0x82f3,0x2cd,
+    0x831a,0x284,
+    0x2f2,0x23c,
+    0x82d4,0x203,
+    0x82b4,0x1cb,
+    0x8294,0x192,
+    0x8276,0x159,
+    0x8284,0x134,
+    0x82a1,0x134,
+    0x82bf,0x14c,
+    0x82d0,0x16f,
+    0x82e2,0x18f,
+    0x82f3,0x1b0,
+    0x8305,0x1d0,
+    0x8319,0x1ef
+]
+
+EFFECT_TROMBONE = [
+    0x2a0,0x411,
+    0x8280,0x3e8,
+    0x826d,0x3be,
+    0x8264,0x38f,
+    0x8263,0x35d,
+    0x8269,0x33d,
+    0x8275,0x325,
+    0x828a,0x315,
+    0x82a9,0x312,
+    0x828e,0x308,
+    0x8271,0x31b,
+    0x8261,0x33a,
+    0x8251,0x356,
+    0x820f,0x387,
+    0x81c5,0x3af,
+    0x819f,0x3c3,
+    0x817a,0x3d2,
+    0x8179,0x3c3,
+    0x8177,0x3b4,
+    0x8175,0x394,
+    0x8174,0x372,
+    0x8172,0x364,
+    0x8174,0x357,
+    0x819d,0x341,
+    0x81ce,0x333,
+    0x81c7,0x326,
+    0x81c5,0x31b,
+    0x818b,0x32c,
+    0x814d,0x341,
+    0x80f4,0x35e,
+    0x809c,0x37a,
+    0x8061,0x38c,
+    0x802a,0x3a7,
+    0x800e,0x3c5,
+    0x8001,0x3e6,
+    0x8000,0x412,
+    0x800d,0x42f,
+    0x801f,0x43f,
+    0x8036,0x449,
+    0x8043,0x44c,
+    0x8051,0x44c,
+    0x805d,0x44b,
+    0x8069,0x44a,
+    0x8087,0x444,
+    0x80a5,0x43d,
+    0x815b,0x40a,
+    0x8213,0x3f0,
+    0x8247,0x3f0,
+    0x8279,0x3fa,
+    0x8286,0x405,
+    0x8294,0x411,
+    0x2ca,0x420,
+    0x82b1,0x421,
+    0x829a,0x417,
+    0x87,0x426,
+    0x8085,0x408,
+    0x8082,0x3ea,
+    0x8081,0x3df,
+    0x8081,0x3d5,
+    0x8080,0x3be,
+    0x807b,0x3aa,
+    0x806a,0x3a9,
+    0x805a,0x3b0,
+    0x802f,0x3c9,
+    0x8019,0x3f3,
+    0x8019,0x3ff,
+    0x801c,0x40b,
+    0x8025,0x41e,
+    0x8036,0x42c,
+    0x8047,0x431,
+    0x805a,0x432,
+    0x8097,0x425,
+    0x80d2,0x410,
+    0x8124,0x3f1,
+    0x8177,0x3d5,
+    0x93,0x423,
+    0x8092,0x3fd,
+    0x808e,0x3d2,
+    0x808d,0x3c6,
+    0x808d,0x3ba,
+    0x808b,0x3a8,
+    0x807e,0x3a2,
+    0x2ca,0x420,
+    0x82d4,0x419,
+    0x82da,0x414,
+    0x82f1,0x3f5,
+    0x82f9,0x3cf,
+    0x82fa,0x3ad,
+    0x82f8,0x38d,
+    0x82f4,0x36a,
+    0x82e0,0x33b,
+    0x82d6,0x32e,
+    0x82cc,0x321,
+    0x82be,0x31b,
+    0x82b0,0x314,
+    0xd2,0x40e,
+    0x80cd,0x3e9,
+    0x80cc,0x3c3,
+    0x80c9,0x3a2,
+    0x80cc,0x381,
+    0x80d6,0x38f,
+    0x80d8,0x3a2,
+    0x80d8,0x3af,
+    0x80d9,0x3bd,
+    0x80dd,0x3e3,
+    0x80de,0x40b,
+    0x279,0x3f6,
+    0x826c,0x3d6,
+    0x825f,0x3b1,
+    0x825b,0x37e,
+    0x825a,0x368,
+    0x825a,0x34f,
+    0x297,0x3f0,
+    0x82ac,0x3c1,
+    0x82ab,0x39a,
+    0x8297,0x36b,
+    0x8279,0x354,
+    0x16e,0x3d2,
+    0x816a,0x3ba,
+    0x8169,0x3a5,
+    0x8168,0x39a,
+    0x8168,0x390,
+    0x8166,0x37c,
+    0x8165,0x369,
+    0x8166,0x358,
+    0x8171,0x354,
+    0x8d,0x39f,
+    0x80a9,0x395,
+    0x80c6,0x38d,
+    0xd5,0x38a,
+    0x811a,0x36e,
+    0x8162,0x35a,
+    0x1ce,0x333,
+    0x8208,0x31f,
+    0x8243,0x30c,
+    0x243,0x2d9,
+    0x8220,0x2c5,
+    0x8201,0x2af,
+    0x823d,0x297,
+    0x827f,0x284,
+    0x82f2,0x25e,
+    0x8366,0x23a,
+    0x838c,0x22e,
+    0x83b4,0x222,
+    0x83e6,0x217,
+    0x8417,0x21d,
+    0x8428,0x22a,
+    0x8430,0x23c,
+    0x8427,0x249,
+    0x841a,0x252,
+    0x83ef,0x264,
+    0x83c3,0x272,
+    0x8351,0x298,
+    0x82df,0x2be,
+    0x829c,0x2d0,
+    0x8258,0x2e8,
+    0x824e,0x2df,
+    0x8243,0x2d9,
+    0x177,0x2e2,
+    0x816d,0x2df,
+    0x815d,0x2e2,
+    0x8144,0x2e9,
+    0x8125,0x2f7,
+    0x8104,0x302,
+    0x80f4,0x2eb,
+    0x80f6,0x2dd,
+    0x80fe,0x2cf,
+    0x8112,0x2ce,
+    0x8126,0x2cd,
+    0x8135,0x2cc,
+    0x8144,0x2cb,
+    0x8153,0x2c3,
+    0x8167,0x2bf,
+    0x8195,0x2b0,
+    0x81c6,0x2a1,
+    0x81dc,0x297,
+    0x81f2,0x291,
+    0x822b,0x27f,
+    0x8264,0x26d,
+    0x82ea,0x241,
+    0x8372,0x217,
+    0x83a7,0x206,
+    0x83de,0x1fa,
+    0x83e9,0x1f8,
+    0x83f6,0x1f8,
+    0x8402,0x1f9,
+    0x840e,0x1fb,
+    0x8433,0x20b,
+    0x844b,0x22a,
+    0x844c,0x24a,
+    0x842c,0x269,
+    0x83a9,0x29a,
+    0x8324,0x2c2,
+    0x82b4,0x2ea,
+    0x8243,0x30c,
+    0x145,0x2e1,
+    0x8146,0x2db,
+    0x8144,0x2cf,
+    0x1da,0x2b9,
+    0x820c,0x2d5,
+    0x823a,0x2f1,
+    0x8213,0x304,
+    0x81e5,0x30d,
+    0x81bc,0x2f5,
+    0x818a,0x2d6,
+    0x81b4,0x2c7,
+    0x81da,0x2b9,
+    0x178,0x2e2,
+    0x819b,0x2fd,
+    0x81c2,0x315
+]
+
+EFFECT_TRUMPET = [
+    0x26c,0x2bd,
+    0x828b,0x2f3,
+    0x82af,0x328,
+    0x82d7,0x380,
+    0x82f0,0x3dc,
+    0x82f4,0x3fa,
+    0x82f8,0x417,
+    0x82f9,0x420,
+    0x82f8,0x428,
+    0x82f1,0x43b,
+    0x82f6,0x44c,
+    0x8307,0x44b,
+    0x8314,0x43f,
+    0x8330,0x41d,
+    0x834c,0x3fb,
+    0x83ad,0x386,
+    0x840e,0x312,
+    0x8427,0x2f4,
+    0x8440,0x2d7,
+    0x8448,0x2cb,
+    0x844c,0x2bd,
+    0x8446,0x2b4,
+    0x843c,0x2b1,
+    0x8430,0x2b8,
+    0x8425,0x2bf,
+    0x8415,0x2c2,
+    0x8403,0x2c3,
+    0x83f5,0x2c3,
+    0x83e7,0x2c3,
+    0x83cb,0x2c3,
+    0x83b2,0x2c3,
+    0x8384,0x2be,
+    0x8355,0x2b5,
+    0x8347,0x2b2,
+    0x8339,0x2af,
+    0x830a,0x2a0,
+    0x82dc,0x28e,
+    0x82c6,0x282,
+    0x82af,0x27b,
+    0x82a3,0x282,
+    0x8299,0x28e,
+    0x8284,0x2a8,
+    0x826c,0x2bd,
+    0x2fb,0x425,
+    0x831d,0x404,
+    0x833f,0x3d9,
+    0x8393,0x376,
+    0x83e6,0x312,
+    0x8409,0x2ea,
+    0x8422,0x2c3,
+    0x26c,0x2bd,
+    0x823c,0x295,
+    0x8209,0x26c,
+    0x81fe,0x263,
+    0x81f3,0x25a,
+    0x81af,0x221,
+    0x816a,0x1e8,
+    0x80fc,0x189,
+    0x8088,0x12c,
+    0x8056,0x10c,
+    0x8026,0xeb,
+    0x804c,0xbf,
+    0x8070,0x91,
+    0x806f,0x78,
+    0x8058,0x6e,
+    0x8030,0x92,
+    0x800e,0xc0,
+    0x8004,0xcd,
+    0x8000,0xdd,
+    0x800b,0xee,
+    0x8023,0xed,
+    0x1ce,0x288,
+    0x81df,0x284,
+    0x81e4,0x274,
+    0x81d5,0x262,
+    0x81c0,0x256,
+    0x81b2,0x25a,
+    0x81ac,0x269,
+    0x81ba,0x27b,
+    0x81ce,0x288,
+    0x2a7,0x27a,
+    0x8298,0x26c,
+    0x8288,0x25f,
+    0x825b,0x23a,
+    0x8231,0x215,
+    0x8250,0x1f0,
+    0x8270,0x1c9,
+    0x827d,0x1ba,
+    0x8285,0x1aa,
+    0x8272,0x18c,
+    0x8255,0x175,
+    0x8234,0x159,
+    0x8212,0x13d,
+    0x81f8,0x128,
+    0x81de,0x114,
+    0x81be,0xf6,
+    0x8199,0xe4,
+    0x818a,0xee,
+    0x817d,0xfe,
+    0x815c,0x126,
+    0x813c,0x14a,
+    0x815d,0x167,
+    0x8180,0x184,
+    0x81b5,0x1b0,
+    0x81ea,0x1dd,
+    0x820d,0x1f9,
+    0x822e,0x215,
+    0x1e5,0x26f,
+    0x81ea,0x268,
+    0x81f0,0x261,
+    0x28b,0x261,
+    0x82ae,0x236,
+    0x82c8,0x204,
+    0x82cc,0x1f7,
+    0x82ce,0x1ea,
+    0x82ce,0x1dd,
+    0x82ce,0x1ce,
+    0x8289,0x14d,
+    0x820f,0xeb,
+    0x81ea,0xcd,
+    0x81c3,0xb2,
+    0x81b5,0xac,
+    0x81a7,0xa7,
+    0x815a,0xa4,
+    0x8115,0xc7,
+    0x80fd,0xe4,
+    0x80e2,0xfa,
+    0x80cf,0xf2,
+    0x80bf,0xe2,
+    0x8098,0xb9,
+    0x8072,0x93,
+    0x17a,0x21a,
+    0x816c,0x21f,
+    0x8166,0x22e,
+    0x8175,0x242,
+    0x818b,0x24f,
+    0x819a,0x24b,
+    0x819f,0x23c,
+    0x8191,0x22a,
+    0x817d,0x21a,
+    0x8185,0x210,
+    0x818e,0x207,
+    0x1c3,0x253,
+    0x81cb,0x24a,
+    0x81d4,0x242,
+    0x25b,0x239,
+    0x827e,0x210,
+    0x8290,0x1dc,
+    0x8290,0x1c5,
+    0x8288,0x1af,
+    0x19e,0x236,
+    0x81a7,0x22d,
+    0x81af,0x223,
+    0x155,0x1fb,
+    0x813b,0x1e5,
+    0x8121,0x1ed,
+    0x8131,0x20a,
+    0x814f,0x214,
+    0x815d,0x201,
+    0x8169,0x1ea,
+    0x20f,0x1f9,
+    0x823d,0x1c2,
+    0x826c,0x18b,
+    0x136,0x1df,
+    0x813d,0x1d7,
+    0x8144,0x1ce,
+    0xfb,0x1da,
+    0x810d,0x1d7,
+    0x8113,0x1c6,
+    0x8104,0x1b5,
+    0x80f0,0x1a7,
+    0x80e0,0x1ab,
+    0x80db,0x1bb,
+    0x80e8,0x1cd,
+    0x80fb,0x1da,
+    0x1ea,0x1da,
+    0x8219,0x1a3,
+    0x8247,0x16c,
+    0x115,0x1c0,
+    0x811c,0x1b8,
+    0x8123,0x1af,
+    0x1c9,0x1bd,
+    0x81f8,0x187,
+    0x8225,0x150,
+    0xf3,0x1a4,
+    0x80fa,0x19c,
+    0x8101,0x193,
+    0x1a4,0x1a1,
+    0x81d3,0x16b,
+    0x81fe,0x134,
+    0x182,0x185,
+    0x81b0,0x14e,
+    0x81df,0x118,
+    0x15e,0x166,
+    0x818d,0x130,
+    0x81bb,0xf9,
+    0xdf,0xfe,
+    0x80f9,0x114,
+    0x8112,0x129,
+    0x8127,0x13b,
+    0x813c,0x14a,
+    0x88,0x128,
+    0x80a4,0x108,
+    0x80c0,0xe8,
+    0x112,0x126,
+    0x812b,0x107,
+    0x814a,0xec,
+    0x816d,0xdf,
+    0x818e,0xdf
+]
+
+EFFECT_VINTAGE_CAR_HORN = [
+    0x2c7,0x1ba,
+    0x82a1,0x1e8,
+    0x8285,0x239,
+    0x827c,0x266,
+    0x31f,0x20d,
+    0x82e6,0x24b,
+    0x82c7,0x289,
+    0x31e,0x20a,
+    0x8332,0x1df,
+    0x8320,0x1b9,
+    0x82f8,0x1a2,
+    0x82c6,0x1b9,
+    0x333,0x1dd,
+    0x8373,0x1e1,
+    0x8398,0x1ce,
+    0x83b0,0x1ad,
+    0x83b9,0x183,
+    0x83b2,0x158,
+    0x839b,0x12e,
+    0x8378,0x110,
+    0x8350,0x101,
+    0x8327,0x103,
+    0x8302,0x117,
+    0x82ea,0x138,
+    0x82e1,0x162,
+    0x82eb,0x1a3,
+    0x2f2,0x247,
+    0x8338,0x25c,
+    0x8388,0x259,
+    0x83cf,0x233,
+    0x83ff,0x1f1,
+    0x8411,0x1a1,
+    0x8403,0x14b,
+    0x83d7,0xfb,
+    0x8392,0xc0,
+    0x8343,0xa3,
+    0x82f3,0xa7,
+    0x82ac,0xcd,
+    0x827c,0x10e,
+    0x826a,0x15f,
+    0x8278,0x1b4,
+    0x829c,0x1f7,
+    0x283,0x411,
+    0x8341,0x44c,
+    0x440,0x331,
+    0x83b8,0x2b5,
+    0x346,0x44c,
+    0x83f1,0x43e,
+    0x844c,0x3c4,
+    0x843e,0x330,
+    0x16c,0x231,
+    0x819f,0x1e0,
+    0x81b4,0x18d,
+    0x81ab,0x141,
+    0x8183,0x106,
+    0x8143,0xe8,
+    0x80f7,0xea,
+    0x80a9,0x10c,
+    0x8062,0x14a,
+    0x802f,0x19b,
+    0x801a,0x1ee,
+    0x8023,0x23a,
+    0x804b,0x275,
+    0x808b,0x293,
+    0x80d7,0x291,
+    0x8125,0x26f,
+    0x816c,0x231,
+    0x816c,0x231,
+    0x1d2,0x1a5,
+    0x81ec,0x1e0,
+    0x821f,0x221,
+    0x8260,0x25a,
+    0x828c,0x27b,
+    0x82cc,0x28f,
+    0x111,0x298,
+    0x8169,0x2ad,
+    0x81cd,0x2db,
+    0x821f,0x309,
+    0x822f,0x319,
+    0x2cf,0x28e,
+    0x835e,0x280,
+    0x250,0x3cb,
+    0x8228,0x33f,
+    0x22d,0x315,
+    0x8231,0x355,
+    0x8248,0x377,
+    0x826d,0x389,
+    0x8299,0x387,
+    0x82c6,0x374,
+    0x82ef,0x34f,
+    0x830c,0x321,
+    0x8318,0x2f0,
+    0x8313,0x2c4,
+    0x82fc,0x2a2,
+    0x82d7,0x290,
+    0x24f,0x3ca,
+    0x8275,0x403,
+    0x82b2,0x421,
+    0x82fb,0x41e,
+    0x8346,0x3fe,
+    0x838b,0x3c1,
+    0x83bb,0x373,
+    0x83d0,0x323,
+    0x83cd,0x2f1,
+    0x83c7,0x2d9,
+    0x83a1,0x2a0,
+    0x8364,0x282,
+    0x180,0x243,
+    0x81b9,0x1e7,
+    0x81d1,0x189,
+    0x81c7,0x132,
+    0x819a,0xef,
+    0x8151,0xcc,
+    0x80fb,0xcf,
+    0x80a2,0xf5,
+    0x8051,0x13c,
+    0x8018,0x198,
+    0x8000,0x1f6,
+    0x800a,0x24d,
+    0x8037,0x290,
+    0x807f,0x2b3,
+    0x80d6,0x2b0,
+    0x812f,0x28a,
+    0x8180,0x243,
+    0x8180,0x243
+]
+
+EFFECT_XYLOPHONE = [
+    0x29c,0x2c2,
+    0x82a1,0x277,
+    0x82a4,0x222,
+    0x82a7,0x1cd,
+    0x82aa,0x1b4,
+    0x82a4,0x19b,
+    0x8292,0x194,
+    0x827e,0x197,
+    0x8247,0x1a0,
+    0x8212,0x1b0,
+    0x8203,0x1be,
+    0x81fc,0x1d1,
+    0x81fa,0x1e6,
+    0x81f8,0x1fc,
+    0x81f8,0x216,
+    0x81f8,0x232,
+    0x81f8,0x26f,
+    0x81f8,0x2aa,
+    0x81f8,0x2b8,
+    0x81f8,0x2c7,
+    0x81f6,0x301,
+    0x81f5,0x33b,
+    0x81f3,0x373,
+    0x81f1,0x3ab,
+    0x81f1,0x3cb,
+    0x81f1,0x3e9,
+    0x81f1,0x3fe,
+    0x81f1,0x414,
+    0x81f1,0x429,
+    0x81fa,0x43a,
+    0x8233,0x449,
+    0x8270,0x44c,
+    0x8281,0x447,
+    0x828b,0x438,
+    0x8294,0x3f6,
+    0x8294,0x3b2,
+    0x8296,0x38b,
+    0x8298,0x366,
+    0x8296,0x338,
+    0x829d,0x309,
+    0x829c,0x2c2,
+    0x2a4,0x304,
+    0x82d0,0x305,
+    0x2d5,0x358,
+    0x82d5,0x368,
+    0x82d3,0x378,
+    0x82d0,0x3bb,
+    0x82d2,0x3fe,
+    0x82d0,0x419,
+    0x82d5,0x432,
+    0x82e6,0x43a,
+    0x82fa,0x43d,
+    0x8334,0x449,
+    0x836d,0x44c,
+    0x8381,0x43c,
+    0x8386,0x422,
+    0x8389,0x3e3,
+    0x838a,0x3a4,
+    0x838c,0x37b,
+    0x838e,0x350,
+    0x8392,0x300,
+    0x8395,0x2ad,
+    0x8395,0x29b,
+    0x8396,0x289,
+    0x8398,0x278,
+    0x8399,0x265,
+    0x839c,0x213,
+    0x83a0,0x1c6,
+    0x83a2,0x18e,
+    0x83a4,0x155,
+    0x83a2,0x142,
+    0x8395,0x133,
+    0x836d,0x134,
+    0x8346,0x13e,
+    0x8314,0x147,
+    0x82e9,0x15d,
+    0x82db,0x18a,
+    0x82dd,0x1bb,
+    0x82db,0x22e,
+    0x82d8,0x29f,
+    0x82d9,0x2ac,
+    0x82d9,0x2b8,
+    0x82d7,0x2c5,
+    0x82d6,0x2d2,
+    0x82d5,0x2e9,
+    0x82d6,0x315,
+    0x82d5,0x358,
+    0x1cf,0x264,
+    0x81d1,0x219,
+    0x81d2,0x1ff,
+    0x81ca,0x1e8,
+    0x81a5,0x1e6,
+    0x817d,0x1f0,
+    0x815d,0x1f7,
+    0x8142,0x207,
+    0x8135,0x246,
+    0x8138,0x289,
+    0x8138,0x29a,
+    0x8138,0x2aa,
+    0x8138,0x2c1,
+    0x8138,0x2d9,
+    0x8138,0x2e7,
+    0x8136,0x2f6,
+    0x8135,0x309,
+    0x8135,0x31e,
+    0x8133,0x36e,
+    0x8131,0x3bd,
+    0x812d,0x3f8,
+    0x8135,0x42f,
+    0x816a,0x440,
+    0x81a5,0x443,
+    0x81bd,0x419,
+    0x81bf,0x3e1,
+    0x81c1,0x36f,
+    0x81c9,0x2fd,
+    0x81c7,0x2d4,
+    0x81cc,0x2aa,
+    0x81cf,0x264,
+    0x1d2,0x2a9,
+    0x81f1,0x2aa,
+    0xe2,0x437,
+    0x8108,0x418,
+    0x810a,0x3de,
+    0x810c,0x39f,
+    0x8110,0x35f,
+    0x8112,0x315,
+    0x8115,0x2ca,
+    0x8117,0x2ba,
+    0x8118,0x2aa,
+    0x8118,0x29b,
+    0x8118,0x28d,
+    0x811d,0x25b,
+    0x810d,0x232,
+    0x80cf,0x239,
+    0x809d,0x257,
+    0x8096,0x290,
+    0x8099,0x2ca,
+    0x8097,0x2eb,
+    0x8095,0x30c,
+    0x8096,0x33e,
+    0x8095,0x371,
+    0x8095,0x380,
+    0x8093,0x38e,
+    0x8092,0x3a0,
+    0x8092,0x3b2,
+    0x8092,0x3c9,
+    0x8091,0x3de,
+    0x808f,0x401,
+    0x8096,0x425,
+    0x80b9,0x432,
+    0x80e2,0x437,
+    0x71,0x38e,
+    0x8072,0x35d,
+    0x8076,0x32c,
+    0x8078,0x30a,
+    0x8079,0x2e7,
+    0x807d,0x2c1,
+    0x807a,0x29c,
+    0x8046,0x295,
+    0x800f,0x2ab,
+    0x8006,0x2d6,
+    0x8008,0x304,
+    0x8007,0x363,
+    0x8005,0x3c1,
+    0x8000,0x3ec,
+    0x8003,0x417,
+    0x8030,0x429,
+    0x8062,0x427,
+    0x806d,0x412,
+    0x806e,0x3fb,
+    0x806e,0x3c5,
+    0x8075,0x392,
+    0x8083,0x395,
+    0x808e,0x395,
+    0x1c2,0x3e9,
+    0x81d8,0x3e9,
+    0x81ee,0x3e9,
+    0x10d,0x3e5,
+    0x811d,0x3e5,
+    0x812e,0x3e5,
+    0x294,0x3e5,
+    0x82b1,0x3e5,
+    0x82ce,0x3e5,
+    0x173,0x3de,
+    0x8191,0x3d5,
+    0x8187,0x3b6,
+    0x8169,0x3bf,
+    0x8173,0x3de,
+    0x23d,0x3de,
+    0x825c,0x3d5,
+    0x8253,0x3b6,
+    0x8234,0x3bf,
+    0x823d,0x3de,
+    0x31a,0x3de,
+    0x8339,0x3d5,
+    0x832f,0x3b6,
+    0x8310,0x3bf,
+    0x831a,0x3de,
+    0x71,0x3da,
+    0x8081,0x3db,
+    0x808e,0x3de,
+    0x34,0x3d4,
+    0x804e,0x3c4,
+    0x803e,0x3a7,
+    0x8022,0x3b6,
+    0x8034,0x3d4,
+    0xc8,0x3d3,
+    0x80e1,0x3c3,
+    0x80cf,0x3a7,
+    0x80b6,0x3b7,
+    0x80c8,0x3d3,
+    0x1c6,0x39c,
+    0x81da,0x39c,
+    0x81ee,0x39c,
+    0x298,0x399,
+    0x82b3,0x39b,
+    0x82ce,0x39c,
+    0x111,0x399,
+    0x811f,0x399,
+    0x812e,0x399,
+    0x7c,0x308,
+    0x8087,0x308,
+    0x8092,0x308,
+    0x3f,0x2fe,
+    0x805c,0x2f1,
+    0x804d,0x2d4,
+    0x8031,0x2e2,
+    0x803f,0x2fe,
+    0x118,0x301,
+    0x8125,0x301,
+    0x8131,0x301,
+    0x1cd,0x301,
+    0x81df,0x301,
+    0x81f1,0x301,
+    0xd3,0x2ef,
+    0x80ec,0x2dc,
+    0x80d7,0x2c2,
+    0x80be,0x2d5,
+    0x80d3,0x2ef,
+    0x17a,0x2dc,
+    0x8198,0x2d4,
+    0x818c,0x2b5,
+    0x816f,0x2bf,
+    0x817a,0x2dc,
+    0x245,0x2dc,
+    0x8263,0x2d4,
+    0x8256,0x2b5,
+    0x823a,0x2bf,
+    0x8245,0x2dc,
+    0x322,0x2dc,
+    0x8340,0x2d4,
+    0x8333,0x2b5,
+    0x8317,0x2be,
+    0x8322,0x2dc,
+    0x80,0x2b8,
+    0x808b,0x2b8,
+    0x8096,0x2b8,
+    0x11c,0x2aa,
+    0x8126,0x2aa,
+    0x8131,0x2aa,
+    0x2a3,0x2a3,
+    0x82bc,0x2a3,
+    0x82d5,0x2a3,
+    0x212,0xf0,
+    0x8209,0x106,
+    0x8200,0x11b,
+    0x81e8,0x131,
+    0x81d1,0x147,
+    0x8215,0x168,
+    0x825c,0x14a,
+    0x8267,0x134,
+    0x8269,0x11b,
+    0x8265,0x107,
+    0x8259,0xf6,
+    0x823d,0xee,
+    0x821d,0xeb,
+    0x8211,0xdf,
+    0x8214,0xcf,
+    0x8242,0xc4,
+    0x8274,0xc3,
+    0x8285,0xc1,
+    0x8298,0xc0,
+    0x82f9,0xb6,
+    0x8358,0xb2,
+    0x8370,0xb2,
+    0x8387,0xb2,
+    0x8395,0xb5,
+    0x83a0,0xbe,
+    0x838a,0xdc,
+    0x835f,0xe8,
+    0x8308,0xef,
+    0x82b1,0xf0,
+    0x8289,0xf0,
+    0x8261,0xf0,
+    0x20b,0xcc,
+    0x81d9,0x9b,
+    0x8197,0xa8,
+    0x8180,0xcb,
+    0x8177,0xf4,
+    0x817c,0x11d,
+    0x8193,0x13e,
+    0x81b1,0x14b,
+    0x81d1,0x147,
+    0x232,0xc5,
+    0x8243,0xa8,
+    0x8258,0x8b,
+    0x828a,0x46,
+    0x82c3,0x9,
+    0x82ec,0x0,
+    0x82fb,0x22,
+    0x82de,0x4e,
+    0x82b8,0x75,
+    0x829a,0x97,
+    0x827b,0xba
+]
+
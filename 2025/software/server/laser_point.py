@@ -1,5 +1,11 @@
 """Defines a LaserPoint class and helper functions"""
 
+import time
+import numpy as np
+
+POINTS_PER_PACKET = 170
+BYTES_PER_POINT = 6
+
 def bytes_to_xy(b0: int, b1: int, b2: int) -> list[int]:
     """Converts three 8 bit values to two 12 bit values"""
     return [b0 << 4 | b1 >> 4, (b1 & 0x0f) << 8 | b2]
@@ -9,6 +15,8 @@ def xy_to_bytes(x: int, y: int) -> list[int]:
     return [x >> 4, (x & 0xf) << 4 | y >> 8, y & 0xff]
 
 class LaserPoint:
+    __slots__ = ('id', 'x', 'y', 'r', 'g', 'b')
+
     def __init__(self, id: int, x: int = 0, y: int = 0, r: int = 0, g: int = 0, b: int = 0) -> None:
         self.id = id
         self.x = x
@@ -33,6 +41,99 @@ class LaserPoint:
     def rgb(self) -> list[int]:
         return [self.r, self.g, self.b]
     
+class LaserFrame:
+    """One point for each laser, stored as a (num_lasers, 5) array of x, y, r, g, b values
+    where the row is the laser id. Generators can reuse a frame between yields."""
+    __slots__ = ('values',)
+    MIN_VALUES = np.array([0, 0, 0, 0, 0], dtype=np.int32)
+    MAX_VALUES = np.array([4095, 4095, 255, 255, 255], dtype=np.int32)
+
+    def __init__(self, num_lasers: int) -> None:
+        self.values = np.zeros((num_lasers, 5), dtype=np.int32)
+
+    @classmethod
+    def from_points(cls, points: list[LaserPoint]):
+        frame = cls(len(points))
+        for p in points:
+            frame.set(p.id, p.x, p.y, p.r, p.g, p.b)
+        return frame
+
+    def to_points(self) -> list[LaserPoint]:
+        return [LaserPoint(i, *v) for i, v in enumerate(self.values.tolist())]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, id: int) -> LaserPoint:
+        return LaserPoint(id, *self.values[id].tolist())
+
+    def __repr__(self) -> str:
+        return f'LaserFrame({self.to_points()})'
+
+    def set(self, id: int, x: float, y: float, r: float = 0, g: float = 0, b: float = 0) -> None:
+        """Sets the point of one laser, truncating the values to integers"""
+        self.values[id] = (x, y, r, g, b)
+
+    def blank(self) -> None:
+        self.values[:] = 0
+
+    def clamp(self):
+        """Constrains all values to valid ranges and returns the frame"""
+        np.clip(self.values, LaserFrame.MIN_VALUES, LaserFrame.MAX_VALUES, out=self.values)
+        return self
+
+def decode_points(points: np.ndarray, x: np.ndarray, y: np.ndarray) -> None:
+    """Unpacks an (n, 6) uint8 array of wire format points into 12 bit x and y arrays"""
+    np.left_shift(points[:, 0], 4, out=x, dtype=np.int32)
+    np.bitwise_or(x, points[:, 1] >> 4, out=x)
+    np.bitwise_and(points[:, 1], 0x0f, out=y, dtype=np.int32)
+    np.left_shift(y, 8, out=y)
+    np.bitwise_or(y, points[:, 2], out=y)
+
+def decode_packet(data: bytes) -> tuple[int, np.ndarray, np.ndarray, np.ndarray]:
+    """Decodes a laser packet into its sequence number and arrays of x, y and rgb values"""
+    points = np.frombuffer(data, dtype=np.uint8, offset=1, count=(len(data) - 1) // BYTES_PER_POINT * BYTES_PER_POINT)
+    points = points.reshape(-1, BYTES_PER_POINT)
+    x = np.empty(len(points), dtype=np.int32)
+    y = np.empty(len(points), dtype=np.int32)
+    decode_points(points, x, y)
+    return data[0], x, y, points[:, 3:].copy()
+
+class PacketReceiver:
+    """Receives laser packets into a reusable buffer and decodes them into reusable arrays,
+    so simulators and capture tools can keep up with the lasers at full rate"""
+    def __init__(self, sock, points_per_packet: int = POINTS_PER_PACKET) -> None:
+        self.sock = sock
+        self.buffer = bytearray(1 + points_per_packet * BYTES_PER_POINT)
+        self._points = np.frombuffer(self.buffer, dtype=np.uint8, offset=1).reshape(points_per_packet, BYTES_PER_POINT)
+        self._x = np.zeros(points_per_packet, dtype=np.int32)
+        self._y = np.zeros(points_per_packet, dtype=np.int32)
+        self.seq = 0
+        self.num_points = 0
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._x[:self.num_points]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._y[:self.num_points]
+
+    @property
+    def rgb(self) -> np.ndarray:
+        return self._points[:self.num_points, 3:]
+
+    def receive(self) -> int:
+        """Waits for the next packet and returns its number of points, or -1 for an empty datagram.
+        The arrays are only valid until the next call."""
+        nbytes = self.sock.recv_into(self.buffer)
+        if nbytes == 0:
+            return -1
+        self.seq = self.buffer[0]
+        self.num_points = (nbytes - 1) // BYTES_PER_POINT
+        decode_points(self._points[:self.num_points], self._x[:self.num_points], self._y[:self.num_points])
+        return self.num_points
+
 class LaserSegment:
     def __init__(self, id: int, p1: LaserPoint=None, p2: LaserPoint=None, color: list[int]=None) -> None:
         self.start = p1 if p1 else LaserPoint(id)
@@ -53,3 +154,74 @@ def get_segment_data(segs: list[LaserSegment]) -> tuple[list, list]:
             segments.append([[seg.start.x, seg.start.y], [seg.end.x, seg.end.y]])
             colors.append(seg.color)
     return (segments, colors)
+
+class PacketEncoder:
+    """Packs blocks of points for all lasers into preallocated packet buffers"""
+    def __init__(self, num_lasers: int, points_per_packet: int = POINTS_PER_PACKET, clipper=None) -> None:
+        self.num_lasers = num_lasers
+        self.points_per_packet = points_per_packet
+        # Object with a clip method applied to each block encode_stream gathers, such as a surface_clipper.SurfaceClipper
+        self.clipper = clipper
+        self.packets = np.zeros((num_lasers, 1 + points_per_packet * BYTES_PER_POINT), dtype=np.uint8)
+        self._points = self.packets[:, 1:].reshape(num_lasers, points_per_packet, BYTES_PER_POINT)
+        self._bytes = [self._points[:, :, i] for i in range(3)]
+        self._rgb = self._points[:, :, 3:]
+        self._scratch = np.zeros((2, num_lasers, points_per_packet), dtype=np.int32)
+        self._block = np.zeros((num_lasers, points_per_packet, 5), dtype=np.int32)
+        self._leftover = None
+        self.generate_time = 0
+
+    def encode(self, seq: int, block: np.ndarray) -> np.ndarray:
+        """Encodes a (num_lasers, points_per_packet, 5) block of x, y, r, g, b values
+        into the 12 bit XY + RGB wire format, one packet per laser"""
+        x = block[:, :, 0]
+        y = block[:, :, 1]
+        hi, lo = self._scratch
+        self.packets[:, 0] = seq
+        np.right_shift(x, 4, out=hi)
+        np.copyto(self._bytes[0], hi, casting='unsafe')
+        np.bitwise_and(x, 0xf, out=hi)
+        np.left_shift(hi, 4, out=hi)
+        np.right_shift(y, 8, out=lo)
+        np.bitwise_or(hi, lo, out=hi)
+        np.copyto(self._bytes[1], hi, casting='unsafe')
+        np.bitwise_and(y, 0xff, out=hi)
+        np.copyto(self._bytes[2], hi, casting='unsafe')
+        np.copyto(self._rgb, block[:, :, 2:], casting='unsafe')
+        return self.packets
+
+    def encode_stream(self, seq: int, gen) -> np.ndarray:
+        """Encodes the next points_per_packet points from a generator.
+
+        The generator may yield a LaserFrame, a list with one LaserPoint per laser, or a
+        (num_lasers, n, 5) array of n points per laser. Points of an array that do not
+        fit into this packet are carried over to the next packet from the same generator.
+        The time spent in the generator is kept in generate_time."""
+        filled = 0
+        self.generate_time = 0
+        while filled < self.points_per_packet:
+            if self._leftover is not None and self._leftover[0] is gen:
+                item = self._leftover[1]
+            else:
+                start = time.perf_counter()
+                item = next(gen)
+                self.generate_time += time.perf_counter() - start
+            self._leftover = None
+
+            # Items are copied straight away, since generators may reuse them between yields
+            if isinstance(item, LaserFrame):
+                self._block[:, filled] = item.values
+                filled += 1
+            elif isinstance(item, np.ndarray):
+                count = min(item.shape[1], self.points_per_packet - filled)
+                self._block[:, filled:filled + count] = item[:, :count]
+                filled += count
+                if count < item.shape[1]:
+                    self._leftover = (gen, item[:, count:])
+            else:
+                self._block[:, filled] = [(p.x, p.y, p.r, p.g, p.b) for p in item]
+                filled += 1
+
+        if self.clipper is not None:
+            self.clipper.clip(self._block)
+        return self.encode(seq, self._block)
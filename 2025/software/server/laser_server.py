@@ -1,68 +1,232 @@
 """This module generates data for the lasers"""
 
-import socket
 import time
 import threading
+import firmware_model
 import laser_generators
+import laser_point
+import laser_telemetry
+import packet_ring
+import packet_sender
+import surface_clipper
 import utilities
 
+PACKET_DELAY = firmware_model.PACKET_DELAY
+# Points kept queued on each laser. With the default lookahead of 2 packets this holds about
+# 100 ms of content between the generators and the galvos, and the emulator sees no underruns
+BUFFER_TARGET = 2 * laser_point.POINTS_PER_PACKET
+# Clips everything the generators draw to the face of the pyramid each laser projects onto.
+# Off by default, since audio visualization and wand drawing draw much of their output past
+# the face and would lose it (python surface_clipper.py reports how much)
+CLIP_TO_SURFACE = False
+
+# Maps mode number to the generator that draws it
+GENERATORS = {
+    1: None,
+    2: laser_generators.audio_visualization,
+    3: laser_generators.equations,
+    4: laser_generators.spirograph,
+    5: laser_generators.pong,
+    6: laser_generators.drums_graphics,
+    7: laser_generators.wand_drawing,
+    8: None,
+    9: laser_generators.calibration
+}
+
+def next_mode(mode: int) -> int:
+    """Returns the mode that is most likely to be selected after mode"""
+    modes = [m for m, gen in GENERATORS.items() if gen is not None]
+    return next((m for m in modes if m > mode), modes[0])
+
+class GeneratorCache:
+    """Creates the generator for each mode on first use, or ahead of time in a background thread"""
+    def __init__(self, num_lasers: int) -> None:
+        self.num_lasers = num_lasers
+        self.generators = {}
+        # Maps each mode whose generator is being created to an event set when that finishes
+        self.warming = {}
+        self.lock = threading.Lock()
+
+    def get(self, mode: int):
+        """Returns the generator for a mode, or None if the mode has no generator"""
+        if GENERATORS.get(mode) is None:
+            return None
+        while True:
+            with self.lock:
+                if (gen := self.generators.get(mode)) is not None:
+                    return gen
+                if (done := self.warming.get(mode)) is None:
+                    self.warming[mode] = threading.Event()
+                    break
+            # Another thread is already setting it up, so wait for that rather than running the setup twice
+            done.wait()
+        return self._create(mode)
+
+    def warm_up(self, mode: int) -> None:
+        """Creates the generator for a mode in the background so switching to it is fast"""
+        with self.lock:
+            if GENERATORS.get(mode) is None or mode in self.generators or mode in self.warming:
+                return
+            self.warming[mode] = threading.Event()
+        threading.Thread(target=self._create, args=(mode,), daemon=True).start()
+
+    def _create(self, mode: int):
+        """Sets up the generator for a mode the caller has marked as warming"""
+        try:
+            gen = GENERATORS[mode](self.num_lasers)
+            # Generators do their setup on the first call to next, so run it here rather than in the first packet
+            next(gen)
+            with self.lock:
+                self.generators[mode] = gen
+            return gen
+        finally:
+            # A failed warm-up is not left marked as in progress, so the next get tries again
+            with self.lock:
+                self.warming.pop(mode).set()
+
+def create_encoder(num_lasers: int) -> laser_point.PacketEncoder:
+    """Returns the encoder generator output goes through, clipping it to the surface if enabled"""
+    return laser_point.PacketEncoder(num_lasers, clipper=surface_clipper.SurfaceClipper(num_lasers) if CLIP_TO_SURFACE else None)
+
+def fill_ring(ring: packet_ring.PacketRing, encoder: laser_point.PacketEncoder, gen, tag: int = 0) -> bool:
+    """Encodes the next packet from gen into the ring, returns False if the ring is full"""
+    if (slot := ring.writable_slot()) is None:
+        return False
+    start = time.perf_counter()
+    slot[:] = encoder.encode_stream(0, gen)
+    elapsed = time.perf_counter() - start
+    ring.commit(tag, encoder.generate_time, elapsed - encoder.generate_time)
+    return True
+
 class LaserServer:
     """This class generates data for the lasers"""
-    def __init__(self, num_lasers: int, host_ip: str, wands=None) -> None:
+    def __init__(self, num_lasers: int, host_ip: str, wands=None, lookahead: int=2,
+                 use_worker_process: bool=False, buffer_target: int=BUFFER_TARGET,
+                 warm_up: bool=True) -> None:
         if host_ip == '127.0.0.1':
             self.targets = [(host_ip, 8090 + i) for i in range(num_lasers)]
         else:
             self.targets = [(f'10.0.0.{10 + i}', 8090) for i in range(num_lasers)]
 
         laser_generators.current_wands = wands
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.server = threading.Thread(target=self._server, daemon=True)
+        self.producer = threading.Thread(target=self._producer, daemon=True)
         self.server_running = False
-        self.mode = 0
+        self.buffer_models = [firmware_model.BufferModel(target_fill=buffer_target) for _ in range(num_lasers)]
+        self.underruns = 0
+        self.send_lateness = 0
+        self.max_send_lateness = 0
+        self.dropped_packets = 0
+        self.telemetry = laser_telemetry.LaserTelemetry(num_lasers)
+        # Time from a mode switch until the first points of the new mode play, after the old ones have drained
+        self.switch_latency = 0
+        self._switch_time = None
+        self._mode = 0
         self.num_lasers = num_lasers
-        self.mode_list = {
-            1: None, 
-            2: laser_generators.audio_visualization(num_lasers),
-            3: laser_generators.equations(num_lasers),
-            4: laser_generators.spirograph(num_lasers),
-            5: laser_generators.pong(num_lasers),
-            6: laser_generators.drums_graphics(num_lasers),
-            7: laser_generators.wand_drawing(num_lasers),
-            8: None,
-            9: laser_generators.calibration(num_lasers)
-        }
-
-    def _server(self):
+        self.warm_up = warm_up
+        if use_worker_process:
+            import laser_worker
+            self.worker = laser_worker.GeneratorWorker(num_lasers, lookahead, wands, warm_up)
+            self.ring = packet_ring.PacketRing(lookahead, num_lasers, self.worker.buffer)
+            self.mode_list = None
+        else:
+            self.worker = None
+            self.ring = packet_ring.PacketRing(lookahead, num_lasers)
+            self.mode_list = GeneratorCache(num_lasers)
+
+    @property
+    def mode(self) -> int:
+        return self._mode
+
+    @mode.setter
+    def mode(self, mode: int) -> None:
+        self._switch_time = time.monotonic() if GENERATORS.get(mode) is not None else None
+        self._mode = mode
+        if self.worker:
+            self.worker.set_mode(mode)
+        elif self.warm_up:
+            self.mode_list.warm_up(next_mode(mode))
+
+    @property
+    def queue_depth(self) -> int:
+        return self.ring.depth if self.ring else 0
+
+    def _producer(self) -> None:
+        encoder = create_encoder(self.num_lasers)
+        while self.server_running:
+            mode = self.mode
+            gen = self.mode_list.get(mode)
+            if gen is None or not fill_ring(self.ring, encoder, gen, mode):
+                time.sleep(PACKET_DELAY / 4)
+
+    def _server(self) -> None:
         for target_ip, _ in self.targets:
             if not utilities.ping(target_ip):
                 print(f'Could not ping {target_ip}!')
-            
-        PACKET_DELAY = 0.0258
-        last_sent = 0
-        seq = 0
-        packet = None
+
+        if self.worker:
+            self.worker.start()
+        else:
+            self.producer.start()
+        sender = packet_sender.PacketSender(self.ring, self.targets)
+        deadlines = [0] * self.num_lasers
+        due = [False] * self.num_lasers
+        starved = [False] * self.num_lasers
+        visible = [0] * self.num_lasers
         while self.server_running:
-            if self.mode not in self.mode_list or self.mode_list[self.mode] is None:
+            # Packets queued before a mode switch are dropped so the new mode is sent as soon as it is ready
+            mode = self.mode
+            for i in range(self.num_lasers):
+                self.dropped_packets += self.ring.discard_stale(i, mode)
+
+            now = time.monotonic()
+            for i, model in enumerate(self.buffer_models):
+                deadlines[i] = model.next_send_time()
+            if now < min(deadlines):
+                time.sleep(min(min(deadlines) - now, PACKET_DELAY))
                 continue
 
-            if not packet and (gen := self.mode_list[self.mode]):
-                packet = [[seq] for _ in range(self.num_lasers)]
-                for _ in range(170):
-                    p = next(gen)
-                    for i in range(self.num_lasers):
-                        packet[i].extend(p[i].get_bytes())
-                seq = (seq + 1) % 255
-
-            new_time = time.time()
-            if packet and new_time - last_sent > PACKET_DELAY:
-                for i in range(self.num_lasers):
-                    self.sock.sendto(bytearray(packet[i]), self.targets[i])
-                last_sent = new_time
-                packet = None
+            waiting = False
+            for i, model in enumerate(self.buffer_models):
+                slot = self.ring.readable_slot(i)
+                due[i] = deadlines[i] <= now and slot is not None
+                if due[i]:
+                    if model.last_update is not None and not starved[i]:
+                        self.send_lateness = now - deadlines[i]
+                        self.max_send_lateness = max(self.max_send_lateness, self.send_lateness)
+                        self.telemetry.on_jitter(i, self.send_lateness)
+                    self.telemetry.on_send(i, self.ring.slots[slot, i], *self.ring.timings[slot])
+                    # The packet starts to play once the points already queued ahead of it have drained
+                    visible[i] = now + model.update(now) * model.point_period
+                    model.on_send(now)
+                    starved[i] = False
+                elif deadlines[i] <= now:
+                    waiting = True
+                    if not starved[i] and GENERATORS.get(mode) is not None:
+                        self.underruns += 1
+                        starved[i] = True
+            sender.send(due)
+
+            if self._switch_time is not None and mode == self.mode and any(due):
+                self.switch_latency = max(visible[i] for i in range(self.num_lasers) if due[i]) - self._switch_time
+                self._switch_time = None
+                print(f'Switched to mode {mode}, visible after {self.switch_latency * 1000:.1f} ms')
+
+            if waiting:
+                time.sleep(PACKET_DELAY / 4)
+
+        sender.close()
+        if self.worker:
+            # The ring lives in the worker's shared memory, so release it before the worker frees it
+            self.ring = None
+            self.worker.stop()
+        else:
+            self.producer.join()
     
     def start(self) -> None:
         if not self.server_running:
             print(f'Starting laser server targeting {self.targets}')
+            self.telemetry.start()
             self.server_running = True
             self.server.start()
             
@@ -71,12 +235,17 @@ class LaserServer:
             print('Stopping laser server')
             self.server_running = False
             self.server.join()
+            self.telemetry.stop()
 
     def set_effect(self, effect) -> None:
         laser_generators.current_effect = effect
+        if self.worker:
+            self.worker.effect = effect
 
     def set_song(self, song) -> None:
         laser_generators.current_song = song
+        if self.worker:
+            self.worker.song = song
 
     def set_song_handler(self, song_handler) -> None:
         laser_generators.song_handler = song_handler
@@ -89,7 +258,7 @@ if __name__ == '__main__':
     server.start()
     try:
         while True:
-            for i in server.mode_list:
+            for i in GENERATORS:
                 server.mode = i
                 time.sleep(5)
     except KeyboardInterrupt:
@@ -16,25 +16,24 @@ segments = [[laser_point.LaserSegment(i)] for i in range(NUM_LASERS)]
 def _laser_thread(laser_index):
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     sock.bind(('127.0.0.1', 8090 + laser_index))
+    receiver = laser_point.PacketReceiver(sock)
     curr_seq = 0
     while True:
-        data, _ = sock.recvfrom(1024)
-        raw_bytes = list(data)
-        seq = raw_bytes.pop(0)
+        if receiver.receive() < 0:
+            continue
+        seq = receiver.seq
         if seq != (curr_seq + 1) % 255:
             curr_seq = seq
             continue
         curr_seq = seq
 
-        for i in range(0, len(raw_bytes), 6):
-            chunk = raw_bytes[i:i + 6]
-            if len(chunk) != 6:
-                break
-            new_point = laser_point.LaserPoint.from_bytes(laser_index, chunk)
-            segments[laser_index].append(laser_point.LaserSegment(laser_index, segments[laser_index][-1].end, new_point, 
-                                                    [new_point.r / 255, new_point.g / 255, new_point.b / 255]))
-            while len(segments[laser_index]) > MAX_POINTS:
-                segments[laser_index].pop(0)
+        # Only the last MAX_POINTS points are ever drawn
+        start = max(receiver.num_points - MAX_POINTS, 0)
+        rgb = (receiver.rgb[start:] / 255).tolist()
+        for x, y, color in zip(receiver.x[start:].tolist(), receiver.y[start:].tolist(), rgb):
+            new_point = laser_point.LaserPoint(laser_index, x, y)
+            segments[laser_index].append(laser_point.LaserSegment(laser_index, segments[laser_index][-1].end, new_point, color))
+        del segments[laser_index][:-MAX_POINTS]
 
 fig = plt.figure()
 
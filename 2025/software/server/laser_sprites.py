@@ -0,0 +1,122 @@
+"""Precompiles the IMG_* frame sets into sprite animations
+
+Each frame of an animation is made of parts, such as the cat's body and one of its
+tails, drawn in the part's color. Every part is ordered and resampled on its own and
+padded to the same length in every frame, so a part that does not change lines up
+point for point between frames and the parts that do can be blended into in-between
+frames. The frames are then laid out into one timeline of whole passes over each
+frame at close to a fixed frame rate, so playing a sprite is only a walk along that
+array."""
+
+import functools
+import numpy as np
+import firmware_model
+import galvo_resampler
+import laser_objects
+import stroke_optimizer
+
+WHITE = (255, 255, 255)
+PINK = (255, 0, 255)
+CYAN = (0, 255, 255)
+GOLD = (255, 160, 0)
+
+# Maps animation name to its frames, each a list of graphic names and colors
+ANIMATIONS = {
+    'nyan_cat': [[('IMG_CATBODY', WHITE), (f'IMG_CATTAIL{i}', PINK)] for i in range(1, 7)],
+    'flying_toaster': [[('IMG_TOASTER', WHITE), (f'IMG_WING{wing}', CYAN)] for wing in ['DOWN', 'MID', 'TOP', 'MID']],
+    'toast': [[('IMG_TOAST', GOLD)]],
+}
+
+FRAME_RATE = 8
+# In-between frames blended from each pair of neighbouring frames
+MORPH_STEPS = 1
+
+class Sprite:
+    """Compiled animation, frames is an (F, N, 5) array and timeline the points of one cycle at close to FRAME_RATE"""
+    def __init__(self, name: str, frames: np.ndarray, timeline: np.ndarray, size: tuple[int, int]) -> None:
+        self.name = name
+        self.frames = frames
+        self.timeline = timeline
+        self.size = size
+
+    def __repr__(self) -> str:
+        return f'Sprite(Name: {self.name}, Frames: {len(self.frames)}, Points: {self.frames.shape[1]}, Timeline: {len(self.timeline)})'
+
+def _pad(points: np.ndarray, length: int) -> np.ndarray:
+    """Stretches points to length by repeating points spread evenly along the path"""
+    return points[np.arange(length) * len(points) // length]
+
+def _part_points(strokes: list[list[tuple[int, int]]], start: list[int], end: list[int]) -> np.ndarray:
+    """Resamples a part starting with a blanked jump from start, and ending with one to end if given"""
+    obj = [start] + [[x, y, 1 if i > 0 else 0] for stroke in strokes for i, (x, y) in enumerate(stroke)]
+    if end is not None:
+        obj.append(end)
+    # The start point was drawn by the previous part
+    return galvo_resampler.resample(obj)[1:]
+
+def _blend(a: np.ndarray, b: np.ndarray, t: float) -> np.ndarray:
+    """Returns a frame between a and b, lit only where both are so blanked jumps never light up"""
+    frame = np.empty_like(a)
+    frame[:, :2] = np.rint(a[:, :2] * (1 - t) + b[:, :2] * t)
+    frame[:, 2:] = np.where((a[:, 2:].any(axis=1) & b[:, 2:].any(axis=1))[:, None], a[:, 2:], 0)
+    return frame
+
+@functools.lru_cache(maxsize=None)
+def compile_sprite(name: str, scale: float) -> Sprite:
+    """Returns an animation compiled into frames of equal length, centered on the middle of all its frames"""
+    frames = ANIMATIONS[name]
+    parts = [[[[(int(x * scale), int(y * scale)) for x, y in stroke]
+                for stroke in stroke_optimizer.order_strokes(stroke_optimizer.split_strokes(getattr(laser_objects, graphic).tolist()), scale)]
+               for graphic, _ in frame] for frame in frames]
+    xs = [x for frame in parts for part in frame for stroke in part for x, _ in stroke]
+    ys = [y for frame in parts for part in frame for stroke in part for _, y in stroke]
+    mid_x, mid_y = (min(xs) + max(xs)) // 2, (min(ys) + max(ys)) // 2
+    parts = [[[[(x - mid_x, y - mid_y) for x, y in stroke] for stroke in part] for part in frame] for frame in parts]
+
+    # Each part jumps from the end of the one before it, and the last part back to the start of the first
+    resampled = []
+    for frame in parts:
+        first = [*frame[0][0][0], 0]
+        ends = [[*part[-1][-1], 0] for part in frame]
+        resampled.append([_part_points(part, first if p == 0 else ends[p - 1], first if p == len(frame) - 1 else None)
+                          for p, part in enumerate(frame)])
+    lengths = [max(len(frame[p]) for frame in resampled) for p in range(len(frames[0]))]
+
+    compiled = np.zeros((len(frames), sum(lengths), 5), dtype=np.int32)
+    for f, frame in enumerate(resampled):
+        start = 0
+        for p, (points, length) in enumerate(zip(frame, lengths)):
+            padded = _pad(points, length)
+            compiled[f, start:start + length, :2] = padded[:, :2]
+            compiled[f, start:start + length, 2:] = np.outer(padded[:, 2] != 0, frames[f][p][1])
+            start += length
+
+    if len(compiled) > 1:
+        steps = [_blend(compiled[f], compiled[(f + 1) % len(compiled)], s / (MORPH_STEPS + 1))
+                 for f in range(len(compiled)) for s in range(MORPH_STEPS + 1)]
+        compiled = np.array(steps)
+
+    # Each frame is drawn the whole number of passes closest to its share of the frame rate, so
+    # every pass is complete and every frame is drawn equally bright
+    passes = max(1, round(1 / ((MORPH_STEPS + 1) * FRAME_RATE * firmware_model.POINT_PERIOD * compiled.shape[1])))
+    if len(compiled) > 1:
+        timeline = np.tile(compiled, (1, passes, 1)).reshape(-1, 5)
+    else:
+        timeline = compiled[0].copy()
+    compiled.flags.writeable = False
+    timeline.flags.writeable = False
+    return Sprite(name, compiled, timeline, (max(xs) - min(xs), max(ys) - min(ys)))
+
+if __name__ == '__main__':
+    import argparse
+    import time
+    parser = argparse.ArgumentParser(description='Compiles every animation and reports its size')
+    parser.add_argument('--scale', type=float, default=0.3)
+    args = parser.parse_args()
+
+    for name in ANIMATIONS:
+        start = time.perf_counter()
+        sprite = compile_sprite(name, args.scale)
+        cycle = len(sprite.timeline) * firmware_model.POINT_PERIOD
+        rate = f' at {len(sprite.frames) / (MORPH_STEPS + 1) / cycle:.1f} frames/s' if len(sprite.frames) > 1 else ''
+        print(f'{sprite} in {(time.perf_counter() - start) * 1000:.1f} ms, {cycle:.2f} s per cycle{rate}')
@@ -0,0 +1,180 @@
+"""Collects per-laser output statistics and serves them as JSON over local UDP"""
+
+import json
+import socket
+import threading
+import time
+import numpy as np
+import laser_point
+
+PORT = 8089
+# Upper bounds of the histogram buckets in microseconds, the last bucket catches everything slower
+BUCKET_BOUNDS_US = [10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 50000]
+RATE_WINDOW = 1.0
+
+class Histogram:
+    """Counts durations in fixed buckets"""
+    def __init__(self) -> None:
+        self.bounds = np.array(BUCKET_BOUNDS_US, dtype=np.float64) / 1e6
+        self.counts = np.zeros(len(self.bounds) + 1, dtype=np.int64)
+        self.total = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.counts[np.searchsorted(self.bounds, seconds)] += 1
+        self.total += seconds
+
+    def percentile(self, q: float) -> float:
+        """Returns the upper bound in microseconds of the bucket holding the q-th percentile,
+        or the last bound when it falls in the overflow bucket"""
+        count = self.counts.sum()
+        if count == 0:
+            return 0
+        bucket = int(np.searchsorted(np.cumsum(self.counts), count * q / 100))
+        return BUCKET_BOUNDS_US[min(bucket, len(BUCKET_BOUNDS_US) - 1)]
+
+    def to_dict(self) -> dict:
+        count = int(self.counts.sum())
+        return {'bounds_us': BUCKET_BOUNDS_US,
+                'counts': self.counts.tolist(),
+                'mean_us': self.total / count * 1e6 if count else 0,
+                'p50_us': self.percentile(50),
+                'p99_us': self.percentile(99)}
+
+class LaserStats:
+    """Counters and histograms for the packets sent to one laser"""
+    def __init__(self) -> None:
+        self.packets = 0
+        self.points = 0
+        self.lit_points = 0
+        self.generate_time = Histogram()
+        self.encode_time = Histogram()
+        self.send_jitter = Histogram()
+        self.packet_rate = 0.0
+        self.point_rate = 0.0
+        self.window_packets = 0
+
+    def to_dict(self) -> dict:
+        return {'packets': self.packets,
+                'points': self.points,
+                'packets_per_second': self.packet_rate,
+                'points_per_second': self.point_rate,
+                'lit_ratio': self.lit_points / self.points if self.points else 0,
+                'generate_time': self.generate_time.to_dict(),
+                'encode_time': self.encode_time.to_dict(),
+                'send_jitter': self.send_jitter.to_dict()}
+
+class LaserTelemetry:
+    """Records what the laser server sends and answers any datagram on PORT with a JSON snapshot"""
+    def __init__(self, num_lasers: int, port: int = PORT) -> None:
+        self.lasers = [LaserStats() for _ in range(num_lasers)]
+        self.port = port
+        self.window_start = time.monotonic()
+        # Held by the sender thread while recording and by readers while they take a snapshot
+        self.lock = threading.Lock()
+        self.server_running = False
+        self.server = None
+
+    def on_send(self, laser_index: int, packet: np.ndarray, generate_time: float, encode_time: float) -> None:
+        """Records a packet sent to a laser along with the time it took to produce"""
+        rgb = packet[1:].reshape(-1, laser_point.BYTES_PER_POINT)[:, 3:]
+        lit_points = int(np.count_nonzero(rgb.any(axis=1)))
+        with self.lock:
+            stats = self.lasers[laser_index]
+            stats.packets += 1
+            stats.points += len(rgb)
+            stats.lit_points += lit_points
+            stats.generate_time.add(generate_time)
+            stats.encode_time.add(encode_time)
+
+    def on_jitter(self, laser_index: int, lateness: float) -> None:
+        with self.lock:
+            self.lasers[laser_index].send_jitter.add(abs(lateness))
+
+    def _update_rates(self) -> None:
+        """Recomputes the packet and point rates once a full window has passed, with the lock held"""
+        now = time.monotonic()
+        elapsed = now - self.window_start
+        if elapsed < RATE_WINDOW:
+            return
+        for stats in self.lasers:
+            stats.packet_rate = (stats.packets - stats.window_packets) / elapsed
+            stats.point_rate = stats.packet_rate * laser_point.POINTS_PER_PACKET
+            stats.window_packets = stats.packets
+        self.window_start = now
+
+    def update_rates(self) -> None:
+        with self.lock:
+            self._update_rates()
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            self._update_rates()
+            return {'time': time.time(), 'lasers': [stats.to_dict() for stats in self.lasers]}
+
+    def summary(self) -> str:
+        """Returns a one line summary for the control station"""
+        with self.lock:
+            self._update_rates()
+            points = sum(stats.points for stats in self.lasers)
+            lit = sum(stats.lit_points for stats in self.lasers) / points if points else 0
+            rate = min(stats.packet_rate for stats in self.lasers)
+            jitter = max(stats.send_jitter.percentile(99) for stats in self.lasers)
+        return f'{rate:.1f} pkt/s, {lit:.0%} lit, p99 jitter {jitter / 1000:.1f} ms'
+
+    def start(self, required: bool = False) -> bool:
+        """Binds the endpoint and starts answering requests, returning whether it is serving.
+
+        Recording works without the endpoint, so a port that cannot be bound is only logged,
+        unless required is set, in which case the OSError is raised."""
+        if not self.server_running:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            try:
+                sock.bind(('127.0.0.1', self.port))
+            except OSError as e:
+                sock.close()
+                if required:
+                    raise
+                print(f'Telemetry endpoint disabled, could not bind port {self.port}: {e}')
+                return False
+            self.server_running = True
+            self.server = threading.Thread(target=self._server, args=(sock,), daemon=True)
+            self.server.start()
+        return True
+
+    def stop(self) -> None:
+        if self.server_running:
+            self.server_running = False
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.sendto(bytes([]), ('127.0.0.1', self.port))
+            sock.close()
+            self.server.join()
+
+    def _server(self, sock: socket.socket) -> None:
+        while self.server_running:
+            data, addr = sock.recvfrom(64)
+            if len(data) == 0:
+                continue
+            sock.sendto(json.dumps(self.snapshot()).encode(), addr)
+        sock.close()
+
+def request_snapshot(port: int = PORT, timeout: float = 1.0) -> dict:
+    """Asks a running laser server for its telemetry"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.settimeout(timeout)
+    try:
+        sock.sendto(b'?', ('127.0.0.1', port))
+        data, _ = sock.recvfrom(65536)
+        return json.loads(data)
+    finally:
+        sock.close()
+
+if __name__ == '__main__':
+    while True:
+        try:
+            for i, laser in enumerate(request_snapshot()['lasers']):
+                print(f'Laser {i}: {laser["packets_per_second"]:5.1f} packets/s, {laser["points_per_second"]:7.0f} points/s, '
+                      f'{laser["lit_ratio"]:4.0%} lit, generate p99 {laser["generate_time"]["p99_us"]} us, '
+                      f'encode p99 {laser["encode_time"]["p99_us"]} us, jitter p99 {laser["send_jitter"]["p99_us"]} us')
+        except socket.timeout:
+            print('No response from the laser server')
+        time.sleep(1)
@@ -0,0 +1,116 @@
+"""Lays out strings with the CHAR_* glyphs and compiles them into laser paths
+
+Glyphs are 1000 units tall. Each pair of glyphs is kerned by comparing the right edge
+of the first with the left edge of the second in horizontal bands, so that pairs like
+AV close up while pairs like HI keep their spacing. The strokes of a string are ordered
+as one path by stroke_optimizer and resampled by galvo_resampler, and compiled strings
+are kept in an LRU cache so drawing the same string again costs nothing."""
+
+import functools
+import string
+import numpy as np
+import galvo_resampler
+import laser_objects
+import stroke_optimizer
+
+GLYPH_HEIGHT = 1000
+LETTER_SPACING = 150
+SPACE_WIDTH = 500
+# Bands the glyph height is split into when kerning, and how much of the space between two glyphs' edges
+# beyond the letter spacing kerning closes up
+KERNING_BANDS = 10
+KERNING_FACTOR = 0.5
+
+GLYPHS = {c: f'CHAR_{c}' for c in string.ascii_uppercase + string.digits}
+
+def glyph_char(c: str) -> str:
+    """Returns the glyph drawn for a character, or a space if there is none"""
+    c = c.upper()
+    return c if c in GLYPHS else ' '
+
+@functools.lru_cache(maxsize=None)
+def glyph_strokes(c: str) -> tuple[tuple[tuple[int, int], ...], ...]:
+    """Returns the strokes of a glyph with its left edge at x = 0"""
+    if c == ' ':
+        return ()
+    strokes = stroke_optimizer.split_strokes(getattr(laser_objects, GLYPHS[c]).tolist())
+    left = min(x for stroke in strokes for x, _ in stroke)
+    return tuple(tuple((x - left, y) for x, y in stroke) for stroke in strokes)
+
+@functools.lru_cache(maxsize=None)
+def glyph_width(c: str) -> int:
+    strokes = glyph_strokes(c)
+    return max(x for stroke in strokes for x, _ in stroke) if strokes else SPACE_WIDTH
+
+@functools.lru_cache(maxsize=None)
+def _profile(c: str) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the leftmost and rightmost x of the glyph's lit lines in each band, NaN where a band is empty"""
+    left = np.full(KERNING_BANDS, np.nan)
+    right = np.full(KERNING_BANDS, np.nan)
+    for stroke in glyph_strokes(c):
+        points = np.array(stroke, dtype=np.float64)
+        if len(points) > 1:
+            # Sample along each line so bands it crosses without a vertex are covered
+            t = np.linspace(0, 1, 16)[:, None, None]
+            points = (points[:-1] + t * (points[1:] - points[:-1])).reshape(-1, 2)
+        bands = np.clip((points[:, 1] * KERNING_BANDS // (GLYPH_HEIGHT + 1)).astype(int), 0, KERNING_BANDS - 1)
+        for band in np.unique(bands):
+            xs = points[bands == band, 0]
+            left[band] = np.fmin(left[band], xs.min())
+            right[band] = np.fmax(right[band], xs.max())
+    return left, right
+
+@functools.lru_cache(maxsize=None)
+def kerning(first: str, second: str) -> int:
+    """Returns how far the second glyph can move left of its unkerned position next to the first"""
+    if first == ' ' or second == ' ':
+        return 0
+    gaps = glyph_width(first) - _profile(first)[1] + _profile(second)[0]
+    if np.all(np.isnan(gaps)):
+        return 0
+    return int(np.nanmin(gaps) * KERNING_FACTOR)
+
+def layout(text: str) -> tuple[list[int], int]:
+    """Returns the x position of each character in text and the total width"""
+    chars = [glyph_char(c) for c in text]
+    positions = []
+    pen = 0
+    for i, c in enumerate(chars):
+        if i > 0:
+            pen += LETTER_SPACING - kerning(chars[i - 1], c)
+        positions.append(pen)
+        pen += glyph_width(c)
+    return positions, pen
+
+@functools.lru_cache(maxsize=256)
+def compile_text(text: str, scale: float) -> np.ndarray:
+    """Returns text drawn as one looped path in an (N, 3) array of x, y, on values, left edge at x = 0.
+
+    The array is shared by every caller asking for the same string, so it is read-only."""
+    positions, _ = layout(text)
+    strokes = [[(x + pen, y) for x, y in stroke]
+               for c, pen in zip(map(glyph_char, text), positions) for stroke in glyph_strokes(c)]
+    if not strokes:
+        points = np.zeros((1, 3), dtype=np.int32)
+        points.flags.writeable = False
+        return points
+    obj = [[int(x * scale), int(y * scale), 1 if i > 0 else 0]
+           for stroke in stroke_optimizer.order_strokes(strokes, scale) for i, (x, y) in enumerate(stroke)]
+    obj.append(obj[0])
+    points = galvo_resampler.resample(obj)
+    points.flags.writeable = False
+    return points
+
+if __name__ == '__main__':
+    import argparse
+    import time
+    parser = argparse.ArgumentParser(description='Compiles a string and reports its size and compile time')
+    parser.add_argument('text', nargs='?', default='HELLO WORLD')
+    parser.add_argument('--scale', type=float, default=0.2)
+    args = parser.parse_args()
+
+    for attempt in ['first', 'cached']:
+        start = time.perf_counter()
+        points = compile_text(args.text, args.scale)
+        print(f'{attempt:>6}: {len(points)} points in {(time.perf_counter() - start) * 1000:.3f} ms')
+    print(f'Width: {layout(args.text)[1] * args.scale:.0f} units, {compile_text.cache_info()}')
@@ -0,0 +1,208 @@
+"""This module runs the laser generators in a separate process"""
+
+import multiprocessing
+import queue
+import threading
+import time
+from multiprocessing import shared_memory
+import pygame
+import soundfile
+import laser_generators
+import laser_point
+import packet_ring
+import song_handler
+
+STATE_INTERVAL = 0.02
+
+class SongSnapshot(song_handler.Song):
+    """Worker-side copy of the playing song, positioned from published timestamps"""
+    def __init__(self, path: str) -> None:
+        super().__init__(path, 0)
+        self.data, self.sr = soundfile.read(self.path)
+        self.length_s = int(len(self.data) / self.sr)
+        self.pos_ms = 0
+        self.pos_time = time.time()
+
+    def get_data(self, blocksize: int, interval: int) -> list[float]:
+        pos_s = self.pos_ms / 1000 + time.time() - self.pos_time
+        start_index = int(pos_s * self.sr)
+        return [x[0] for x in self.data[start_index:start_index + blocksize]][::interval]
+
+class EffectSnapshot(song_handler.Effect):
+    """Worker-side copy of the playing effect"""
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.name = None
+        self.data, self.sr = soundfile.read(self.path)
+        self.length_s = len(self.data) / self.sr
+        self.start_time = 0
+
+class WandSnapshot:
+    """Worker-side copy of the state of a wand"""
+    def __init__(self, laser_point: laser_point.LaserPoint, button: bool) -> None:
+        self.laser_point = laser_point
+        self.button = button
+
+    def get_laser_point(self) -> laser_point.LaserPoint:
+        return self.laser_point
+
+class SnapshotLoader:
+    """Decodes snapshots of audio files in a background thread, so the worker keeps filling
+    the ring while a song loads rather than letting the lasers run dry"""
+    def __init__(self, create) -> None:
+        self.create = create
+        self.path = None
+        self.snapshot = None
+        self.lock = threading.Lock()
+
+    def get(self, path: str):
+        """Returns the snapshot of a file, starting to decode it if it is new, or None until it is decoded"""
+        with self.lock:
+            if path != self.path:
+                self.path = path
+                self.snapshot = None
+                if path is not None:
+                    threading.Thread(target=self._load, args=(path,), daemon=True).start()
+            return self.snapshot
+
+    def _load(self, path: str) -> None:
+        snapshot = self.create(path)
+        with self.lock:
+            # The file may have changed again while this one was decoding
+            if path == self.path:
+                self.snapshot = snapshot
+
+class SoundRequester:
+    """Forwards sound requests from the worker to the main process"""
+    def __init__(self, events: multiprocessing.Queue) -> None:
+        self.events = events
+
+    def play_pong_sound(self, key: str) -> None:
+        self.events.put(('pong_sound', key))
+
+class GeneratorWorker:
+    """Hosts the laser generators in a worker process that fills a shared memory packet ring"""
+    def __init__(self, num_lasers: int, capacity: int, wands=None, warm_up: bool=True) -> None:
+        self.num_lasers = num_lasers
+        self.capacity = capacity
+        self.wands = wands
+        self.song = None
+        self.effect = None
+        self.shm = shared_memory.SharedMemory(create=True, size=packet_ring.PacketRing.buffer_size(capacity, num_lasers))
+        self.states = multiprocessing.Queue()
+        self.events = multiprocessing.Queue()
+        self.process = multiprocessing.Process(target=_worker_main, daemon=True,
+            args=(self.shm.name, capacity, num_lasers, self.states, self.events, warm_up))
+        self.publish_thread = threading.Thread(target=self._publish_thread, daemon=True)
+        self.event_thread = threading.Thread(target=self._event_thread, daemon=True)
+        self.running = False
+
+    @property
+    def buffer(self) -> memoryview:
+        return self.shm.buf
+
+    def start(self) -> None:
+        if not self.running:
+            self.running = True
+            self.process.start()
+            self.publish_thread.start()
+            self.event_thread.start()
+
+    def stop(self) -> None:
+        """Stops the worker, the packet ring must no longer be in use"""
+        if self.running:
+            self.running = False
+            self.states.put(('stop', None))
+            self.events.put(('stop', None))
+            self.publish_thread.join()
+            self.event_thread.join()
+            self.process.join(timeout=5)
+            self.shm.close()
+            self.shm.unlink()
+
+    def set_mode(self, mode: int) -> None:
+        self.states.put(('mode', mode))
+
+    def _get_state(self) -> dict:
+        song = None
+        if self.song and self.song.data is not None:
+            song = (self.song.path, pygame.mixer.music.get_pos(), time.time())
+        effect = (self.effect.path, self.effect.name, self.effect.start_time) if self.effect else None
+        wands = {}
+        if self.wands is not None:
+            # Only the main process has wands, so the worker process never imports wand
+            import wand
+            connected = [(address, w) for address in list(self.wands) if (w := self.wands.get(address))]
+            laser_points = wand.get_laser_points([w for _, w in connected])
+            for (address, w), lp in zip(connected, laser_points):
+                wands[address] = (lp, w.button)
+        return { 'song': song, 'effect': effect, 'wands': wands }
+
+    def _publish_thread(self) -> None:
+        while self.running:
+            self.states.put(('state', self._get_state()))
+            time.sleep(STATE_INTERVAL)
+
+    def _event_thread(self) -> None:
+        while self.running:
+            event, value = self.events.get()
+            if event == 'pong_sound' and laser_generators.song_handler:
+                laser_generators.song_handler.play_pong_sound(value)
+
+def _apply_state(state: dict, songs: SnapshotLoader, effects: SnapshotLoader) -> None:
+    song = state['song']
+    laser_generators.current_song = songs.get(song[0] if song else None)
+    if laser_generators.current_song is not None:
+        _, pos_ms, pos_time = song
+        laser_generators.current_song.pos_ms = pos_ms
+        laser_generators.current_song.pos_time = pos_time
+
+    effect = state['effect']
+    laser_generators.current_effect = effects.get(effect[0] if effect else None)
+    if laser_generators.current_effect is not None:
+        _, name, start_time = effect
+        laser_generators.current_effect.name = name
+        laser_generators.current_effect.start_time = start_time
+
+    wands = laser_generators.current_wands
+    for address in list(wands):
+        if address not in state['wands']:
+            del wands[address]
+    for address, (lp, button) in state['wands'].items():
+        wands[address] = WandSnapshot(lp, button)
+
+def _worker_main(shm_name: str, capacity: int, num_lasers: int,
+                 states: multiprocessing.Queue, events: multiprocessing.Queue, warm_up: bool) -> None:
+    import laser_server
+    shm = shared_memory.SharedMemory(name=shm_name)
+    ring = packet_ring.PacketRing(capacity, num_lasers, shm.buf)
+    encoder = laser_server.create_encoder(num_lasers)
+    laser_generators.song_handler = SoundRequester(events)
+    laser_generators.current_wands = {}
+    mode_list = laser_server.GeneratorCache(num_lasers)
+    songs = SnapshotLoader(SongSnapshot)
+    effects = SnapshotLoader(EffectSnapshot)
+    mode = 0
+
+    running = True
+    while running:
+        try:
+            while True:
+                message, value = states.get_nowait()
+                if message == 'state':
+                    _apply_state(value, songs, effects)
+                elif message == 'mode':
+                    mode = value
+                    if warm_up:
+                        mode_list.warm_up(laser_server.next_mode(mode))
+                elif message == 'stop':
+                    running = False
+        except queue.Empty:
+            pass
+
+        gen = mode_list.get(mode)
+        if gen is None or not laser_server.fill_ring(ring, encoder, gen, mode):
+            time.sleep(laser_server.PACKET_DELAY / 4)
+
+    del ring
+    shm.close()
@@ -0,0 +1,71 @@
+"""Defines a ring buffer of pre-encoded laser packets"""
+
+import numpy as np
+import laser_point
+
+PACKET_SIZE = 1 + laser_point.POINTS_PER_PACKET * laser_point.BYTES_PER_POINT
+
+class PacketRing:
+    """Single producer ring of packets for all lasers, where each laser is read at its own pace.
+
+    The write and per-laser read counters live in the same buffer as the packets,
+    so the ring can also be placed in shared memory and used across processes.
+    Each slot is tagged with the mode that produced it, so stale packets can be
+    skipped after a mode switch, and with the time it took to generate and encode."""
+    def __init__(self, capacity: int, num_lasers: int, buffer=None) -> None:
+        self.capacity = capacity
+        self.num_lasers = num_lasers
+        if buffer is None:
+            buffer = bytearray(PacketRing.buffer_size(capacity, num_lasers))
+        self._written = np.ndarray((1,), dtype=np.int64, buffer=buffer)
+        self._read = np.ndarray((num_lasers,), dtype=np.int64, buffer=buffer, offset=8)
+        self.tags = np.ndarray((capacity,), dtype=np.int64, buffer=buffer, offset=8 * (1 + num_lasers))
+        self.timings = np.ndarray((capacity, 2), dtype=np.float64, buffer=buffer, offset=8 * (1 + num_lasers + capacity))
+        self.slots = np.ndarray((capacity, num_lasers, PACKET_SIZE), dtype=np.uint8,
+                                buffer=buffer, offset=PacketRing.header_size(capacity, num_lasers))
+
+    @staticmethod
+    def header_size(capacity: int, num_lasers: int) -> int:
+        return 8 * (1 + num_lasers + 3 * capacity)
+
+    @staticmethod
+    def buffer_size(capacity: int, num_lasers: int) -> int:
+        return PacketRing.header_size(capacity, num_lasers) + capacity * num_lasers * PACKET_SIZE
+
+    @property
+    def depth(self) -> int:
+        """Returns the number of packets waiting to be sent to the slowest laser"""
+        return int(self._written[0] - self._read.min())
+
+    def writable_slot(self) -> np.ndarray:
+        """Returns the next free slot, or None if the ring is full"""
+        written = self._written[0]
+        if written - self._read.min() >= self.capacity:
+            return None
+        return self.slots[written % self.capacity]
+
+    def commit(self, tag: int = 0, generate_time: float = 0, encode_time: float = 0) -> None:
+        """Publishes the slot returned by writable_slot"""
+        slot = self._written[0] % self.capacity
+        self.tags[slot] = tag
+        self.timings[slot] = generate_time, encode_time
+        self._written[0] += 1
+
+    def readable_slot(self, laser_index: int) -> int:
+        """Returns the index of the oldest slot queued for a laser, or None if there are none"""
+        read = self._read[laser_index]
+        if self._written[0] == read:
+            return None
+        return int(read % self.capacity)
+
+    def release(self, laser_index: int) -> None:
+        """Frees the slot returned by readable_slot"""
+        self._read[laser_index] += 1
+
+    def discard_stale(self, laser_index: int, tag: int) -> int:
+        """Releases the slots queued for a laser that were not tagged with tag, returns how many were dropped"""
+        dropped = 0
+        while (slot := self.readable_slot(laser_index)) is not None and self.tags[slot] != tag:
+            self.release(laser_index)
+            dropped += 1
+        return dropped
@@ -0,0 +1,55 @@
+"""Sends packets from a packet ring to the lasers"""
+
+import socket
+import packet_ring
+
+# laser.c drops any packet that is not exactly one more than the last sequence
+# number without wrapping, so it is resynced with an empty packet instead of losing points
+SYNC_PACKET = bytes([0])
+
+class PacketSender:
+    """Sends ring packets to each laser through connected sockets and preallocated memoryviews,
+    so sending a tick of packets does not allocate. Already connected sockets can be passed in
+    place of targets, for example to benchmark without a network."""
+    def __init__(self, ring: packet_ring.PacketRing, targets: list[tuple[str, int]], socks: list=None) -> None:
+        self.ring = ring
+        self.targets = targets
+        if socks is None:
+            socks = []
+            for target in targets:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                sock.connect(target)
+                socks.append(sock)
+        self.socks = socks
+        self._sends = [sock.send for sock in self.socks]
+        self._views = [[memoryview(ring.slots[slot, laser]) for laser in range(ring.num_lasers)]
+                       for slot in range(ring.capacity)]
+        self.seqs = [0] * ring.num_lasers
+        self.send_errors = 0
+
+    def send(self, due: list[bool]) -> None:
+        """Sends the next queued packet to every laser flagged as due, which must each have one"""
+        for i, is_due in enumerate(due):
+            if not is_due:
+                continue
+            view = self._views[self.ring.readable_slot(i)][i]
+            try:
+                if self.seqs[i] == 0:
+                    self._sends[i](SYNC_PACKET)
+                    self.seqs[i] = 1
+                view[0] = self.seqs[i]
+                self._sends[i](view)
+            except ConnectionRefusedError:
+                # A connected UDP socket reports an earlier ICMP port unreachable here
+                self.send_errors += 1
+            self.ring.release(i)
+            self.seqs[i] = (self.seqs[i] + 1) % 255
+
+    def close(self) -> None:
+        """Releases the views into the ring and closes the sockets"""
+        for views in self._views:
+            for view in views:
+                view.release()
+        self._views = []
+        for sock in self.socks:
+            sock.close()
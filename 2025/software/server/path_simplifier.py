@@ -0,0 +1,65 @@
+"""Simplifies the strokes of laser graphics with the Ramer-Douglas-Peucker algorithm
+
+Vertices are removed while the simplified stroke stays within tolerance graphic units
+of the original, which drops the dense collinear runs many graphics have before
+galvo_resampler fills them in again."""
+
+import numpy as np
+import stroke_optimizer
+
+# In the 0 to 1100 units of the graphic source, which the generators scale down before drawing
+DEFAULT_TOLERANCE = 1.0
+
+def _distances(points: np.ndarray, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Returns the distance of each point from the line through start and end"""
+    direction = end - start
+    length = np.hypot(*direction)
+    offsets = points - start
+    if length == 0:
+        return np.hypot(offsets[:, 0], offsets[:, 1])
+    return np.abs(direction[0] * offsets[:, 1] - direction[1] * offsets[:, 0]) / length
+
+def simplify_stroke(stroke: list[tuple[int, int]], tolerance: float) -> list[tuple[int, int]]:
+    if len(stroke) < 3:
+        return stroke
+    points = np.array(stroke, dtype=np.float64)
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+    ranges = [(0, len(points) - 1)]
+    while ranges:
+        first, last = ranges.pop()
+        if last - first < 2:
+            continue
+        distances = _distances(points[first + 1:last], points[first], points[last])
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            index = first + 1 + farthest
+            keep[index] = True
+            ranges += [(first, index), (index, last)]
+    return [p for p, k in zip(stroke, keep) if k]
+
+def simplify(graphic: list[int], tolerance: float = DEFAULT_TOLERANCE) -> list[int]:
+    """Returns the graphic with the vertices of each stroke simplified to within tolerance"""
+    if len(graphic) < 2 or graphic[0] & stroke_optimizer.ON_BIT:
+        # A lit first point draws the closing segment back to the start, which split_strokes does not model
+        return list(graphic)
+    strokes = stroke_optimizer.split_strokes(graphic)
+    return stroke_optimizer.join_strokes([simplify_stroke(stroke, tolerance) for stroke in strokes])
+
+if __name__ == '__main__':
+    import argparse
+    import build_laser_objects
+    parser = argparse.ArgumentParser(description='Reports the points saved by simplifying each graphic')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    print(f'{"graphic":>24} {"vertices":>8} {"simplified":>10} {"points":>7} {"simplified":>10} {"saved":>6}')
+    total, total_simplified = 0, 0
+    for name, graphic in build_laser_objects.parse_source().items():
+        simplified = simplify(graphic, args.tolerance)
+        points, simplified_points = stroke_optimizer.loop_points(graphic), stroke_optimizer.loop_points(simplified)
+        total += points
+        total_simplified += simplified_points
+        print(f'{name:>24} {len(graphic) // 2:8d} {len(simplified) // 2:10d} {points:7d} {simplified_points:10d} '
+              f'{1 - simplified_points / points:6.1%}')
+    print(f'{"total":>24} {"":>8} {"":>10} {total:7d} {total_simplified:10d} {1 - total_simplified / total:6.1%}')
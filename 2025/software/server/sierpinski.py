@@ -3,8 +3,6 @@
 import threading
 import socket
 import numpy as np
-from matplotlib import pyplot as plt
-from matplotlib import animation
 from laser_point import *
 
 np.set_printoptions(suppress=True)
@@ -71,31 +69,9 @@ lasers = [
     np.array(find_edge_pos(edges[5], projection_bottom))
 ]
 
-def eigen(a):
-    a = a.astype(float)
-    eigenvalues = []
-    eigenvectors = []
-
-    for _ in range(4):
-        eigenvector = np.random.rand(4)
-        for _ in range(1000):
-            temp = np.dot(a, eigenvector)
-            eigenvector = temp / np.linalg.norm(temp)
-        eigenvectors.append(eigenvector)
-
-        eigenvalue = max(np.dot(eigenvector, np.dot(a, eigenvector)), 0.001)
-        eigenvalues.append(eigenvalue)
-        a -= eigenvalue * np.outer(eigenvector, eigenvector)
-
-    return np.array(eigenvalues), np.array(eigenvectors).T
-
-def lstsq(a, b):
-    eigenvalues, V = eigen(a.T @ a)
-    S = np.sqrt(eigenvalues)
-    U = a @ V / S
-    U = np.delete(U, -1, axis=1)
-    S_inv = np.array([[1 / S[0], 0, 0], [0, 1 / S[1], 0], [0, 0, 1 / S[2]], [0, 0, 0]])
-    return V @ S_inv @ U.T @ b
+def solve_affine(a, b):
+    """Returns the minimum norm x with a @ x = b, for an a with full row rank"""
+    return a.T @ np.linalg.solve(a @ a.T, b)
 
 transforms = []
 inv_transforms = []
@@ -109,17 +85,37 @@ for laser, pn, s in zip(lasers, plane_normals, surfaces):
     a = np.array([[0, 2048, 0, 1], [2048, 4095, 0, 1], [2048, 2048, 0, 1]])
     b = np.array([laser_center + half_width * v1, laser_center + half_width * v2, laser_center])
     b = np.concatenate((b, np.ones((3, 1))), axis=1)
-    transforms.append(lstsq(a, b).T)
-    inv_transforms.append(lstsq(b, a).T)
+    transforms.append(solve_affine(a, b).T)
+    inv_transforms.append(solve_affine(b, a).T)
+
+transform_array = np.array(transforms)
+inv_transform_array = np.array(inv_transforms)
+
+def _transform_points(matrices, laser_index, points, rows):
+    """Applies the affine part of the matrices for laser_index, a single index or one per point, to (N, 3) or (N, 2) points"""
+    points = np.asarray(points, dtype=float)
+    m = matrices[laser_index]
+    linear, offset = m[..., :rows, :points.shape[-1]], m[..., :rows, 3]
+    if m.ndim == 2:
+        return points @ linear.T + offset
+    return np.einsum('nij,nj->ni', linear, points) + offset
+
+def sierpinski_to_laser_points(laser_index, points):
+    """Converts (N, 3) points on the pyramid to (N, 2) laser coordinates"""
+    return _transform_points(inv_transform_array, laser_index, points, 2)
+
+def laser_to_sierpinski_points(laser_index, points):
+    """Converts (N, 2) laser coordinates to (N, 3) points on the pyramid"""
+    return _transform_points(transform_array, laser_index, points, 3)
 
 def sierpinski_to_laser_coords(laser_index, x, y, z):
-    return np.dot(inv_transforms[laser_index], [x, y, z, 1])[:2]
+    return sierpinski_to_laser_points(laser_index, [[x, y, z]])[0]
 
 def laser_to_sierpinksi_coords(laser_index, x, y):
-    return np.dot(transforms[laser_index], [x, y, 0, 1])[:3]
+    return laser_to_sierpinski_points(laser_index, [[x, y]])[0]
 
 def get_laser_coordinate_bounds():
-    return [sierpinski_to_laser_coords(0, *p) for p in surfaces[0]]
+    return sierpinski_to_laser_points(0, surfaces[0])
 
 def get_laser_min_max_interior():
     bounds = get_laser_coordinate_bounds()
@@ -150,61 +146,75 @@ def calibrate_wand_position(quat):
     pitch_diff = np.arcsin(target_vector[2]) - np.arcsin(wand_pos[2])
     yaw_diff = np.arctan2(target_vector[1], target_vector[0]) - np.arctan2(wand_pos[1], wand_pos[0])
     
+def apply_quaternions(quats):
+    """Returns the unit direction of each wand, from Quaternions or a (K, 4) array of w, x, y, z values"""
+    if not isinstance(quats, np.ndarray):
+        quats = np.array([q.elements for q in quats], dtype=float).reshape(-1, 4)
+    q = quats / np.linalg.norm(quats, axis=1, keepdims=True)
+    w, u = q[:, :1], q[:, 1:]
+    uv = np.cross(u, WAND_VECTOR)
+    qv = WAND_VECTOR + 2 * w * uv + 2 * np.cross(u, uv)
+    pitch = np.arcsin(np.clip(qv[:, 2], -1, 1)) + pitch_diff
+    yaw = np.arctan2(qv[:, 1], qv[:, 0]) + yaw_diff
+    return np.column_stack((np.cos(pitch) * np.cos(yaw), np.cos(pitch) * np.sin(yaw), np.sin(pitch)))
+
 def apply_quaternion(quat):
-    qv = quat.rotate(WAND_VECTOR)
-    pitch = np.arcsin(qv[2]) + pitch_diff
-    yaw = np.arctan2(qv[1], qv[0]) + yaw_diff
-    x = np.cos(pitch) * np.cos(yaw)
-    y = np.cos(pitch) * np.sin(yaw)
-    z = np.sin(pitch)
-    v = np.array([x, y, z])
-    return v / np.linalg.norm(v)
+    return apply_quaternions([quat])[0]
+
+# Each surface is a convex quad, so a point on its plane is inside when it is on the inner side of all four edges
+plane_origins = np.array([s[0] for s in surfaces])
+edge_origins = np.array(surfaces)
+edge_normals = np.cross(plane_normals[:, None, :], np.roll(edge_origins, -1, axis=1) - edge_origins)
+edge_normals *= np.sign(np.einsum('ske,ske->sk', edge_normals, edge_origins.mean(axis=1, keepdims=True) - edge_origins))[..., None]
+
+def get_wand_projections(directions):
+    """Intersects (K, 3) wand directions with the surfaces, returning the surface index of each, -1 where
+    it points at none, and the (K, 3) points hit"""
+    directions = np.asarray(directions, dtype=float)
+    ends = directions + [0, 0, HUMAN_HEIGHT]
+    denoms = directions @ plane_normals.T
+    with np.errstate(divide='ignore', invalid='ignore'):
+        distances = np.einsum('ksj,sj->ks', plane_origins[None] - ends[:, None], plane_normals) / denoms
+        points = ends[:, None] + distances[..., None] * directions[:, None]
+    inside = np.all(np.einsum('ksme,sme->ksm', points[:, :, None] - edge_origins, edge_normals) >= 0, axis=2)
+    hits = inside & (denoms >= 0.01) & (directions[:, 2:] >= 0)
+    indices = np.where(hits.any(axis=1), hits.argmax(axis=1), -1)
+    return indices, points[np.arange(len(directions)), np.maximum(indices, 0)]
+
+def get_wand_laser_points(quats):
+    """Returns the surface index of each wand, -1 where it points at none, and its (K, 2) laser coordinates"""
+    indices, points = get_wand_projections(apply_quaternions(quats))
+    return indices, sierpinski_to_laser_points(np.maximum(indices, 0), points)
 
 def get_wand_projection(quaternion):
-    start = np.array([0, 0, HUMAN_HEIGHT])
-    end = apply_quaternion(quaternion)
-    end[2] += HUMAN_HEIGHT
-    v = end - start
-    if v[2] < 0:
-        return None
-    for i, (pn, s) in enumerate(zip(plane_normals, surfaces)):
-        denom = np.dot(v, pn)
-        if denom < 0.01:
-            continue
-        point = end + (np.dot(s[0] - end, pn / denom) * v)
-        if point_in_surface(s, point):
-            return (i, point)
-    return None
-
+    indices, points = get_wand_projections(apply_quaternions([quaternion]))
+    return (int(indices[0]), points[0]) if indices[0] >= 0 else None
 
 laser_lines = [None] * 3
 def _laser_thread(laser_index):
     try:
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.bind(('127.0.0.1', 8090 + laser_index))
+        receiver = PacketReceiver(sock)
         curr_seq = 0
         while True:
-            data, _ = sock.recvfrom(1024)
-            raw_bytes = list(data)
-            seq = raw_bytes.pop(0)
+            if receiver.receive() < 0:
+                continue
+            seq = receiver.seq
             if seq != (curr_seq + 1) % 255:
                 curr_seq = seq
                 continue
             curr_seq = seq
 
-            segments = []
-            for i in range(0, len(raw_bytes), 6):
-                chunk = raw_bytes[i:i + 6]
-                if len(chunk) != 6:
-                    break
-                new_point = LaserPoint.from_bytes(laser_index, chunk)
-                segments.append([*laser_to_sierpinksi_coords(laser_index, new_point.x, new_point.y),
-                                 new_point.r, new_point.g, new_point.b])
-            laser_lines[laser_index] = segments
+            coords = laser_to_sierpinski_points(laser_index, np.column_stack((receiver.x, receiver.y)))
+            laser_lines[laser_index] = np.column_stack((coords, receiver.rgb))
     except:
         pass
 
 if __name__ == '__main__':
+    from matplotlib import pyplot as plt
+    from matplotlib import animation
+
     fig = plt.figure()
     ax = fig.add_subplot(111, projection='3d')
     ax.set_xlim((-25, 25))
@@ -233,14 +243,9 @@ if __name__ == '__main__':
 
     def animate(_):
         for i in range(3):
-            if laser_lines[i]:
-                xs, ys, zs = [], [], []
-                for ll in laser_lines[i]:
-                    xs.append(ll[0])
-                    ys.append(ll[1])
-                    zs.append(ll[2])
-                laser_plots[i][0].set_data(xs, ys)
-                laser_plots[i][0].set_3d_properties(zs)
+            if (lines := laser_lines[i]) is not None:
+                laser_plots[i][0].set_data(lines[:, 0], lines[:, 1])
+                laser_plots[i][0].set_3d_properties(lines[:, 2])
 
     ani = animation.FuncAnimation(fig, animate, interval=25, cache_frame_data=False)
     plt.show()
@@ -0,0 +1,103 @@
+"""Reorders the strokes of laser graphics to minimize the blanked travel between them
+
+A graphic is a flat list of x, y pairs where bit 15 of x lights the segment ending at
+that point. It is split into strokes at the blanked segments, and the strokes are
+reordered and reversed with a greedy nearest neighbour tour improved by 2-opt. A jump
+costs the points galvo_resampler spends moving and settling on it at the scale the
+strokes are drawn at. The graphic is drawn in a loop, so the jump from the last stroke
+back to the first counts."""
+
+import math
+import firmware_model
+import galvo_resampler
+
+ON_BIT = 0x8000
+# Bumped whenever optimize orders strokes differently, so build_laser_objects rebuilds compiled graphics
+VERSION = 2
+
+def split_strokes(graphic: list[int]) -> list[list[tuple[int, int]]]:
+    """Returns the runs of lit segments as lists of points, points with no lit segment become one point strokes"""
+    strokes = []
+    for i in range(0, len(graphic), 2):
+        point = (graphic[i] & 0x7FFF, graphic[i + 1])
+        if graphic[i] & ON_BIT and strokes:
+            strokes[-1].append(point)
+        else:
+            strokes.append([point])
+    return strokes
+
+def join_strokes(strokes: list[list[tuple[int, int]]]) -> list[int]:
+    graphic = []
+    for stroke in strokes:
+        for i, (x, y) in enumerate(stroke):
+            graphic += [x | ON_BIT if i > 0 else x, y]
+    return graphic
+
+def jump_points(a: tuple[int, int], b: tuple[int, int], scale: float = 1) -> int:
+    """Returns how many points galvo_resampler spends on a blanked jump from a to b drawn at scale"""
+    return galvo_resampler.blank_jump_points(math.hypot(a[0] - b[0], a[1] - b[1]) * scale)
+
+def tour_cost(strokes: list[list[tuple[int, int]]], scale: float = 1) -> int:
+    return sum(jump_points(strokes[i - 1][-1], strokes[i][0], scale) for i in range(len(strokes)))
+
+def _greedy(strokes: list[list[tuple[int, int]]], scale: float) -> list[list[tuple[int, int]]]:
+    tour = [strokes[0]]
+    remaining = strokes[1:]
+    while remaining:
+        end = tour[-1][-1]
+        best, best_cost, best_reversed = 0, None, False
+        for i, stroke in enumerate(remaining):
+            for is_reversed, start in [(False, stroke[0]), (True, stroke[-1])]:
+                cost = jump_points(end, start, scale)
+                if best_cost is None or cost < best_cost:
+                    best, best_cost, best_reversed = i, cost, is_reversed
+        stroke = remaining.pop(best)
+        tour.append(stroke[::-1] if best_reversed else stroke)
+    return tour
+
+def _two_opt(tour: list[list[tuple[int, int]]], scale: float) -> list[list[tuple[int, int]]]:
+    """Reverses runs of strokes, including the direction of each stroke, while that shortens the jumps"""
+    n = len(tour)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, n):
+            for j in range(i, n):
+                before, after = tour[i - 1][-1], tour[(j + 1) % n][0]
+                delta = (jump_points(before, tour[j][-1], scale) + jump_points(tour[i][0], after, scale)
+                         - jump_points(before, tour[i][0], scale) - jump_points(tour[j][-1], after, scale))
+                if delta < 0:
+                    tour[i:j + 1] = [stroke[::-1] for stroke in reversed(tour[i:j + 1])]
+                    improved = True
+    return tour
+
+def order_strokes(strokes: list[list[tuple[int, int]]], scale: float = 1) -> list[list[tuple[int, int]]]:
+    """Returns the strokes reordered and reversed to minimize blanked travel, or as given if that does not help"""
+    tour = _two_opt(_greedy(strokes, scale), scale)
+    return tour if tour_cost(tour, scale) < tour_cost(strokes, scale) else strokes
+
+def optimize(graphic: list[int], scale: float = 1) -> list[int]:
+    """Returns the graphic with its strokes reordered to minimize blanked travel, or unchanged if that does not help"""
+    if len(graphic) < 2 or graphic[0] & ON_BIT:
+        # A lit first point draws the closing segment back to the start, which has to stay in place
+        return list(graphic)
+    strokes = split_strokes(graphic)
+    tour = order_strokes(strokes, scale)
+    return list(graphic) if tour is strokes else join_strokes(tour)
+
+def loop_points(graphic: list[int], scale: float = 1) -> int:
+    """Returns how many points the lasers draw for one loop of a graphic"""
+    import laser_objects
+    return len(galvo_resampler.resample(laser_objects.convert_to_xy(graphic, scale, scale)))
+
+if __name__ == '__main__':
+    import build_laser_objects
+    print(f'{"graphic":>24} {"points":>7} {"optimized":>9} {"loop Hz":>8} {"optimized":>9} {"gain":>6}')
+    total, total_optimized = 0, 0
+    for name, graphic in build_laser_objects.parse_source().items():
+        points, optimized = loop_points(graphic), loop_points(optimize(graphic))
+        total += points
+        total_optimized += optimized
+        rate, optimized_rate = 1 / (points * firmware_model.POINT_PERIOD), 1 / (optimized * firmware_model.POINT_PERIOD)
+        print(f'{name:>24} {points:7d} {optimized:9d} {rate:8.1f} {optimized_rate:9.1f} {optimized_rate / rate - 1:6.1%}')
+    print(f'{"total":>24} {total:7d} {total_optimized:9d} {"":>8} {"":>9} {total / total_optimized - 1:6.1%}')
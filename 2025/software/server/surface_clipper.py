@@ -0,0 +1,132 @@
+"""Clips generator output to the face of the pyramid a laser projects onto
+
+The face is the trapezoid sierpinski.get_laser_coordinate_bounds gives in laser
+coordinates, which is the same for every laser. Points are clipped a packet at a time
+as segments from the point before them. A lit segment leaving the face ends on the
+edge it crosses, a point before one that comes back in moves blanked to where it
+re-enters, and any other point outside is blanked and pulled onto the edge toward the
+middle of the face, so the galvos never travel to where nothing can be seen. Idle
+all-zero points are left alone."""
+
+import numpy as np
+import sierpinski
+
+POLYGON = sierpinski.get_laser_coordinate_bounds()
+CENTER = POLYGON.mean(axis=0)
+# Unit normals of the edges from each corner to the next, pointing into the face
+_directions = np.roll(POLYGON, -1, axis=0) - POLYGON
+EDGE_NORMALS = np.column_stack((-_directions[:, 1], _directions[:, 0])) / np.hypot(*_directions.T)[:, None]
+EDGE_NORMALS *= np.sign(np.einsum('ej,ej->e', EDGE_NORMALS, CENTER - POLYGON))[:, None]
+EDGE_OFFSETS = np.einsum('ej,ej->e', EDGE_NORMALS, POLYGON)
+# Points this close outside an edge count as on it, so outlines drawn on the edges are kept
+MARGIN = 2
+
+def edge_distances(points) -> np.ndarray:
+    """Returns the distance of (..., 2) points inside each of the edges, negative outside it"""
+    return np.asarray(points, dtype=float) @ EDGE_NORMALS.T - EDGE_OFFSETS
+
+def edge_x(edge: int, y: float) -> float:
+    """Returns the x coordinate of an edge at a given y"""
+    (x0, y0), (x1, y1) = POLYGON[edge], POLYGON[(edge + 1) % len(POLYGON)]
+    return x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+
+def _crossing(a: np.ndarray, da: np.ndarray, b: np.ndarray, db: np.ndarray) -> np.ndarray:
+    """Returns where segments from a inside the face to b outside it cross the edge, given their edge distances"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.where(db < 0, np.maximum(da, 0) / (da - db), np.inf).min(axis=-1)
+    return a + np.clip(t, 0, 1)[..., None] * (b - a)
+
+class SurfaceClipper:
+    """Clips blocks of points to the face, keeping the last point of each laser to clip across blocks"""
+    def __init__(self, num_lasers: int) -> None:
+        self.num_lasers = num_lasers
+        self._last = np.tile(CENTER, (num_lasers, 1))
+        self._last_inside = np.ones(num_lasers, dtype=bool)
+        self.points = 0
+        self.clipped = 0
+        self.clipped_lit = 0
+
+    def __repr__(self) -> str:
+        return f'SurfaceClipper(Clipped: {self.clipped} of {self.points} points, {self.clipped_lit} of them lit)'
+
+    def reset(self) -> None:
+        """Clears the point counts"""
+        self.points = self.clipped = self.clipped_lit = 0
+
+    def clip(self, block: np.ndarray) -> np.ndarray:
+        """Clips a (num_lasers, n, 5) block of x, y, r, g, b values in place and returns it.
+
+        All-zero points are idle, which the firmware skips, so they are left as they are and
+        the segments around them are clipped from the last point before them."""
+        current = block[:, :, :2].astype(float)
+        current_distances = edge_distances(current)
+        idle = ~block.any(axis=-1)
+        any_idle = idle.any()
+        inside = np.all(current_distances >= -MARGIN, axis=-1)
+        if any_idle:
+            inside |= idle
+        self.points += idle.size - np.count_nonzero(idle)
+        if not any_idle and inside.all() and self._last_inside.all():
+            self._last = current[:, -1]
+            return block
+
+        # Index of the last point that is not idle up to each point, counting the one kept from the last block as 0
+        positions = np.arange(1, block.shape[1] + 1)
+        last = np.maximum.accumulate(np.where(idle, 0, positions), axis=1)
+        carried = np.concatenate((self._last[:, None], current), axis=1)
+        carried_inside = np.concatenate((self._last_inside[:, None], inside), axis=1)
+        previous_inside_all = self._last_inside.all()
+        self._last = np.take_along_axis(carried, last[:, -1, None, None], axis=1)[:, 0]
+        self._last_inside = np.take_along_axis(carried_inside, last[:, -1, None], axis=1)[:, 0]
+        if inside.all() and previous_inside_all:
+            return block
+
+        before = np.concatenate((np.zeros((len(block), 1), dtype=last.dtype), last[:, :-1]), axis=1)
+        previous = np.take_along_axis(carried, before[:, :, None], axis=1)
+        previous_distances = edge_distances(previous)
+        previous_inside = np.take_along_axis(carried_inside, before, axis=1)
+        # Index of the next point that is not idle after each point, or the point itself if there is none
+        ahead = np.minimum.accumulate(np.where(idle, block.shape[1], positions - 1)[:, ::-1], axis=1)[:, ::-1]
+        after = np.concatenate((ahead[:, 1:], np.full((len(block), 1), block.shape[1])), axis=1)
+        has_following = after < block.shape[1]
+        after = np.where(has_following, after, positions - 1)
+        following = np.take_along_axis(current, after[:, :, None], axis=1)
+        following_distances = np.take_along_axis(current_distances, after[:, :, None], axis=1)
+        lit = block[:, :, 2:].any(axis=-1)
+
+        outside = ~inside
+        exits = outside & previous_inside & lit
+        # The last point cannot see the one after it, so the next block blanks the re-entry instead
+        entries = outside & ~exits & has_following & np.take_along_axis(inside, after, axis=1)
+        reentries = inside & ~previous_inside & ~idle
+        carried_entries = np.concatenate((np.zeros((len(block), 1), dtype=bool), entries), axis=1)
+        reentries &= ~np.take_along_axis(carried_entries, before, axis=1)
+
+        clipped = current.copy()
+        clipped[outside] = _crossing(CENTER, edge_distances(CENTER), current[outside], current_distances[outside])
+        clipped[exits] = _crossing(previous[exits], previous_distances[exits], current[exits], current_distances[exits])
+        clipped[entries] = _crossing(following[entries], following_distances[entries], current[entries], current_distances[entries])
+        block[:, :, :2] = np.rint(clipped)
+        block[(outside & ~exits) | reentries, 2:] = 0
+
+        self.clipped += np.count_nonzero(outside)
+        self.clipped_lit += np.count_nonzero(outside & lit)
+        return block
+
+if __name__ == '__main__':
+    import argparse
+    import generator_benchmark
+    import laser_point
+
+    parser = argparse.ArgumentParser(description='Reports the share of each generator\'s points that fall outside the face')
+    parser.add_argument('--packets', type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f'{"generator":>20} {"clipped":>8} {"of them lit":>12}')
+    for name in generator_benchmark.GENERATORS:
+        gen, _ = generator_benchmark.create(name, generator_benchmark.FakeClock())
+        clipper = SurfaceClipper(generator_benchmark.NUM_LASERS)
+        encoder = laser_point.PacketEncoder(generator_benchmark.NUM_LASERS, clipper=clipper)
+        for _ in range(args.packets):
+            encoder.encode_stream(0, gen)
+        print(f'{name:>20} {clipper.clipped / clipper.points:8.1%} {clipper.clipped_lit / clipper.points:12.1%}')
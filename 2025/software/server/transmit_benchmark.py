@@ -0,0 +1,69 @@
+"""Compares the legacy per-laser sendto loop against PacketSender"""
+
+import socket
+import time
+import tracemalloc
+import numpy as np
+import firmware_model
+import laser_point
+import packet_ring
+import packet_sender
+
+NUM_LASERS = 3
+TICKS = 2000
+PACKET_DELAY = firmware_model.PACKET_DELAY
+
+def measure(name: str, build, send) -> None:
+    """Runs TICKS ticks of build and send, tracking the peak memory allocated during each tick
+    and the latency of the send calls"""
+    latencies = []
+    allocated = 0
+    tracemalloc.start()
+    for t in range(TICKS):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        packets = build(t)
+        t0 = time.perf_counter_ns()
+        send(packets)
+        latencies.append(time.perf_counter_ns() - t0)
+        _, peak = tracemalloc.get_traced_memory()
+        allocated += peak - before
+        del packets
+    tracemalloc.stop()
+    latencies = np.array(latencies) / 1000
+    per_second = allocated / TICKS / PACKET_DELAY
+    print(f'{name:>8}: {per_second / 1024:8.1f} KiB/s allocated at the laser packet rate, '
+          f'send call {np.mean(latencies):6.1f} us mean, {np.percentile(latencies, 99):6.1f} us p99')
+
+if __name__ == '__main__':
+    sinks = [socket.socket(socket.AF_INET, socket.SOCK_DGRAM) for _ in range(NUM_LASERS)]
+    for sink in sinks:
+        sink.bind(('127.0.0.1', 0))
+    targets = [sink.getsockname() for sink in sinks]
+    rng = np.random.default_rng(0)
+    frames = [[laser_point.LaserPoint(i, *rng.integers(0, 4096, 2), *rng.integers(0, 256, 3)) for i in range(NUM_LASERS)]
+              for _ in range(laser_point.POINTS_PER_PACKET)]
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    def legacy_build(t):
+        packet = [[t % 255] for _ in range(NUM_LASERS)]
+        for p in frames:
+            for i in range(NUM_LASERS):
+                packet[i].extend(p[i].get_bytes())
+        return packet
+    def legacy_send(packet):
+        for i in range(NUM_LASERS):
+            sock.sendto(bytearray(packet[i]), targets[i])
+    measure('legacy', legacy_build, legacy_send)
+
+    ring = packet_ring.PacketRing(4, NUM_LASERS)
+    encoder = laser_point.PacketEncoder(NUM_LASERS)
+    sender = packet_sender.PacketSender(ring, targets)
+    due = [True] * NUM_LASERS
+    block = np.array([[(p.x, p.y, p.r, p.g, p.b) for p in frame] for frame in frames], dtype=np.int32)
+    block = np.ascontiguousarray(block.swapaxes(0, 1))
+    def ring_build(_):
+        ring.writable_slot()[:] = encoder.encode(0, block)
+        ring.commit()
+    measure('ring', ring_build, lambda _: sender.send(due))
+    sender.close()
@@ -3,6 +3,7 @@
 import colorsys
 import pyquaternion
 import sierpinski
+import wand_lut
 import laser_point
 import numpy as np
 import time
@@ -19,6 +20,8 @@ FADE_OUT = np.linspace(1, 0, FADE_LENGTH)
 FADE_IN = np.linspace(0, 1, FADE_LENGTH)
 BUFFER_LIMIT = 10
 PORT = 5005
+# Maps wands through the precomputed wand_lut table instead of projecting them exactly
+USE_LUT = False
 
 class WandServer():
     def __init__(self, connected_callback=None, disconnected_callback=None) -> None:
@@ -214,14 +217,7 @@ class Wand:
             return None
 
     def get_laser_point(self) -> laser_point.LaserPoint:
-        if self.position is None:
-            return None
-        if wand_projection := sierpinski.get_wand_projection(self.position):
-            laser_index, wand_point = wand_projection
-            laser_x, laser_y = sierpinski.sierpinski_to_laser_coords(laser_index, *wand_point)
-            return laser_point.LaserPoint(laser_index, int(laser_x), int(laser_y), *self.get_wand_color())
-        else:
-            return None
+        return get_laser_points([self])[0]
 
     def check_for_impact(self) -> bool:
         if len(self.pos_queue) > self.POS_QUEUE_LIMIT:
@@ -249,6 +245,21 @@ class Wand:
             self.button_pressed_time = time.time()
 
 
+def get_laser_points(wands: list[Wand]) -> list[laser_point.LaserPoint]:
+    """Returns the laser point each wand points at, or None, projecting all of the wands at once"""
+    positioned = [i for i, w in enumerate(wands) if w.position is not None]
+    result = [None] * len(wands)
+    if positioned:
+        positions = [wands[i].position for i in positioned]
+        if USE_LUT:
+            indices, coords = wand_lut.get().lookup_quaternions(positions)
+        else:
+            indices, coords = sierpinski.get_wand_laser_points(positions)
+        for i, laser_index, (x, y) in zip(positioned, indices.tolist(), coords.tolist()):
+            if laser_index >= 0:
+                result[i] = laser_point.LaserPoint(laser_index, int(x), int(y), *wands[i].get_wand_color())
+    return result
+
 class WandSimulator(Wand):
     def __init__(self) -> None:
         super().__init__()
@@ -0,0 +1,138 @@
+"""Precomputed table mapping wand directions to laser coordinates
+
+The table holds the surface index and laser x, y that sierpinski.get_wand_projections
+gives on a grid of yaw and pitch angles. Lookups interpolate bilinearly between the
+four grid points around a direction when they all hit the same surface, and fall back
+to the exact projection in the few cells a surface edge passes through. The table is
+indexed by the direction after the calibration offsets have been applied, so it only
+depends on the geometry, and it is kept on disk keyed by a hash of that geometry."""
+
+import glob
+import os
+import threading
+import zlib
+import numpy as np
+import sierpinski
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+STEP = np.radians(0.5)
+# Directions are projected in chunks while building to bound the memory used
+BUILD_CHUNK = 16384
+
+def _angles(directions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    return np.arctan2(directions[:, 1], directions[:, 0]), np.arcsin(np.clip(directions[:, 2], -1, 1))
+
+def _directions(yaws: np.ndarray, pitches: np.ndarray) -> np.ndarray:
+    return np.column_stack((np.cos(pitches) * np.cos(yaws), np.cos(pitches) * np.sin(yaws), np.sin(pitches)))
+
+def _exact(directions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    indices, points = sierpinski.get_wand_projections(directions)
+    return indices, sierpinski.sierpinski_to_laser_points(np.maximum(indices, 0), points)
+
+def _geometry_key(step: float) -> int:
+    """Returns a hash of everything the table depends on, so changing the pyramid rebuilds it"""
+    arrays = [np.asarray(sierpinski.surfaces), sierpinski.plane_normals, sierpinski.inv_transform_array,
+              np.array([sierpinski.HUMAN_HEIGHT, step])]
+    return zlib.crc32(b''.join(a.astype(np.float64).tobytes() for a in arrays))
+
+class WandLUT:
+    """Table of the surface index and laser coordinates over yaw from -pi to pi and pitch from 0 to pi / 2"""
+    def __init__(self, step: float = STEP, cache: bool = True) -> None:
+        self.step = step
+        self.shape = (int(round(2 * np.pi / step)) + 1, int(round(np.pi / 2 / step)) + 1)
+        path = os.path.join(DIRECTORY, f'wand_lut_{_geometry_key(step):08x}.npz')
+        try:
+            with np.load(path) as data:
+                self.indices, self.coords = data['indices'], data['coords']
+        except (OSError, ValueError, KeyError):
+            self.indices, self.coords = self._build()
+            if cache:
+                for stale in glob.glob(os.path.join(DIRECTORY, 'wand_lut_*.npz')):
+                    os.remove(stale)
+                temp_path = f'{path}.{os.getpid()}.tmp'
+                with open(temp_path, 'wb') as f:
+                    np.savez(f, indices=self.indices, coords=self.coords)
+                os.replace(temp_path, path)
+
+        # Per cell, the surface all four corners hit or -2 if they differ, and the coefficients of
+        # a + b * ty + c * tp + d * ty * tp that interpolate the corners
+        corners = np.stack([self.indices[:-1, :-1], self.indices[1:, :-1], self.indices[:-1, 1:], self.indices[1:, 1:]], axis=-1)
+        self.cell_indices = np.where(np.all(corners == corners[..., :1], axis=-1), corners[..., 0], -2).ravel()
+        c00, c10, c01, c11 = self.coords[:-1, :-1], self.coords[1:, :-1], self.coords[:-1, 1:], self.coords[1:, 1:]
+        self.cell_coefficients = np.stack([c00, c10 - c00, c01 - c00, c11 - c10 - c01 + c00], axis=-2).reshape(-1, 4, 2)
+
+    def __repr__(self) -> str:
+        return f'WandLUT(Step: {np.degrees(self.step):.2f} deg, Shape: {self.shape}, Size: {self.indices.nbytes + self.coords.nbytes} bytes)'
+
+    def _build(self) -> tuple[np.ndarray, np.ndarray]:
+        yaws, pitches = np.meshgrid(np.linspace(-np.pi, np.pi, self.shape[0]), np.linspace(0, np.pi / 2, self.shape[1]), indexing='ij')
+        directions = _directions(yaws.ravel(), pitches.ravel())
+        indices = np.empty(len(directions), dtype=np.int8)
+        coords = np.empty((len(directions), 2), dtype=np.float32)
+        for start in range(0, len(directions), BUILD_CHUNK):
+            chunk_indices, chunk_coords = _exact(directions[start:start + BUILD_CHUNK])
+            indices[start:start + BUILD_CHUNK] = chunk_indices
+            coords[start:start + BUILD_CHUNK] = chunk_coords
+        return indices.reshape(self.shape), coords.reshape(*self.shape, 2)
+
+    def lookup(self, directions) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the surface index of each of the (K, 3) directions, -1 where it points at none, and its (K, 2) laser coordinates"""
+        directions = np.asarray(directions, dtype=float)
+        yaws, pitches = _angles(directions)
+        fy = (yaws + np.pi) / self.step
+        fp = np.maximum(pitches, 0) / self.step
+        i = np.minimum(fy.astype(np.intp), self.shape[0] - 2)
+        j = np.minimum(fp.astype(np.intp), self.shape[1] - 2)
+        cells = i * (self.shape[1] - 1) + j
+        ty, tp = fy - i, fp - j
+
+        weights = np.column_stack((np.ones_like(ty), ty, tp, ty * tp))
+        coords = np.einsum('kc,kcx->kx', weights, self.cell_coefficients[cells])
+        indices = self.cell_indices[cells].astype(np.int64)
+        indices[pitches < 0] = -1
+        if (edges := indices == -2).any():
+            indices[edges], coords[edges] = _exact(directions[edges])
+        return indices, coords
+
+    def lookup_quaternions(self, quats) -> tuple[np.ndarray, np.ndarray]:
+        return self.lookup(sierpinski.apply_quaternions(quats))
+
+    def validate(self, samples: int = 100000, seed: int = 0) -> tuple[int, float]:
+        """Returns how many random directions the table maps to the wrong surface and its largest error in laser units"""
+        rng = np.random.default_rng(seed)
+        directions = _directions(rng.uniform(-np.pi, np.pi, samples), rng.uniform(-np.pi / 2, np.pi / 2, samples))
+        indices, coords = self.lookup(directions)
+        exact_indices, exact_coords = _exact(directions)
+        hits = exact_indices >= 0
+        errors = np.hypot(*(coords[hits] - exact_coords[hits]).T)
+        return int(np.sum(indices != exact_indices)), float(errors.max()) if len(errors) else 0.0
+
+_lut = None
+_lock = threading.Lock()
+
+def get() -> WandLUT:
+    """Returns the shared table, loading or building it on first use"""
+    global _lut
+    with _lock:
+        if _lut is None:
+            _lut = WandLUT()
+        return _lut
+
+if __name__ == '__main__':
+    import time
+    for attempt in ['build', 'load']:
+        if attempt == 'build':
+            for stale in glob.glob(os.path.join(DIRECTORY, 'wand_lut_*.npz')):
+                os.remove(stale)
+        start = time.perf_counter()
+        lut = WandLUT()
+        print(f'{attempt:>5}: {lut} in {(time.perf_counter() - start) * 1000:.1f} ms')
+    mismatches, max_error = lut.validate()
+    print(f'Wrong surface for {mismatches} of 100000 directions, largest error {max_error:.3f} laser units')
+
+    directions = _directions(np.random.uniform(-np.pi, np.pi, 12), np.random.uniform(0, np.pi / 2, 12))
+    for name, f in [('exact', _exact), ('table', lut.lookup)]:
+        start = time.perf_counter()
+        for _ in range(1000):
+            f(directions)
+        print(f'{name:>5}: {(time.perf_counter() - start):.3f} ms for 12 wands')